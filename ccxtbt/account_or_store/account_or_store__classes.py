@@ -23,46 +23,84 @@ import ccxt
 import collections
 import copy
 import datetime
+import functools
 import gc
 import inspect
 import json
 import math
+import os
+import threading
 import time
 import traceback
-import websocket
 
 from backtrader.utils.py3 import queue
 from ccxt.base.errors import NetworkError, ExchangeError, OrderNotFound
 from functools import wraps
 
-from pybit import usdt_perpetual
 from pprint import pprint
 from time import time as timer
 
+from ccxtbt.account_or_store.account_or_store__specifications import DEFAULT__BALANCE_CACHE__TTL_IN_SECONDS, \
+    DEFAULT__BALANCE_CACHE__WEBSOCKET_TTL_IN_SECONDS, DEFAULT__BATCHED_ORDER_POLLING, DEFAULT__BINANCE_WEBSOCKET, \
+    DEFAULT__DEFERRED_RECOVERY, \
+    DEFAULT__ORDER_STATE_WAIT__TIMEOUT_IN_SECONDS, DEFAULT__POSITION_STATE_WAIT__TIMEOUT_IN_SECONDS, \
+    DEFAULT__PUSH_ORDER_NOTIFICATION, DEFAULT__RECONCILIATION__WATERMARK_OVERLAP_IN_SECONDS, \
+    BINANCE_WEBSOCKET_CONNECTIONS, BYBIT_WEBSOCKET_CONNECTIONS, MAINNET_MARKET_CONNECTION, MARKET_DATA_HUB_OWNERSHIP_TASK, \
+    MAINNET_USDT_PERPETUAL_CONNECTION, ORDER_STATE_RETRY_INTERVAL_IN_SECONDS, USDT_PERPETUAL_CONNECTION, \
+    USER_DATA_CONNECTION
+from ccxtbt.async_exchange.async_exchange__classes import Async_Exchange_Bridge
+from ccxtbt.async_exchange.async_exchange__specifications import DEFAULT__ASYNC_MODE
 from ccxtbt.bt_ccxt__specifications import CASH_DIGITS, CCXT__MARKET_TYPES, CCXT__MARKET_TYPE__FUTURE, \
     CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP, CCXT__MARKET_TYPE__SPOT, \
     MAX_LEVERAGE_IN_PERCENT, MIN_LEVERAGE, MIN_LEVERAGE_IN_PERCENT
-from ccxtbt.exchange_or_broker.binance.binance__exchange__helper import get_binance_leverages, set_binance_leverage
+from ccxtbt.circuit_breaker.circuit_breaker__helper import get_backoff_delay_in_seconds, get_shared_circuit_breaker
+from ccxtbt.exchange_or_broker.binance.binance__exchange__classes import Binance_Listen_Key_Keeper, Binance_Websocket
+from ccxtbt.exchange_or_broker.binance.binance__exchange__helper import close_binance_listen_key, \
+    create_binance_listen_key, get_binance_leverage, get_binance_market_websocket_url, get_binance_max_leverage, \
+    get_binance_risk_limit, get_binance_user_data_websocket_url, is_binance_conditional_order, \
+    keep_alive_binance_listen_key, parse_binance_ws_kline, parse_binance_ws_order, parse_binance_ws_positions, \
+    set_binance_leverage
 from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID, \
-    BINANCE__FUTURES__DEFAULT_DUAL_POSITION_MODE
-from ccxtbt.exchange_or_broker.bybit.bybit__exchange__helper import get_bybit_leverages, get_ccxt_market_symbol_name, \
-    set_bybit_leverage
-from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
-from ccxtbt.exchange_or_broker.exchange__helper import get_symbol_id
+    BINANCE__FUTURES__ACCOUNT_UPDATE_EVENT, BINANCE__FUTURES__DEFAULT_DUAL_POSITION_MODE, \
+    BINANCE__FUTURES__ORDER_TRADE_UPDATE_EVENT, BINANCE__KLINE_EVENT, BINANCE__LISTEN_KEY_EXPIRED_EVENT, \
+    BINANCE__SPOT__ACCOUNT_POSITION_EVENT, BINANCE__SPOT__BALANCE_UPDATE_EVENT, BINANCE__SPOT__EXECUTION_REPORT_EVENT
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__helper import get_bybit_leverage, get_bybit_max_leverage, \
+    get_bybit_risk_limit, get_ccxt_market_symbol_name, set_bybit_leverage
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID, \
+    BYBIT__ORDER_BOOK_STREAM__DEPTH
+from ccxtbt.exchange_or_broker.exchange__helper import classify_exchange_error
 from ccxtbt.exchange_or_broker.exchange__classes import BT_CCXT_Exchange
-from ccxtbt.exchange_or_broker.exchange__specifications import CCXT_COMMON_MAPPING_VALUES, MAX_LIVE_EXCHANGE_RETRIES
-from ccxtbt.order.order__classes import BT_CCXT_Order
-from ccxtbt.order.order__helper import converge_ccxt_reduce_only_value, force_ccxt_order_status, get_ccxt_order_id, \
-    reverse_engineer__ccxt_order
-from ccxtbt.order.order__specifications import CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT, CCXT_ORDER_TYPES, CCXT_SIDE_KEY, \
-    CCXT_SYMBOL_KEY, DERIVED__CCXT_ORDER__KEYS, LIST_OF_CCXT_KEY_TO_BE_RENAMED, CANCELED_ORDER, CLOSED_ORDER, \
-    EXECUTION_TYPE, EXPIRED_ORDER, OPENED_ORDER, ORDERING_TYPE, ORDER_INTENT, PARTIALLY_FILLED_ORDER, POSITION_TYPE, \
-    REJECTED_ORDER, STATUS
+from ccxtbt.exchange_or_broker.exchange__specifications import BREAK_ACTION, CCXT_COMMON_MAPPING_VALUES, \
+    CCXT_TERMINAL_MAPPING_VALUES, MAX_LIVE_EXCHANGE_RETRIES, RAISE_ACTION, RETRY_WITH_BACKOFF_ACTION
+from ccxtbt.http_session.http_session__helper import attach_shared_http_session
+from ccxtbt.http_session.http_session__specifications import DEFAULT__HTTP_SESSION__TIMEOUT_IN_SECONDS
+from ccxtbt.metadata_cache.metadata_cache__helper import get_metadata_cache_key, get_shared_metadata_cache
+from ccxtbt.metadata_cache.metadata_cache__specifications import MARKETS_KEY, RISK_LIMIT_KEY
+from ccxtbt.market_data_hub.market_data_hub__helper import get_shared_market_data_hub
+from ccxtbt.market_data_hub.market_data_hub__specifications import INSTRUMENT_INFO_TOPIC, KLINE_TOPIC
+from ccxtbt.order_book.order_book__classes import Local_Order_Book
+from ccxtbt.order_book.order_book__helper import parse_order_book_message
+from ccxtbt.order_book.order_book__specifications import DEFAULT__ORDER_BOOK__MAX_AGE_IN_SECONDS
+from ccxtbt.order.order__classes import BT_CCXT_Order, CCXT_Order_Normalizer, Order_State_Waiter, \
+    Websocket_Order_Cache
+from ccxtbt.order.order__helper import force_ccxt_order_status, get_ccxt_order_id
+from ccxtbt.order.order__specifications import CCXT_ORDER_TYPES, CCXT_STATUS_KEY, DERIVED__CCXT_ORDER__KEYS, \
+    CANCELED_ORDER, CLOSED_ORDER, EXECUTION_TYPE, EXPIRED_ORDER, OPENED_ORDER, ORDERING_TYPE, ORDER_INTENT, \
+    PARTIALLY_FILLED_ORDER, POSITION_TYPE, REJECTED_ORDER, STATUS
+from ccxtbt.parallel_processing.parallel_processing__classes import Single_Flight
+from ccxtbt.parallel_processing.parallel_processing__helper import run_in_thread_pool
 from ccxtbt.persistent_storage.persistent_storage__helper import delete_from_persistent_storage, \
-    read_from_persistent_storage, save_to_persistent_storage
+    read_from_persistent_storage, read_reconciliation_watermark, save_reconciliation_watermark, \
+    save_to_persistent_storage
 from ccxtbt.persistent_storage.persistent_storage__specifications import PERSISTENT_STORAGE_CSV_HEADERS, \
     PS_CCXT_ORDER_ID, PS_ORDERING_TYPE
-from ccxtbt.utils import capitalize_sentence, convert_slider_from_percent, legality_check_not_none_obj, \
+from ccxtbt.quote.quote__classes import Quote_Store
+from ccxtbt.quote.quote__specifications import DEFAULT__QUOTE__MAX_AGE_IN_SECONDS
+from ccxtbt.rate_limiter.rate_limiter__helper import get_exchange_host, get_shared_rate_limiter
+from ccxtbt.websocket_supervisor.websocket_supervisor__classes import Websocket_Supervisor
+from ccxtbt.websocket_supervisor.websocket_supervisor__specifications import \
+    DEFAULT__WEBSOCKET_SUPERVISOR__HEARTBEAT_TIMEOUT_IN_SECONDS
+from ccxtbt.utils import convert_slider_from_percent, legality_check_not_none_obj, \
     round_to_nearest_decimal_points, truncate, get_time_diff
 
 
@@ -122,90 +160,78 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
     def retry(method):
         @wraps(method)
         def retry_method(self, *args, **kwargs):
+            # Every account_or_store hitting the same end point of the same exchange host shares the same breaker
+            get_shared_circuit_breaker__dict = dict(
+                host=self.exchange_host,
+                endpoint=method.__name__,
+            )
+            circuit_breaker = get_shared_circuit_breaker(
+                params=get_shared_circuit_breaker__dict)
+
             for i in range(self.retries):
                 if self.debug:
                     print(
                         '{} - {} - Attempt {}'.format(datetime.datetime.now(), method.__name__, i))
-                time.sleep(self.exchange.rateLimit / 1000)
+
+                # Fail fast while the end point is degraded instead of tying up the thread in retries
+                circuit_breaker.raise_if_open()
+
+                # Only sleep when the request budget shared with other accounts on the same host is exhausted
+                self.rate_limiter.acquire()
                 try:
-                    return method(self, *args, **kwargs)
+                    ret_value = method(self, *args, **kwargs)
+                    circuit_breaker.record_success()
+                    return ret_value
                 except (NetworkError, ExchangeError) as e:
+                    (action, error_code, error_msg, ) = self._record_exchange_error(
+                        circuit_breaker, e)
+
                     if i == self.retries - 1:
                         raise
 
-                    if isinstance(e, ExchangeError):
-                        # Extract the exchange name from the exception
-                        json_error = e.args[0].replace(
-                            self.exchange_dropdown_value + " ", "")
-                        exchange_error_dict = json.loads(json_error)
-                        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
-                            # If the order is not found in the exchange
-                            if exchange_error_dict['code'] == -1102:
-                                '''
-                                'msg' = "Mandatory parameter 'orderId' was not sent, was empty/null, or malformed."
-                                '''
-                                break
-                            elif exchange_error_dict['code'] == -2011:
-                                '''
-                                'msg' = "Unknown order sent."
-                                '''
-                                break
-                            pass
-                        elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
-                            if exchange_error_dict['ret_code'] == 130125:
-                                '''
-                                'ret_msg' = 'current position is zero, cannot fix reduce-only order qty'
-                                '''
-                                break
-                            elif exchange_error_dict['ret_code'] == 130074:
-                                '''
-                                'ret_msg' = 'expect Rising, but trigger_price[12705000] <= current[12706500]'
-                                '''
-                                # This error is likely caused by base_price is incorrectly configured. Hence, it should
-                                # be raised immediately without retry
-                                raise
-                            elif exchange_error_dict['ret_code'] == 130075:
-                                '''
-                                'ret_msg' = 'expect Failling, but trigger_price[11975000] \u003e= current[11968000]??1'
-                                '''
-                                # This error is likely caused by base_price is incorrectly configured. Hence, it should
-                                # be raised immediately without retry
-                                raise
-                            elif exchange_error_dict['ret_code'] == 130010:
-                                '''
-                                'ret_msg' = 'order not exists or too late to repalce'
-                                '''
-                                break
-                            elif exchange_error_dict['ret_code'] == 20001:
-                                '''
-                                'ret_msg' = 'order not exists or too late to repalce'
-                                '''
-                                break
-
-                            # Print out warning regarding the response received from ExchangeError
-                            frameinfo = inspect.getframeinfo(
-                                inspect.currentframe())
-                            msg = "{} Line: {}: INFO: {}: {}/{}: ".format(
-                                frameinfo.function, frameinfo.lineno,
-                                datetime.datetime.now().isoformat().replace(
-                                    "T", " ")[:-3],
-                                i + 1, self.retries,
-                            )
-                            sub_msg = "{}: ret_code: {}, ret_msg: {}{}".format(
-                                self.exchange_dropdown_value,
-                                exchange_error_dict['ret_code'],
-                                exchange_error_dict['ret_msg'],
-                                " " * 3,
-                            )
-
-                            # Credits: https://stackoverflow.com/questions/3419984/print-to-the-same-line-and-not-a-new-line
-                            # Print on the same line without newline, customized accordingly to cater for our requirement
-                            print("\r" + msg + sub_msg, end="")
+                    if action == BREAK_ACTION:
+                        break
+                    elif action == RAISE_ACTION:
+                        raise
 
-                    pass
+                    # Validate assumption made
+                    assert action == RETRY_WITH_BACKOFF_ACTION
+
+                    # Print out warning regarding the unclassified response received
+                    msg = "{}: INFO: {}: {}/{}: ".format(
+                        method.__name__,
+                        datetime.datetime.now().isoformat().replace(
+                            "T", " ")[:-3],
+                        i + 1, self.retries,
+                    )
+                    sub_msg = "{}: code: {}, msg: {}{}".format(
+                        self.exchange_dropdown_value,
+                        error_code,
+                        error_msg,
+                        " " * 3,
+                    )
+
+                    # Credits: https://stackoverflow.com/questions/3419984/print-to-the-same-line-and-not-a-new-line
+                    # Print on the same line without newline, customized accordingly to cater for our requirement
+                    print("\r" + msg + sub_msg, end="")
+
+                    get_backoff_delay_in_seconds__dict = dict(
+                        attempt=i,
+                    )
+                    time.sleep(get_backoff_delay_in_seconds(
+                        params=get_backoff_delay_in_seconds__dict))
 
         return retry_method
 
+    def single_flight(method):
+        @wraps(method)
+        def single_flight_method(self, *args, **kwargs):
+            # Concurrent identical requests share one in-flight network call
+            key = (method.__name__, repr(args), repr(sorted(kwargs.items())), )
+            return self.single_flight_group.do(key, method, self, *args, **kwargs)
+
+        return single_flight_method
+
     def __init__(self, exchange_dropdown_value, wallet_currency, config, retries, symbols_id,
                  main_net_toggle_switch_value, initial__capital_reservation__value, is_ohlcv_provider,
                  account__thread__connectivity__lock, isolated_toggle_switch_value, leverage_in_percent,
@@ -269,22 +295,101 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
             raise ValueError("{}: {} market_type must be one of {}!!!".format(
                 inspect.currentframe(), self.market_type, range(len(CCXT__MARKET_TYPES))))
 
-        self.parent = None
-        self.ccxt_instruments = []
+        self._init_exchange(exchange_dropdown_value, config)
+        self._init_in_memory_state(config)
+        self._init_websocket_and_balance(config)
 
-        self.account = collections.defaultdict(
-            backtrader.utils.AutoOrderedDict)
+        # It is crucial to initialize leverage here
+        self.set_leverage_in_percent(leverage_in_percent)
+
+    def _init_exchange(self, exchange_dropdown_value, config):
+        '''
+        Network bound part of init2, i.e. the ccxt exchange together with its markets and the resources shared per
+        exchange host
+        '''
         self.exchange = getattr(ccxt, exchange_dropdown_value)(config)
         self.exchange.set_sandbox_mode(not self.main_net_toggle_switch_value)
 
         # Alias
         self.exchange_dropdown_value = self.exchange.name.lower()
+        self.exchange_host = get_exchange_host(
+            self.exchange, self.market_type)
+
+        # Every account_or_store hitting the same exchange host and IP shares the same request budget
+        get_shared_rate_limiter__dict = dict(
+            exchange=self.exchange,
+
+            # Optional Params
+            capacity=config.get('rate_limiter_capacity', None),
+            market_type=self.market_type,
+            source_ip=config.get('source_ip', None),
+        )
+        self.rate_limiter = get_shared_rate_limiter(
+            params=get_shared_rate_limiter__dict)
+
+        # Every account_or_store hitting the same exchange host reuses the same keep-alive connections
+        attach_shared_http_session__dict = dict(
+            exchange=self.exchange,
+
+            # Optional Params
+            market_type=self.market_type,
+            pool_size=config.get('http_pool_size', None),
+        )
+        attach_shared_http_session(params=attach_shared_http_session__dict)
+
+        # Static exchange metadata shared by every account_or_store of the same exchange, market type and network
+        get_shared_metadata_cache__dict = dict(
+            exchange_dropdown_value=self.exchange_dropdown_value,
+            market_type=self.market_type,
+            main_net_toggle_switch_value=self.main_net_toggle_switch_value,
+
+            # Optional Params
+            root_dir_path=config.get('metadata_cache_dir', None),
+            ttl_in_seconds=config.get('metadata_cache_ttl_in_seconds', None),
+            enabled=config.get('metadata_cache_enabled', None),
+        )
+        self.metadata_cache = get_shared_metadata_cache(
+            params=get_shared_metadata_cache__dict)
 
         # Preload all markets from the exchange base on the market type specified by user
-        load_markets__dict = dict(
-            type=config['type'],  # CCXT Market Type
+        get_metadata_cache_key__dict = dict(
+            metadata_cache_key=MARKETS_KEY,
         )
-        self.exchange.load_markets(params=load_markets__dict)
+        # Markets refreshed in the background once the cached entry turns stale are applied by _apply_markets too
+        self.async_exchange_bridge = None
+        cached_markets = self.metadata_cache.get_or_fetch(
+            get_metadata_cache_key(params=get_metadata_cache_key__dict), self._fetch_markets, self._apply_markets)
+        self._apply_markets(cached_markets)
+
+        # Optionally mirror the exchange with ccxt.async_support so that independent requests could run concurrently
+        if config.get('async_mode', DEFAULT__ASYNC_MODE):
+            self.async_exchange_bridge = Async_Exchange_Bridge(
+                exchange_constructor=exchange_dropdown_value, config=config)
+            async_exchange = self.async_exchange_bridge.exchange
+            async_exchange.set_sandbox_mode(
+                not self.main_net_toggle_switch_value)
+
+            # Reuse the markets preloaded above instead of loading them again
+            async_exchange.set_markets(
+                self.exchange.markets, self.exchange.currencies)
+
+    def _init_in_memory_state(self, config):
+        '''
+        In-memory state of init2 which neither connects to the exchange nor to its websocket, hence could be reused by
+        an offline account_or_store built on top of a fake ccxt exchange
+        '''
+        self.parent = None
+        self.ccxt_instruments = []
+
+        self.account = collections.defaultdict(
+            backtrader.utils.AutoOrderedDict)
+
+        # Coalesce concurrent identical market data and balance requests issued by parallel datafeeds
+        self.single_flight_group = Single_Flight()
+
+        # Connect and read timeout of the requests issued outside ccxt, e.g. symbol static info
+        self.http_timeout_in_seconds = config.get(
+            'http_timeout_in_seconds', DEFAULT__HTTP_SESSION__TIMEOUT_IN_SECONDS)
 
         self.config__api_key = None
         self.config__api_secret = None
@@ -299,12 +404,125 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         # Track the partially_filled_earlier status
         self.partially_filled_earlier = None
 
+        # Signalled by websocket order handlers so that order submission and cancellation could wake up immediately
+        self.order_state_waiter = Order_State_Waiter()
+
+        # True for websocket handlers to push the id of every updated order to a worker thread of its own, which
+        #       applies the update, i.e. executes fills, syncs positions over HTTP and queues the notifications. Neither
+        #       is the websocket thread held up nor is there anything left for next() to poll.
+        self.push_order_notification = config.get(
+            'push_order_notification', DEFAULT__PUSH_ORDER_NOTIFICATION)
+        self.pushed_ccxt_orders_id = queue.Queue()
+        self.order_notification_worker = None
+
+        # Guard open_orders as orders could be submitted from threads other than the one running next()
+        self.open_orders__lock = threading.RLock()
+
+        # Built on first use as it depends on the parent
+        self.ccxt_order_normalizer = None
+        self.ccxt_order_normalizer__parent = None
+
+        # True to reconcile open orders per symbol instead of per order during next()
+        self.batched_order_polling = config.get(
+            'batched_order_polling', DEFAULT__BATCHED_ORDER_POLLING)
+
+        # Wallet balance served from memory until stale or invalidated. Websocket wallet stream keeps it fresh for
+        #       exchanges that support it, hence the longer TTL
+        self.balance_cache_ttl_in_seconds = \
+            config.get('balance_cache_ttl_in_seconds',
+                       DEFAULT__BALANCE_CACHE__TTL_IN_SECONDS)
+        self.balance_cache_websocket_ttl_in_seconds = \
+            config.get('balance_cache_websocket_ttl_in_seconds',
+                       DEFAULT__BALANCE_CACHE__WEBSOCKET_TTL_IN_SECONDS)
+        self.balance__lock = threading.Lock()
+        self.cached_balance = None
+        self.cached_balance__timestamp = None
+
+        # Websocket positions are trusted only if they arrived after the last fill seen for the symbol
+        self.position_state_wait__timeout_in_seconds = \
+            config.get('position_state_wait__timeout_in_seconds',
+                       DEFAULT__POSITION_STATE_WAIT__TIMEOUT_IN_SECONDS)
+        self.ws_positions__condition = threading.Condition(threading.RLock())
+        self.ws_positions__timestamp = {}
+        self.ws_fills__timestamp = {}
+
+        # Current leverage per symbol, kept in sync on every successful set_leverage_in_percent
+        self.leverages__lock = threading.Lock()
+        self.leverages = {}
+
+        # True to leave restart reconciliation of every added instrument to Crash_Recovery_Coordinator, which
+        #       Enhanced_Cerebro.run invokes before the strategies start
+        self.deferred_recovery = config.get(
+            'deferred_recovery', DEFAULT__DEFERRED_RECOVERY)
+        self.pending_recovery__lock = threading.Lock()
+        self.pending_recovery__instruments = []
+
+        # Set once Crash_Recovery_Coordinator took over the pending instruments. Nothing recovers instrument added
+        #       afterwards, hence it is recovered as soon as it is added regardless of deferred_recovery
+        self.is_recovery_coordinated = False
+
+        # Restart reconciliation looks back to the previous reconciliation of the symbol minus this overlap
+        self.reconciliation_watermark_overlap_in_seconds = \
+            config.get('reconciliation_watermark_overlap_in_seconds',
+                       DEFAULT__RECONCILIATION__WATERMARK_OVERLAP_IN_SECONDS)
+
+        # Latest quotes of the instrument info stream as received by this account while it owns the market data hub
+        self.quote_store = Quote_Store()
+        self.quote_max_age_in_seconds = \
+            config.get('quote_max_age_in_seconds',
+                       DEFAULT__QUOTE__MAX_AGE_IN_SECONDS)
+
+        # Public market data is always streamed from MAINNET, once per exchange and market type no matter how many
+        #       accounts or processes need it. Pass a hub connected with connect_market_data_hub to share it with
+        #       another process.
+        self.market_data_hub = config.get('market_data_hub', None)
+        if self.market_data_hub is None:
+            get_shared_market_data_hub__dict = dict(
+                exchange_dropdown_value=self.exchange_dropdown_value,
+                market_type=self.market_type,
+            )
+            self.market_data_hub = get_shared_market_data_hub(
+                params=get_shared_market_data_hub__dict)
+        self.market_data_hub__owner = "{}: {}: {}".format(
+            os.getpid(), self.account_alias, id(self))
+
+        # Whichever account owns the public streams, have them cover the symbols of this account as well
+        for topic in self._get_market_data_topics():
+            self.market_data_hub.request(
+                self.market_data_hub__owner, topic, self.symbols_id)
+        # Version of the requests of the market data hub the public streams were last subscribed with
+        self.market_data__requests__version = None
+
+        # Only OHLCV_PROVIDER subscribes to the public streams, and only if no other account does already. Otherwise its
+        #       websocket supervisor keeps trying to take them over.
+        self.is_market_data_owner = False
+        if self.is_ohlcv_provider == True:
+            self.is_market_data_owner = self.market_data_hub.acquire_ownership(
+                self.market_data_hub__owner)
+
+        # Order book maintained from the depth stream is trusted only if it has been updated within this time
+        self.order_book_max_age_in_seconds = \
+            config.get('order_book_max_age_in_seconds',
+                       DEFAULT__ORDER_BOOK__MAX_AGE_IN_SECONDS)
+        self.local_order_books = None
+
         # Invoke websocket if available
         self.is_ws_available = False
+        self.websocket_heartbeat_timeout_in_seconds = \
+            config.get('websocket_heartbeat_timeout_in_seconds',
+                       DEFAULT__WEBSOCKET_SUPERVISOR__HEARTBEAT_TIMEOUT_IN_SECONDS)
+        self.websocket_supervisor = None
         self.ws_mainnet_usdt_perpetual = None
         self.ws_usdt_perpetual = None
-        self.twm = None
+        self.ws_binance_user_data = None
+        self.ws_binance_mainnet_market = None
+        self.binance_listen_key = None
+        self.binance_listen_key_keeper = None
 
+    def _init_websocket_and_balance(self, config):
+        '''
+        Connect the websockets of the account and take the initial wallet balance
+        '''
         # For sensitive section, apply thread-safe locking mechanism to guarantee connection is completely
         #       established before moving on to another thread
         with self.account__thread__connectivity__lock:
@@ -315,19 +533,26 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 )
                 self.config__api_key = config['apiKey']
                 self.config__api_secret = config['secret']
-                # self.is_ws_available = True
-                #
-                # Gated by: https://github.com/sammchardy/python-binance/issues/1243
-                # # socket manager using threads
-                # twm__dict = dict(
-                #     api_key=config['apiKey'],
-                #     api_secret=config['secret'],
-                # )
-                # self.twm = binance.ThreadedWebsocketManager(**twm__dict)
-                # self.twm.start()
-                #
-                # self.establish_binance_websocket()
-                pass
+                self.is_ws_available = config.get(
+                    'binance_websocket', DEFAULT__BINANCE_WEBSOCKET)
+                self.local_order_books = None
+
+                if self.is_ws_available == True:
+                    self.ws_active_orders = Websocket_Order_Cache()
+                    self.ws_conditional_orders = Websocket_Order_Cache()
+                    self.ws_positions = collections.defaultdict(list)
+
+                    # Created ahead of the connections as their handlers report heartbeats to it
+                    self.websocket_supervisor = Websocket_Supervisor(
+                        name=self.account_alias,
+                        heartbeat_timeout_in_seconds=self.websocket_heartbeat_timeout_in_seconds,
+                    )
+                    self.establish_binance_websocket()
+                    self.supervise_binance_websocket()
+                else:
+                    self.ws_active_orders = None
+                    self.ws_conditional_orders = None
+                    self.ws_positions = None
             # Support for Bybit below
             elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
                 self.is_ws_available = True
@@ -335,41 +560,49 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 self.config__api_secret = config['secret']
                 self.fetch_balance__dict = {}
 
-                self.ws_instrument_info = collections.defaultdict(tuple)
-                self.ws_klines = collections.defaultdict(tuple)
-                self.ws_active_orders = collections.defaultdict(list)
-                self.ws_conditional_orders = collections.defaultdict(list)
+                self.ws_active_orders = Websocket_Order_Cache()
+                self.ws_conditional_orders = Websocket_Order_Cache()
                 self.ws_positions = collections.defaultdict(list)
-
+                self.local_order_books = \
+                    {symbol_id: Local_Order_Book(symbol_id, max_depth=BYBIT__ORDER_BOOK_STREAM__DEPTH)
+                     for symbol_id in self.symbols_id}
+
+                # Created ahead of the connections as their handlers report heartbeats to it
+                self.websocket_supervisor = Websocket_Supervisor(
+                    name=self.account_alias,
+                    heartbeat_timeout_in_seconds=self.websocket_heartbeat_timeout_in_seconds,
+                )
                 self.establish_bybit_websocket()
+                self.supervise_bybit_websocket()
             else:
-                self.ws_instrument_info = None
-                self.ws_klines = None
                 self.ws_active_orders = None
                 self.ws_conditional_orders = None
                 self.ws_positions = None
+                self.local_order_books = None
 
             balance = \
                 self.exchange.fetch_balance(
                     params=self.fetch_balance__dict) if 'secret' in config else 0.0
+            if balance != 0:
+                self._set_cached_balance(balance)
             try:
-                if balance == 0 or not balance['free'][wallet_currency]:
+                if balance == 0 or not balance['free'][self.wallet_currency]:
                     self._cash = 0
                 else:
-                    self._cash = balance['free'][wallet_currency]
+                    self._cash = balance['free'][self.wallet_currency]
             except KeyError:  # never funded or eg. all USD exchanged
                 self._cash = 0
 
             try:
-                if balance == 0 or not balance['total'][wallet_currency]:
+                if balance == 0 or not balance['total'][self.wallet_currency]:
                     self._value = 0
                 else:
-                    self._value = balance['total'][wallet_currency]
+                    self._value = balance['total'][self.wallet_currency]
             except KeyError:
                 self._value = 0
 
-        # It is crucial to initialize leverage here
-        self.set_leverage_in_percent(leverage_in_percent)
+        if self._is_order_notification_pushed() == True:
+            self.start_order_notification_worker()
 
     def set_leverage_in_percent(self, leverage_in_percent, position_value=0.0):
         # Legality Check
@@ -391,39 +624,13 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID or self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
             if self.market_type == CCXT__MARKET_TYPE__FUTURE or \
                     self.market_type == CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP:
-                for symbol_id in self.symbols_id:
-                    get_leverage__dict = dict(
-                        bt_ccxt_account_or_store=self,
-                        market_type=self.market_type,
-                        symbol_id=symbol_id,
-                        notional_value=position_value,
-                    )
-                    if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
-                        (from_leverage, max_leverage,) = get_binance_leverages(
-                            params=get_leverage__dict)
-                    else:
-                        assert self.exchange_dropdown_value == BYBIT_EXCHANGE_ID
-
-                        (from_leverage, max_leverage,) = get_bybit_leverages(
-                            params=get_leverage__dict)
-
-                    to_leverage = int(convert_slider_from_percent(
-                        self.leverage_in_percent, MIN_LEVERAGE, max_leverage))
-
-                    if to_leverage != from_leverage:
-                        set_leverage__dict = copy.copy(get_leverage__dict)
-                        set_leverage__dict.update(dict(
-                            from_leverage=from_leverage,
-                            to_leverage=to_leverage,
-                        ))
-                        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
-                            set_binance_leverage(params=set_leverage__dict)
-                        else:
-                            assert str(self.exchange).lower(
-                            ) == BYBIT_EXCHANGE_ID
-
-                            set_bybit_leverage(params=set_leverage__dict)
-                    else:
+                run_in_thread_pool__dict = dict(
+                    tasks=[functools.partial(self._set_symbol_leverage, symbol_id, position_value)
+                           for symbol_id in self.symbols_id],
+                    rate_limiters=[self.rate_limiter],
+                )
+                for result in run_in_thread_pool(params=run_in_thread_pool__dict):
+                    if result == False:
                         success = False
             # Spot Market does not support leverage
         else:
@@ -431,6 +638,118 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
         return success
 
+    def call_rate_limited(self, fn, *args, **kwargs):
+        '''
+        Network call issued outside the retry layer, e.g. an implicit ccxt end point or plain HTTP, still takes its
+        token from the request budget shared by the accounts hitting the same host. Wrap the fetch function of a
+        metadata cache entry with it so that an entry served from the cache costs nothing.
+        '''
+        self.rate_limiter.acquire()
+        return fn(*args, **kwargs)
+
+    def _get_risk_limit(self, symbol_id) -> list:
+        '''
+        Risk limit tiers rarely change, hence serve them from the metadata cache shared with the instrument
+        '''
+        get_risk_limit__dict = dict(
+            bt_ccxt_account_or_store=self,
+            market_type=self.market_type,
+            symbol_id=symbol_id,
+        )
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            fetch_fn = functools.partial(
+                self.call_rate_limited, get_binance_risk_limit, params=get_risk_limit__dict)
+        elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+            fetch_fn = functools.partial(
+                self.call_rate_limited, get_bybit_risk_limit, params=get_risk_limit__dict)
+        else:
+            raise NotImplementedError(
+                "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
+
+        get_metadata_cache_key__dict = dict(
+            metadata_cache_key=RISK_LIMIT_KEY,
+            symbol_id=symbol_id,
+        )
+        risk_limit = self.metadata_cache.get_or_fetch(
+            get_metadata_cache_key(params=get_metadata_cache_key__dict), fetch_fn)
+        return risk_limit
+
+    def _get_leverage(self, symbol_id):
+        '''
+        Leverage is only ever changed through set_leverage_in_percent, hence the exchange is queried once per symbol
+        '''
+        with self.leverages__lock:
+            if symbol_id in self.leverages.keys():
+                return self.leverages[symbol_id]
+
+        get_leverage__dict = dict(
+            bt_ccxt_account_or_store=self,
+            market_type=self.market_type,
+            symbol_id=symbol_id,
+        )
+        self.rate_limiter.acquire()
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            leverage = get_binance_leverage(params=get_leverage__dict)
+        else:
+            assert self.exchange_dropdown_value == BYBIT_EXCHANGE_ID
+
+            leverage = get_bybit_leverage(params=get_leverage__dict)
+
+        with self.leverages__lock:
+            self.leverages[symbol_id] = leverage
+        return leverage
+
+    def _set_symbol_leverage(self, symbol_id, position_value) -> bool:
+        get_max_leverage__dict = dict(
+            bt_ccxt_account_or_store=self,
+            market_type=self.market_type,
+            symbol_id=symbol_id,
+            notional_value=position_value,
+            risk_limit=self._get_risk_limit(symbol_id),
+        )
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            max_leverage = get_binance_max_leverage(
+                params=get_max_leverage__dict)
+        else:
+            assert self.exchange_dropdown_value == BYBIT_EXCHANGE_ID
+
+            max_leverage = get_bybit_max_leverage(
+                params=get_max_leverage__dict)
+
+        from_leverage = self._get_leverage(symbol_id)
+        to_leverage = int(convert_slider_from_percent(
+            self.leverage_in_percent, MIN_LEVERAGE, max_leverage))
+
+        success = True
+        if to_leverage != from_leverage:
+            set_leverage__dict = dict(
+                bt_ccxt_account_or_store=self,
+                market_type=self.market_type,
+                symbol_id=symbol_id,
+                from_leverage=from_leverage,
+                to_leverage=to_leverage,
+            )
+            self.rate_limiter.acquire()
+            try:
+                if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+                    set_binance_leverage(params=set_leverage__dict)
+                else:
+                    assert str(self.exchange).lower(
+                    ) == BYBIT_EXCHANGE_ID
+
+                    set_bybit_leverage(params=set_leverage__dict)
+            except Exception:
+                # Leverage on the exchange is unknown now, hence query it again next time
+                with self.leverages__lock:
+                    self.leverages.pop(symbol_id, None)
+                raise
+
+            with self.leverages__lock:
+                self.leverages[symbol_id] = to_leverage
+        else:
+            success = False
+        return success
+
     def __repr__(self):
         return str(self)
 
@@ -559,6 +878,13 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
             params=delete_from_persistent_storage__dict)
 
         self.open_orders.remove(order)
+        self.order_state_waiter.discard(order.ccxt_id)
+
+    def _add_open_order(self, order):
+        self.open_orders.append(order)
+        if self._is_order_notification_pushed() == True:
+            # Its update could have been pushed before it was tracked
+            self.pushed_ccxt_orders_id.put(order.ccxt_id)
 
     def next(self, ut_provided__new_ccxt_order=None):
         if self.debug:
@@ -572,7 +898,31 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
             #     print(msg)
             pass
 
-        for order in self.open_orders:
+        if self._is_order_notification_pushed() == True and not ut_provided__new_ccxt_order:
+            # Applied by the order notification worker as soon as pushed, whose notifications are drained by the caller
+            #       through get_notification
+            return
+
+        # Iterate over a snapshot as concluded orders are removed along the way
+        with self.open_orders__lock:
+            open_orders = list(self.open_orders)
+
+        batched__ccxt_orders = None
+        if not ut_provided__new_ccxt_order:
+            # Websocket lookups are served from memory, only HTTP polling benefits from batching
+            if self.batched_order_polling and not self.is_ws_available:
+                batched__ccxt_orders = self._fetch_ccxt_orders_in_batch()
+
+            # In async mode, fetch whatever is left to be fetched individually concurrently
+            if self.async_exchange_bridge is not None and not self.is_ws_available:
+                if batched__ccxt_orders is None:
+                    batched__ccxt_orders = {}
+                remaining_orders = \
+                    [order for order in open_orders if order.ccxt_id not in batched__ccxt_orders.keys()]
+                batched__ccxt_orders.update(
+                    self._fetch_ccxt_orders_concurrently(remaining_orders))
+
+        for order in open_orders:
             ccxt_order_id = order.ccxt_id
 
             # Print debug before fetching so we know which order is giving an
@@ -594,14 +944,14 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 # dump_obj(order.created, "order.created")
                 pass
 
-            if self.partially_filled_earlier is not None:
-                # Carry forward partially_filled_earlier status to the next order
-                order.partially_filled_earlier = self.partially_filled_earlier
-
             if ut_provided__new_ccxt_order:
                 # Use the order provided by UT
                 new_ccxt_order = order.ccxt_order
+            elif batched__ccxt_orders is not None and ccxt_order_id in batched__ccxt_orders.keys():
+                # The order has been fetched in batch or concurrently already
+                new_ccxt_order = batched__ccxt_orders[ccxt_order_id]
             else:
+                # Either batching is off or the order has left the open set, fetch it individually
                 # Get the order from exchange
                 if order.ordering_type == backtrader.Order.ACTIVE_ORDERING_TYPE:
                     if self.debug:
@@ -645,210 +995,232 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
 
                 continue
 
-            '''
-            next Line: 397: DEBUG: ccxt_order:
-            {
-                "info": {
-                    "order_id": "b788dac1-8ebd-4bdb-9a5e-265ffee07b7d",
-                    "order_link_id": "",
-                    "symbol": "ETHUSDT",
-                    "side": "Buy",
-                    "order_type": "Market",
-                    "price": 1272.6,
-                    "qty": 0.61,
-                    "leaves_qty": 0,
-                    "last_exec_price": 1212,
-                    "cum_exec_qty": 0.61,
-                    "cum_exec_value": 739.31995,
-                    "cum_exec_fee": 0.443592,
-                    "time_in_force": "ImmediateOrCancel",
-                    "create_type": "CreateByUser",
-                    "cancel_type": "UNKNOWN",
-                    "order_status": "Filled",
-                    "take_profit": 0,
-                    "stop_loss": 0,
-                    "trailing_stop": 0,
-                    "create_time": "2022-11-27T13:48:13.684754416Z",
-                    "update_time": "2022-11-27T13:48:13.687587957Z",
-                    "reduce_only": false,
-                    "close_on_trigger": false,
-                    "position_idx": "1"
-                },
-                "id": "b788dac1-8ebd-4bdb-9a5e-265ffee07b7d",
-                "clientOrderId": null,
-                "timestamp": 1669556893684,
-                "datetime": "2022-11-27T13:48:13.684Z",
-                "lastTradeTimestamp": 1669556893687,
+            # The order could have been concluded in the meantime, e.g. cancelled from another thread
+            with self.open_orders__lock:
+                if order in self.open_orders:
+                    self._apply_ccxt_order_update(order, new_ccxt_order)
+
+    def _apply_ccxt_order_update(self, order, new_ccxt_order):
+        '''
+        Apply the latest post-processed ccxt order onto the tracked order, i.e. execute new fills, transition its status
+        and notify. Caller must hold open_orders__lock.
+        '''
+        if self.partially_filled_earlier is not None:
+            # Carry forward partially_filled_earlier status to the next order
+            order.partially_filled_earlier = self.partially_filled_earlier
+
+        '''
+        next Line: 397: DEBUG: ccxt_order:
+        {
+            "info": {
+                "order_id": "b788dac1-8ebd-4bdb-9a5e-265ffee07b7d",
+                "order_link_id": "",
                 "symbol": "ETHUSDT",
-                "type": "market",
-                "timeInForce": "IOC",
-                "postOnly": false,
-                "side": "buy",
+                "side": "Buy",
+                "order_type": "Market",
                 "price": 1272.6,
-                "stopPrice": null,
-                "amount": 0.61,
-                "cost": 739.31995,
-                "average": 1211.9999180327868,
-                "filled": 0.61,
-                "remaining": 0.0,
-                "status": "closed",
-                "fee": {
+                "qty": 0.61,
+                "leaves_qty": 0,
+                "last_exec_price": 1212,
+                "cum_exec_qty": 0.61,
+                "cum_exec_value": 739.31995,
+                "cum_exec_fee": 0.443592,
+                "time_in_force": "ImmediateOrCancel",
+                "create_type": "CreateByUser",
+                "cancel_type": "UNKNOWN",
+                "order_status": "Filled",
+                "take_profit": 0,
+                "stop_loss": 0,
+                "trailing_stop": 0,
+                "create_time": "2022-11-27T13:48:13.684754416Z",
+                "update_time": "2022-11-27T13:48:13.687587957Z",
+                "reduce_only": false,
+                "close_on_trigger": false,
+                "position_idx": "1"
+            },
+            "id": "b788dac1-8ebd-4bdb-9a5e-265ffee07b7d",
+            "clientOrderId": null,
+            "timestamp": 1669556893684,
+            "datetime": "2022-11-27T13:48:13.684Z",
+            "lastTradeTimestamp": 1669556893687,
+            "symbol": "ETHUSDT",
+            "type": "market",
+            "timeInForce": "IOC",
+            "postOnly": false,
+            "side": "buy",
+            "price": 1272.6,
+            "stopPrice": null,
+            "amount": 0.61,
+            "cost": 739.31995,
+            "average": 1211.9999180327868,
+            "filled": 0.61,
+            "remaining": 0.0,
+            "status": "closed",
+            "fee": {
+                "cost": 0.443592,
+                "currency": "USDT"
+            },
+            "trades": [],
+            "fees": [
+                {
                     "cost": 0.443592,
                     "currency": "USDT"
-                },
-                "trades": [],
-                "fees": [
-                    {
-                        "cost": 0.443592,
-                        "currency": "USDT"
-                    }
-                ]
-            }
-            '''
-            # Check for new fills
-            if 'trades' in new_ccxt_order and new_ccxt_order['trades'] is not None:
-                for fill in new_ccxt_order['trades']:
-                    if fill not in order.executed_fills:
-                        # Execute according to the OrderExecutionBit
-                        dt = fill['datetime']
-                        size = fill['amount']
-                        price = fill['price']
-                        closed = 0.0
-                        closed_value = 0.0
-                        closed_commission = 0.0
-                        opened = 0.0
-                        opened_value = 0.0
-                        opened_commission = 0.0
-                        margin = 0.0
-                        profit_and_loss_amount = 0.0
-                        spread_in_ticks = 0.0
-                        position_size = 0.0
-                        position_average_price = 0.0
-                        order.execute(dt, size, price,
-                                      closed, closed_value, closed_commission,
-                                      opened, opened_value, opened_commission,
-                                      margin, profit_and_loss_amount, spread_in_ticks,
-                                      position_size, position_average_price)
-                        order.executed_fills.append(fill['id'])
-
-            # TODO: Debug use
-            if self.debug:
-                frameinfo = inspect.getframeinfo(inspect.currentframe())
-                msg = "{} Line: {}: DEBUG: new_ccxt_order:".format(
-                    frameinfo.function, frameinfo.lineno,
-                )
-                print(msg)
-                print(json.dumps(new_ccxt_order, indent=self.indent))
-
-            # Check if the exchange order is opened
-            if new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[OPENED_ORDER]]['key']] == \
-                    self.parent.mappings[CCXT_ORDER_TYPES[OPENED_ORDER]]['value']:
-                # But the backtrader status is not Accepted
-                if order.status != backtrader.Order.Accepted:
-                    # Reset partially_filled_earlier status
-                    self.partially_filled_earlier = None
-
-                    # Refresh the content of ccxt_order with the latest ccxt_order
-                    order.extract_from_ccxt_order(new_ccxt_order)
-                    order.accept()
+                }
+            ]
+        }
+        '''
+        # Check for new fills
+        if 'trades' in new_ccxt_order and new_ccxt_order['trades'] is not None:
+            for fill in new_ccxt_order['trades']:
+                if fill not in order.executed_fills:
+                    # Execute according to the OrderExecutionBit
+                    dt = fill['datetime']
+                    size = fill['amount']
+                    price = fill['price']
+                    closed = 0.0
+                    closed_value = 0.0
+                    closed_commission = 0.0
+                    opened = 0.0
+                    opened_value = 0.0
+                    opened_commission = 0.0
+                    margin = 0.0
+                    profit_and_loss_amount = 0.0
+                    spread_in_ticks = 0.0
+                    position_size = 0.0
+                    position_average_price = 0.0
+                    order.execute(dt, size, price,
+                                  closed, closed_value, closed_commission,
+                                  opened, opened_value, opened_commission,
+                                  margin, profit_and_loss_amount, spread_in_ticks,
+                                  position_size, position_average_price)
+                    order.executed_fills.append(fill['id'])
 
-                    # Notify using clone so that UT could snapshot the order
-                    accepted_bt_ccxt_order = order.clone()
-                    if self.ut_keep_original_ccxt_order:
-                        self.notified_bt_ccxt_orders.append(
-                            accepted_bt_ccxt_order)
-                    self.notify(accepted_bt_ccxt_order)
-            # Check if the exchange order is partially filled
-            elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[PARTIALLY_FILLED_ORDER]]['key']] == \
-                    self.parent.mappings[CCXT_ORDER_TYPES[PARTIALLY_FILLED_ORDER]]['value']:
-                if order.status != backtrader.Order.Partial:
-                    # Refresh the content of ccxt_order with the latest ccxt_order
-                    order.extract_from_ccxt_order(new_ccxt_order)
-                    order.partial()
-
-                    # Only notify but NOT execute as it wouldn't create any impact to the trade.update
-                    # self.execute(order, order.price)
+        # TODO: Debug use
+        if self.debug:
+            frameinfo = inspect.getframeinfo(inspect.currentframe())
+            msg = "{} Line: {}: DEBUG: new_ccxt_order:".format(
+                frameinfo.function, frameinfo.lineno,
+            )
+            print(msg)
+            print(json.dumps(new_ccxt_order, indent=self.indent))
 
-                    # Notify using clone so that UT could snapshot the order
-                    partially_filled_bt_ccxt_order = order.clone()
-                    if self.ut_keep_original_ccxt_order:
-                        self.notified_bt_ccxt_orders.append(
-                            partially_filled_bt_ccxt_order)
-                    self.notify(partially_filled_bt_ccxt_order)
+        # Check if the exchange order is opened
+        if new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[OPENED_ORDER]]['key']] == \
+                self.parent.mappings[CCXT_ORDER_TYPES[OPENED_ORDER]]['value']:
+            # But the backtrader status is not Accepted
+            if order.status != backtrader.Order.Accepted:
+                # Reset partially_filled_earlier status
+                self.partially_filled_earlier = None
 
-                    # Carry forward partially_filled_earlier status to the next ccxt order
-                    self.partially_filled_earlier = order.partially_filled_earlier
+                # Refresh the content of ccxt_order with the latest ccxt_order
+                order.extract_from_ccxt_order(new_ccxt_order)
+                order.accept()
 
-                    instrument = self.get__child(order.p.symbol_id)
-                    instrument.sync_symbol_positions()
-            # Check if the exchange order is closed
-            elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[CLOSED_ORDER]]['key']] == \
-                    self.parent.mappings[CCXT_ORDER_TYPES[CLOSED_ORDER]]['value']:
+                # Notify using clone so that UT could snapshot the order
+                accepted_bt_ccxt_order = order.clone()
+                if self.ut_keep_original_ccxt_order:
+                    self.notified_bt_ccxt_orders.append(
+                        accepted_bt_ccxt_order)
+                self.notify(accepted_bt_ccxt_order)
+        # Check if the exchange order is partially filled
+        elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[PARTIALLY_FILLED_ORDER]]['key']] == \
+                self.parent.mappings[CCXT_ORDER_TYPES[PARTIALLY_FILLED_ORDER]]['value']:
+            if order.status != backtrader.Order.Partial:
                 # Refresh the content of ccxt_order with the latest ccxt_order
                 order.extract_from_ccxt_order(new_ccxt_order)
-                order.completed()
+                order.partial()
+
+                # Only notify but NOT execute as it wouldn't create any impact to the trade.update
+                # self.execute(order, order.price)
 
                 # Notify using clone so that UT could snapshot the order
-                completed_bt_ccxt_order = order.clone()
+                partially_filled_bt_ccxt_order = order.clone()
                 if self.ut_keep_original_ccxt_order:
                     self.notified_bt_ccxt_orders.append(
-                        completed_bt_ccxt_order)
-                self.notify(completed_bt_ccxt_order)
+                        partially_filled_bt_ccxt_order)
+                self.notify(partially_filled_bt_ccxt_order)
 
-                self.execute(order, order.price)
-                assert order.executed.remaining_size == 0.0
+                # Carry forward partially_filled_earlier status to the next ccxt order
+                self.partially_filled_earlier = order.partially_filled_earlier
+
+                # Fills change the wallet balance. Websocket wallet stream takes care of it if available
+                if self.is_ws_available == False:
+                    self.invalidate_balance()
 
                 instrument = self.get__child(order.p.symbol_id)
                 instrument.sync_symbol_positions()
+        # Check if the exchange order is closed
+        elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[CLOSED_ORDER]]['key']] == \
+                self.parent.mappings[CCXT_ORDER_TYPES[CLOSED_ORDER]]['value']:
+            # Refresh the content of ccxt_order with the latest ccxt_order
+            order.extract_from_ccxt_order(new_ccxt_order)
+            order.completed()
 
-                self.remove_open_order(order)
-            # Check if the exchange order is rejected
-            elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[REJECTED_ORDER]]['key']] == \
-                    self.parent.mappings[CCXT_ORDER_TYPES[REJECTED_ORDER]]['value']:
-                # Refresh the content of ccxt_order with the latest ccxt_order
-                order.extract_from_ccxt_order(new_ccxt_order)
-                order.reject()
-                # Notify using clone so that UT could snapshot the order
-                rejected_bt_ccxt_order = order.clone()
-                if self.ut_keep_original_ccxt_order:
-                    self.notified_bt_ccxt_orders.append(rejected_bt_ccxt_order)
-                self.notify(rejected_bt_ccxt_order)
-                self.remove_open_order(order)
-            # Manage case when an order is being Canceled or Expired from the Exchange
-            # from https://github.com/juancols/bt-ccxt-store/
-            elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[CANCELED_ORDER]]['key']] == \
-                    self.parent.mappings[CCXT_ORDER_TYPES[CANCELED_ORDER]]['value']:
-                # Refresh the content of ccxt_order with the latest ccxt_order
-                order.extract_from_ccxt_order(new_ccxt_order)
-                order.cancel()
-                # Notify using clone so that UT could snapshot the order
-                canceled_bt_ccxt_order = order.clone()
-                if self.ut_keep_original_ccxt_order:
-                    self.notified_bt_ccxt_orders.append(canceled_bt_ccxt_order)
-                self.notify(canceled_bt_ccxt_order)
-                self.remove_open_order(order)
-            elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[EXPIRED_ORDER]]['key']] == \
-                    self.parent.mappings[CCXT_ORDER_TYPES[EXPIRED_ORDER]]['value']:
-                # Refresh the content of ccxt_order with the latest ccxt_order
-                order.extract_from_ccxt_order(new_ccxt_order)
-                order.expire()
-                expired_bt_ccxt_order = order.clone()
-                if self.ut_keep_original_ccxt_order:
-                    self.notified_bt_ccxt_orders.append(expired_bt_ccxt_order)
-                self.notify(expired_bt_ccxt_order)
-                self.remove_open_order(order)
-            else:
-                msg = "{} Line: {}: {}: WARNING: ".format(
-                    inspect.getframeinfo(inspect.currentframe()).function,
-                    inspect.getframeinfo(inspect.currentframe()).lineno,
-                    datetime.datetime.now().isoformat().replace("T", " ")[:-3],
-                )
-                sub_msg = "new_ccxt_order ID: {}, status: {} is not processed".format(
-                    new_ccxt_order['id'],
-                    new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[OPENED_ORDER]]['key']],
-                )
-                print(msg + sub_msg)
-                pass
+            # Notify using clone so that UT could snapshot the order
+            completed_bt_ccxt_order = order.clone()
+            if self.ut_keep_original_ccxt_order:
+                self.notified_bt_ccxt_orders.append(
+                    completed_bt_ccxt_order)
+            self.notify(completed_bt_ccxt_order)
+
+            self.execute(order, order.price)
+            assert order.executed.remaining_size == 0.0
+
+            # Fills change the wallet balance. Websocket wallet stream takes care of it if available
+            if self.is_ws_available == False:
+                self.invalidate_balance()
+
+            instrument = self.get__child(order.p.symbol_id)
+            instrument.sync_symbol_positions()
+
+            self.remove_open_order(order)
+        # Check if the exchange order is rejected
+        elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[REJECTED_ORDER]]['key']] == \
+                self.parent.mappings[CCXT_ORDER_TYPES[REJECTED_ORDER]]['value']:
+            # Refresh the content of ccxt_order with the latest ccxt_order
+            order.extract_from_ccxt_order(new_ccxt_order)
+            order.reject()
+            # Notify using clone so that UT could snapshot the order
+            rejected_bt_ccxt_order = order.clone()
+            if self.ut_keep_original_ccxt_order:
+                self.notified_bt_ccxt_orders.append(rejected_bt_ccxt_order)
+            self.notify(rejected_bt_ccxt_order)
+            self.remove_open_order(order)
+        # Manage case when an order is being Canceled or Expired from the Exchange
+        # from https://github.com/juancols/bt-ccxt-store/
+        elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[CANCELED_ORDER]]['key']] == \
+                self.parent.mappings[CCXT_ORDER_TYPES[CANCELED_ORDER]]['value']:
+            # Refresh the content of ccxt_order with the latest ccxt_order
+            order.extract_from_ccxt_order(new_ccxt_order)
+            order.cancel()
+            # Notify using clone so that UT could snapshot the order
+            canceled_bt_ccxt_order = order.clone()
+            if self.ut_keep_original_ccxt_order:
+                self.notified_bt_ccxt_orders.append(canceled_bt_ccxt_order)
+            self.notify(canceled_bt_ccxt_order)
+            self.remove_open_order(order)
+        elif new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[EXPIRED_ORDER]]['key']] == \
+                self.parent.mappings[CCXT_ORDER_TYPES[EXPIRED_ORDER]]['value']:
+            # Refresh the content of ccxt_order with the latest ccxt_order
+            order.extract_from_ccxt_order(new_ccxt_order)
+            order.expire()
+            expired_bt_ccxt_order = order.clone()
+            if self.ut_keep_original_ccxt_order:
+                self.notified_bt_ccxt_orders.append(expired_bt_ccxt_order)
+            self.notify(expired_bt_ccxt_order)
+            self.remove_open_order(order)
+        else:
+            msg = "{} Line: {}: {}: WARNING: ".format(
+                inspect.getframeinfo(inspect.currentframe()).function,
+                inspect.getframeinfo(inspect.currentframe()).lineno,
+                datetime.datetime.now().isoformat().replace("T", " ")[:-3],
+            )
+            sub_msg = "new_ccxt_order ID: {}, status: {} is not processed".format(
+                new_ccxt_order['id'],
+                new_ccxt_order[self.parent.mappings[CCXT_ORDER_TYPES[OPENED_ORDER]]['key']],
+            )
+            print(msg + sub_msg)
+            pass
 
     def _submit(self, owner, symbol_id, datafeed, execution_type, side, amount, price, position_type, ordering_type,
                 order_intent, simulated, params):
@@ -964,9 +1336,10 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         if ret_ord is None or ret_ord['id'] is None:
             return None
 
-        # Based on experience in Testnet, it is better to wait momentarily as the server will require time to
-        #       process the order, inclusive of providing websocket response.
-        time.sleep(0.1)
+        # The server requires time to process the order, inclusive of providing websocket response. Wait until the
+        #       websocket acknowledges the order so that the lookup below is served from memory. Should it not arrive
+        #       in time, fetch_ccxt_order falls back to HTTP.
+        self.wait_for_order_state(ret_ord['id'])
 
         # Perform exchange-specific parameter extraction here
         order_type_name = None
@@ -1105,7 +1478,8 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         if self.ut_keep_original_ccxt_order:
             self.notified_bt_ccxt_orders.append(submitted_bt_ccxt_order)
         self.notify(submitted_bt_ccxt_order)
-        self.open_orders.append(bt_ccxt_order)
+        with self.open_orders__lock:
+            self._add_open_order(bt_ccxt_order)
 
         ccxt_order_id = bt_ccxt_order.ccxt_id
 
@@ -1143,56 +1517,415 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         self.next(ut_provided__new_ccxt_order=True)
         return bt_ccxt_order
 
-    def fetch_ccxt_order(self, symbol_id, order_id=None, stop_order_id=None):
-        # Mutually exclusive legality check
-        if order_id is None:
-            legality_check_not_none_obj(stop_order_id, "stop_order_id")
+    def _invoke_exchange(self, method_name, *args, **kwargs):
+        '''
+        Single ccxt call, issued on the event loop of the async exchange in async mode so that the blocking exchange is
+        only left with the markets. Retry is up to the caller.
+        '''
+        if self.async_exchange_bridge is None:
+            return getattr(self.exchange, method_name)(*args, **kwargs)
+        return self.async_exchange_bridge.call(method_name, *args, **kwargs)
 
-        if stop_order_id is None:
-            legality_check_not_none_obj(order_id, "order_id")
+    def _record_exchange_error(self, circuit_breaker, exchange_error) -> tuple:
+        '''
+        Record the failed ccxt call onto the circuit breaker of its end point and return the tuple of (action,
+        error_code, error_msg) the retry layer should take. Only an exchange error carrying an exchange code proves the
+        end point responsive, i.e. it is the request that is refused by the exchange. Network errors and exchange
+        errors without any code (e.g. 5xx from the gateway) count as failures.
+        '''
+        if isinstance(exchange_error, NetworkError):
+            circuit_breaker.record_failure()
+            ret_value = (RETRY_WITH_BACKOFF_ACTION,
+                         None, str(exchange_error), )
+            return ret_value
 
-        # One of these must be valid
-        assert order_id is not None or stop_order_id is not None
+        classify_exchange_error__dict = dict(
+            exchange_dropdown_value=self.exchange_dropdown_value,
+            exchange_error=exchange_error,
+        )
+        (action, error_code, error_msg, ) = classify_exchange_error(
+            params=classify_exchange_error__dict)
+        if error_code is None:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+        ret_value = (action, error_code, error_msg, )
+        return ret_value
 
-        start = timer()
-        ccxt_order = None
+    @retry
+    def _call_exchange(self, method_name, *args, **kwargs):
+        return self._invoke_exchange(method_name, *args, **kwargs)
 
-        # CCXT Market Type is explicitly required
-        params = dict(
-            type=self.market_type_name,
-        )
-        # Due to nature of order is processed async, the order could not be found immediately right after
-        #       order is opened. Hence, perform retry to confirm if that's the case.
-        for retry_no in range(self.max_retry):
-            try:
-                if stop_order_id is not None:
-                    # Conditional Order
-                    params.update(dict(
-                        stop_order_id=stop_order_id,
-                    ))
-                    ccxt_order = \
-                        self.fetch_order(
-                            order_id=None, symbol_id=symbol_id, params=params, index=retry_no+1,
-                            max_index=self.max_retry)
-                else:
-                    # Active Order
-                    ccxt_order = self.fetch_order(
-                        order_id=order_id, symbol_id=symbol_id, params=params, index=retry_no+1,
-                        max_index=self.max_retry)
+    def gather_exchange_calls(self, calls, recover_failed_calls=True):
+        '''
+        Issue a list of independent (method_name, args, kwargs) ccxt calls and return their results in the same
+        order. In async mode the calls are in flight concurrently, otherwise they are issued one after another.
 
-                if ccxt_order is not None:
-                    if stop_order_id is not None:
-                        order_type_name = 'Conditional'
-                    else:
-                        legality_check_not_none_obj(order_id, "order_id")
-                        order_type_name = 'Active'
+        :param recover_failed_calls: Any call that fails concurrently is recovered through the blocking path so that
+            the retry policy applies. Otherwise its exception is returned in place of the result.
+        '''
+        assert isinstance(calls, list)
 
-                    if self.debug:
-                        # TODO: Debug use
-                        frameinfo = inspect.getframeinfo(
-                            inspect.currentframe())
-                        msg = "{} Line: {}: DEBUG: {}: For ".format(
-                            frameinfo.function, frameinfo.lineno,
+        if self.async_exchange_bridge is None:
+            return [self._call_exchange(method_name, *args, **kwargs) for (method_name, args, kwargs) in calls]
+
+        # Same per end point circuit breakers and shared request budget as the blocking path
+        circuit_breakers = []
+        for (method_name, _, _) in calls:
+            get_shared_circuit_breaker__dict = dict(
+                host=self.exchange_host,
+                endpoint=method_name,
+            )
+            circuit_breaker = get_shared_circuit_breaker(
+                params=get_shared_circuit_breaker__dict)
+            circuit_breaker.raise_if_open()
+            circuit_breakers.append(circuit_breaker)
+
+        for _ in calls:
+            self.rate_limiter.acquire()
+        results = self.async_exchange_bridge.gather(calls)
+
+        for i, result in enumerate(results):
+            if isinstance(result, NetworkError) or isinstance(result, ExchangeError):
+                self._record_exchange_error(circuit_breakers[i], result)
+            else:
+                circuit_breakers[i].record_success()
+
+            if isinstance(result, Exception) and recover_failed_calls == True:
+                (method_name, args, kwargs) = calls[i]
+                results[i] = self._call_exchange(method_name, *args, **kwargs)
+        return results
+
+    def _get_balance_along_with(self, method_name, *args, **kwargs):
+        '''
+        Refresh the balance if it is stale together with another independent ccxt call, concurrently in async mode.
+        Return the result of the other call.
+        '''
+        calls = [(method_name, args, kwargs, ), ]
+        refresh_balance = self._get_cached_balance() is None
+        if refresh_balance == True:
+            calls.append(
+                ('fetch_balance', (self.fetch_balance__dict, ), dict(), ))
+
+        results = self.gather_exchange_calls(calls)
+        if refresh_balance == True:
+            self._set_cached_balance(results[1])
+
+        # Update the cash and value of the account from the balance
+        self._get_balance()
+        return results[0]
+
+    def close_async_exchange(self):
+        if self.async_exchange_bridge is not None:
+            self.async_exchange_bridge.close()
+            self.async_exchange_bridge = None
+
+    def stop(self):
+        '''
+        Called by Enhanced_Cerebro once the strategies are stopped
+        '''
+        self.stop_order_notification_worker()
+        self.close_async_exchange()
+        super().stop()
+
+    def _fetch_ccxt_orders_in_batch(self):
+        '''
+        Fetch the open orders of every symbol with a pending order in one request per symbol (plus one for
+        Bybit conditional orders) and return the post-processed orders keyed by their id. Orders that are no
+        longer in the open set are absent from the result and must be fetched individually by the caller.
+        '''
+        symbols_id = []
+        symbols_id__with_conditional_order = []
+        for order in self.open_orders:
+            if order.symbol_id not in symbols_id:
+                symbols_id.append(order.symbol_id)
+            if order.ordering_type == backtrader.Order.CONDITIONAL_ORDERING_TYPE:
+                if order.symbol_id not in symbols_id__with_conditional_order:
+                    symbols_id__with_conditional_order.append(order.symbol_id)
+
+        open_orders_id = [order.ccxt_id for order in self.open_orders]
+        calls = []
+        for symbol_id in symbols_id:
+            # CCXT Market Type is explicitly required
+            fetch_ccxt_orders__dict = dict(
+                type=self.market_type_name,
+            )
+            calls.append(('fetch_open_orders', (symbol_id, ),
+                         dict(params=fetch_ccxt_orders__dict), ))
+
+            # Bybit serves conditional orders from a separate end point
+            if self.exchange_dropdown_value == BYBIT_EXCHANGE_ID and \
+                    symbol_id in symbols_id__with_conditional_order:
+                fetch_ccxt_orders__dict = dict(
+                    type=self.market_type_name,
+                    stop=True,
+                )
+                calls.append(('fetch_open_orders', (symbol_id, ),
+                             dict(params=fetch_ccxt_orders__dict), ))
+
+        matched__ccxt_orders = []
+        for ccxt_orders in self.gather_exchange_calls(calls):
+            if ccxt_orders is None:
+                # The request has been given up by retry, let the caller fetch the orders individually
+                continue
+
+            for ccxt_order in ccxt_orders:
+                if ccxt_order['id'] in open_orders_id:
+                    matched__ccxt_orders.append(ccxt_order)
+
+        batched__ccxt_orders = {}
+        if len(matched__ccxt_orders) > 0:
+            # Post-process the CCXT orders so that they are consistent across multiple exchanges
+            post_process__ccxt_orders__dict = dict(
+                bt_ccxt_exchange=self.parent,
+                bt_ccxt_account_or_store=self,
+                ccxt_orders=matched__ccxt_orders,
+            )
+            for ccxt_order in self.post_process__ccxt_orders(params=post_process__ccxt_orders__dict):
+                batched__ccxt_orders[ccxt_order['id']] = ccxt_order
+        return batched__ccxt_orders
+
+    def _fetch_ccxt_orders_concurrently(self, orders):
+        '''
+        Fetch each of the orders by its id in one concurrent round and return the post-processed orders keyed by
+        their id. Orders that could not be fetched are absent from the result and must be fetched individually by the
+        caller, which takes care of the retries.
+        '''
+        calls = []
+        for order in orders:
+            # CCXT Market Type is explicitly required
+            fetch_order__dict = dict(
+                type=self.market_type_name,
+            )
+            if order.ordering_type == backtrader.Order.CONDITIONAL_ORDERING_TYPE:
+                fetch_order__dict.update(dict(
+                    stop_order_id=order.ccxt_id,
+                ))
+            calls.append(('fetch_order', (order.ccxt_id,
+                         order.symbol_id, fetch_order__dict, ), dict(), ))
+
+        fetched__ccxt_orders = []
+        for ccxt_order in self.gather_exchange_calls(calls, recover_failed_calls=False):
+            if ccxt_order is not None and not isinstance(ccxt_order, Exception):
+                fetched__ccxt_orders.append(ccxt_order)
+
+        concurrent__ccxt_orders = {}
+        if len(fetched__ccxt_orders) > 0:
+            # Post-process the CCXT orders so that they are consistent across multiple exchanges
+            post_process__ccxt_orders__dict = dict(
+                bt_ccxt_exchange=self.parent,
+                bt_ccxt_account_or_store=self,
+                ccxt_orders=fetched__ccxt_orders,
+            )
+            for ccxt_order in self.post_process__ccxt_orders(params=post_process__ccxt_orders__dict):
+                concurrent__ccxt_orders[ccxt_order['id']] = ccxt_order
+        return concurrent__ccxt_orders
+
+    def _get_ws_ccxt_order(self, order):
+        '''
+        Look up the latest ccxt order pushed by the websocket for the tracked order without touching HTTP. Return the
+        post-processed ccxt order or None if the websocket has yet to report it.
+        '''
+        ccxt_order = None
+        if order.ordering_type == backtrader.Order.CONDITIONAL_ORDERING_TYPE:
+            ccxt_order = self.ws_conditional_orders.get(
+                order.symbol_id, order.ccxt_id)
+        if ccxt_order is None:
+            ccxt_order = self.ws_active_orders.get(
+                order.symbol_id, order.ccxt_id)
+        if ccxt_order is None:
+            return None
+
+        # Post-process the CCXT order so that they are consistent across multiple exchanges
+        post_process__ccxt_orders__dict = dict(
+            bt_ccxt_exchange=self.parent,
+            bt_ccxt_account_or_store=self,
+            ccxt_orders=[ccxt_order],
+        )
+        ccxt_orders = self.post_process__ccxt_orders(
+            params=post_process__ccxt_orders__dict)
+        return ccxt_orders[0]
+
+    def _is_order_notification_pushed(self) -> bool:
+        return self.push_order_notification == True and self.is_ws_available == True
+
+    def _push_ws_ccxt_order(self, ccxt_order):
+        '''
+        Enqueue the id of the order updated by websocket for the order notification worker to apply. Nothing else is
+        done on the websocket thread so that it is never held up by fills, HTTP or notifications.
+        '''
+        if self.parent is None:
+            return
+        self.pushed_ccxt_orders_id.put(ccxt_order['id'])
+
+    def start_order_notification_worker(self):
+        if self.order_notification_worker is not None:
+            return
+
+        self.order_notification_worker = threading.Thread(target=self._run_order_notification_worker,
+                                                          name="{}: order_notification".format(
+                                                              self.account_alias),
+                                                          daemon=True)
+        self.order_notification_worker.start()
+
+    def stop_order_notification_worker(self):
+        '''
+        Let the worker apply whatever has been pushed so far, then stop it
+        '''
+        order_notification_worker = self.order_notification_worker
+        if order_notification_worker is None:
+            return
+
+        self.order_notification_worker = None
+        # Sentinel
+        self.pushed_ccxt_orders_id.put(None)
+        order_notification_worker.join()
+
+    def _run_order_notification_worker(self):
+        while True:
+            ccxt_order_id = self.pushed_ccxt_orders_id.get()
+            if ccxt_order_id is None:
+                return
+
+            try:
+                self._apply_pushed_ccxt_order(ccxt_order_id)
+            except Exception:
+                traceback.print_exc()
+
+    def _apply_pushed_ccxt_order(self, ccxt_order_id):
+        '''
+        Apply the latest update of the tracked order. Ids of untracked orders (e.g. placed by another client) are simply
+        ignored.
+        '''
+        with self.open_orders__lock:
+            orders = [
+                order for order in self.open_orders if order.ccxt_id == ccxt_order_id]
+        if len(orders) == 0:
+            return
+
+        order = orders[0]
+        new_ccxt_order = self._get_ws_ccxt_order(order)
+        if new_ccxt_order is None:
+            # Not in the websocket cache, e.g. evicted already. Fall back to HTTP rather than losing the update
+            if order.ordering_type == backtrader.Order.ACTIVE_ORDERING_TYPE:
+                new_ccxt_order = self.fetch_ccxt_order(
+                    order.symbol_id, order_id=ccxt_order_id)
+            else:
+                # Validate assumption made
+                assert order.ordering_type == backtrader.Order.CONDITIONAL_ORDERING_TYPE
+
+                new_ccxt_order = self.fetch_ccxt_order(
+                    order.symbol_id, stop_order_id=ccxt_order_id)
+        if new_ccxt_order is None:
+            return
+
+        # The order could have been concluded in the meantime, e.g. cancelled from another thread
+        with self.open_orders__lock:
+            if order in self.open_orders:
+                self._apply_ccxt_order_update(order, new_ccxt_order)
+
+    def _record_ws_fill(self, symbol_id, ccxt_order):
+        if ccxt_order['filled']:
+            with self.ws_positions__condition:
+                self.ws_fills__timestamp[symbol_id] = time.monotonic()
+
+    def get_fresh_ws_positions(self, symbol_id, timeout=None):
+        '''
+        Return a copy of the websocket positions of the symbol once they are newer than the last fill seen for the
+        symbol. Return None on timeout or if there is no websocket position yet, in which case the caller should use
+        HTTP.
+        '''
+        if self.is_ws_available == False:
+            return None
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            # Only futures have positions streamed
+            if self.market_type != CCXT__MARKET_TYPE__FUTURE or self.ws_binance_user_data is None:
+                return None
+        elif self.ws_usdt_perpetual is None:
+            return None
+
+        if timeout is None:
+            timeout = self.position_state_wait__timeout_in_seconds
+
+        def is_fresh():
+            if symbol_id not in self.ws_positions__timestamp:
+                return False
+            return self.ws_positions__timestamp[symbol_id] >= self.ws_fills__timestamp.get(symbol_id, 0.0)
+
+        with self.ws_positions__condition:
+            if self.ws_positions__condition.wait_for(is_fresh, timeout=timeout) == False:
+                return None
+            return list(self.ws_positions[symbol_id])
+
+    def wait_for_order_state(self, order_id, states=None, timeout=None):
+        '''
+        Block until the websocket reports the order in one of the states (any state if None). Return the latest ccxt
+        order, or None if it times out or websocket is not available, in which case the caller should use HTTP.
+        '''
+        if not self.is_ws_available:
+            return None
+
+        if timeout is None:
+            timeout = DEFAULT__ORDER_STATE_WAIT__TIMEOUT_IN_SECONDS
+        return self.order_state_waiter.wait_for_order_state(order_id, states=states, timeout=timeout)
+
+    def fetch_ccxt_order(self, symbol_id, order_id=None, stop_order_id=None):
+        # Mutually exclusive legality check
+        if order_id is None:
+            legality_check_not_none_obj(stop_order_id, "stop_order_id")
+
+        if stop_order_id is None:
+            legality_check_not_none_obj(order_id, "order_id")
+
+        # One of these must be valid
+        assert order_id is not None or stop_order_id is not None
+
+        start = timer()
+        ccxt_order = None
+
+        # CCXT Market Type is explicitly required
+        params = dict(
+            type=self.market_type_name,
+        )
+        search_order_id = order_id if order_id is not None else stop_order_id
+
+        # Due to nature of order is processed async, the order could not be found immediately right after
+        #       order is opened. Hence, perform retry to confirm if that's the case.
+        for retry_no in range(self.max_retry):
+            if retry_no > 0:
+                # Give the websocket a chance to deliver the order before searching again
+                self.wait_for_order_state(
+                    search_order_id, timeout=ORDER_STATE_RETRY_INTERVAL_IN_SECONDS)
+
+            try:
+                if stop_order_id is not None:
+                    # Conditional Order
+                    params.update(dict(
+                        stop_order_id=stop_order_id,
+                    ))
+                    ccxt_order = \
+                        self.fetch_order(
+                            order_id=None, symbol_id=symbol_id, params=params, index=retry_no+1,
+                            max_index=self.max_retry)
+                else:
+                    # Active Order
+                    ccxt_order = self.fetch_order(
+                        order_id=order_id, symbol_id=symbol_id, params=params, index=retry_no+1,
+                        max_index=self.max_retry)
+
+                if ccxt_order is not None:
+                    if stop_order_id is not None:
+                        order_type_name = 'Conditional'
+                    else:
+                        legality_check_not_none_obj(order_id, "order_id")
+                        order_type_name = 'Active'
+
+                    if self.debug:
+                        # TODO: Debug use
+                        frameinfo = inspect.getframeinfo(
+                            inspect.currentframe())
+                        msg = "{} Line: {}: DEBUG: {}: For ".format(
+                            frameinfo.function, frameinfo.lineno,
                             datetime.datetime.now().isoformat().replace(
                                 "T", " ")[:-3],
                         )
@@ -1225,7 +1958,8 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                         print(msg)
                     break
             except OrderNotFound:
-                time.sleep(0.1)
+                if not self.is_ws_available:
+                    time.sleep(ORDER_STATE_RETRY_INTERVAL_IN_SECONDS)
                 pass
 
         if self.debug:
@@ -1758,6 +2492,10 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                     pass
 
                 if proceed_with_next == True:
+                    # Wake up as soon as the websocket confirms the order is no longer opened
+                    self.wait_for_order_state(
+                        ccxt_order_id, states=CCXT_TERMINAL_MAPPING_VALUES)
+
                     # frameinfo = inspect.getframeinfo(inspect.currentframe())
                     # msg = "{} Line: {}: DEBUG: ".format(
                     #     frameinfo.function, frameinfo.lineno,
@@ -1808,75 +2546,23 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         if self.ut_keep_original_ccxt_order:
             self.exchange_ccxt_orders = copy.deepcopy(ccxt_orders)
 
-        from_items = []
-        to_items = []
-        for ccxt_key_tuple in LIST_OF_CCXT_KEY_TO_BE_RENAMED:
-            from_items.append(ccxt_key_tuple[0])
-            to_items.append(ccxt_key_tuple[1])
-
-        ret_ccxt_orders = []
-        for ccxt_order in ccxt_orders:
-            assert isinstance(ccxt_order, dict)
-
-            # Rename dict while maintaining its ordering
-            renamed_ccxt_order = {}
-            for k, v in ccxt_order.items():
-                if k in from_items:
-                    index = from_items.index(k)
-                    to_item = to_items[index]
-
-                    # Rename the key
-                    renamed_ccxt_order.update({
-                        to_item: v,
-                    })
-                else:
-                    # Retain the same item
-                    renamed_ccxt_order.update({
-                        k: v,
-                    })
-
-            if CCXT_SYMBOL_KEY in renamed_ccxt_order.keys():
-                get_symbol_id__dict = dict(
-                    exchange_dropdown_value=self.exchange_dropdown_value,
-                    symbol_name=renamed_ccxt_order[CCXT_SYMBOL_KEY],
-                )
-                renamed_ccxt_order['symbol_id'] = \
-                    get_symbol_id(params=get_symbol_id__dict)
-
-            if CCXT_SIDE_KEY in renamed_ccxt_order.keys():
-                renamed_ccxt_order[CCXT_SIDE_KEY] = \
-                    capitalize_sentence(renamed_ccxt_order[CCXT_SIDE_KEY])
-
-                # Convert CCXT_SIDE_KEY to enum
-                renamed_ccxt_order['side'] = backtrader.Order.Order_Types.index(
-                    renamed_ccxt_order[CCXT_SIDE_KEY])
-
-            for ccxt_order_key in CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT:
-                if ccxt_order_key in renamed_ccxt_order.keys():
-                    if renamed_ccxt_order[ccxt_order_key] is not None:
-                        renamed_ccxt_order[ccxt_order_key] = \
-                            self.exchange.safe_float(
-                                renamed_ccxt_order, ccxt_order_key)
-                    else:
-                        # Convert None to 0.0 for consistency
-                        renamed_ccxt_order[ccxt_order_key] = 0.0
+        return self._get_ccxt_order_normalizer().normalize_all(ccxt_orders)
 
-            ccxt_reduce_only_value__dict = dict(
+    def _get_ccxt_order_normalizer(self):
+        '''
+        The normalizer depends on the order types and mappings of the parent, hence it is rebuilt should the parent
+        change
+        '''
+        if self.ccxt_order_normalizer is None or self.ccxt_order_normalizer__parent is not self.parent:
+            ccxt_order_normalizer__dict = dict(
                 exchange_dropdown_value=self.exchange_dropdown_value,
-                ccxt_order=renamed_ccxt_order,
-            )
-            ccxt_order = converge_ccxt_reduce_only_value(
-                params=ccxt_reduce_only_value__dict)
-
-            reverse_engineer__ccxt_order__dict = dict(
-                ccxt_order=ccxt_order,
+                order_types=self.parent.order_types,
+                mappings=self.parent.mappings,
             )
-            reverse_engineer__ccxt_order__dict.update(params)
-            ccxt_order = reverse_engineer__ccxt_order(
-                params=reverse_engineer__ccxt_order__dict)
-
-            ret_ccxt_orders.append(ccxt_order)
-        return ret_ccxt_orders
+            self.ccxt_order_normalizer = CCXT_Order_Normalizer(
+                params=ccxt_order_normalizer__dict)
+            self.ccxt_order_normalizer__parent = self.parent
+        return self.ccxt_order_normalizer
 
     def _common_handle_orders_routine(self, params):
         # Un-serialize Params
@@ -2079,163 +2765,602 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         is_private = True
         return self.__common_end_point(is_private, type, endpoint, params, prefix)
 
-    def handle_socket_message(self, msg):
-        print(f"message type: {msg['e']}")
-        print(msg)
-
     def establish_binance_websocket(self):
-        for symbol_id in self.symbols_id:
-            self.twm.start_kline_socket(
-                callback=self.handle_socket_message, symbol=symbol_id)
+        self.establish_binance_user_data_websocket()
+        self.establish_binance_mainnet_market_websocket()
 
-    def establish_bybit_websocket(self):
-        self.establish_bybit_usdt_perpetual_websocket()
-        self.establish_bybit_mainnet_usdt_perpetual_websocket()
+    def supervise_binance_websocket(self):
+        '''
+        Hand the established connections over to the supervisor thread, which owns reconnection from now on.
+        '''
+        self.websocket_supervisor.add_connection(
+            BINANCE_WEBSOCKET_CONNECTIONS[USER_DATA_CONNECTION],
+            connect=self._connect_binance_user_data_websocket,
+            is_connected=self._is_binance_user_data_websocket_connected,
+            close=self.close_binance_user_data_websocket,
+            on_reconnected=self._resync_after_binance_user_data_websocket_reconnected,
+        )
 
-    def establish_bybit_usdt_perpetual_websocket(self):
-        proceed_with_connection = False
+        # Only the owner of the market data hub should be connected to ws_binance_mainnet_market
+        if self.is_market_data_owner == True:
+            self._supervise_market_data_websocket()
+        if self.is_ohlcv_provider == True:
+            self.websocket_supervisor.add_task(
+                MARKET_DATA_HUB_OWNERSHIP_TASK, self._check_market_data_hub_ownership)
+        self.websocket_supervisor.start()
 
-        if self.ws_usdt_perpetual is None:
-            proceed_with_connection = True
-        else:
-            # Validate assumption made
-            assert self.ws_usdt_perpetual is not None
+    def establish_binance_user_data_websocket(self):
+        '''
+        Block until connected. Only meant for the first connection during init, reconnection afterwards is owned by the
+        websocket supervisor.
+        '''
+        attempt = 0
+        while self._is_binance_user_data_websocket_connected() == False:
+            if self._connect_binance_user_data_websocket() == True:
+                break
 
-            if self.ws_usdt_perpetual.is_connected() == False:
-                proceed_with_connection = True
+            get_backoff_delay_in_seconds__dict = dict(
+                attempt=attempt,
+            )
+            time.sleep(get_backoff_delay_in_seconds(
+                params=get_backoff_delay_in_seconds__dict))
+            attempt += 1
 
-        if proceed_with_connection == True:
-            # Legality Check
-            assert isinstance(self.symbols_id, list)
-            assert len(self.symbols_id) > 0
-
-            while True:
-                self.ws_usdt_perpetual = \
-                    usdt_perpetual.WebSocket(
-                        test=not self.main_net_toggle_switch_value,
-                        api_key=self.config__api_key,
-                        api_secret=self.config__api_secret,
-                        # to pass a custom domain in case of connectivity problems, you can use:
-                        # domain="bytick"  # the default is "bybit"
-
-                        # Attempting to resolve WebSocket USDT Perp encountered error: ping/pong timed out in
-                        #       dashboard
-                        # ping_interval=20,
-                        # ping_timeout=10,
-                        retries=20,
-                        # trace_logging=True,
-                    )
+    def _is_binance_user_data_websocket_connected(self) -> bool:
+        ws_binance_user_data = self.ws_binance_user_data
+        return ws_binance_user_data is not None and ws_binance_user_data.is_connected() == True
 
-                try:
-                    self.ws_usdt_perpetual.order_stream(
-                        self.handle_active_order)
-                    time.sleep(0.1)
+    def _connect_binance_user_data_websocket(self) -> bool:
+        '''
+        Single attempt to start a user data stream and connect to it.
+        '''
+        listen_key__dict = dict(
+            bt_ccxt_account_or_store=self,
+            market_type=self.market_type,
+        )
+        self.binance_listen_key = create_binance_listen_key(
+            params=listen_key__dict)
+        listen_key__dict.update(dict(
+            listen_key=self.binance_listen_key,
+        ))
 
-                    self.ws_usdt_perpetual.stop_order_stream(
-                        self.handle_conditional_order)
-                    time.sleep(0.1)
+        get_binance_user_data_websocket_url__dict = dict(
+            market_type=self.market_type,
+            main_net_toggle_switch_value=self.main_net_toggle_switch_value,
+            listen_key=self.binance_listen_key,
+        )
+        ws_binance_user_data = Binance_Websocket(
+            get_binance_user_data_websocket_url(
+                params=get_binance_user_data_websocket_url__dict),
+            on_message=self.handle_binance_user_data,
+            on_heartbeat=functools.partial(self.websocket_supervisor.touch,
+                                           BINANCE_WEBSOCKET_CONNECTIONS[USER_DATA_CONNECTION]),
+        )
+        if ws_binance_user_data.connect() == False:
+            ws_binance_user_data.close()
+            return False
 
-                    self.ws_usdt_perpetual.position_stream(
-                        self.handle_positions)
-                except websocket._exceptions.WebSocketConnectionClosedException:
-                    pass
-                except websocket._exceptions.WebSocketTimeoutException:
-                    '''
-                    To address: WebSocket USDT Perp connection failed. Too many connection attempts. pybit will no
-                    longer try to reconnect.
-                    '''
-                    pass
+        self.ws_binance_user_data = ws_binance_user_data
+        self.binance_listen_key_keeper = Binance_Listen_Key_Keeper(
+            functools.partial(keep_alive_binance_listen_key, params=listen_key__dict))
+        self.binance_listen_key_keeper.start()
+        return True
 
-                if len(self.ws_usdt_perpetual.active_connections) > 0 and \
-                        self.ws_usdt_perpetual.is_connected() == True:
+    def establish_binance_mainnet_market_websocket(self):
+        '''
+        Block until connected. Only meant for the first connection during init, reconnection afterwards is owned by the
+        websocket supervisor.
+        '''
+        # Only the owner of the market data hub should be connected to ws_binance_mainnet_market
+        if self.is_market_data_owner == True:
+            attempt = 0
+            while self._is_binance_mainnet_market_websocket_connected() == False:
+                if self._connect_binance_mainnet_market_websocket() == True:
                     break
-                else:
-                    self.ws_usdt_perpetual = None
-                    time.sleep(0.1)
-                    gc.collect()
 
-    def establish_bybit_mainnet_usdt_perpetual_websocket(self):
-        proceed_with_connection = False
+                get_backoff_delay_in_seconds__dict = dict(
+                    attempt=attempt,
+                )
+                time.sleep(get_backoff_delay_in_seconds(
+                    params=get_backoff_delay_in_seconds__dict))
+                attempt += 1
 
-        # Only OHLCV_PROVIDER should be connected to ws_mainnet_usdt_perpetual
-        if self.is_ohlcv_provider == True:
-            if self.ws_mainnet_usdt_perpetual is None:
-                proceed_with_connection = True
-            else:
-                # Validate assumption made
-                assert self.ws_mainnet_usdt_perpetual is not None
+    def _is_binance_mainnet_market_websocket_connected(self) -> bool:
+        ws_binance_mainnet_market = self.ws_binance_mainnet_market
+        return ws_binance_mainnet_market is not None and ws_binance_mainnet_market.is_connected() == True
 
-                if self.ws_mainnet_usdt_perpetual.is_connected() == False:
-                    proceed_with_connection = True
+    def _connect_binance_mainnet_market_websocket(self) -> bool:
+        '''
+        Single attempt to connect to the kline streams of every symbol requested from the market data hub.
+        '''
+        (requests__version, symbols_id__per_topic,
+         ) = self.market_data_hub.get_requests()
+        get_binance_market_websocket_url__dict = dict(
+            market_type=self.market_type,
+            symbols_id=symbols_id__per_topic[KLINE_TOPIC],
+        )
+        ws_binance_mainnet_market = Binance_Websocket(
+            get_binance_market_websocket_url(
+                params=get_binance_market_websocket_url__dict),
+            on_message=self.handle_binance_mainnet_market,
+            on_heartbeat=functools.partial(self.websocket_supervisor.touch,
+                                           BINANCE_WEBSOCKET_CONNECTIONS[MAINNET_MARKET_CONNECTION]),
+        )
+        if ws_binance_mainnet_market.connect() == False:
+            ws_binance_mainnet_market.close()
+            return False
+
+        self.ws_binance_mainnet_market = ws_binance_mainnet_market
+        self.market_data__requests__version = requests__version
+        return True
+
+    def close_binance_websocket(self):
+        # Stop the supervisor first so that it does not reconnect what is being closed
+        if self.websocket_supervisor is not None:
+            self.websocket_supervisor.stop()
+
+        self.close_binance_user_data_websocket()
+        self.close_binance_mainnet_market_websocket()
+        self.release_market_data_hub()
+        self.market_data_hub.cancel_requests(self.market_data_hub__owner)
+
+    def close_binance_user_data_websocket(self):
+        if self.binance_listen_key_keeper is not None:
+            self.binance_listen_key_keeper.stop()
+            self.binance_listen_key_keeper = None
+
+        if self.ws_binance_user_data is not None:
+            self.ws_binance_user_data.close()
+            self.ws_binance_user_data = None
+
+        if self.binance_listen_key is not None:
+            listen_key__dict = dict(
+                bt_ccxt_account_or_store=self,
+                market_type=self.market_type,
+                listen_key=self.binance_listen_key,
+            )
+            self.binance_listen_key = None
+            try:
+                close_binance_listen_key(params=listen_key__dict)
+            except Exception:
+                # Expired listen key is of no concern
+                pass
 
-        if proceed_with_connection == True:
-            # Legality Check
-            assert isinstance(self.symbols_id, list)
-            assert len(self.symbols_id) > 0
-
-            while True:
-                # Connect with authentication
-                self.ws_mainnet_usdt_perpetual = usdt_perpetual.WebSocket(
-                    test=False,
-                    api_key=self.config__api_key,
-                    api_secret=self.config__api_secret,
-                    # to pass a custom domain in case of connectivity problems, you can use:
-                    # domain="bytick"  # the default is "bybit"
-
-                    # Attempting to resolve WebSocket USDT Perp encountered error: ping/pong timed out in
-                    #       dashboard
-                    # ping_interval=20,
-                    # ping_timeout=10,
-                    retries=20,
-                    # trace_logging=True,
-                )
+    def close_binance_mainnet_market_websocket(self):
+        if self.ws_binance_mainnet_market is not None:
+            self.ws_binance_mainnet_market.close()
+            self.ws_binance_mainnet_market = None
 
-                try:
-                    if self.ws_mainnet_usdt_perpetual.is_connected() == True:
-                        # Reference: https://bybit-exchange.github.io/docs/futuresV2/linear/#t-websocketkline
-                        # Subscribe to 1 minute candle
-                        if len(self.symbols_id) == 1:
-                            self.ws_mainnet_usdt_perpetual.kline_stream(
-                                self.handle_klines, self.symbols_id[0], "1")
-                            time.sleep(0.1)
-
-                            self.ws_mainnet_usdt_perpetual.instrument_info_stream(self.handle_instrument_info_stream,
-                                                                                  symbol=self.symbols_id[0])
-                        else:
-                            self.ws_mainnet_usdt_perpetual.kline_stream(
-                                self.handle_klines, self.symbols_id, "1")
-                            time.sleep(0.1)
+    def release_market_data_hub(self):
+        '''
+        Hand the public streams over to whichever account acquires the market data hub next
+        '''
+        if self.is_market_data_owner == True:
+            self.market_data_hub.release_ownership(self.market_data_hub__owner)
+            self.is_market_data_owner = False
 
-                            self.ws_mainnet_usdt_perpetual.instrument_info_stream(self.handle_instrument_info_stream,
-                                                                                  symbol=self.symbols_id)
-                except websocket._exceptions.WebSocketConnectionClosedException:
-                    pass
-                except websocket._exceptions.WebSocketTimeoutException:
-                    '''
-                    To address: WebSocket USDT Perp connection failed. Too many connection attempts. pybit will no
-                    longer try to reconnect.
-                    '''
-                    pass
+    def _get_market_data_topics(self) -> tuple:
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            return (KLINE_TOPIC, )
+        elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+            return (KLINE_TOPIC, INSTRUMENT_INFO_TOPIC, )
+        else:
+            raise NotImplementedError(
+                "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
 
-                if len(self.ws_mainnet_usdt_perpetual.active_connections) > 0 and \
-                        self.ws_mainnet_usdt_perpetual.is_connected() == True:
-                    break
-                else:
-                    self.ws_mainnet_usdt_perpetual = None
-                    time.sleep(0.1)
-                    gc.collect()
+    def _get_market_data_websocket_name(self) -> str:
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            return BINANCE_WEBSOCKET_CONNECTIONS[MAINNET_MARKET_CONNECTION]
+        elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+            return BYBIT_WEBSOCKET_CONNECTIONS[MAINNET_USDT_PERPETUAL_CONNECTION]
+        else:
+            raise NotImplementedError(
+                "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
 
-    def close_bybit_websocket(self):
-        self.close_bybit_usdt_perpetual_websocket()
-        self.close_bybit_mainnet_usdt_perpetual_websocket()
+    def _supervise_market_data_websocket(self, is_established=True):
+        '''
+        Hand the public connection of the market data hub owner over to the websocket supervisor.
 
-    def close_bybit_usdt_perpetual_websocket(self):
-        if self.ws_usdt_perpetual is not None:
-            if len(self.ws_usdt_perpetual.active_connections) > 0 and \
-                    self.ws_usdt_perpetual.is_connected() == True:
-                try:
-                    if hasattr(self.ws_usdt_perpetual, 'ws'):
-                        self.ws_usdt_perpetual.ws.close()
+        :param is_established: False to let the supervisor make the first connection, e.g. after a takeover
+        '''
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            self.websocket_supervisor.add_connection(
+                self._get_market_data_websocket_name(),
+                connect=self._connect_binance_mainnet_market_websocket,
+                is_connected=self._is_binance_mainnet_market_websocket_connected,
+                close=self.close_binance_mainnet_market_websocket,
+                is_established=is_established,
+            )
+        elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+            self.websocket_supervisor.add_connection(
+                self._get_market_data_websocket_name(),
+                connect=self._connect_bybit_mainnet_usdt_perpetual_websocket,
+                is_connected=self._is_bybit_mainnet_usdt_perpetual_websocket_connected,
+                close=functools.partial(
+                    self.close_bybit_mainnet_usdt_perpetual_websocket, force=True),
+                is_established=is_established,
+            )
+        else:
+            raise NotImplementedError(
+                "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
+
+    def _check_market_data_hub_ownership(self):
+        '''
+        Run by the websocket supervisor of an OHLCV_PROVIDER. Take the public streams over once their owner has released
+        them or gone silent for longer than the owner timeout of the hub, and step down once taken over in turn.
+        '''
+        if self.is_market_data_owner == True:
+            if self.market_data_hub.get_owner() == self.market_data_hub__owner:
+                self._resubscribe_market_data_if_requests_grown()
+                return
+
+            # Taken over after going silent, leave the public streams to the new owner
+            self.websocket_supervisor.remove_connection(
+                self._get_market_data_websocket_name())
+            if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+                self.close_binance_mainnet_market_websocket()
+            else:
+                self.close_bybit_mainnet_usdt_perpetual_websocket(force=True)
+            self.is_market_data_owner = False
+        elif self.market_data_hub.acquire_ownership(self.market_data_hub__owner) == True:
+            self.is_market_data_owner = True
+
+            # Connected by the supervisor on its next check
+            self._supervise_market_data_websocket(is_established=False)
+            self.websocket_supervisor.wake()
+
+    def _resubscribe_market_data_if_requests_grown(self):
+        '''
+        Run by the owner of the market data hub. Once another account or subscriber has requested a pair the public
+        streams do not cover yet, close them so that the websocket supervisor reconnects with the union of the requests.
+        '''
+        (requests__version, _, ) = self.market_data_hub.get_requests()
+        if self.market_data__requests__version is None or requests__version == self.market_data__requests__version:
+            return
+
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            self.close_binance_mainnet_market_websocket()
+        else:
+            self.close_bybit_mainnet_usdt_perpetual_websocket(force=True)
+        self.market_data__requests__version = None
+        self.websocket_supervisor.wake()
+
+    def _resync_after_binance_user_data_websocket_reconnected(self):
+        '''
+        Updates sent while disconnected are lost. Let the next query go through HTTP for whatever the user data stream
+        would otherwise have kept up to date.
+        '''
+        self.invalidate_balance()
+        with self.ws_positions__condition:
+            self.ws_positions__timestamp.clear()
+
+    def handle_binance_user_data(self, event):
+        '''
+        This routine gets triggered whenever there is an order, balance or position update.
+        '''
+        try:
+            event_type = event['e']
+            if event_type == BINANCE__SPOT__EXECUTION_REPORT_EVENT or \
+                    event_type == BINANCE__FUTURES__ORDER_TRADE_UPDATE_EVENT:
+                self._handle_binance_order_update(event)
+            elif event_type == BINANCE__FUTURES__ACCOUNT_UPDATE_EVENT:
+                self.invalidate_balance()
+                self._handle_binance_position_update(event)
+            elif event_type == BINANCE__SPOT__ACCOUNT_POSITION_EVENT or \
+                    event_type == BINANCE__SPOT__BALANCE_UPDATE_EVENT:
+                self.invalidate_balance()
+            elif event_type == BINANCE__LISTEN_KEY_EXPIRED_EVENT:
+                # Supervisor reconnects with a new listen key
+                self.ws_binance_user_data.close()
+                self.websocket_supervisor.wake()
+        except Exception:
+            traceback.print_exc()
+
+    def _handle_binance_order_update(self, event):
+        parse_binance_ws_order__dict = dict(
+            market_type=self.market_type,
+            event=event,
+        )
+        raw_order = parse_binance_ws_order(params=parse_binance_ws_order__dict)
+        market = self.get_market(raw_order['symbol'])
+        ccxt_order = self.exchange.parse_order(raw_order, market)
+
+        # Strip away "/" and ":USDT"
+        ccxt_order['symbol'] = ccxt_order['symbol'].replace("/", "")
+        ccxt_order['symbol'] = ccxt_order['symbol'].replace(":USDT", "")
+
+        # Replace the existing ws order if any
+        symbol_id = ccxt_order['symbol']
+        if is_binance_conditional_order(raw_order) == True:
+            ws_orders = self.ws_conditional_orders
+        else:
+            ws_orders = self.ws_active_orders
+        self._record_ws_fill(symbol_id, ccxt_order)
+        ws_orders.upsert(symbol_id, ccxt_order)
+        if self.push_order_notification:
+            self._push_ws_ccxt_order(ccxt_order)
+
+        # Signal the waiter last so that the woken thread observes the order after the update is applied
+        self.order_state_waiter.update(ccxt_order['id'], ccxt_order)
+
+    def _handle_binance_position_update(self, event):
+        '''
+        Keep the positions in the same form as balance['info']['positions'] so that the instrument could read either.
+        '''
+        for position in parse_binance_ws_positions(event):
+            symbol_id = position['symbol']
+            with self.ws_positions__condition:
+                ws_positions = [ws_position for ws_position in self.ws_positions[symbol_id]
+                                if ws_position['info']['positionSide'] != position['positionSide']]
+                ws_positions.append(dict(
+                    symbol=symbol_id,
+                    side=position['positionSide'].lower(),
+                    info=position,
+                ))
+                self.ws_positions[symbol_id] = sorted(
+                    ws_positions, key=lambda k: k['side'])
+
+                # Mark the symbol fresh only after the update is applied
+                self.ws_positions__timestamp[symbol_id] = time.monotonic()
+                self.ws_positions__condition.notify_all()
+
+    def handle_binance_mainnet_market(self, event):
+        '''
+        This routine gets triggered whenever there is a kline update.
+        '''
+        try:
+            if event.get('e', None) == BINANCE__KLINE_EVENT:
+                (symbol_id, tstamp, ohlcv, ) = parse_binance_ws_kline(event)
+                self.market_data_hub.publish(
+                    KLINE_TOPIC, symbol_id, (tstamp, ohlcv, ))
+        except Exception:
+            traceback.print_exc()
+
+    def establish_bybit_websocket(self):
+        self.establish_bybit_usdt_perpetual_websocket()
+        self.establish_bybit_mainnet_usdt_perpetual_websocket()
+
+    def supervise_bybit_websocket(self):
+        '''
+        Hand the established connections over to the supervisor thread, which owns reconnection from now on.
+        '''
+        self.websocket_supervisor.add_connection(
+            BYBIT_WEBSOCKET_CONNECTIONS[USDT_PERPETUAL_CONNECTION],
+            connect=self._connect_bybit_usdt_perpetual_websocket,
+            is_connected=self._is_bybit_usdt_perpetual_websocket_connected,
+            close=functools.partial(
+                self.close_bybit_usdt_perpetual_websocket, force=True),
+            on_reconnected=self._resync_after_bybit_usdt_perpetual_websocket_reconnected,
+        )
+
+        # Only the owner of the market data hub should be connected to ws_mainnet_usdt_perpetual
+        if self.is_market_data_owner == True:
+            self._supervise_market_data_websocket()
+        if self.is_ohlcv_provider == True:
+            self.websocket_supervisor.add_task(
+                MARKET_DATA_HUB_OWNERSHIP_TASK, self._check_market_data_hub_ownership)
+        self.websocket_supervisor.start()
+
+    def _resync_after_bybit_usdt_perpetual_websocket_reconnected(self):
+        '''
+        Private and depth updates sent while disconnected are lost. Reload over REST what the websocket would otherwise
+        have kept up to date. The order book is resubscribed upon reconnection, whose first message is a whole book, so
+        get_orderbook falls back to REST only until then.
+        '''
+        self.invalidate_balance()
+        for symbol_id in self.symbols_id:
+            self.local_order_books[symbol_id].invalidate()
+
+    def get_websocket_metrics(self) -> dict:
+        '''
+        :return: State and reconnect time of each websocket connection, keyed by connection name
+        '''
+        if self.websocket_supervisor is None:
+            return {}
+        return self.websocket_supervisor.get_metrics()
+
+    def establish_bybit_usdt_perpetual_websocket(self):
+        '''
+        Block until connected. Only meant for the first connection during init, reconnection afterwards is owned by the
+        websocket supervisor.
+        '''
+        attempt = 0
+        while self._is_bybit_usdt_perpetual_websocket_connected() == False:
+            if self._connect_bybit_usdt_perpetual_websocket() == True:
+                break
+
+            get_backoff_delay_in_seconds__dict = dict(
+                attempt=attempt,
+            )
+            time.sleep(get_backoff_delay_in_seconds(
+                params=get_backoff_delay_in_seconds__dict))
+            attempt += 1
+
+    def _is_bybit_usdt_perpetual_websocket_connected(self) -> bool:
+        ws_usdt_perpetual = self.ws_usdt_perpetual
+        return ws_usdt_perpetual is not None and len(ws_usdt_perpetual.active_connections) > 0 and \
+            ws_usdt_perpetual.is_connected() == True
+
+    def _connect_bybit_usdt_perpetual_websocket(self) -> bool:
+        '''
+        Single attempt to connect and subscribe all topics.
+        '''
+        # Legality Check
+        assert isinstance(self.symbols_id, list)
+        assert len(self.symbols_id) > 0
+
+        # pybit and its websocket client are only needed by Bybit accounts, hence imported on first connection
+        #       instead of module load
+        import websocket
+        from pybit import usdt_perpetual
+
+        self.ws_usdt_perpetual = \
+            usdt_perpetual.WebSocket(
+                test=not self.main_net_toggle_switch_value,
+                api_key=self.config__api_key,
+                api_secret=self.config__api_secret,
+                # to pass a custom domain in case of connectivity problems, you can use:
+                # domain="bytick"  # the default is "bybit"
+
+                # Attempting to resolve WebSocket USDT Perp encountered error: ping/pong timed out in
+                #       dashboard
+                # ping_interval=20,
+                # ping_timeout=10,
+                retries=20,
+                # trace_logging=True,
+            )
+
+        try:
+            self.ws_usdt_perpetual.order_stream(
+                self.handle_active_order)
+            time.sleep(0.1)
+
+            self.ws_usdt_perpetual.stop_order_stream(
+                self.handle_conditional_order)
+            time.sleep(0.1)
+
+            self.ws_usdt_perpetual.position_stream(
+                self.handle_positions)
+            time.sleep(0.1)
+
+            self.ws_usdt_perpetual.wallet_stream(
+                self.handle_wallet)
+            time.sleep(0.1)
+
+            # Order book of the very same net the orders are placed on
+            if len(self.symbols_id) == 1:
+                self.ws_usdt_perpetual.orderbook_25_stream(
+                    self.handle_orderbook_stream, self.symbols_id[0])
+            else:
+                self.ws_usdt_perpetual.orderbook_25_stream(
+                    self.handle_orderbook_stream, self.symbols_id)
+        except websocket._exceptions.WebSocketConnectionClosedException:
+            pass
+        except websocket._exceptions.WebSocketTimeoutException:
+            '''
+            To address: WebSocket USDT Perp connection failed. Too many connection attempts. pybit will no
+            longer try to reconnect.
+            '''
+            pass
+
+        if self._is_bybit_usdt_perpetual_websocket_connected() == True:
+            return True
+
+        self.ws_usdt_perpetual = None
+        gc.collect()
+        return False
+
+    def establish_bybit_mainnet_usdt_perpetual_websocket(self):
+        '''
+        Block until connected. Only meant for the first connection during init, reconnection afterwards is owned by the
+        websocket supervisor.
+        '''
+        # Only the owner of the market data hub should be connected to ws_mainnet_usdt_perpetual
+        if self.is_market_data_owner == True:
+            attempt = 0
+            while self._is_bybit_mainnet_usdt_perpetual_websocket_connected() == False:
+                if self._connect_bybit_mainnet_usdt_perpetual_websocket() == True:
+                    break
+
+                get_backoff_delay_in_seconds__dict = dict(
+                    attempt=attempt,
+                )
+                time.sleep(get_backoff_delay_in_seconds(
+                    params=get_backoff_delay_in_seconds__dict))
+                attempt += 1
+
+    def _is_bybit_mainnet_usdt_perpetual_websocket_connected(self) -> bool:
+        ws_mainnet_usdt_perpetual = self.ws_mainnet_usdt_perpetual
+        return ws_mainnet_usdt_perpetual is not None and len(ws_mainnet_usdt_perpetual.active_connections) > 0 and \
+            ws_mainnet_usdt_perpetual.is_connected() == True
+
+    def _connect_bybit_mainnet_usdt_perpetual_websocket(self) -> bool:
+        '''
+        Single attempt to connect and subscribe all topics for every symbol requested from the market data hub.
+        '''
+        (requests__version, symbols_id__per_topic,
+         ) = self.market_data_hub.get_requests()
+        kline__symbols_id = symbols_id__per_topic[KLINE_TOPIC]
+        instrument_info__symbols_id = symbols_id__per_topic[INSTRUMENT_INFO_TOPIC]
+
+        # Legality Check
+        assert len(kline__symbols_id) > 0
+        assert len(instrument_info__symbols_id) > 0
+
+        import websocket
+        from pybit import usdt_perpetual
+
+        # Connect with authentication
+        self.ws_mainnet_usdt_perpetual = usdt_perpetual.WebSocket(
+            test=False,
+            api_key=self.config__api_key,
+            api_secret=self.config__api_secret,
+            # to pass a custom domain in case of connectivity problems, you can use:
+            # domain="bytick"  # the default is "bybit"
+
+            # Attempting to resolve WebSocket USDT Perp encountered error: ping/pong timed out in
+            #       dashboard
+            # ping_interval=20,
+            # ping_timeout=10,
+            retries=20,
+            # trace_logging=True,
+        )
+
+        try:
+            if self.ws_mainnet_usdt_perpetual.is_connected() == True:
+                # Reference: https://bybit-exchange.github.io/docs/futuresV2/linear/#t-websocketkline
+                # Subscribe to 1 minute candle
+                if len(kline__symbols_id) == 1:
+                    self.ws_mainnet_usdt_perpetual.kline_stream(
+                        self.handle_klines, kline__symbols_id[0], "1")
+                else:
+                    self.ws_mainnet_usdt_perpetual.kline_stream(
+                        self.handle_klines, kline__symbols_id, "1")
+                time.sleep(0.1)
+
+                if len(instrument_info__symbols_id) == 1:
+                    self.ws_mainnet_usdt_perpetual.instrument_info_stream(self.handle_instrument_info_stream,
+                                                                          symbol=instrument_info__symbols_id[0])
+                else:
+                    self.ws_mainnet_usdt_perpetual.instrument_info_stream(self.handle_instrument_info_stream,
+                                                                          symbol=instrument_info__symbols_id)
+        except websocket._exceptions.WebSocketConnectionClosedException:
+            pass
+        except websocket._exceptions.WebSocketTimeoutException:
+            '''
+            To address: WebSocket USDT Perp connection failed. Too many connection attempts. pybit will no
+            longer try to reconnect.
+            '''
+            pass
+
+        if self._is_bybit_mainnet_usdt_perpetual_websocket_connected() == True:
+            self.market_data__requests__version = requests__version
+            return True
+
+        self.ws_mainnet_usdt_perpetual = None
+        gc.collect()
+        return False
+
+    def close_bybit_websocket(self):
+        # Stop the supervisor first so that it does not reconnect what is being closed
+        if self.websocket_supervisor is not None:
+            self.websocket_supervisor.stop()
+
+        self.close_bybit_usdt_perpetual_websocket()
+        self.close_bybit_mainnet_usdt_perpetual_websocket()
+        self.release_market_data_hub()
+        self.market_data_hub.cancel_requests(self.market_data_hub__owner)
+
+    def close_bybit_usdt_perpetual_websocket(self, force=False):
+        '''
+        :param force: Also tear down a connection that is no longer connected, so that it stops retrying on its own
+        '''
+        if self.ws_usdt_perpetual is not None:
+            if force == True or (len(self.ws_usdt_perpetual.active_connections) > 0 and
+                                 self.ws_usdt_perpetual.is_connected() == True):
+                try:
+                    if hasattr(self.ws_usdt_perpetual, 'ws'):
+                        self.ws_usdt_perpetual.ws.close()
                     self.ws_usdt_perpetual.close()
                 except Exception:
                     pass
@@ -2244,12 +3369,15 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 time.sleep(0.1)
                 gc.collect()
 
-    def close_bybit_mainnet_usdt_perpetual_websocket(self):
-        # Only OHLCV_PROVIDER should be connected to ws_mainnet_usdt_perpetual
-        if self.is_ohlcv_provider == True:
+    def close_bybit_mainnet_usdt_perpetual_websocket(self, force=False):
+        '''
+        :param force: Also tear down a connection that is no longer connected, so that it stops retrying on its own
+        '''
+        # Only the owner of the market data hub should be connected to ws_mainnet_usdt_perpetual
+        if self.is_market_data_owner == True:
             if self.ws_mainnet_usdt_perpetual is not None:
-                if len(self.ws_mainnet_usdt_perpetual.active_connections) > 0 and \
-                        self.ws_mainnet_usdt_perpetual.is_connected() == True:
+                if force == True or (len(self.ws_mainnet_usdt_perpetual.active_connections) > 0 and
+                                     self.ws_mainnet_usdt_perpetual.is_connected() == True):
                     try:
                         if hasattr(self.ws_mainnet_usdt_perpetual, 'ws'):
                             self.ws_mainnet_usdt_perpetual.ws.close()
@@ -2261,6 +3389,12 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                     time.sleep(0.1)
                     gc.collect()
 
+            # Quotes received before the disconnection must not be mistaken as live, unless another account has taken
+            #       over and keeps them up to date
+            self.quote_store.invalidate()
+            if self.market_data_hub.get_owner() == self.market_data_hub__owner:
+                self.market_data_hub.invalidate(INSTRUMENT_INFO_TOPIC)
+
     def get_open_orders(self):
         # In order to prevent manipulation from caller
         cloned_open_orders = []
@@ -2292,6 +3426,8 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         appear in the message.
         '''
         try:
+            self.websocket_supervisor.touch(
+                BYBIT_WEBSOCKET_CONNECTIONS[USDT_PERPETUAL_CONNECTION])
             if self.debug:
                 # # TODO: Debug use
                 # frameinfo = inspect.getframeinfo(inspect.currentframe())
@@ -2326,55 +3462,112 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 results, 'symbol', symbols, False)
 
             for symbol_id in symbols:
-                if len(self.ws_positions[symbol_id]) == 0:
-                    # Exercise the longer time route
-                    market_type = CCXT__MARKET_TYPES.index(symbol_type)
-                    ccxt_market_symbol_name = get_ccxt_market_symbol_name(
-                        market_type, symbol_id)
-
-                    # Store the outdated positions first
-                    self.ws_positions[symbol_id] = \
-                        self._fetch_opened_positions_from_exchange(
-                            symbols=[ccxt_market_symbol_name], params={'type': symbol_type})
-
-                # Identify ws_position to be changed
-                positions_to_be_changed = []
-                for i, _ in enumerate(self.ws_positions[symbol_id]):
-                    for latest_changed_position in latest_changed_positions:
-                        if latest_changed_position['symbol'] == symbol_id:
-                            if self.ws_positions[symbol_id][i]['side'] == \
-                                    latest_changed_position['side']:
-                                positions_to_be_changed.append(
-                                    (i, latest_changed_position))
-
-                # Update with the latest position from websocket
-                for position_to_be_changed_tuple in positions_to_be_changed:
-                    index, latest_changed_position = position_to_be_changed_tuple
-                    self.ws_positions[symbol_id][index] = latest_changed_position
-
-                # Legality Check
-                assert len(self.ws_positions[symbol_id]) <= 2, \
-                    "len(ws_positions): {} should not be greater than 2!!!".format(
-                        len(self.ws_positions[symbol_id]))
-
-                if symbol_type == "linear":
-                    assert len(self.ws_positions[symbol_id]) == 2, \
-                        "For {} symbol, len(ws_positions): {} does not equal to 2!!!".format(
-                            symbol_type, len(self.ws_positions[symbol_id])
-                    )
+                with self.ws_positions__condition:
+                    self._update_ws_positions(
+                        symbol_id, symbol_type, latest_changed_positions)
+
+                    # Mark the symbol fresh only after the update is applied
+                    self.ws_positions__timestamp[symbol_id] = time.monotonic()
+                    self.ws_positions__condition.notify_all()
+        except Exception:
+            traceback.print_exc()
+
+    def _update_ws_positions(self, symbol_id, symbol_type, latest_changed_positions):
+        if len(self.ws_positions[symbol_id]) == 0:
+            # Exercise the longer time route
+            market_type = CCXT__MARKET_TYPES.index(symbol_type)
+            ccxt_market_symbol_name = get_ccxt_market_symbol_name(
+                market_type, symbol_id)
+
+            # Store the outdated positions first
+            self.ws_positions[symbol_id] = \
+                self._fetch_opened_positions_from_exchange(
+                    symbols=[ccxt_market_symbol_name], params={'type': symbol_type})
+
+        # Identify ws_position to be changed
+        positions_to_be_changed = []
+        for i, _ in enumerate(self.ws_positions[symbol_id]):
+            for latest_changed_position in latest_changed_positions:
+                if latest_changed_position['symbol'] == symbol_id:
+                    if self.ws_positions[symbol_id][i]['side'] == \
+                            latest_changed_position['side']:
+                        positions_to_be_changed.append(
+                            (i, latest_changed_position))
+
+        # Update with the latest position from websocket
+        for position_to_be_changed_tuple in positions_to_be_changed:
+            index, latest_changed_position = position_to_be_changed_tuple
+            self.ws_positions[symbol_id][index] = latest_changed_position
+
+        # Legality Check
+        assert len(self.ws_positions[symbol_id]) <= 2, \
+            "len(ws_positions): {} should not be greater than 2!!!".format(
+                len(self.ws_positions[symbol_id]))
+
+        if symbol_type == "linear":
+            assert len(self.ws_positions[symbol_id]) == 2, \
+                "For {} symbol, len(ws_positions): {} does not equal to 2!!!".format(
+                    symbol_type, len(self.ws_positions[symbol_id])
+            )
+
+        # Sort dictionary list by key
+        reverse = False
+        sort_by_key = 'side'
+        self.ws_positions[symbol_id] = \
+            sorted(self.ws_positions[symbol_id],
+                   key=lambda k: k[sort_by_key],
+                   reverse=reverse)
+
+    def handle_wallet(self, message):
+        '''
+        This routine gets triggered whenever there is a wallet balance change. It keeps the cached balance up to date
+        so that get_cash, get_value and _get_balance could be served from memory.
+        '''
+        try:
+            self.websocket_supervisor.touch(
+                BYBIT_WEBSOCKET_CONNECTIONS[USDT_PERPETUAL_CONNECTION])
+            assert type(message['data']) == list
+            responses = self.exchange.safe_value(message, 'data')
 
-                # Sort dictionary list by key
-                reverse = False
-                sort_by_key = 'side'
-                self.ws_positions[symbol_id] = \
-                    sorted(self.ws_positions[symbol_id],
-                           key=lambda k: k[sort_by_key],
-                           reverse=reverse)
+            with self.balance__lock:
+                if self.cached_balance is None:
+                    # Let the first HTTP fetch seed the cache as the stream only carries the settlement currency
+                    return
+
+                balance = copy.copy(self.cached_balance)
+                balance['free'] = dict(balance['free'])
+                balance['total'] = dict(balance['total'])
+
+                for wallet in responses:
+                    # USDT Perpetual wallet is denominated in the settlement currency
+                    currency = self.exchange.safe_string(
+                        wallet, 'coin', self.wallet_currency)
+                    free = self.exchange.safe_float(
+                        wallet, 'available_balance')
+                    total = self.exchange.safe_float(wallet, 'wallet_balance')
+
+                    balance['free'][currency] = free
+                    balance['total'][currency] = total
+                    if isinstance(balance.get(currency, None), dict):
+                        balance[currency] = dict(
+                            balance[currency], free=free, total=total)
+
+                self.cached_balance = balance
+                self.cached_balance__timestamp = time.monotonic()
+
+            cash = balance['free'].get(self.wallet_currency, None)
+            value = balance['total'].get(self.wallet_currency, None)
+
+            # Fix for scenario where None is returned
+            self._cash = cash if cash else 0.0
+            self._value = value if value else 0.0
         except Exception:
             traceback.print_exc()
 
     def handle_active_order(self, message):
         try:
+            self.websocket_supervisor.touch(
+                BYBIT_WEBSOCKET_CONNECTIONS[USDT_PERPETUAL_CONNECTION])
             if self.debug:
                 # # TODO: Debug use
                 # frameinfo = inspect.getframeinfo(inspect.currentframe())
@@ -2388,12 +3581,9 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
 
             responses = message['data']
             assert type(responses) == list
-            active_orders_to_be_added = collections.defaultdict(list)
-            symbols_id = []
             for order in responses:
                 market = self.get_market(order['symbol'])
-                result = self.exchange.safe_value(message, 'data')
-                active_order = self.exchange.parse_order(result[0], market)
+                active_order = self.exchange.parse_order(order, market)
 
                 # Strip away "/" and ":USDT"
                 active_order['symbol'] = active_order['symbol'].replace(
@@ -2401,11 +3591,16 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 active_order['symbol'] = active_order['symbol'].replace(
                     ":USDT", "")
 
+                # Replace the existing ws active order if any
                 symbol_id = active_order['symbol']
-                if symbol_id not in symbols_id:
-                    symbols_id.append(symbol_id)
+                self._record_ws_fill(symbol_id, active_order)
+                self.ws_active_orders.upsert(symbol_id, active_order)
+                if self.push_order_notification:
+                    self._push_ws_ccxt_order(active_order)
 
-                active_orders_to_be_added[symbol_id].append(active_order)
+                # Signal the waiter last so that the woken thread observes the order after the update is applied
+                self.order_state_waiter.update(
+                    active_order['id'], active_order)
 
                 if self.debug:
                     # TODO: Debug use
@@ -2416,62 +3611,17 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                             "T", " ")[:-3],
                         self.account_alias,
                     )
-                    msg += "appended active_order['id']: {} into active_orders_to_be_added".format(
+                    msg += "upserted active_order['id']: {} into ws_active_orders".format(
                         active_order['id'])
                     print(msg)
 
-            for symbol_id in symbols_id:
-                active_order_ids_to_be_added = \
-                    [active_order['id']
-                        for active_order in active_orders_to_be_added[symbol_id]]
-
-                # Look for existing order in the list
-                ws_active_orders_to_be_removed = []
-                for ws_active_order in self.ws_active_orders[symbol_id]:
-                    if ws_active_order['id'] in active_order_ids_to_be_added:
-                        ws_active_orders_to_be_removed.append(ws_active_order)
-
-                # Remove the existing ws active order
-                for ws_active_order in ws_active_orders_to_be_removed:
-                    if self.debug:
-                        # TODO: Debug use
-                        frameinfo = inspect.getframeinfo(
-                            inspect.currentframe())
-                        msg = "{} Line: {}: WARNING: {}: {}: ".format(
-                            frameinfo.function, frameinfo.lineno,
-                            datetime.datetime.now().isoformat().replace(
-                                "T", " ")[:-3],
-                            self.account_alias,
-                        )
-                        msg += "removing ws_active_order['id']: {} from ws_active_orders".format(
-                            ws_active_order['id'])
-                        print(msg)
-
-                    self.ws_active_orders[symbol_id].remove(ws_active_order)
-
-                # Add the latest active orders
-                for active_order in active_orders_to_be_added[symbol_id]:
-                    self.ws_active_orders[symbol_id].append(active_order)
-
-                    if self.debug:
-                        # TODO: Debug use
-                        frameinfo = inspect.getframeinfo(
-                            inspect.currentframe())
-                        msg = "{} Line: {}: DEBUG: {}: {}: ".format(
-                            frameinfo.function, frameinfo.lineno,
-                            datetime.datetime.now().isoformat().replace(
-                                "T", " ")[:-3],
-                            self.account_alias,
-                        )
-                        msg += "appended active_order['id']: {} into ws_active_orders".format(
-                            active_order['id'])
-                        print(msg)
-
         except Exception:
             traceback.print_exc()
 
     def handle_conditional_order(self, message):
         try:
+            self.websocket_supervisor.touch(
+                BYBIT_WEBSOCKET_CONNECTIONS[USDT_PERPETUAL_CONNECTION])
             if self.debug:
                 # # TODO: Debug use
                 # frameinfo = inspect.getframeinfo(inspect.currentframe())
@@ -2485,13 +3635,9 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
 
             responses = message['data']
             assert type(responses) == list
-            conditional_orders_to_be_added = collections.defaultdict(list)
-            symbols_id = []
             for order in responses:
                 market = self.get_market(order['symbol'])
-                result = self.exchange.safe_value(message, 'data')
-                conditional_order = self.exchange.parse_order(
-                    result[0], market)
+                conditional_order = self.exchange.parse_order(order, market)
 
                 # Strip away "/" and ":USDT"
                 conditional_order['symbol'] = conditional_order['symbol'].replace(
@@ -2499,12 +3645,16 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 conditional_order['symbol'] = conditional_order['symbol'].replace(
                     ":USDT", "")
 
+                # Replace the existing ws conditional order if any
                 symbol_id = conditional_order['symbol']
-                if symbol_id not in symbols_id:
-                    symbols_id.append(symbol_id)
+                self._record_ws_fill(symbol_id, conditional_order)
+                self.ws_conditional_orders.upsert(symbol_id, conditional_order)
+                if self.push_order_notification:
+                    self._push_ws_ccxt_order(conditional_order)
 
-                conditional_orders_to_be_added[symbol_id].append(
-                    conditional_order)
+                # Signal the waiter last so that the woken thread observes the order after the update is applied
+                self.order_state_waiter.update(
+                    conditional_order['id'], conditional_order)
 
                 if self.debug:
                     # TODO: Debug use
@@ -2515,60 +3665,10 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                             "T", " ")[:-3],
                         self.account_alias,
                     )
-                    msg += "appended conditional_order['id']: {} into conditional_orders_to_be_added".format(
+                    msg += "upserted conditional_order['id']: {} into ws_conditional_orders".format(
                         conditional_order['id'])
                     print(msg)
 
-            for symbol_id in symbols_id:
-                conditional_order_ids_to_be_added = \
-                    [conditional_order['id']
-                        for conditional_order in conditional_orders_to_be_added[symbol_id]]
-
-                # Look for existing order in the list
-                ws_conditional_orders_to_be_removed = []
-                for ws_conditional_order in self.ws_conditional_orders[symbol_id]:
-                    if ws_conditional_order['id'] in conditional_order_ids_to_be_added:
-                        ws_conditional_orders_to_be_removed.append(
-                            ws_conditional_order)
-
-                # Remove the existing ws conditional order
-                for ws_conditional_order in ws_conditional_orders_to_be_removed:
-                    if self.debug:
-                        # TODO: Debug use
-                        frameinfo = inspect.getframeinfo(
-                            inspect.currentframe())
-                        msg = "{} Line: {}: WARNING: {}: {}: ".format(
-                            frameinfo.function, frameinfo.lineno,
-                            datetime.datetime.now().isoformat().replace(
-                                "T", " ")[:-3],
-                            self.account_alias,
-                        )
-                        msg += "removing ws_conditional_order['id']: {} from ws_conditional_orders".format(
-                            ws_conditional_order['id'])
-                        print(msg)
-
-                    self.ws_conditional_orders[symbol_id].remove(
-                        ws_conditional_order)
-
-                # Add the latest conditional orders
-                for conditional_order in conditional_orders_to_be_added[symbol_id]:
-                    self.ws_conditional_orders[symbol_id].append(
-                        conditional_order)
-
-                    if self.debug:
-                        # TODO: Debug use
-                        frameinfo = inspect.getframeinfo(
-                            inspect.currentframe())
-                        msg = "{} Line: {}: DEBUG: {}: {}: ".format(
-                            frameinfo.function, frameinfo.lineno,
-                            datetime.datetime.now().isoformat().replace(
-                                "T", " ")[:-3],
-                            self.account_alias,
-                        )
-                        msg += "appended conditional_order['id']: {} into ws_conditional_orders".format(
-                            conditional_order['id'])
-                        print(msg)
-
         except Exception:
             traceback.print_exc()
 
@@ -2577,6 +3677,8 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         This routine gets triggered whenever there is a kline update.
         '''
         try:
+            self.websocket_supervisor.touch(
+                BYBIT_WEBSOCKET_CONNECTIONS[MAINNET_USDT_PERPETUAL_CONNECTION])
             if self.debug:
                 # # TODO: Debug use
                 # frameinfo = inspect.getframeinfo(inspect.currentframe())
@@ -2604,7 +3706,8 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                      float(data_responses[0]['low']), float(
                          data_responses[0]['close']),
                      float(data_responses[0]['volume']))
-                self.ws_klines[symbol_id] = (tstamp, ohlcv)
+                self.market_data_hub.publish(
+                    KLINE_TOPIC, symbol_id, (tstamp, ohlcv, ))
         except Exception:
             traceback.print_exc()
 
@@ -2613,6 +3716,8 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         This routine gets triggered whenever there is instrument info update.
         '''
         try:
+            self.websocket_supervisor.touch(
+                BYBIT_WEBSOCKET_CONNECTIONS[MAINNET_USDT_PERPETUAL_CONNECTION])
             if self.debug:
                 # # TODO: Debug use
                 # frameinfo = inspect.getframeinfo(inspect.currentframe())
@@ -2632,30 +3737,119 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 mark_price = float(responses['mark_price'])
                 ask1_price = float(responses['ask1_price'])
                 bid1_price = float(responses['bid1_price'])
-                self.ws_instrument_info[symbol_id] = (
-                    mark_price, ask1_price, bid1_price)
+                timestamp = message.get('timestamp_e6', None)
+                quote = self.quote_store.publish(symbol_id, mark_price, ask1_price, bid1_price,
+                                                 # Microseconds to milliseconds as per ccxt
+                                                 exchange_timestamp=int(
+                                                     timestamp) // 1000
+                                                 if timestamp is not None else None)
+                self.market_data_hub.publish(
+                    INSTRUMENT_INFO_TOPIC, symbol_id, quote)
+        except Exception:
+            traceback.print_exc()
+
+    def handle_orderbook_stream(self, message):
+        '''
+        This routine gets triggered whenever there is order book update.
+
+        Limitation: pybit applies the deltas of orderBookL2_25 to the book it maintains itself and hands that whole book
+        over as a snapshot on every update, hence the raw deltas never reach here. A lost delta is thus beyond reach,
+        the local order book only mirrors the book of pybit and stops being served once it turns crossed.
+        '''
+        try:
+            self.websocket_supervisor.touch(
+                BYBIT_WEBSOCKET_CONNECTIONS[USDT_PERPETUAL_CONNECTION])
+            parse_order_book_message__dict = dict(
+                exchange_dropdown_value=self.exchange_dropdown_value,
+                message=message,
+            )
+            order_book_message = parse_order_book_message(
+                params=parse_order_book_message__dict)
+
+            symbol_id = order_book_message['symbol_id']
+            local_order_book = self.local_order_books.get(symbol_id, None)
+            if local_order_book is None:
+                return
+
+            local_order_book.apply_snapshot(order_book_message['bids'], order_book_message['asks'],
+                                            sequence=order_book_message['sequence'],
+                                            timestamp=order_book_message['timestamp'])
         except Exception:
             traceback.print_exc()
 
     def run_pulse_check_for_ws(self):
         if self.is_ws_available == True:
-            self.establish_bybit_usdt_perpetual_websocket()
-            self.establish_bybit_mainnet_usdt_perpetual_websocket()
+            # Reconnection is owned by the supervisor thread. Only nudge it, hence the caller is never blocked
+            self.websocket_supervisor.wake()
+
+    def _apply_markets(self, cached_markets):
+        '''
+        Hand markets served by the metadata cache to the exchange. Also invoked with the markets refreshed in the
+        background once a stale entry is replaced, so that a long running session picks up listing changes
+        '''
+        self.exchange.set_markets(
+            cached_markets['markets'], cached_markets['currencies'])
+        if self.async_exchange_bridge is not None:
+            self.async_exchange_bridge.exchange.set_markets(
+                self.exchange.markets, self.exchange.currencies)
+
+    def _fetch_markets(self):
+        '''
+        Equivalent of load_markets(reload=True) without touching the markets currently in use by the exchange
+        '''
+        currencies = None
+        if self.exchange.has['fetchCurrencies'] == True:
+            currencies = self.exchange.fetch_currencies()
+
+        fetch_markets__dict = dict(
+            type=self.market_type_name,  # CCXT Market Type
+        )
+        markets = self.exchange.fetch_markets(params=fetch_markets__dict)
+        ret_value = dict(
+            markets=markets,
+            currencies=currencies,
+        )
+        return ret_value
 
-    @retry
     def get_market(self, symbol):
         market = self.exchange.market(symbol)
         return market
 
+    @single_flight
     @retry
     def _get_wallet_balance(self, params=None):
         if params is None:
             params = self.fetch_balance__dict
-        balance = self.exchange.fetch_balance(params)
+        balance = self._invoke_exchange('fetch_balance', params)
         return balance
 
+    def _set_cached_balance(self, balance):
+        with self.balance__lock:
+            self.cached_balance = balance
+            self.cached_balance__timestamp = time.monotonic()
+
+    def invalidate_balance(self):
+        with self.balance__lock:
+            self.cached_balance__timestamp = None
+
+    def _get_cached_balance(self):
+        if self.is_ws_available == True:
+            ttl_in_seconds = self.balance_cache_websocket_ttl_in_seconds
+        else:
+            ttl_in_seconds = self.balance_cache_ttl_in_seconds
+
+        with self.balance__lock:
+            if self.cached_balance is None or self.cached_balance__timestamp is None:
+                return None
+            if time.monotonic() - self.cached_balance__timestamp >= ttl_in_seconds:
+                return None
+            return self.cached_balance
+
     def _get_balance(self):
-        balance = self._get_wallet_balance()
+        balance = self._get_cached_balance()
+        if balance is None:
+            balance = self._get_wallet_balance()
+            self._set_cached_balance(balance)
 
         # Legality Check
         assert self.wallet_currency in balance['free'].keys()
@@ -2675,44 +3869,39 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
     @retry
     def create_order(self, symbol, order_type, side, amount, price, params):
         # returns the order
-        return self.exchange.create_order(
-            symbol=symbol, type=order_type, side=side, amount=amount, price=price, params=params)
+        return self._invoke_exchange(
+            'create_order', symbol=symbol, type=order_type, side=side, amount=amount, price=price, params=params)
 
     @retry
     def _edit_order(self, order_id, symbol, type, side, amount=None, price=None, trigger_price=None, params={}):
         # returns the order
-        return self.exchange.edit_order(
-            order_id, symbol, type, side, amount=amount, price=price, trigger_price=trigger_price, params=params)
+        return self._invoke_exchange(
+            'edit_order', order_id, symbol, type, side, amount=amount, price=price, trigger_price=trigger_price,
+            params=params)
 
     @retry
     def cancel_order(self, order_id, symbol, params=None):
         if params is None:
             params = {}
-        return self.exchange.cancel_order(order_id, symbol, params=params)
+        return self._invoke_exchange('cancel_order', order_id, symbol, params=params)
 
     @retry
     def fetch_trades(self, symbol):
-        return self.exchange.fetch_trades(symbol)
+        return self._invoke_exchange('fetch_trades', symbol)
 
-    @retry
     def parse_timeframe(self, timeframe):
         return self.exchange.parse_timeframe(timeframe)
 
-    @retry
     def filter_by_since_limit(self, array, since=None, limit=None, key='timestamp', tail=False):
         return self.exchange.filter_by_since_limit(array, since, limit, key, tail)
 
     def fetch_ws_klines(self, dataname):
-        if self.main_net_toggle_switch_value == True:
-            mainnet__account_or_store = self
-        else:
-            ohlcv_provider__account_or_store = self.parent.get_ohlcv_provider__account_or_store()
-            mainnet__account_or_store = ohlcv_provider__account_or_store
-
-        # Always fetch klines from MAINNET instead of TESTNET
-        ret_value = mainnet__account_or_store.ws_klines[dataname]
+        # Always fetch klines from MAINNET instead of TESTNET, as published by the owner of the market data hub
+        ret_value = self.market_data_hub.get_latest(
+            KLINE_TOPIC, dataname, default=())
         return ret_value
 
+    @single_flight
     @retry
     def fetch_ohlcv(self, symbol, timeframe, since, limit, params={}):
         if self.debug:
@@ -2722,28 +3911,27 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 symbol, timeframe, since, since_dt, limit, params))
 
         if self.main_net_toggle_switch_value == True:
-            mainnet_exchange = self.exchange
+            mainnet__account_or_store = self
         else:
             legality_check_not_none_obj(self.parent, "self.parent")
-            ohlcv_provider__account_or_store = self.parent.get_ohlcv_provider__account_or_store()
-            mainnet_exchange = ohlcv_provider__account_or_store.exchange
+            mainnet__account_or_store = self.parent.get_ohlcv_provider__account_or_store()
 
         # Always fetch OHLCV from MAINNET instead of TESTNET
-        ret_value = mainnet_exchange.fetch_ohlcv(
-            symbol, timeframe=timeframe, since=since, limit=limit, params=params)
+        ret_value = mainnet__account_or_store._invoke_exchange(
+            'fetch_ohlcv', symbol, timeframe=timeframe, since=since, limit=limit, params=params)
         return ret_value
 
+    @single_flight
     @retry
     def fetch_order_book(self, symbol, limit=None, params={}):
         if self.main_net_toggle_switch_value == True:
-            mainnet_exchange = self.exchange
+            mainnet__account_or_store = self
         else:
-            ohlcv_provider__account_or_store = self.parent.get_ohlcv_provider__account_or_store()
-            mainnet_exchange = ohlcv_provider__account_or_store.exchange
+            mainnet__account_or_store = self.parent.get_ohlcv_provider__account_or_store()
 
         # Always fetch order book from MAINNET instead of TESTNET
-        ret_value = mainnet_exchange.fetch_order_book(
-            symbol, limit=limit, params=params)
+        ret_value = mainnet__account_or_store._invoke_exchange(
+            'fetch_order_book', symbol, limit=limit, params=params)
         return ret_value
 
     @retry
@@ -2752,7 +3940,8 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         try:
             # Due to nature of order is processed async, the order could not be found immediately right after
             #       order is opened. Hence, perform retry to confirm if that's the case.
-            order = self.exchange.fetch_order(order_id, symbol_id, params)
+            order = self._invoke_exchange(
+                'fetch_order', order_id, symbol_id, params)
         except OrderNotFound:
             # Ignore order not found error
             pass
@@ -2822,8 +4011,6 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         search_into_ws_conditional_order = False
         search_into_ws_active_order = False
         order = None
-        searched__conditional_order_ids = []
-        searched__active_order_ids = []
 
         if self.is_ws_available == True:
             # If we are looking for Conditional Order
@@ -2850,86 +4037,19 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 pass
 
             if search_into_ws_conditional_order == True:
-                if self.debug:
-                    # TODO: Debug use
-                    frameinfo = inspect.getframeinfo(inspect.currentframe())
-                    msg = "{} Line: {}: DEBUG: {}: ".format(
-                        frameinfo.function, frameinfo.lineno,
-                        datetime.datetime.now().isoformat().replace(
-                            "T", " ")[:-3],
-                    )
-                    msg += "len(self.ws_conditional_orders[{}]): {}".format(
-                        symbol_id,
-                        len(self.ws_conditional_orders[symbol_id]),
-                    )
-                    print(msg)
-                    pass
-
-                for i, conditional_order in enumerate(self.ws_conditional_orders[symbol_id]):
-                    searched__conditional_order_ids.append(
-                        conditional_order['id'])
-                    if self.debug:
-                        # TODO: Debug use
-                        frameinfo = inspect.getframeinfo(
-                            inspect.currentframe())
-                        msg = "{} Line: {}: DEBUG: {}: ".format(
-                            frameinfo.function, frameinfo.lineno,
-                            datetime.datetime.now().isoformat().replace(
-                                "T", " ")[:-3],
-                        )
-                        msg += "{}/{}: detected conditional_order['id']: {}".format(
-                            i + 1,
-                            len(self.ws_conditional_orders[symbol_id]),
-                            conditional_order['id'],
-                        )
-                        print(msg)
-
-                    if search_order_id == conditional_order['id']:
-                        # Extract the order from the websocket
-                        order = conditional_order
-                        found_order_in_ws = True
-                        break
+                # Extract the order from the websocket
+                order = self.ws_conditional_orders.get(
+                    symbol_id, search_order_id)
+                if order is not None:
+                    found_order_in_ws = True
 
             if found_order_in_ws == False:
                 if search_into_ws_active_order == True:
-                    if self.debug:
-                        # TODO: Debug use
-                        frameinfo = inspect.getframeinfo(
-                            inspect.currentframe())
-                        msg = "{} Line: {}: DEBUG: {}: ".format(
-                            frameinfo.function, frameinfo.lineno,
-                            datetime.datetime.now().isoformat().replace(
-                                "T", " ")[:-3],
-                        )
-                        msg += "len(self.ws_active_orders[{}]): {}".format(
-                            symbol_id,
-                            len(self.ws_active_orders[symbol_id]),
-                        )
-                        print(msg)
-
-                    for i, active_order in enumerate(self.ws_active_orders[symbol_id]):
-                        searched__active_order_ids.append(active_order['id'])
-                        if self.debug:
-                            # TODO: Debug use
-                            frameinfo = inspect.getframeinfo(
-                                inspect.currentframe())
-                            msg = "{} Line: {}: DEBUG: {}: ".format(
-                                frameinfo.function, frameinfo.lineno,
-                                datetime.datetime.now().isoformat().replace(
-                                    "T", " ")[:-3],
-                            )
-                            msg += "{}/{}: detected active_order['id']: {}".format(
-                                i + 1,
-                                len(self.ws_active_orders[symbol_id]),
-                                active_order['id'],
-                            )
-                            print(msg)
-
-                        if search_order_id == active_order['id']:
-                            # Extract the order from the websocket
-                            order = active_order
-                            found_order_in_ws = True
-                            break
+                    # Extract the order from the websocket
+                    order = self.ws_active_orders.get(
+                        symbol_id, search_order_id)
+                    if order is not None:
+                        found_order_in_ws = True
 
             if found_order_in_ws == False:
                 frameinfo = inspect.getframeinfo(inspect.currentframe())
@@ -2941,10 +4061,12 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 )
                 sub_msg = "searched__conditional_order_ids:"
                 print(msg + sub_msg)
-                pprint(searched__conditional_order_ids)
+                pprint(self.ws_conditional_orders.get_orders_id(
+                    symbol_id) if search_into_ws_conditional_order else [])
                 sub_msg = "searched__active_order_ids:"
                 print(msg + sub_msg)
-                pprint(searched__active_order_ids)
+                pprint(self.ws_active_orders.get_orders_id(symbol_id)
+                       if search_into_ws_active_order else [])
 
                 msg = "{} Line: {}: WARNING: {}: ".format(
                     frameinfo.function, frameinfo.lineno,
@@ -2984,35 +4106,35 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
     @retry
     def _fetch_orders(self, symbol=None, since=None, limit=None, params={}):
         if symbol is None:
-            return self.exchange.fetch_orders(
-                since=since, limit=limit, params=params)
+            return self._invoke_exchange(
+                'fetch_orders', since=since, limit=limit, params=params)
         else:
-            return self.exchange.fetch_orders(
-                symbol=symbol, since=since, limit=limit, params=params)
+            return self._invoke_exchange(
+                'fetch_orders', symbol=symbol, since=since, limit=limit, params=params)
 
     @retry
     def _fetch_opened_orders(self, symbol=None, since=None, limit=None, params={}):
         if symbol is None:
-            return self.exchange.fetch_open_orders(
-                since=since, limit=limit, params=params)
+            return self._invoke_exchange(
+                'fetch_open_orders', since=since, limit=limit, params=params)
         else:
-            return self.exchange.fetch_open_orders(
-                symbol=symbol, since=since, limit=limit, params=params)
+            return self._invoke_exchange(
+                'fetch_open_orders', symbol=symbol, since=since, limit=limit, params=params)
 
     @retry
     def _fetch_closed_orders(self, symbol=None, since=None, limit=None, params={}):
         if symbol is None:
-            return self.exchange.fetch_closed_orders(
-                since=since, limit=limit, params=params)
+            return self._invoke_exchange(
+                'fetch_closed_orders', since=since, limit=limit, params=params)
         else:
-            return self.exchange.fetch_closed_orders(
-                symbol=symbol, since=since, limit=limit, params=params)
+            return self._invoke_exchange(
+                'fetch_closed_orders', symbol=symbol, since=since, limit=limit, params=params)
 
     @retry
     def _fetch_opened_positions_from_exchange(self, symbols=None, params={}):
         assert len(symbols) == 1
         # pprint("symbols: {}, params: {}".format(symbols, params))
-        return self.exchange.fetch_positions(symbols=symbols, params=params)
+        return self._invoke_exchange('fetch_positions', symbols=symbols, params=params)
 
     def _fetch_opened_positions(self, symbols=None, params={}):
         assert len(symbols) == 1
@@ -3069,9 +4191,90 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
             # Do nothing here
             pass
 
+    def _fetch_reconciliation_orders(self, symbol_id, since) -> tuple:
+        '''
+        Return the opened orders and the orders closed since the timestamp (all of them if None) of the symbol, both
+        keyed by ccxt_id
+        '''
+        fetch_ccxt_orders__params = [dict(
+            # CCXT requires the market type name to be specified correctly
+            type=CCXT__MARKET_TYPES[self.market_type],
+        )]
+        if self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+            # Bybit serves conditional orders from a separate end point
+            fetch_ccxt_orders__params.append(dict(
+                type=CCXT__MARKET_TYPES[self.market_type],
+                stop=True,
+            ))
+
+        opened_bt_ccxt_orders__dict = collections.OrderedDict()
+        closed_bt_ccxt_orders__dict = collections.OrderedDict()
+        for fetch_ccxt_orders__dict in fetch_ccxt_orders__params:
+            # Opened orders are bounded by nature, hence never filtered by the watermark
+            for bt_ccxt_order in self.fetch_opened_orders(symbol=symbol_id,
+                                                          since=None,
+                                                          limit=None,
+                                                          params=fetch_ccxt_orders__dict):
+                opened_bt_ccxt_orders__dict[bt_ccxt_order.ccxt_id] = bt_ccxt_order
+
+            for bt_ccxt_order in self.fetch_closed_orders(symbol=symbol_id,
+                                                          since=since,
+                                                          limit=None,
+                                                          params=fetch_ccxt_orders__dict):
+                closed_bt_ccxt_orders__dict[bt_ccxt_order.ccxt_id] = bt_ccxt_order
+
+        ret_value = (opened_bt_ccxt_orders__dict,
+                     closed_bt_ccxt_orders__dict, )
+        return ret_value
+
     def _post_process__after_child_is_added(self, instrument):
+        if self.deferred_recovery == True:
+            with self.pending_recovery__lock:
+                is_deferred = self.is_recovery_coordinated == False
+                if is_deferred == True:
+                    # Leave it to Crash_Recovery_Coordinator to recover every instrument concurrently
+                    self.pending_recovery__instruments.append(instrument)
+            if is_deferred == True:
+                return
+
+            msg = "{} Line: {}: {}: WARNING: ".format(
+                inspect.getframeinfo(inspect.currentframe()).function,
+                inspect.getframeinfo(inspect.currentframe()).lineno,
+                datetime.datetime.now().isoformat().replace("T", " ")[:-3],
+            )
+            sub_msg = "{} is added after Crash_Recovery_Coordinator has run, hence recovered right away".format(
+                instrument.symbol_id)
+            print(msg + sub_msg)
+
+        recovery_plan = self.fetch_recovery_plan(instrument)
+        self.apply_recovery_plan(recovery_plan)
+
+    def pop_pending_recovery__instruments(self) -> list:
+        with self.pending_recovery__lock:
+            instruments = self.pending_recovery__instruments
+            self.pending_recovery__instruments = []
+            self.is_recovery_coordinated = True
+        return instruments
+
+    def push_back_pending_recovery__instruments(self, instruments) -> None:
+        '''
+        Hand the instruments Crash_Recovery_Coordinator failed to recover back so that its next recover retries them
+        '''
+        assert isinstance(instruments, list)
+        with self.pending_recovery__lock:
+            self.pending_recovery__instruments = instruments + \
+                self.pending_recovery__instruments
+
+    def fetch_recovery_plan(self, instrument) -> dict:
+        '''
+        Network bound half of the restart reconciliation of the instrument. Look up every persisted order on the
+        exchange without touching any state of this account_or_store, hence safe to run concurrently across instruments.
+        '''
+        # Anything placed from here onwards is seen by this process, hence becomes the watermark of the next restart
+        reconciliation_timestamp = int(time.time() * 1000)
+
         # Verify [Entry] order is captured in Persistent Storage
-        read_from_persistent_storage__dict = dict(
+        persistent_storage__dict = dict(
             exchange_dropdown_value=self.exchange_dropdown_value,
             market_type=self.market_type,
             main_net_toggle_switch_value=self.main_net_toggle_switch_value,
@@ -3079,8 +4282,9 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
         )
         dataframe = \
             read_from_persistent_storage(
-                params=read_from_persistent_storage__dict)
+                params=persistent_storage__dict)
 
+        persisted_orders = []
         if dataframe is not None:
             # If there is at least one ccxt_orders_id discovered
             if len(dataframe) > 0:
@@ -3089,172 +4293,194 @@ class BT_CCXT_Account_or_Store(backtrader.with_metaclass(Meta_Account_or_Store,
                 ccxt_orders_id = \
                     dataframe[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]].tolist()
 
-                fetch_ccxt_orders__dict = dict(
-                    # CCXT requires the market type name to be specified correctly
-                    type=CCXT__MARKET_TYPES[self.market_type],
-                )
-                opened_bt_ccxt_orders = \
-                    self.fetch_opened_orders(symbol=instrument.symbol_id,
-                                             since=None,
-                                             limit=None,
-                                             params=fetch_ccxt_orders__dict)
-
-                if self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
-                    fetch_ccxt_orders__dict.update(dict(
-                        stop=True,
-                    ))
-                    opened_bt_ccxt_orders += \
-                        self.fetch_opened_orders(symbol=instrument.symbol_id,
-                                                 since=None,
-                                                 limit=None,
-                                                 params=fetch_ccxt_orders__dict)
-
-                closed_bt_ccxt_orders = \
-                    self.fetch_closed_orders(symbol=instrument.symbol_id,
-                                             since=None,
-                                             limit=None,
-                                             params=fetch_ccxt_orders__dict)
-
-                if self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
-                    fetch_ccxt_orders__dict.update(dict(
-                        stop=True,
-                    ))
-                    closed_bt_ccxt_orders += \
-                        self.fetch_closed_orders(symbol=instrument.symbol_id,
-                                                 since=None,
-                                                 limit=None,
-                                                 params=fetch_ccxt_orders__dict)
+                # Only look back as far as the previous reconciliation
+                since = None
+                watermark = read_reconciliation_watermark(
+                    params=persistent_storage__dict)
+                if watermark is not None:
+                    since = max(
+                        0, watermark - int(self.reconciliation_watermark_overlap_in_seconds * 1000))
+
+                (opened_bt_ccxt_orders__dict, closed_bt_ccxt_orders__dict, ) = \
+                    self._fetch_reconciliation_orders(
+                        instrument.symbol_id, since)
 
                 if self.ut_modify_open_to_ccxt_status:
                     if self.ut_modify_open_to_ccxt_status == CLOSED_ORDER:
-                        closed_bt_ccxt_orders += opened_bt_ccxt_orders
+                        closed_bt_ccxt_orders__dict.update(
+                            opened_bt_ccxt_orders__dict)
 
                     # Clear the opened orders
-                    opened_bt_ccxt_orders = []
+                    opened_bt_ccxt_orders__dict = collections.OrderedDict()
 
                 for ordering_type, ccxt_order_id in zip(ordering_type_list, ccxt_orders_id):
-                    found_opened = False
-                    bt_ccxt_order = None
-                    for opened_bt_ccxt_order in opened_bt_ccxt_orders:
-                        if opened_bt_ccxt_order.ccxt_id == ccxt_order_id:
-                            bt_ccxt_order = opened_bt_ccxt_order
-                            found_opened = True
-                            break
-
-                    found_closed = False
-                    if found_opened == False:
-                        for closed_bt_ccxt_order in closed_bt_ccxt_orders:
-                            if closed_bt_ccxt_order.ccxt_id == ccxt_order_id:
-                                found_closed = True
-                                break
-
-                    if found_opened == True:
-                        legality_check_not_none_obj(
-                            bt_ccxt_order, "bt_ccxt_order")
-
-                        # Stage 1 of STAGES_OF_RESEND_NOTIFICATION
-                        if bt_ccxt_order.status == backtrader.Order.Submitted:
-                            # Notify using clone so that UT could snapshot the order
-                            submitted_bt_ccxt_order = bt_ccxt_order.clone()
-                            if self.ut_keep_original_ccxt_order:
-                                self.notified_bt_ccxt_orders.append(
-                                    submitted_bt_ccxt_order)
-                            self.notify(submitted_bt_ccxt_order)
-
-                            # Convert to Accepted
-                            bt_ccxt_order.status = backtrader.Order.Accepted
-                            bt_ccxt_order.status_name = backtrader.Order.Status[bt_ccxt_order.status]
-
-                        self.open_orders.append(bt_ccxt_order)
-
-                        # Delegate to next to handle next course of action
-                        self.next(ut_provided__new_ccxt_order=True)
-                    else:
-                        # Validate assumption made
-                        assert bt_ccxt_order is None
-
-                        if found_closed == False:
-                            # Get the order from exchange
-                            if ordering_type == backtrader.Order.ACTIVE_ORDERING_TYPE:
-                                ccxt_order = self.fetch_ccxt_order(
-                                    instrument.symbol_id, order_id=ccxt_order_id)
-                            else:
-                                # Validate assumption made
-                                assert ordering_type == backtrader.Order.CONDITIONAL_ORDERING_TYPE
-
-                                ccxt_order = self.fetch_ccxt_order(
-                                    instrument.symbol_id, stop_order_id=ccxt_order_id)
-
-                            if ccxt_order is not None:
-                                if self.ut_modify_open_to_ccxt_status:
-                                    force_ccxt_order_status__dict = dict(
-                                        ccxt_order=ccxt_order,
-                                        ut_modify_open_to_ccxt_status=self.ut_modify_open_to_ccxt_status,
-                                        bt_ccxt_exchange=self.parent,
-                                    )
-                                    ccxt_order = force_ccxt_order_status(
-                                        params=force_ccxt_order_status__dict)
-
-                                datafeed = None
-                                handle_orders_routine__dict = dict(
-                                    ccxt_orders=[ccxt_order],
-
-                                    # Optional Params
-                                    datafeed=datafeed,
-                                    skip_post_processing=True,
-                                )
-                                notified_bt_ccxt_orders = \
-                                    self._common_handle_orders_routine(
-                                        params=handle_orders_routine__dict)
-                                assert len(notified_bt_ccxt_orders) == 1
-                                bt_ccxt_order = notified_bt_ccxt_orders[0]
-
-                                # Stage 1 of STAGES_OF_RESEND_NOTIFICATION
-                                if bt_ccxt_order.status == backtrader.Order.Submitted:
-                                    # Notify using clone so that UT could snapshot the order
-                                    submitted_bt_ccxt_order = bt_ccxt_order.clone()
-                                    if self.ut_keep_original_ccxt_order:
-                                        self.notified_bt_ccxt_orders.append(
-                                            submitted_bt_ccxt_order)
-                                    self.notify(submitted_bt_ccxt_order)
-
-                                    # Convert to Accepted
-                                    bt_ccxt_order.status = backtrader.Order.Accepted
-                                    bt_ccxt_order.status_name = \
-                                        backtrader.Order.Status[bt_ccxt_order.status]
-
-                                # Stage 2 of STAGES_OF_RESEND_NOTIFICATION
-                                if bt_ccxt_order.status == backtrader.Order.Accepted:
-                                    # Notify using clone so that UT could snapshot the order
-                                    accepted_bt_ccxt_order = bt_ccxt_order.clone()
-                                    if self.ut_keep_original_ccxt_order:
-                                        self.notified_bt_ccxt_orders.append(
-                                            accepted_bt_ccxt_order)
-                                    self.notify(accepted_bt_ccxt_order)
-
-                                self.open_orders.append(bt_ccxt_order)
-
-                                # Stage 3 of STAGES_OF_RESEND_NOTIFICATION
-                                # Delegate to next to handle next course of action
-                                self.next(ut_provided__new_ccxt_order=True)
-
-                        # If the order no longer present in the opened list
-                        delete_from_persistent_storage__dict = dict(
-                            ordering_type=ordering_type,
-                            ccxt_order_id=ccxt_order_id,
-                            exchange_dropdown_value=self.exchange_dropdown_value,
-                            market_type=self.market_type,
-                            main_net_toggle_switch_value=self.main_net_toggle_switch_value,
-                            symbol_id=instrument.symbol_id,
+                    bt_ccxt_order = opened_bt_ccxt_orders__dict.get(
+                        ccxt_order_id, None)
+
+                    ccxt_order = None
+                    if bt_ccxt_order is None and ccxt_order_id not in closed_bt_ccxt_orders__dict.keys():
+                        # Get the order from exchange
+                        if ordering_type == backtrader.Order.ACTIVE_ORDERING_TYPE:
+                            ccxt_order = self.fetch_ccxt_order(
+                                instrument.symbol_id, order_id=ccxt_order_id)
+                        else:
+                            # Validate assumption made
+                            assert ordering_type == backtrader.Order.CONDITIONAL_ORDERING_TYPE
+
+                            ccxt_order = self.fetch_ccxt_order(
+                                instrument.symbol_id, stop_order_id=ccxt_order_id)
+
+                        # An order placed before the watermark that has since been closed would have been in the
+                        #       closed list had the whole history been fetched
+                        if ccxt_order is not None and since is not None and \
+                                ccxt_order[CCXT_STATUS_KEY] in CCXT_TERMINAL_MAPPING_VALUES:
+                            ccxt_order = None
+
+                    persisted_orders.append(dict(
+                        ordering_type=ordering_type,
+                        ccxt_order_id=ccxt_order_id,
+                        bt_ccxt_order=bt_ccxt_order,
+                        ccxt_order=ccxt_order,
+                    ))
+
+        recovery_plan = dict(
+            instrument=instrument,
+            persistent_storage__dict=persistent_storage__dict,
+            reconciliation_timestamp=reconciliation_timestamp,
+            persisted_orders=persisted_orders,
+        )
+        return recovery_plan
+
+    def apply_recovery_plan(self, recovery_plan, call_next=True) -> bool:
+        '''
+        State changing half of the restart reconciliation. Notify and reinstate the orders found by
+        fetch_recovery_plan. Must be called from one thread at a time.
+
+        :return: True if at least one order is reinstated
+        '''
+        persistent_storage__dict = recovery_plan['persistent_storage__dict']
+
+        reinstated_order = False
+        for persisted_order in recovery_plan['persisted_orders']:
+            bt_ccxt_order = persisted_order['bt_ccxt_order']
+            ccxt_order = persisted_order['ccxt_order']
+
+            if bt_ccxt_order is not None:
+                # Stage 1 of STAGES_OF_RESEND_NOTIFICATION
+                if bt_ccxt_order.status == backtrader.Order.Submitted:
+                    # Notify using clone so that UT could snapshot the order
+                    submitted_bt_ccxt_order = bt_ccxt_order.clone()
+                    if self.ut_keep_original_ccxt_order:
+                        self.notified_bt_ccxt_orders.append(
+                            submitted_bt_ccxt_order)
+                    self.notify(submitted_bt_ccxt_order)
+
+                    # Convert to Accepted
+                    bt_ccxt_order.status = backtrader.Order.Accepted
+                    bt_ccxt_order.status_name = backtrader.Order.Status[bt_ccxt_order.status]
+
+                self._add_open_order(bt_ccxt_order)
+                reinstated_order = True
+            else:
+                if ccxt_order is not None:
+                    if self.ut_modify_open_to_ccxt_status:
+                        force_ccxt_order_status__dict = dict(
+                            ccxt_order=ccxt_order,
+                            ut_modify_open_to_ccxt_status=self.ut_modify_open_to_ccxt_status,
+                            bt_ccxt_exchange=self.parent,
                         )
-                        delete_from_persistent_storage(
-                            params=delete_from_persistent_storage__dict)
+                        ccxt_order = force_ccxt_order_status(
+                            params=force_ccxt_order_status__dict)
+
+                    datafeed = None
+                    handle_orders_routine__dict = dict(
+                        ccxt_orders=[ccxt_order],
 
+                        # Optional Params
+                        datafeed=datafeed,
+                        skip_post_processing=True,
+                    )
+                    notified_bt_ccxt_orders = \
+                        self._common_handle_orders_routine(
+                            params=handle_orders_routine__dict)
+                    assert len(notified_bt_ccxt_orders) == 1
+                    bt_ccxt_order = notified_bt_ccxt_orders[0]
+
+                    # Stage 1 of STAGES_OF_RESEND_NOTIFICATION
+                    if bt_ccxt_order.status == backtrader.Order.Submitted:
+                        # Notify using clone so that UT could snapshot the order
+                        submitted_bt_ccxt_order = bt_ccxt_order.clone()
+                        if self.ut_keep_original_ccxt_order:
+                            self.notified_bt_ccxt_orders.append(
+                                submitted_bt_ccxt_order)
+                        self.notify(submitted_bt_ccxt_order)
+
+                        # Convert to Accepted
+                        bt_ccxt_order.status = backtrader.Order.Accepted
+                        bt_ccxt_order.status_name = \
+                            backtrader.Order.Status[bt_ccxt_order.status]
+
+                    # Stage 2 of STAGES_OF_RESEND_NOTIFICATION
+                    if bt_ccxt_order.status == backtrader.Order.Accepted:
+                        # Notify using clone so that UT could snapshot the order
+                        accepted_bt_ccxt_order = bt_ccxt_order.clone()
+                        if self.ut_keep_original_ccxt_order:
+                            self.notified_bt_ccxt_orders.append(
+                                accepted_bt_ccxt_order)
+                        self.notify(accepted_bt_ccxt_order)
+
+                    self._add_open_order(bt_ccxt_order)
+                    reinstated_order = True
+
+                # If the order no longer present in the opened list
+                delete_from_persistent_storage__dict = dict(
+                    ordering_type=persisted_order['ordering_type'],
+                    ccxt_order_id=persisted_order['ccxt_order_id'],
+                )
+                delete_from_persistent_storage__dict.update(
+                    persistent_storage__dict)
+                delete_from_persistent_storage(
+                    params=delete_from_persistent_storage__dict)
+
+        # Stage 3 of STAGES_OF_RESEND_NOTIFICATION
+        # Delegate to next once to handle next course of action of every reinstated order
+        if reinstated_order == True and call_next == True:
+            self.next(ut_provided__new_ccxt_order=True)
+
+        save_reconciliation_watermark__dict = dict(
+            timestamp=recovery_plan['reconciliation_timestamp'],
+        )
+        save_reconciliation_watermark__dict.update(persistent_storage__dict)
+        save_reconciliation_watermark(
+            params=save_reconciliation_watermark__dict)
+        return reinstated_order
+
+    def get_quote(self, symbol_id):
+        '''
+        :return: The latest websocket quote of the symbol if it is fresh enough to price orders with, otherwise None
+        '''
+        # Instrument info is streamed from mainnet, which does not reflect the book of testnet
+        if self.main_net_toggle_switch_value == False:
+            return None
+
+        # The owner reads its own quotes without going through the hub, which could be in another process
+        if self.is_market_data_owner == True:
+            return self.quote_store.get(symbol_id, max_age_in_seconds=self.quote_max_age_in_seconds)
+        return self.market_data_hub.get_latest(INSTRUMENT_INFO_TOPIC, symbol_id,
+                                               max_age_in_seconds=self.quote_max_age_in_seconds)
+
+    @single_flight
     @retry
     def _get_orderbook(self, symbol_id):
-        return self.exchange.fetchOrderBook(symbol=symbol_id)
+        return self._invoke_exchange('fetch_order_book', symbol=symbol_id)
 
     def get_orderbook(self, symbol_id):
+        # Serve from the book maintained by the depth stream whenever it is in sync and fresh
+        if self.local_order_books is not None and symbol_id in self.local_order_books.keys():
+            local_order_book = self.local_order_books[symbol_id]
+            if local_order_book.is_synced(max_age_in_seconds=self.order_book_max_age_in_seconds) == True:
+                return local_order_book.get_snapshot()
+
         response = self._get_orderbook(symbol_id=symbol_id)
         '''
         Sample response:
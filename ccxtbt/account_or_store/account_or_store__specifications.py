@@ -1,2 +1,49 @@
 DEFAULT_ACCOUNT_ALIAS = "Main"
 STAGES_OF_RESEND_NOTIFICATION = 3
+
+# Reconcile open orders with one fetch_open_orders per symbol per tick instead of one fetch_order per order
+DEFAULT__BATCHED_ORDER_POLLING = True
+
+# Time given to the websocket to acknowledge a submitted or cancelled order before falling back to HTTP
+DEFAULT__ORDER_STATE_WAIT__TIMEOUT_IN_SECONDS = 3.0
+
+# Time given to the websocket to deliver an order between two HTTP lookups
+ORDER_STATE_RETRY_INTERVAL_IN_SECONDS = 0.1
+
+# Websocket handlers push the id of every updated order to a worker thread which applies it, so that next() has
+#       nothing to poll
+DEFAULT__PUSH_ORDER_NOTIFICATION = False
+
+# Serve the wallet balance from memory and only hit the exchange when the cached copy is older than this
+DEFAULT__BALANCE_CACHE__TTL_IN_SECONDS = 5.0
+
+# Safety net used when the private wallet stream keeps the cached balance up to date
+DEFAULT__BALANCE_CACHE__WEBSOCKET_TTL_IN_SECONDS = 60.0
+
+# Time given to the websocket position stream to catch up with a fill before falling back to HTTP
+DEFAULT__POSITION_STATE_WAIT__TIMEOUT_IN_SECONDS = 1.0
+
+# Restart reconciliation only fetches closed orders since the previous reconciliation minus this overlap, which absorbs
+#       clock skew against the exchange and orders placed moments before the previous shutdown
+DEFAULT__RECONCILIATION__WATERMARK_OVERLAP_IN_SECONDS = 300.0
+
+# Reconcile persisted orders as soon as the instrument is added. Set to True to let Crash_Recovery_Coordinator recover
+#       every instrument of every account concurrently before Enhanced_Cerebro.run starts the strategies
+DEFAULT__DEFERRED_RECOVERY = False
+
+# Websocket connections of a Bybit account as registered with Websocket_Supervisor
+BYBIT_WEBSOCKET_CONNECTIONS = ('usdt_perpetual', 'mainnet_usdt_perpetual', )
+USDT_PERPETUAL_CONNECTION, MAINNET_USDT_PERPETUAL_CONNECTION, = range(
+    len(BYBIT_WEBSOCKET_CONNECTIONS))
+
+# Serve Binance order, position and kline updates over the user data and market streams instead of polling over HTTP
+DEFAULT__BINANCE_WEBSOCKET = True
+
+# Websocket connections of a Binance account as registered with Websocket_Supervisor
+BINANCE_WEBSOCKET_CONNECTIONS = ('user_data', 'mainnet_market', )
+USER_DATA_CONNECTION, MAINNET_MARKET_CONNECTION, = range(
+    len(BINANCE_WEBSOCKET_CONNECTIONS))
+
+# Housekeeping of an OHLCV_PROVIDER registered with Websocket_Supervisor, which takes the public streams over from a
+#       market data hub owner that has released them or gone silent
+MARKET_DATA_HUB_OWNERSHIP_TASK = "market_data_hub_ownership"
@@ -0,0 +1,101 @@
+import asyncio
+import concurrent.futures
+import threading
+
+from ccxt.base.errors import RequestTimeout
+
+from ccxtbt.async_exchange.async_exchange__specifications import DEFAULT__ASYNC_EXCHANGE__TIMEOUT_IN_SECONDS
+from ccxtbt.utils import legality_check_not_none_obj
+
+
+class Async_Exchange_Bridge(object):
+    '''
+    Owns a ccxt.async_support exchange together with a private event loop running in a daemon thread. Independent
+    requests are awaited concurrently on that loop while the caller keeps a synchronous API, which is what
+    Enhanced_Cerebro expects from the account_or_store.
+
+    :param exchange_constructor: Exchange class, or the id of a ccxt.async_support exchange which is then imported on
+        construction only so that accounts not in async mode never load aiohttp
+    '''
+
+    def __init__(self, exchange_constructor, config, timeout_in_seconds=None):
+        # Legality Check
+        legality_check_not_none_obj(
+            exchange_constructor, "exchange_constructor")
+        legality_check_not_none_obj(config, "config")
+
+        if timeout_in_seconds is None:
+            timeout_in_seconds = DEFAULT__ASYNC_EXCHANGE__TIMEOUT_IN_SECONDS
+        self.timeout_in_seconds = timeout_in_seconds
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self._run_loop, name="Async_Exchange_Bridge", daemon=True)
+        self.thread.start()
+
+        # Construct the exchange within the loop so that its HTTP session is bound to the loop
+        self.exchange = self.run(
+            self._construct_exchange(exchange_constructor, config))
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: exchange: {}, is_running: {}".format(
+            type(self).__name__, type(self.exchange).__name__, self.loop.is_running())
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _construct_exchange(self, exchange_constructor, config):
+        if isinstance(exchange_constructor, str):
+            import ccxt.async_support as ccxt_async
+            exchange_constructor = getattr(ccxt_async, exchange_constructor)
+        return exchange_constructor(config)
+
+    async def _gather(self, calls):
+        coroutines = []
+        for (method_name, args, kwargs) in calls:
+            coroutines.append(
+                getattr(self.exchange, method_name)(*args, **kwargs))
+        return await asyncio.gather(*coroutines, return_exceptions=True)
+
+    def run(self, coroutine):
+        '''
+        Block the calling thread until the coroutine completes on the event loop and return its result. Raise ccxt's
+        RequestTimeout should it take longer than the timeout.
+        '''
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout=self.timeout_in_seconds)
+        except concurrent.futures.TimeoutError:
+            # Cancel the coroutine on the loop instead of leaving it in flight, then let the retry layer and the
+            # circuit breaker see it as the ccxt network error it is
+            future.cancel()
+            raise RequestTimeout("{}: timed out after {}s".format(
+                type(self).__name__, self.timeout_in_seconds))
+
+    def call(self, method_name, *args, **kwargs):
+        return self.run(getattr(self.exchange, method_name)(*args, **kwargs))
+
+    def gather(self, calls):
+        '''
+        Issue every (method_name, args, kwargs) call concurrently and return the results in the same order. A
+        failed call yields its exception in place of the result so that the caller could decide how to recover.
+        '''
+        assert isinstance(calls, list)
+        if len(calls) == 0:
+            return []
+        return self.run(self._gather(calls))
+
+    def close(self):
+        if self.loop.is_closed():
+            return
+
+        close_method = getattr(self.exchange, 'close', None)
+        if close_method is not None:
+            self.run(close_method())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
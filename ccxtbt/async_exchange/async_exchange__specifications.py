@@ -0,0 +1,5 @@
+# Maximum time the synchronous caller waits for a coroutine submitted to the event loop
+DEFAULT__ASYNC_EXCHANGE__TIMEOUT_IN_SECONDS = 60
+
+# Keep the blocking ccxt exchange unless the account config explicitly opts in
+DEFAULT__ASYNC_MODE = False
@@ -16,7 +16,7 @@ from time import time as timer
 from ccxtbt.cerebro.cerebro__specifications import enhanced_cerebro_force_get_data__dict_template, \
     enhanced_cerebro_new_check_data__dict_template
 from ccxtbt.parallel_processing.parallel_processing__helper import prep_threads, run_threads
-from ccxtbt.parallel_processing.parallel_processing__classes import Thread_Skeleton
+from ccxtbt.parallel_processing.parallel_processing__classes import Crash_Recovery_Coordinator, Thread_Skeleton
 from ccxtbt.parallel_processing.parallel_processing__specifications import thread_queue__dict_template
 from ccxtbt.utils import legality_check_not_none_obj
 
@@ -626,6 +626,13 @@ class Enhanced_Cerebro(backtrader.Cerebro):
             if key in pkeys:
                 setattr(self.params, key, val)
 
+        # Strategies must only start once every order persisted by the previous run has been reconciled
+        if hasattr(self._broker_or_exchange, 'get__children'):
+            crash_recovery_coordinator = \
+                Crash_Recovery_Coordinator(
+                    list(self._broker_or_exchange.get__children()))
+            crash_recovery_coordinator.recover()
+
         # Manage activate/deactivate object cache
         linebuffer.LineActions.cleancache()  # clean cache
         indicator.Indicator.cleancache()  # clean cache
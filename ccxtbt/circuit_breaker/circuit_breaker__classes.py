@@ -0,0 +1,92 @@
+import threading
+
+from ccxt.base.errors import ExchangeNotAvailable
+from time import monotonic
+
+from ccxtbt.circuit_breaker.circuit_breaker__specifications import CIRCUIT_BREAKER_STATES, CLOSED_STATE, \
+    HALF_OPEN_STATE, OPEN_STATE
+
+
+class Circuit_Breaker_Open_Error(ExchangeNotAvailable):
+    pass
+
+
+class Circuit_Breaker(object):
+    '''
+    Track consecutive failures of an end point. Once the failure threshold is reached, the breaker opens and requests
+    fail fast until the reset timeout lapses. A single probe request is then let through; its success closes the
+    breaker while its failure re-opens it.
+    '''
+
+    def __init__(self, name, failure_threshold, reset_timeout_in_seconds):
+        # Legality Check
+        assert failure_threshold > 0, "failure_threshold: {} must be positive!!!".format(
+            failure_threshold)
+        assert reset_timeout_in_seconds > 0, \
+            "reset_timeout_in_seconds: {} must be positive!!!".format(
+                reset_timeout_in_seconds)
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_in_seconds = reset_timeout_in_seconds
+
+        self.lock = threading.Lock()
+        self.state = CLOSED_STATE
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_started_at = None
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: state: {}, consecutive_failures: {}/{}".format(
+            type(self).__name__, self.name, CIRCUIT_BREAKER_STATES[self.state],
+            self.consecutive_failures, self.failure_threshold)
+
+    def get_state(self):
+        with self.lock:
+            return self.state
+
+    def allow_request(self) -> bool:
+        with self.lock:
+            if self.state == CLOSED_STATE:
+                return True
+
+            now = monotonic()
+            if self.state == OPEN_STATE:
+                if now - self.opened_at < self.reset_timeout_in_seconds:
+                    return False
+                self.state = HALF_OPEN_STATE
+                self.probe_started_at = now
+                return True
+
+            # Validate assumption made
+            assert self.state == HALF_OPEN_STATE
+
+            # Only one probe at a time, unless the probe has gone missing without reporting back
+            if now - self.probe_started_at < self.reset_timeout_in_seconds:
+                return False
+            self.probe_started_at = now
+            return True
+
+    def raise_if_open(self):
+        if not self.allow_request():
+            raise Circuit_Breaker_Open_Error(
+                "{} is failing fast for up to {}s as the end point is degraded".format(
+                    self.name, self.reset_timeout_in_seconds))
+
+    def record_success(self):
+        with self.lock:
+            self.state = CLOSED_STATE
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self.probe_started_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN_STATE or self.consecutive_failures >= self.failure_threshold:
+                self.state = OPEN_STATE
+                self.opened_at = monotonic()
+                self.probe_started_at = None
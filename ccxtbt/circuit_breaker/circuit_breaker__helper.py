@@ -0,0 +1,59 @@
+import random
+import threading
+
+from ccxtbt.circuit_breaker.circuit_breaker__classes import Circuit_Breaker
+from ccxtbt.circuit_breaker.circuit_breaker__specifications import DEFAULT__BACKOFF__BASE_IN_SECONDS, \
+    DEFAULT__BACKOFF__CAP_IN_SECONDS, DEFAULT__CIRCUIT_BREAKER__FAILURE_THRESHOLD, \
+    DEFAULT__CIRCUIT_BREAKER__RESET_TIMEOUT_IN_SECONDS
+from ccxtbt.utils import legality_check_not_none_obj
+
+# Process-wide registry of circuit breakers keyed by (exchange host, end point)
+shared_circuit_breakers = {}
+shared_circuit_breakers__lock = threading.Lock()
+
+
+def get_shared_circuit_breaker(params) -> Circuit_Breaker:
+    # Un-serialize Params
+    host = params['host']
+    endpoint = params['endpoint']
+
+    # Optional Params
+    failure_threshold = params.get('failure_threshold', None)
+    reset_timeout_in_seconds = params.get('reset_timeout_in_seconds', None)
+
+    legality_check_not_none_obj(host, "host")
+    legality_check_not_none_obj(endpoint, "endpoint")
+    if failure_threshold is None:
+        failure_threshold = DEFAULT__CIRCUIT_BREAKER__FAILURE_THRESHOLD
+    if reset_timeout_in_seconds is None:
+        reset_timeout_in_seconds = DEFAULT__CIRCUIT_BREAKER__RESET_TIMEOUT_IN_SECONDS
+
+    key = (host, endpoint, )
+    with shared_circuit_breakers__lock:
+        if key not in shared_circuit_breakers.keys():
+            shared_circuit_breakers[key] = Circuit_Breaker(
+                name="{}/{}".format(host, endpoint),
+                failure_threshold=failure_threshold,
+                reset_timeout_in_seconds=reset_timeout_in_seconds,
+            )
+        circuit_breaker = shared_circuit_breakers[key]
+    return circuit_breaker
+
+
+def get_backoff_delay_in_seconds(params) -> float:
+    '''
+    Exponential backoff with full jitter so that threads retrying the same end point do not retry in lockstep.
+    '''
+    # Un-serialize Params
+    attempt = params['attempt']
+
+    # Optional Params
+    base_in_seconds = params.get('base_in_seconds', None)
+    cap_in_seconds = params.get('cap_in_seconds', None)
+
+    if base_in_seconds is None:
+        base_in_seconds = DEFAULT__BACKOFF__BASE_IN_SECONDS
+    if cap_in_seconds is None:
+        cap_in_seconds = DEFAULT__BACKOFF__CAP_IN_SECONDS
+
+    return random.uniform(0.0, min(cap_in_seconds, base_in_seconds * (2 ** attempt)))
@@ -0,0 +1,12 @@
+CIRCUIT_BREAKER_STATES = ('closed', 'open', 'half_open', )
+CLOSED_STATE, OPEN_STATE, HALF_OPEN_STATE, = range(len(CIRCUIT_BREAKER_STATES))
+
+# Number of consecutive network failures before the end point is considered degraded
+DEFAULT__CIRCUIT_BREAKER__FAILURE_THRESHOLD = 5
+
+# Time to fail fast before a single probe request is let through to test the end point again
+DEFAULT__CIRCUIT_BREAKER__RESET_TIMEOUT_IN_SECONDS = 30.0
+
+# Exponential backoff with full jitter between retries
+DEFAULT__BACKOFF__BASE_IN_SECONDS = 0.1
+DEFAULT__BACKOFF__CAP_IN_SECONDS = 5.0
@@ -1,6 +1,8 @@
 import datetime
 import inspect
-import requests
+import json
+import threading
+import traceback
 
 from pprint import pprint
 
@@ -8,8 +10,11 @@ from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES, CCXT__MARKET_TYPE
     MIN_LEVERAGE, \
     symbol_stationary__dict_template
 from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE__SPOT__V3__HTTP_ENDPOINT_URL, \
-    BINANCE__EXCHANGE_INFO_ENDPOINT, BINANCE__SYMBOL_COMMAND, BINANCE__FUTURES__V1__HTTP_ENDPOINT_URL
+    BINANCE__EXCHANGE_INFO_ENDPOINT, BINANCE__SYMBOL_COMMAND, BINANCE__FUTURES__V1__HTTP_ENDPOINT_URL, \
+    BINANCE__LISTEN_KEY__KEEP_ALIVE_INTERVAL_IN_SECONDS, BINANCE__WS__CONNECT_TIMEOUT_IN_SECONDS, \
+    BINANCE__WS__PING_INTERVAL_IN_SECONDS
 from ccxtbt.expansion.bt_ccxt_expansion__classes import Exchange_HTTP_Parser_Per_Symbol
+from ccxtbt.http_session.http_session__helper import http_get_json
 from ccxtbt.utils import legality_check_not_none_obj, get_digits
 
 
@@ -62,7 +67,13 @@ class Binance_Symbol_Info__HTTP_Parser(Exchange_HTTP_Parser_Per_Symbol):
                 setattr(self, key, None)
 
     def run(self):
-        symbol_exchange_info = requests.get(self.exchange_info_url).json()
+        http_get_json__dict = dict(
+            url=self.exchange_info_url,
+
+            # Optional Params
+            timeout_in_seconds=self.timeout_in_seconds,
+        )
+        symbol_exchange_info = http_get_json(params=http_get_json__dict)
 
         # Legality Check
         if 'symbols' not in symbol_exchange_info.keys():
@@ -114,3 +125,132 @@ class Binance_Symbol_Info__HTTP_Parser(Exchange_HTTP_Parser_Per_Symbol):
                 self.exchange_dropdown_value,
             ))
         pass
+
+
+class Binance_Websocket(object):
+    '''
+    One websocket connection to Binance running websocket-client on its own daemon thread. JSON messages are decoded,
+    unwrapped from the combined stream envelope if any, then handed over to on_message. Every frame received, pong
+    included, is reported to on_heartbeat so that a quiet user data stream is not mistaken for a dropped one.
+
+    A connection is not reused once closed, a new instance is created to reconnect.
+
+    :param websocket_app_factory: Class with the interface of websocket.WebSocketApp, which is the default. Allows a
+        local stand-in to be used instead of Binance.
+    '''
+
+    def __init__(self, url, on_message, on_heartbeat=None, websocket_app_factory=None):
+        self.url = url
+        self.on_message = on_message
+        self.on_heartbeat = on_heartbeat
+        self.websocket_app_factory = websocket_app_factory
+
+        self.connected = False
+        self.opened_event = threading.Event()
+        self.websocket_app = None
+        self.thread = None
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: connected: {}".format(type(self).__name__, self.url, self.connected)
+
+    def connect(self, timeout=None) -> bool:
+        if timeout is None:
+            timeout = BINANCE__WS__CONNECT_TIMEOUT_IN_SECONDS
+
+        websocket_app_factory = self.websocket_app_factory
+        if websocket_app_factory is None:
+            # Only needed by accounts with websocket enabled, hence imported on first connection instead of module load
+            import websocket
+            websocket_app_factory = websocket.WebSocketApp
+
+        self.websocket_app = websocket_app_factory(
+            self.url,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close,
+            on_ping=self._on_frame,
+            on_pong=self._on_frame,
+        )
+        run_forever__dict = dict(
+            ping_interval=BINANCE__WS__PING_INTERVAL_IN_SECONDS,
+        )
+        self.thread = threading.Thread(
+            target=self.websocket_app.run_forever, kwargs=run_forever__dict, daemon=True)
+        self.thread.start()
+
+        self.opened_event.wait(timeout)
+        return self.connected
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def close(self) -> None:
+        self.connected = False
+        if self.websocket_app is not None:
+            self.websocket_app.close()
+
+    def _on_open(self, *args):
+        self.connected = True
+        self.opened_event.set()
+        self._on_frame()
+
+    def _on_frame(self, *args):
+        if self.on_heartbeat is not None:
+            self.on_heartbeat()
+
+    def _on_message(self, websocket_app, message):
+        self._on_frame()
+        event = json.loads(message)
+
+        # Combined stream wraps the event with the name of the stream
+        if 'stream' in event.keys() and 'data' in event.keys():
+            event = event['data']
+        self.on_message(event)
+
+    def _on_error(self, websocket_app, error):
+        frameinfo = inspect.getframeinfo(inspect.currentframe())
+        msg = "{} Line: {}: WARNING: {}: ".format(
+            frameinfo.function, frameinfo.lineno,
+            datetime.datetime.now().isoformat().replace("T", " ")[:-3],
+        )
+        sub_msg = "{}: {}".format(self.url.split("?")[0], error)
+        print(msg + sub_msg)
+
+    def _on_close(self, *args):
+        self.connected = False
+        self.opened_event.set()
+
+
+class Binance_Listen_Key_Keeper(object):
+    '''
+    Keep the listen key of a user data stream alive from a daemon thread until stopped.
+
+    :param keep_alive: Callable extending the validity of the listen key
+    '''
+
+    def __init__(self, keep_alive, interval_in_seconds=None):
+        if interval_in_seconds is None:
+            interval_in_seconds = BINANCE__LISTEN_KEY__KEEP_ALIVE_INTERVAL_IN_SECONDS
+        self.keep_alive = keep_alive
+        self.interval_in_seconds = interval_in_seconds
+
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def run(self) -> None:
+        while self.stop_event.wait(self.interval_in_seconds) == False:
+            try:
+                self.keep_alive()
+            except Exception:
+                traceback.print_exc()
@@ -1,10 +1,16 @@
+import copy
 import datetime
 import inspect
 
 from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES, CCXT__MARKET_TYPE__FUTURE, CCXT__MARKET_TYPE__SPOT, \
-    MIN_LEVERAGE
-from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID
-from ccxtbt.utils import legality_check_not_none_obj
+    MIN_LEVERAGE, risk_limit__dict_template
+from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID, \
+    BINANCE__CONDITIONAL_ORDER_TYPES, BINANCE__FUTURES__ACCOUNT_UPDATE_EVENT, BINANCE__FUTURES__MULTIPLE_WS_STREAM, \
+    BINANCE__FUTURES__ORDER_TRADE_UPDATE_EVENT, BINANCE__FUTURES__SINGLE_WS_STREAM, \
+    BINANCE__FUTURES__TESTNET__SINGLE_WS_STREAM, BINANCE__KLINE_EVENT, BINANCE__KLINE_STREAM, \
+    BINANCE__SPOT__EXECUTION_REPORT_EVENT, BINANCE__SPOT__MULTIPLE_WS_STREAM, BINANCE__SPOT__SINGLE_WS_STREAM, \
+    BINANCE__SPOT__TESTNET__SINGLE_WS_STREAM
+from ccxtbt.utils import get_max_leverage_from_risk_limit, legality_check_not_none_obj
 
 
 def get_binance_commission_rate(params) -> float:
@@ -49,68 +55,74 @@ def get_binance_commission_rate(params) -> float:
     return commission
 
 
-def get_binance_max_leverage(params) -> int:
+def get_binance_risk_limit(params) -> list:
     '''
-    Exchange specific approach to obtain leverage for symbol
+    Exchange specific approach to obtain risk limit tiers for symbol in the form of risk_limit__dict_template
     '''
     # Un-serialize Params
     bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
     market_type = params['market_type']
     symbol_id = params['symbol_id']
-    notional_value = params['notional_value']
 
-    assert notional_value >= 0.0
-
-    max_leverage = None
-    timestamp = int(datetime.datetime.now().timestamp() * 1000)
-    leverage__dict = dict(
-        timestamp=timestamp,
-    )
+    risk_limit = []
     if market_type == CCXT__MARKET_TYPE__FUTURE:
-        # Reference: https://binance-docs.github.io/apidocs/futures/en/#user-leverage-rate-user_data
-        leverage__dict.update(dict(
-            symbol=symbol_id,
-        ))
-        position_bracket = \
-            bt_ccxt_account_or_store.exchange.fapiPrivate_get_leveragebracket(
-                params=leverage__dict)
-
-        point_of_reference = position_bracket[0]
+        # Reference: https://binance-docs.github.io/apidocs/futures/en/#notional-and-leverage-brackets-user_data
+        response = bt_ccxt_account_or_store.exchange.fapiPrivate_get_leveragebracket(
+            {'symbol': symbol_id})
 
+        point_of_reference = response[0]
         # Validate assumption made
         assert point_of_reference['symbol'] == symbol_id
 
-        for i in range(len(point_of_reference['brackets'])):
-            if float(point_of_reference['brackets'][i]['notionalCap']) >= notional_value:
-                max_leverage = int(
-                    point_of_reference['brackets'][i]['initialLeverage'])
-                break
-        pass
-    elif market_type == CCXT__MARKET_TYPE__SPOT:
-        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
-            CCXT__MARKET_TYPES[market_type],
-            BINANCE_EXCHANGE_ID,
-        ))
+        for bracket in point_of_reference['brackets']:
+            risk_limit_dict = copy.deepcopy(risk_limit__dict_template)
+            risk_limit_dict['id'] = bracket['bracket']
+            risk_limit_dict['starting_margin'] = \
+                float(bracket['cum'])
+            risk_limit_dict['maintenance_margin_ratio'] = \
+                float(bracket['maintMarginRatio'])
+            risk_limit_dict['max_leverage'] = \
+                float(bracket['initialLeverage'])
+            risk_limit_dict['min_position_value'] = \
+                float(bracket['notionalFloor'])
+            risk_limit_dict['max_position_value'] = \
+                float(bracket['notionalCap'])
+            risk_limit.append(risk_limit_dict)
     else:
         raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
             CCXT__MARKET_TYPES[market_type],
             BINANCE_EXCHANGE_ID,
         ))
-    legality_check_not_none_obj(max_leverage, "max_leverage")
-    return max_leverage
+    return risk_limit
 
 
-def get_binance_leverages(params) -> tuple:
+def get_binance_max_leverage(params) -> int:
     '''
     Exchange specific approach to obtain leverage for symbol
     '''
     # Un-serialize Params
+    notional_value = params['notional_value']
+
+    # Optional Params
+    risk_limit = params.get('risk_limit', None)
+
+    if risk_limit is None:
+        risk_limit = get_binance_risk_limit(params)
+    max_leverage = int(get_max_leverage_from_risk_limit(
+        risk_limit, notional_value))
+    return max_leverage
+
+
+def get_binance_leverage(params) -> int:
+    '''
+    Exchange specific approach to obtain the current leverage of symbol
+    '''
+    # Un-serialize Params
     bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
     market_type = params['market_type']
     symbol_id = params['symbol_id']
 
     leverage = None
-    max_leverage = None
     timestamp = int(datetime.datetime.now().timestamp() * 1000)
     leverage__dict = dict(
         timestamp=timestamp,
@@ -124,7 +136,6 @@ def get_binance_leverages(params) -> tuple:
             if account_info['positions'][i]['symbol'] == symbol_id:
                 leverage = int(account_info['positions'][i]['leverage'])
                 break
-        max_leverage = get_binance_max_leverage(params)
     elif market_type == CCXT__MARKET_TYPE__SPOT:
         leverage = int(MIN_LEVERAGE)
     else:
@@ -133,7 +144,24 @@ def get_binance_leverages(params) -> tuple:
             BINANCE_EXCHANGE_ID,
         ))
     legality_check_not_none_obj(leverage, "leverage")
-    legality_check_not_none_obj(max_leverage, "max_leverage")
+    return leverage
+
+
+def get_binance_leverages(params) -> tuple:
+    '''
+    Exchange specific approach to obtain leverage for symbol
+    '''
+    # Un-serialize Params
+    market_type = params['market_type']
+
+    leverage = get_binance_leverage(params)
+    if market_type == CCXT__MARKET_TYPE__FUTURE:
+        max_leverage = get_binance_max_leverage(params)
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BINANCE_EXCHANGE_ID,
+        ))
     ret_value = leverage, max_leverage
     return ret_value
 
@@ -187,3 +215,227 @@ def set_binance_leverage(params) -> None:
             CCXT__MARKET_TYPES[market_type],
             BINANCE_EXCHANGE_ID,
         ))
+
+
+def create_binance_listen_key(params) -> str:
+    '''
+    Exchange specific approach to start a user data stream
+    '''
+    # Un-serialize Params
+    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
+    market_type = params['market_type']
+
+    if market_type == CCXT__MARKET_TYPE__FUTURE:
+        # Reference: https://binance-docs.github.io/apidocs/futures/en/#start-user-data-stream-user_stream
+        response = bt_ccxt_account_or_store.exchange.fapiPrivate_post_listenkey()
+    elif market_type == CCXT__MARKET_TYPE__SPOT:
+        # Reference: https://binance-docs.github.io/apidocs/spot/en/#listen-key-spot
+        response = bt_ccxt_account_or_store.exchange.public_post_userdatastream()
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BINANCE_EXCHANGE_ID,
+        ))
+    listen_key = response['listenKey']
+    legality_check_not_none_obj(listen_key, "listen_key")
+    return listen_key
+
+
+def keep_alive_binance_listen_key(params) -> None:
+    '''
+    Exchange specific approach to extend the validity of a user data stream
+    '''
+    # Un-serialize Params
+    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
+    market_type = params['market_type']
+    listen_key = params['listen_key']
+
+    listen_key__dict = dict(
+        listenKey=listen_key,
+    )
+    if market_type == CCXT__MARKET_TYPE__FUTURE:
+        # Reference: https://binance-docs.github.io/apidocs/futures/en/#keepalive-user-data-stream-user_stream
+        bt_ccxt_account_or_store.exchange.fapiPrivate_put_listenkey(
+            params=listen_key__dict)
+    elif market_type == CCXT__MARKET_TYPE__SPOT:
+        bt_ccxt_account_or_store.exchange.public_put_userdatastream(
+            params=listen_key__dict)
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BINANCE_EXCHANGE_ID,
+        ))
+
+
+def close_binance_listen_key(params) -> None:
+    '''
+    Exchange specific approach to close a user data stream
+    '''
+    # Un-serialize Params
+    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
+    market_type = params['market_type']
+    listen_key = params['listen_key']
+
+    listen_key__dict = dict(
+        listenKey=listen_key,
+    )
+    if market_type == CCXT__MARKET_TYPE__FUTURE:
+        # Reference: https://binance-docs.github.io/apidocs/futures/en/#close-user-data-stream-user_stream
+        bt_ccxt_account_or_store.exchange.fapiPrivate_delete_listenkey(
+            params=listen_key__dict)
+    elif market_type == CCXT__MARKET_TYPE__SPOT:
+        bt_ccxt_account_or_store.exchange.public_delete_userdatastream(
+            params=listen_key__dict)
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BINANCE_EXCHANGE_ID,
+        ))
+
+
+def get_binance_user_data_websocket_url(params) -> str:
+    # Un-serialize Params
+    market_type = params['market_type']
+    main_net_toggle_switch_value = params['main_net_toggle_switch_value']
+    listen_key = params['listen_key']
+
+    if market_type == CCXT__MARKET_TYPE__FUTURE:
+        if main_net_toggle_switch_value == True:
+            single_ws_stream = BINANCE__FUTURES__SINGLE_WS_STREAM
+        else:
+            single_ws_stream = BINANCE__FUTURES__TESTNET__SINGLE_WS_STREAM
+    elif market_type == CCXT__MARKET_TYPE__SPOT:
+        if main_net_toggle_switch_value == True:
+            single_ws_stream = BINANCE__SPOT__SINGLE_WS_STREAM
+        else:
+            single_ws_stream = BINANCE__SPOT__TESTNET__SINGLE_WS_STREAM
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BINANCE_EXCHANGE_ID,
+        ))
+    return "{}/{}".format(single_ws_stream, listen_key)
+
+
+def get_binance_market_websocket_url(params) -> str:
+    '''
+    Combined 1 minute kline streams of the symbols, always from MAINNET
+    '''
+    # Un-serialize Params
+    market_type = params['market_type']
+    symbols_id = params['symbols_id']
+
+    if market_type == CCXT__MARKET_TYPE__FUTURE:
+        multiple_ws_stream = BINANCE__FUTURES__MULTIPLE_WS_STREAM
+    elif market_type == CCXT__MARKET_TYPE__SPOT:
+        multiple_ws_stream = BINANCE__SPOT__MULTIPLE_WS_STREAM
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BINANCE_EXCHANGE_ID,
+        ))
+    streams = [BINANCE__KLINE_STREAM.format(
+        symbol_id.lower()) for symbol_id in symbols_id]
+    return "{}={}".format(multiple_ws_stream, "/".join(streams))
+
+
+def parse_binance_ws_order(params) -> dict:
+    '''
+    Translate the order carried by a user data stream event into the shape of the REST order, so that it could be
+    parsed by ccxt parse_order just like the order returned by fetch_order
+    '''
+    # Un-serialize Params
+    market_type = params['market_type']
+    event = params['event']
+
+    if market_type == CCXT__MARKET_TYPE__FUTURE:
+        # Reference: https://binance-docs.github.io/apidocs/futures/en/#event-order-update
+        assert event['e'] == BINANCE__FUTURES__ORDER_TRADE_UPDATE_EVENT
+        order = event['o']
+        average_price = float(order['ap'])
+        filled = float(order['z'])
+        raw_order = dict(
+            orderId=str(order['i']),
+            symbol=order['s'],
+            status=order['X'],
+            clientOrderId=order['c'],
+            price=order['p'],
+            avgPrice=order['ap'],
+            origQty=order['q'],
+            executedQty=order['z'],
+            cumQuote=str(average_price * filled),
+            timeInForce=order['f'],
+            type=order['o'],
+            reduceOnly=order.get('R', False),
+            closePosition=order.get('cp', False),
+            side=order['S'],
+            positionSide=order.get('ps', None),
+            stopPrice=order.get('sp', None),
+            workingType=order.get('wt', None),
+            origType=order.get('ot', order['o']),
+            updateTime=order['T'],
+        )
+    elif market_type == CCXT__MARKET_TYPE__SPOT:
+        # Reference: https://binance-docs.github.io/apidocs/spot/en/#payload-order-update
+        assert event['e'] == BINANCE__SPOT__EXECUTION_REPORT_EVENT
+        raw_order = dict(
+            orderId=str(event['i']),
+            symbol=event['s'],
+            status=event['X'],
+            # Cancellation carries the client order id of the cancel request in 'c' and the original one in 'C'
+            clientOrderId=event['C'] if event.get('C', "") else event['c'],
+            price=event['p'],
+            origQty=event['q'],
+            executedQty=event['z'],
+            cummulativeQuoteQty=event['Z'],
+            timeInForce=event['f'],
+            type=event['o'],
+            side=event['S'],
+            stopPrice=event.get('P', None),
+            isWorking=event.get('w', None),
+            time=event['O'],
+            updateTime=event['T'],
+        )
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BINANCE_EXCHANGE_ID,
+        ))
+    return raw_order
+
+
+def is_binance_conditional_order(raw_order) -> bool:
+    return raw_order['type'] in BINANCE__CONDITIONAL_ORDER_TYPES
+
+
+def parse_binance_ws_positions(event) -> list:
+    '''
+    Translate the positions carried by a futures account update event into the shape of balance['info']['positions']
+    '''
+    # Reference: https://binance-docs.github.io/apidocs/futures/en/#event-balance-and-position-update
+    assert event['e'] == BINANCE__FUTURES__ACCOUNT_UPDATE_EVENT
+    positions = []
+    for position in event['a'].get('P', []):
+        positions.append(dict(
+            symbol=position['s'],
+            positionSide=position['ps'],
+            positionAmt=position['pa'],
+            entryPrice=position['ep'],
+            unrealizedProfit=position['up'],
+        ))
+    return positions
+
+
+def parse_binance_ws_kline(event) -> tuple:
+    '''
+    :return: (symbol_id, tstamp, ohlcv) in the same form as the Bybit kline stream, tstamp being the event time in
+        seconds
+    '''
+    # Reference: https://binance-docs.github.io/apidocs/spot/en/#kline-candlestick-streams
+    assert event['e'] == BINANCE__KLINE_EVENT
+    kline = event['k']
+    tstamp = int(event['E']) / 1e3
+    ohlcv = (float(kline['o']), float(kline['h']), float(
+        kline['l']), float(kline['c']), float(kline['v']))
+    ret_value = (event['s'], tstamp, ohlcv, )
+    return ret_value
@@ -1,3 +1,5 @@
+from ccxtbt.exchange_or_broker.exchange__specifications import BREAK_ACTION
+
 BINANCE_EXCHANGE_ID = "binance"
 BINANCE_OHLCV_LIMIT = 1000
 BINANCE_COMMISSION_PRECISION = 8
@@ -27,6 +29,34 @@ Sample output:
 {"e":"aggTrade","E":1672532700840,"a":1558619352,"s":"BTCUSDT","p":"16531.80","q":"0.021","f":3166759076,"l":3166759076,"T":1672532700685,"m":true}
 '''
 
+# Reference: https://binance-docs.github.io/apidocs/spot/en/#user-data-streams
+BINANCE__SPOT__TESTNET__SINGLE_WS_STREAM = "wss://testnet.binance.vision/ws"
+
+# Reference: https://binance-docs.github.io/apidocs/futures/en/#user-data-streams
+BINANCE__FUTURES__TESTNET__SINGLE_WS_STREAM = "wss://stream.binancefuture.com/ws"
+
+# Listen key expires after 60 minutes unless kept alive. Binance recommends a keep-alive every 30 minutes
+BINANCE__LISTEN_KEY__KEEP_ALIVE_INTERVAL_IN_SECONDS = 30 * 60
+
+# Client side ping, whose pong doubles as the heartbeat of a user data stream that has nothing to report
+BINANCE__WS__PING_INTERVAL_IN_SECONDS = 20
+
+# Time given to a websocket to open before the connection attempt is considered failed
+BINANCE__WS__CONNECT_TIMEOUT_IN_SECONDS = 10.0
+
+# User data and market stream events
+BINANCE__SPOT__EXECUTION_REPORT_EVENT = "executionReport"
+BINANCE__SPOT__ACCOUNT_POSITION_EVENT = "outboundAccountPosition"
+BINANCE__SPOT__BALANCE_UPDATE_EVENT = "balanceUpdate"
+BINANCE__FUTURES__ORDER_TRADE_UPDATE_EVENT = "ORDER_TRADE_UPDATE"
+BINANCE__FUTURES__ACCOUNT_UPDATE_EVENT = "ACCOUNT_UPDATE"
+BINANCE__LISTEN_KEY_EXPIRED_EVENT = "listenKeyExpired"
+BINANCE__KLINE_EVENT = "kline"
+BINANCE__KLINE_STREAM = "{}@kline_1m"
+
+# Orders of these types only enter the book once triggered, hence tracked as conditional orders
+BINANCE__CONDITIONAL_ORDER_TYPES = ("STOP", "STOP_MARKET", "TAKE_PROFIT", "TAKE_PROFIT_MARKET", "TRAILING_STOP_MARKET",
+                                    "STOP_LOSS", "STOP_LOSS_LIMIT", "TAKE_PROFIT_LIMIT", )
 
 BINANCE_SPOT_AND_FUTURES_QTY_DIGITS = 8
 
@@ -51,3 +81,11 @@ BINANCE__FUTURES__COMMISSION_RATE_ENDPOINT = "commissionRate"
 BINANCE__FUTURES__DEFAULT_DUAL_POSITION_MODE = True
 
 BINANCE__PARTIALLY_FILLED__ORDER_STATUS__VALUE = "partially_filled"
+
+# Action taken by the retry layer per code. Unlisted code is retried with backoff.
+BINANCE__EXCHANGE_ERROR_CODE__ACTIONS = {
+    # "Mandatory parameter 'orderId' was not sent, was empty/null, or malformed."
+    -1102: BREAK_ACTION,
+    # "Unknown order sent."
+    -2011: BREAK_ACTION,
+}
@@ -1,6 +1,5 @@
 import datetime
 import inspect
-import requests
 
 from pprint import pprint
 
@@ -11,6 +10,7 @@ from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBI
     BYBIT__SPOT__HTTP_ENDPOINT_URL, BYBIT__SPOT_V3_ENDPOINT, BYBIT__SYMBOLS_COMMAND, \
     BINANCE__USDT__DERIVATIVES__HTTP_ENDPOINT_URL
 from ccxtbt.expansion.bt_ccxt_expansion__classes import Exchange_HTTP_Parser_Per_Symbol
+from ccxtbt.http_session.http_session__helper import http_get_json
 from ccxtbt.utils import legality_check_not_none_obj, get_digits
 
 
@@ -60,7 +60,13 @@ class Bybit_Symbol_Info__HTTP_Parser(Exchange_HTTP_Parser_Per_Symbol):
                 setattr(self, key, None)
 
     def run(self):
-        symbol_exchange_info = requests.get(self.exchange_info_url).json()
+        http_get_json__dict = dict(
+            url=self.exchange_info_url,
+
+            # Optional Params
+            timeout_in_seconds=self.timeout_in_seconds,
+        )
+        symbol_exchange_info = http_get_json(params=http_get_json__dict)
 
         if self.market_type == CCXT__MARKET_TYPE__SPOT:
             ret_code_key = 'retCode'
@@ -1,10 +1,11 @@
 import ccxt
+import copy
 import inspect
 
 from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES, CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP, \
-    CCXT__MARKET_TYPE__SPOT, MIN_LEVERAGE
+    CCXT__MARKET_TYPE__SPOT, MIN_LEVERAGE, risk_limit__dict_template
 from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
-from ccxtbt.utils import legality_check_not_none_obj
+from ccxtbt.utils import get_max_leverage_from_risk_limit, legality_check_not_none_obj
 
 
 def get_wallet_currency(symbol_id):
@@ -84,35 +85,43 @@ def get_bybit_commission_rate(params) -> float:
     return commission
 
 
-def get_bybit_max_leverage(params) -> float:
+def get_bybit_risk_limit(params) -> list:
     '''
-    Exchange specific approach to obtain leverage for symbol
+    Exchange specific approach to obtain risk limit tiers for symbol in the form of risk_limit__dict_template
     '''
     # Un-serialize Params
     bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
     market_type = params['market_type']
     symbol_id = params['symbol_id']
-    notional_value = params['notional_value']
 
-    assert notional_value >= 0.0
-
-    max_leverage = None
+    risk_limit = []
     if market_type == CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP:
         if symbol_id.endswith("USDT"):
             '''
             Reference: https://bybit-exchange.github.io/docs/futuresV2/linear/#t-getrisklimit
             '''
-            # response = bt_ccxt_account_or_store.exchange.private_get_public_linear_risk_limit()
             response = bt_ccxt_account_or_store.exchange.public_get_public_linear_risk_limit(
                 dict(symbol=symbol_id))
 
-            for i in range(len(response['result'])):
+            prev_max_position_value = 0
+            for tier in response['result']:
                 # Validate assumption made
-                assert response['result'][i]['symbol'] == symbol_id
-
-                if float(response['result'][i]['limit']) >= notional_value:
-                    max_leverage = float(response['result'][i]['max_leverage'])
-                    break
+                assert tier['symbol'] == symbol_id
+
+                risk_limit_dict = copy.deepcopy(risk_limit__dict_template)
+                risk_limit_dict['id'] = tier['id']
+                risk_limit_dict['starting_margin'] = \
+                    float(tier['starting_margin'])
+                risk_limit_dict['maintenance_margin_ratio'] = \
+                    float(tier['maintain_margin'])
+                risk_limit_dict['max_leverage'] = \
+                    float(tier['max_leverage'])
+                risk_limit_dict['min_position_value'] = prev_max_position_value
+                risk_limit_dict['max_position_value'] = \
+                    float(tier['limit'])
+                risk_limit.append(risk_limit_dict)
+
+                prev_max_position_value = risk_limit_dict['max_position_value']
             pass
         elif symbol_id.endswith("USD") or symbol_id.endswith("USDC"):
             '''
@@ -128,21 +137,36 @@ def get_bybit_max_leverage(params) -> float:
             CCXT__MARKET_TYPES[market_type],
             BYBIT_EXCHANGE_ID,
         ))
-    legality_check_not_none_obj(max_leverage, "max_leverage")
-    return max_leverage
+    return risk_limit
 
 
-def get_bybit_leverages(params) -> tuple:
+def get_bybit_max_leverage(params) -> float:
     '''
     Exchange specific approach to obtain leverage for symbol
     '''
     # Un-serialize Params
+    notional_value = params['notional_value']
+
+    # Optional Params
+    risk_limit = params.get('risk_limit', None)
+
+    if risk_limit is None:
+        risk_limit = get_bybit_risk_limit(params)
+    max_leverage = float(get_max_leverage_from_risk_limit(
+        risk_limit, notional_value))
+    return max_leverage
+
+
+def get_bybit_leverage(params) -> float:
+    '''
+    Exchange specific approach to obtain the current leverage of symbol
+    '''
+    # Un-serialize Params
     bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
     market_type = params['market_type']
     symbol_id = params['symbol_id']
 
     leverage = None
-    max_leverage = None
     if market_type == CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP:
         response = bt_ccxt_account_or_store.exchange.fetch_positions(
             symbols=[symbol_id], params={'type': CCXT__MARKET_TYPES[market_type]})
@@ -155,8 +179,6 @@ def get_bybit_leverages(params) -> tuple:
         else:
             leverage = float(response['info']['leverage'])
             pass
-
-        max_leverage = get_bybit_max_leverage(params)
     elif market_type == CCXT__MARKET_TYPE__SPOT:
         leverage = MIN_LEVERAGE
     else:
@@ -165,7 +187,24 @@ def get_bybit_leverages(params) -> tuple:
             BYBIT_EXCHANGE_ID,
         ))
     legality_check_not_none_obj(leverage, "leverage")
-    legality_check_not_none_obj(max_leverage, "max_leverage")
+    return leverage
+
+
+def get_bybit_leverages(params) -> tuple:
+    '''
+    Exchange specific approach to obtain leverage for symbol
+    '''
+    # Un-serialize Params
+    market_type = params['market_type']
+
+    leverage = get_bybit_leverage(params)
+    if market_type == CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP:
+        max_leverage = get_bybit_max_leverage(params)
+    else:
+        raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
+            CCXT__MARKET_TYPES[market_type],
+            BYBIT_EXCHANGE_ID,
+        ))
     ret_value = leverage, max_leverage
     return ret_value
 
@@ -1,3 +1,5 @@
+from ccxtbt.exchange_or_broker.exchange__specifications import BREAK_ACTION, RAISE_ACTION
+
 BYBIT_EXCHANGE_ID = "bybit"
 BYBIT_OHLCV_LIMIT = 200
 BYBIT_COMMISSION_PRECISION = 4
@@ -55,3 +57,23 @@ Reference: https://bybit-exchange.github.io/docs/futuresV2/linear/#t-switchposit
 BYBIT__DERIVATIVES__DEFAULT_POSITION_MODE = "BothSide"
 
 BYBIT__PARTIALLY_FILLED__ORDER_STATUS__VALUE = "PartiallyFilled"
+
+# Levels per side of the orderBookL2_25 stream
+# Reference: https://bybit-exchange.github.io/docs/futuresV2/linear/#t-websocketorderbook25
+BYBIT__ORDER_BOOK_STREAM__DEPTH = 25
+
+# Action taken by the retry layer per ret_code. Unlisted ret_code is retried with backoff.
+BYBIT__EXCHANGE_ERROR_CODE__ACTIONS = {
+    # 'current position is zero, cannot fix reduce-only order qty'
+    130125: BREAK_ACTION,
+    # 'expect Rising, but trigger_price[12705000] <= current[12706500]'
+    # This error is likely caused by base_price is incorrectly configured. Hence, it should be raised immediately
+    130074: RAISE_ACTION,
+    # 'expect Failling, but trigger_price[11975000] >= current[11968000]??1'
+    # This error is likely caused by base_price is incorrectly configured. Hence, it should be raised immediately
+    130075: RAISE_ACTION,
+    # 'order not exists or too late to repalce'
+    130010: BREAK_ACTION,
+    # 'order not exists or too late to repalce'
+    20001: BREAK_ACTION,
+}
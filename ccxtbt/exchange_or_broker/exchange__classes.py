@@ -122,6 +122,7 @@ class BT_CCXT_Exchange(backtrader.with_metaclass(backtrader.MetaSingleton, objec
 
         self.account_or_store = None
         self.accounts_or_stores = []
+        self.ohlcv_provider__account_or_store = None
 
     def set__child(self, account_or_store):
         assert account_or_store in self.accounts_or_stores
@@ -139,16 +140,15 @@ class BT_CCXT_Exchange(backtrader.with_metaclass(backtrader.MetaSingleton, objec
         if account_or_store not in self.accounts_or_stores:
             self.accounts_or_stores.append(account_or_store)
 
-    def get_ohlcv_provider__account_or_store(self):
-        ohlcv_provider__account_or_store = None
-
-        for account_or_store in self.accounts_or_stores:
+            # Remembered here so that the lookup does not scan every account on each call. Last one added wins as
+            #       per the previous scan.
             if account_or_store.is_ohlcv_provider == True:
-                ohlcv_provider__account_or_store = account_or_store
+                self.ohlcv_provider__account_or_store = account_or_store
 
+    def get_ohlcv_provider__account_or_store(self):
         legality_check_not_none_obj(
-            ohlcv_provider__account_or_store, "ohlcv_provider__account_or_store")
-        return ohlcv_provider__account_or_store
+            self.ohlcv_provider__account_or_store, "self.ohlcv_provider__account_or_store")
+        return self.ohlcv_provider__account_or_store
 
     def set_account_or_store(self, main_net_toggle_switch_value, account_alias, account_type):
         # Legality Check
@@ -1,16 +1,31 @@
 import os
 import pathlib
+import re
 
 from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES, CCXT__MARKET_TYPE__FUTURE, CCXT__MARKET_TYPE__SPOT
-from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID
+from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID, \
+    BINANCE__EXCHANGE_ERROR_CODE__ACTIONS
 from ccxtbt.exchange_or_broker.bybit.bybit__exchange__helper import get_wallet_currency
-from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
-from ccxtbt.exchange_or_broker.exchange__specifications import FUTURES__MAINNET__API_KEY_AND_SECRET_FILE_NAME, \
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID, \
+    BYBIT__EXCHANGE_ERROR_CODE__ACTIONS
+from ccxtbt.exchange_or_broker.exchange__specifications import RETRY_WITH_BACKOFF_ACTION, \
+    FUTURES__MAINNET__API_KEY_AND_SECRET_FILE_NAME, \
     FUTURES__TESTNET__API_KEY_AND_SECRET_FILE_NAME, MAINNET__API_KEY_AND_SECRET_FILE_NAME, \
     SPOT__MAINNET__API_KEY_AND_SECRET_FILE_NAME, SPOT__TESTNET__API_KEY_AND_SECRET_FILE_NAME, \
     TESTNET__API_KEY_AND_SECRET_FILE_NAME
 from ccxtbt.utils import round_to_nearest_decimal_points
 
+EXCHANGE_ERROR_CODE__ACTIONS = {
+    BINANCE_EXCHANGE_ID: BINANCE__EXCHANGE_ERROR_CODE__ACTIONS,
+    BYBIT_EXCHANGE_ID: BYBIT__EXCHANGE_ERROR_CODE__ACTIONS,
+}
+
+# Extract the error code and message from the exchange response embedded in ccxt exception without parsing it as JSON
+EXCHANGE_ERROR_CODE__PATTERN = re.compile(
+    r'"(?:code|ret_code|retCode)"\s*:\s*"?(-?\d+)')
+EXCHANGE_ERROR_MSG__PATTERN = re.compile(
+    r'"(?:msg|ret_msg|retMsg)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
 
 def get_minimum_instrument_quantity(price, instrument):
     minimum_instrument_quantity = instrument.qty_step
@@ -105,3 +120,31 @@ def get_symbol_id(params):
         raise NotImplementedError(
             "{} exchange is yet to be supported!!!".format(exchange_dropdown_value))
     return symbol_id
+
+
+def classify_exchange_error(params):
+    '''
+    Look up the action the retry layer should take for an exchange error.
+    Returns a tuple of (action, error_code, error_msg). Unknown exchange or error code is retried with backoff.
+    '''
+    # Un-serialize Params
+    exchange_dropdown_value = params['exchange_dropdown_value']
+    exchange_error = params['exchange_error']
+
+    error_string = str(exchange_error)
+    error_code = None
+    error_msg = None
+
+    error_code_match = EXCHANGE_ERROR_CODE__PATTERN.search(error_string)
+    if error_code_match is not None:
+        error_code = int(error_code_match.group(1))
+
+    error_msg_match = EXCHANGE_ERROR_MSG__PATTERN.search(error_string)
+    if error_msg_match is not None:
+        error_msg = error_msg_match.group(1)
+
+    action = RETRY_WITH_BACKOFF_ACTION
+    if exchange_dropdown_value in EXCHANGE_ERROR_CODE__ACTIONS.keys():
+        action = EXCHANGE_ERROR_CODE__ACTIONS[exchange_dropdown_value].get(
+            error_code, RETRY_WITH_BACKOFF_ACTION)
+    return action, error_code, error_msg
@@ -14,3 +14,14 @@ CCXT_COMMON_MAPPING_VALUES = \
     ('open', 'closed', 'canceled', 'cancelled', 'expired', 'rejected', )
 OPEN_VALUE, CLOSED_VALUE, CANCELED_VALUE, CANCELLED_VALUE, EXPIRED_VALUE, REJECTED_VALUE, = \
     range(len(CCXT_COMMON_MAPPING_VALUES))
+
+# An order in any of these statuses will not change anymore
+CCXT_TERMINAL_MAPPING_VALUES = \
+    (CCXT_COMMON_MAPPING_VALUES[CLOSED_VALUE], CCXT_COMMON_MAPPING_VALUES[CANCELED_VALUE],
+     CCXT_COMMON_MAPPING_VALUES[CANCELLED_VALUE], CCXT_COMMON_MAPPING_VALUES[EXPIRED_VALUE],
+     CCXT_COMMON_MAPPING_VALUES[REJECTED_VALUE], )
+
+# Action taken by the retry layer upon an exchange error
+EXCHANGE_ERROR_ACTIONS = ('break', 'raise', 'retry_with_backoff', )
+BREAK_ACTION, RAISE_ACTION, RETRY_WITH_BACKOFF_ACTION, = range(
+    len(EXCHANGE_ERROR_ACTIONS))
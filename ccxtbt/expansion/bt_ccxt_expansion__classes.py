@@ -40,6 +40,10 @@ class Exchange_HTTP_Parser(Wecoz, ABC):
 
         self.market_type_name = CCXT__MARKET_TYPES[self.market_type]
 
+        # Optional attributes
+        if hasattr(self, 'timeout_in_seconds') == False:
+            self.timeout_in_seconds = None
+
 
 class Exchange_HTTP_Parser_Per_Symbol(Exchange_HTTP_Parser, ABC):
     def __init__(self, params) -> None:
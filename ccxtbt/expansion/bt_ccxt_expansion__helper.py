@@ -1,7 +1,12 @@
 import backtrader
+import collections
+import functools
+import inspect
 import json
 import time
 
+from time import time as timer
+
 from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES
 from ccxtbt.account_or_store.account_or_store__classes import BT_CCXT_Account_or_Store
 from ccxtbt.cerebro.cerebro__classes import Enhanced_Cerebro
@@ -18,11 +23,16 @@ from ccxtbt.exchange_or_broker.exchange__helper import get_api_and_secret_file_p
 from ccxtbt.exchange_or_broker.exchange__specifications import CCXT_COMMON_MAPPING_VALUES, MAX_LIVE_EXCHANGE_RETRIES, \
     OPEN_VALUE, CANCELED_VALUE, CLOSED_VALUE, EXPIRED_VALUE, REJECTED_VALUE
 from ccxtbt.expansion.bt_ccxt_expansion__classes import FAKE_COMMISSION_INFO, FAKE_EXCHANGE
+from ccxtbt.expansion.bt_ccxt_expansion__specifications import INSTRUMENT_BOOTSTRAP_STAGES, COMMISSION_RATE_STAGE, \
+    PERSISTED_ORDERS_STAGE, RISK_LIMIT_STAGE, SYMBOL_STATIC_INFO_AND_POSITIONS_STAGE
 from ccxtbt.instrument.instrument__classes import BT_CCXT_Instrument
+from ccxtbt.metadata_cache.metadata_cache__helper import get_metadata_cache_key
+from ccxtbt.metadata_cache.metadata_cache__specifications import COMMISSION_RATE_KEY
 from ccxtbt.order.order__helper import get_filtered_orders
 from ccxtbt.order.order__specifications import CANCELED_ORDER, CLOSED_ORDER, EXPIRED_ORDER, OPENED_ORDER, \
     PARTIALLY_FILLED_ORDER, REJECTED_ORDER, CCXT_ORDER_TYPES, CCXT_STATUS_KEY
-from ccxtbt.utils import legality_check_not_none_obj
+from ccxtbt.parallel_processing.parallel_processing__helper import run_in_thread_pool
+from ccxtbt.utils import get_time_diff, legality_check_not_none_obj
 
 
 def construct_standalone_exchange(params) -> type(BT_CCXT_Exchange):
@@ -216,43 +226,72 @@ def construct_standalone_account_or_store(params) -> tuple:
     return ret_value
 
 
-def construct_standalone_instrument(params) -> type(BT_CCXT_Instrument):
+def get_standalone_commission_rate(params) -> float:
     # Un-serialize Params
     bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
     market_type = params['market_type']
     symbol_id = params['symbol_id']
 
-    # Legality Check
-    assert type(
-        bt_ccxt_account_or_store).__name__ == BT_CCXT_Account_or_Store.__name__, \
-        "Expected {} but Observed: {}".format(BT_CCXT_Account_or_Store.__name__, type(
-            bt_ccxt_account_or_store).__name__)
-
-    bt_ccxt_instrument__dict = dict(
-        symbol_id=symbol_id,
-    )
-    instrument = BT_CCXT_Instrument(**bt_ccxt_instrument__dict)
-
-    # sync_symbol_positions here
-    instrument.set__parent(bt_ccxt_account_or_store)
-
     commission_rate__dict = dict(
         bt_ccxt_account_or_store=bt_ccxt_account_or_store,
         market_type=market_type,
         symbol_id=symbol_id,
     )
     if bt_ccxt_account_or_store.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
-        commission = get_binance_commission_rate(
-            params=commission_rate__dict)
+        fetch_commission_rate = functools.partial(
+            bt_ccxt_account_or_store.call_rate_limited, get_binance_commission_rate, params=commission_rate__dict)
     elif bt_ccxt_account_or_store.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
-        commission = get_bybit_commission_rate(
-            params=commission_rate__dict)
+        # Read from the markets preloaded by the account_or_store, hence no request is issued
+        fetch_commission_rate = functools.partial(
+            get_bybit_commission_rate, params=commission_rate__dict)
     else:
         raise NotImplementedError(
             "{} exchange is yet to be supported!!!".format(bt_ccxt_account_or_store.exchange_dropdown_value))
 
-    get_commission_info__dict = dict(
+    # Commission rate depends on the fee tier of the account, hence it is cached per API key
+    get_metadata_cache_key__dict = dict(
+        metadata_cache_key=COMMISSION_RATE_KEY,
         symbol_id=symbol_id,
+        api_key=bt_ccxt_account_or_store.exchange.apiKey,
+    )
+    commission = bt_ccxt_account_or_store.metadata_cache.get_or_fetch(
+        get_metadata_cache_key(params=get_metadata_cache_key__dict), fetch_commission_rate)
+    return commission
+
+
+def bootstrap_standalone_instrument(params) -> collections.OrderedDict:
+    '''
+    Run the network bound stages of one instrument in dependency order. Return the time taken by each stage in
+    seconds.
+    '''
+    # Un-serialize Params
+    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
+    market_type = params['market_type']
+    instrument = params['instrument']
+
+    stage_timings = collections.OrderedDict()
+
+    # Symbol static info, position mode and positions sync
+    start = timer()
+    instrument.set__parent(bt_ccxt_account_or_store)
+    stage_timings[INSTRUMENT_BOOTSTRAP_STAGES[SYMBOL_STATIC_INFO_AND_POSITIONS_STAGE]] = timer() - \
+        start
+
+    start = timer()
+    get_standalone_commission_rate__dict = dict(
+        bt_ccxt_account_or_store=bt_ccxt_account_or_store,
+        market_type=market_type,
+        symbol_id=instrument.symbol_id,
+    )
+    commission = get_standalone_commission_rate(
+        params=get_standalone_commission_rate__dict)
+    stage_timings[INSTRUMENT_BOOTSTRAP_STAGES[COMMISSION_RATE_STAGE]
+                  ] = timer() - start
+
+    # Risk limit depends on the parent being set
+    start = timer()
+    get_commission_info__dict = dict(
+        symbol_id=instrument.symbol_id,
         isolated_toggle_switch_value=bt_ccxt_account_or_store.isolated_toggle_switch_value,
         leverage_in_percent=bt_ccxt_account_or_store.leverage_in_percent,
         commission=commission,
@@ -261,12 +300,140 @@ def construct_standalone_instrument(params) -> type(BT_CCXT_Instrument):
     commission_info = FAKE_COMMISSION_INFO(params=get_commission_info__dict)
 
     instrument.add_commission_info(commission_info)
+    stage_timings[INSTRUMENT_BOOTSTRAP_STAGES[RISK_LIMIT_STAGE]] = timer() - \
+        start
+    return stage_timings
+
+
+def warn_if_left_pending_recovery(params) -> None:
+    '''
+    With deferred_recovery, an added instrument is only reconciled by Crash_Recovery_Coordinator, which
+    Enhanced_Cerebro.run invokes. Nothing recovers it if the standalone instrument never goes through either.
+    '''
+    # Un-serialize Params
+    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
+    instruments = params['instruments']
+
+    if bt_ccxt_account_or_store.deferred_recovery == True and \
+            bt_ccxt_account_or_store.is_recovery_coordinated == False:
+        frameinfo = inspect.getframeinfo(inspect.currentframe())
+        print("{} Line: {}: WARNING: {} left pending restart reconciliation as deferred_recovery is enabled. Run "
+              "Enhanced_Cerebro.run or Crash_Recovery_Coordinator.recover, else their persisted orders are never "
+              "reconciled".format(frameinfo.function, frameinfo.lineno,
+                                  [instrument.symbol_id for instrument in instruments]))
+
+
+def construct_standalone_instrument(params) -> type(BT_CCXT_Instrument):
+    # Un-serialize Params
+    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
+    market_type = params['market_type']
+    symbol_id = params['symbol_id']
+
+    # Legality Check
+    assert type(
+        bt_ccxt_account_or_store).__name__ == BT_CCXT_Account_or_Store.__name__, \
+        "Expected {} but Observed: {}".format(BT_CCXT_Account_or_Store.__name__, type(
+            bt_ccxt_account_or_store).__name__)
+
+    bt_ccxt_instrument__dict = dict(
+        symbol_id=symbol_id,
+    )
+    instrument = BT_CCXT_Instrument(**bt_ccxt_instrument__dict)
+
+    # sync_symbol_positions here
+    bootstrap_standalone_instrument__dict = dict(
+        bt_ccxt_account_or_store=bt_ccxt_account_or_store,
+        market_type=market_type,
+        instrument=instrument,
+    )
+    bootstrap_standalone_instrument(
+        params=bootstrap_standalone_instrument__dict)
 
     # notify here
     bt_ccxt_account_or_store.add__instrument(instrument)
+
+    warn_if_left_pending_recovery__dict = dict(
+        bt_ccxt_account_or_store=bt_ccxt_account_or_store,
+        instruments=[instrument],
+    )
+    warn_if_left_pending_recovery(params=warn_if_left_pending_recovery__dict)
     return instrument
 
 
+def construct_standalone_instruments(params) -> tuple:
+    '''
+    Concurrent equivalent of construct_standalone_instrument for a list of symbols. The network bound stages of
+    different symbols overlap while the stages of the same symbol still run in dependency order. Tokens of the rate
+    limiter shared by the account_or_store are taken per network request, either by its retry layer or by
+    call_rate_limited for the requests issued outside it, hence stages served from the metadata cache cost nothing. Persisted orders are replayed one symbol after another in the order given as they
+    modify the account_or_store.
+
+    Return the instruments in the order of symbols_id together with the time taken by each stage per symbol.
+    '''
+    # Un-serialize Params
+    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
+    market_type = params['market_type']
+    symbols_id = params['symbols_id']
+
+    # Optional Params
+    max_workers = params.get('max_workers', None)
+    verbose = params.get('verbose', False)
+
+    # Legality Check
+    assert type(
+        bt_ccxt_account_or_store).__name__ == BT_CCXT_Account_or_Store.__name__, \
+        "Expected {} but Observed: {}".format(BT_CCXT_Account_or_Store.__name__, type(
+            bt_ccxt_account_or_store).__name__)
+    assert isinstance(symbols_id, list)
+
+    start = timer()
+    instruments = []
+    for symbol_id in symbols_id:
+        bt_ccxt_instrument__dict = dict(
+            symbol_id=symbol_id,
+        )
+        instruments.append(BT_CCXT_Instrument(**bt_ccxt_instrument__dict))
+
+    bootstrap_standalone_instrument__dicts = [dict(
+        bt_ccxt_account_or_store=bt_ccxt_account_or_store,
+        market_type=market_type,
+        instrument=instrument,
+    ) for instrument in instruments]
+    run_in_thread_pool__dict = dict(
+        tasks=[functools.partial(bootstrap_standalone_instrument, params=bootstrap_standalone_instrument__dict)
+               for bootstrap_standalone_instrument__dict in bootstrap_standalone_instrument__dicts],
+        rate_limiters=[bt_ccxt_account_or_store.rate_limiter],
+        max_workers=max_workers,
+    )
+    stage_timings__dict = collections.OrderedDict(
+        zip(symbols_id, run_in_thread_pool(params=run_in_thread_pool__dict)))
+
+    for instrument in instruments:
+        instrument_start = timer()
+        bt_ccxt_account_or_store.add__instrument(instrument)
+        stage_timings__dict[instrument.symbol_id][INSTRUMENT_BOOTSTRAP_STAGES[PERSISTED_ORDERS_STAGE]] = \
+            timer() - instrument_start
+
+    warn_if_left_pending_recovery__dict = dict(
+        bt_ccxt_account_or_store=bt_ccxt_account_or_store,
+        instruments=instruments,
+    )
+    warn_if_left_pending_recovery(params=warn_if_left_pending_recovery__dict)
+
+    if verbose:
+        for symbol_id, stage_timings in stage_timings__dict.items():
+            print("{}: {}".format(symbol_id, ", ".join(
+                ["{}: {:.2f}s".format(stage, seconds) for stage, seconds in stage_timings.items()])))
+
+        _, minutes, seconds = get_time_diff(start)
+        frameinfo = inspect.getframeinfo(inspect.currentframe())
+        print("{} Line: {}: {} instruments took {}m:{:.2f}s".format(
+            frameinfo.function, frameinfo.lineno, len(instruments), minutes, seconds))
+
+    ret_value = (instruments, stage_timings__dict, )
+    return ret_value
+
+
 def construct_dual_position_datafeeds(params) -> tuple:
     # Un-serialize Params
     exchange_dropdown_value = params['exchange_dropdown_value']
@@ -0,0 +1,6 @@
+# Stages run by the instrument bootstrap pipeline, in dependency order within a symbol
+INSTRUMENT_BOOTSTRAP_STAGES = \
+    ('symbol_static_info_and_positions',
+     'commission_rate', 'risk_limit', 'persisted_orders', )
+SYMBOL_STATIC_INFO_AND_POSITIONS_STAGE, COMMISSION_RATE_STAGE, RISK_LIMIT_STAGE, PERSISTED_ORDERS_STAGE, = \
+    range(len(INSTRUMENT_BOOTSTRAP_STAGES))
@@ -0,0 +1,14 @@
+from requests.adapters import HTTPAdapter
+
+
+class Shared_HTTP_Adapter(HTTPAdapter):
+    '''
+    Connection pool of a host mounted on the own session of every exchange hitting that host. Each session keeps its
+    own cookies and proxy settings, while the keep-alive connections are shared.
+
+    A session closes its adapters when it is closed, e.g. when ccxt garbage collects an exchange. The pool belongs
+    to the process-wide registry instead, hence it is never closed by any session.
+    '''
+
+    def close(self):
+        pass
@@ -0,0 +1,132 @@
+import requests
+import threading
+
+from urllib.parse import urlparse
+
+from ccxtbt.http_session.http_session__classes import Shared_HTTP_Adapter
+from ccxtbt.http_session.http_session__specifications import DEFAULT__HTTP_SESSION__POOL_SIZE, \
+    DEFAULT__HTTP_SESSION__TIMEOUT_IN_SECONDS
+from ccxtbt.rate_limiter.rate_limiter__helper import get_exchange_host
+from ccxtbt.utils import legality_check_not_none_obj
+
+# Process-wide registry of keep-alive connection pools keyed by host so that TLS handshake is paid once per host
+shared_http_adapters = {}
+shared_http_adapters__lock = threading.Lock()
+
+# Process-wide registry of sessions keyed by host for requests issued outside ccxt
+shared_http_sessions = {}
+shared_http_sessions__lock = threading.Lock()
+
+
+def get_shared_http_adapter(params) -> Shared_HTTP_Adapter:
+    # Un-serialize Params
+    host = params['host']
+
+    # Optional Params
+    pool_size = params.get('pool_size', None)
+
+    legality_check_not_none_obj(host, "host")
+    if pool_size is None:
+        pool_size = DEFAULT__HTTP_SESSION__POOL_SIZE
+
+    with shared_http_adapters__lock:
+        if host not in shared_http_adapters.keys():
+            # Mounted on its own host only, hence its pool manager serves exactly one host pool
+            shared_http_adapters[host] = Shared_HTTP_Adapter(
+                pool_connections=1, pool_maxsize=pool_size)
+        http_adapter = shared_http_adapters[host]
+    return http_adapter
+
+
+def mount_shared_http_adapter(params) -> None:
+    '''
+    Mount the shared connection pool of the host on its own url prefix only. Requests to any other host keep going
+    through the default adapter of the session instead of evicting the pool of this host.
+    '''
+    # Un-serialize Params
+    http_session = params['http_session']
+    host = params['host']
+
+    # Optional Params
+    pool_size = params.get('pool_size', None)
+    scheme = params.get('scheme', "https")
+
+    legality_check_not_none_obj(http_session, "http_session")
+
+    get_shared_http_adapter__dict = dict(
+        host=host,
+        pool_size=pool_size,
+    )
+    http_adapter = get_shared_http_adapter(
+        params=get_shared_http_adapter__dict)
+    http_session.mount("{}://{}/".format(scheme, host), http_adapter)
+
+
+def get_shared_http_session(params) -> requests.Session:
+    # Un-serialize Params
+    host = params['host']
+
+    # Optional Params
+    pool_size = params.get('pool_size', None)
+    scheme = params.get('scheme', "https")
+
+    legality_check_not_none_obj(host, "host")
+
+    with shared_http_sessions__lock:
+        if host not in shared_http_sessions.keys():
+            http_session = requests.Session()
+            mount_shared_http_adapter__dict = dict(
+                http_session=http_session,
+                host=host,
+                pool_size=pool_size,
+                scheme=scheme,
+            )
+            mount_shared_http_adapter(params=mount_shared_http_adapter__dict)
+            shared_http_sessions[host] = http_session
+        http_session = shared_http_sessions[host]
+    return http_session
+
+
+def attach_shared_http_session(params) -> None:
+    '''
+    Mount the shared connection pool of its host on the session a synchronous ccxt exchange created for itself. The
+    session itself is left as ccxt configured it (e.g. trust_env) and keeps the cookies of its own account.
+    '''
+    # Un-serialize Params
+    exchange = params['exchange']
+
+    # Optional Params
+    market_type = params.get('market_type', None)
+    pool_size = params.get('pool_size', None)
+
+    legality_check_not_none_obj(exchange, "exchange")
+
+    mount_shared_http_adapter__dict = dict(
+        http_session=exchange.session,
+        host=get_exchange_host(exchange, market_type),
+        pool_size=pool_size,
+    )
+    mount_shared_http_adapter(params=mount_shared_http_adapter__dict)
+
+
+def http_get_json(params):
+    # Un-serialize Params
+    url = params['url']
+
+    # Optional Params
+    timeout_in_seconds = params.get('timeout_in_seconds', None)
+
+    legality_check_not_none_obj(url, "url")
+    if timeout_in_seconds is None:
+        timeout_in_seconds = DEFAULT__HTTP_SESSION__TIMEOUT_IN_SECONDS
+
+    parsed_url = urlparse(url)
+    get_shared_http_session__dict = dict(
+        host=parsed_url.netloc,
+        scheme=parsed_url.scheme,
+    )
+    http_session = get_shared_http_session(
+        params=get_shared_http_session__dict)
+    response = http_session.get(url, timeout=timeout_in_seconds)
+    response.raise_for_status()
+    return response.json()
@@ -0,0 +1,5 @@
+# Number of keep-alive connections kept per host
+DEFAULT__HTTP_SESSION__POOL_SIZE = 10
+
+# Connect and read timeout applied to requests issued outside ccxt
+DEFAULT__HTTP_SESSION__TIMEOUT_IN_SECONDS = 10
@@ -28,14 +28,19 @@ from pprint import pprint
 
 from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES, CCXT__MARKET_TYPE__FUTURE, \
     CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP, CCXT__MARKET_TYPE__SPOT, \
-    risk_limit__dict_template, symbol_stationary__dict_template
+    symbol_stationary__dict_template
 from ccxtbt.account_or_store.account_or_store__classes import BT_CCXT_Account_or_Store
 from ccxtbt.exchange_or_broker.binance.binance__exchange__classes import Binance_Symbol_Info__HTTP_Parser
+from ccxtbt.exchange_or_broker.binance.binance__exchange__helper import get_binance_risk_limit
 from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID
 from ccxtbt.exchange_or_broker.bybit.bybit__exchange__classes import Bybit_Symbol_Info__HTTP_Parser
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__helper import get_bybit_risk_limit
 from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID, \
     BYBIT__DERIVATIVES__DEFAULT_POSITION_MODE
 from ccxtbt.expansion.bt_ccxt_expansion__classes import Enhanced_Position
+from ccxtbt.order_book.order_book__classes import Order_Book_Snapshot
+from ccxtbt.metadata_cache.metadata_cache__helper import get_metadata_cache_key
+from ccxtbt.metadata_cache.metadata_cache__specifications import RISK_LIMIT_KEY, SYMBOL_STATIONARY_KEY
 from ccxtbt.utils import capitalize_sentence, legality_check_not_none_obj
 
 
@@ -123,74 +128,36 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
             # Do nothing
             pass
         else:
-            if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
-                if self.parent.market_type == CCXT__MARKET_TYPE__FUTURE:
-                    response = self.parent.exchange.fapiPrivate_get_leveragebracket(
-                        {'symbol': self.symbol_id})
-
-                    point_of_reference = response[0]
-                    # Validate assumption made
-                    assert point_of_reference['symbol'] == self.symbol_id
-
-                    for risk_limit in point_of_reference['brackets']:
-                        if self.risk_limit is None:
-                            self.risk_limit = []
-
-                        risk_limit_dict = copy.deepcopy(
-                            risk_limit__dict_template)
-                        risk_limit_dict['id'] = risk_limit['bracket']
-                        risk_limit_dict['starting_margin'] = \
-                            float(risk_limit['cum'])
-                        risk_limit_dict['maintenance_margin_ratio'] = \
-                            float(risk_limit['maintMarginRatio'])
-                        risk_limit_dict['max_leverage'] = \
-                            float(risk_limit['initialLeverage'])
-                        risk_limit_dict['min_position_value'] = \
-                            float(risk_limit['notionalFloor'])
-                        risk_limit_dict['max_position_value'] = \
-                            float(risk_limit['notionalCap'])
-                        self.risk_limit.append(risk_limit_dict)
-                    pass
-                else:
-                    raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
-                        CCXT__MARKET_TYPES[self.parent.market_type],
-                        self.exchange_dropdown_value,
-                    ))
-            elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
-                if self.parent.market_type == CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP:
-                    response = self.parent.exchange.public_get_public_linear_risk_limit(
-                        {'symbol': self.symbol_id})
-
-                    prev_max_position_value = 0
-                    for risk_limit in response['result']:
-                        if self.risk_limit is None:
-                            self.risk_limit = []
-
-                        risk_limit_dict = copy.deepcopy(
-                            risk_limit__dict_template)
-                        risk_limit_dict['id'] = risk_limit['id']
-                        risk_limit_dict['starting_margin'] = \
-                            float(risk_limit['starting_margin'])
-                        risk_limit_dict['maintenance_margin_ratio'] = \
-                            float(risk_limit['maintain_margin'])
-                        risk_limit_dict['max_leverage'] = \
-                            float(risk_limit['max_leverage'])
-                        risk_limit_dict['min_position_value'] = prev_max_position_value
-                        risk_limit_dict['max_position_value'] = \
-                            float(risk_limit['limit'])
-                        self.risk_limit.append(risk_limit_dict)
-
-                        prev_max_position_value = risk_limit_dict['max_position_value']
-                    pass
-                else:
-                    raise NotImplementedError("{} market type is not yet enabled for {} exchange".format(
-                        CCXT__MARKET_TYPES[self.parent.market_type],
-                        self.exchange_dropdown_value,
-                    ))
-            else:
-                raise NotImplementedError(
-                    "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
-            pass
+            get_metadata_cache_key__dict = dict(
+                metadata_cache_key=RISK_LIMIT_KEY,
+                symbol_id=self.symbol_id,
+            )
+            risk_limit = self.parent.metadata_cache.get_or_fetch(
+                get_metadata_cache_key(params=get_metadata_cache_key__dict), self._fetch_risk_limit)
+
+            if len(risk_limit) > 0:
+                if self.risk_limit is None:
+                    self.risk_limit = []
+
+                # Cached risk limit is shared, hence copy it over
+                self.risk_limit.extend(copy.deepcopy(risk_limit))
+
+    def _fetch_risk_limit(self) -> list:
+        get_risk_limit__dict = dict(
+            bt_ccxt_account_or_store=self.parent,
+            market_type=self.parent.market_type,
+            symbol_id=self.symbol_id,
+        )
+        if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            ret_risk_limit = self.parent.call_rate_limited(
+                get_binance_risk_limit, params=get_risk_limit__dict)
+        elif self.exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+            ret_risk_limit = self.parent.call_rate_limited(
+                get_bybit_risk_limit, params=get_risk_limit__dict)
+        else:
+            raise NotImplementedError(
+                "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
+        return ret_risk_limit
 
     def get_commission_info(self):
         return self.commission_info
@@ -255,13 +222,13 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
         assert self.symbol_id == symbol_id, "Instrument: {} does NOT support {}!!!".format(
             self.symbol_id, symbol_id)
         legality_check_not_none_obj(self.parent, "self.parent")
-        return self.parent.ws_active_orders[symbol_id]
+        return self.parent.ws_active_orders.get_orders(symbol_id)
 
     def get_ws_conditional_orders(self, symbol_id):
         assert self.symbol_id == symbol_id, "Instrument: {} does NOT support {}!!!".format(
             self.symbol_id, symbol_id)
         legality_check_not_none_obj(self.parent, "self.parent")
-        return self.parent.ws_conditional_orders[symbol_id]
+        return self.parent.ws_conditional_orders.get_orders(symbol_id)
 
     def fetch_order_book(self, symbol):
         assert self.symbol_id == symbol, "Instrument: {} does NOT support {}!!!".format(
@@ -542,21 +509,38 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
         self.populate__symbol_static_info()
         self.sync_symbol_positions()
 
-    def _get_bybit_position_list(self) -> list:
+    def _get_bybit_position_list(self, along_with_balance=False) -> list:
+        '''
+        :param along_with_balance: Refresh the cash and value of the account as well, concurrently in async mode
+        '''
         if self.symbol_id.endswith("USDT"):
-            response = self.parent.exchange.private_get_private_linear_position_list(
-                {'symbol': self.symbol_id})
-            point_of_reference = response['result']
+            method_name = 'private_get_private_linear_position_list'
         elif self.symbol_id.endswith("USD"):
-            response = self.parent.exchange.private_get_v2_private_position_list(
-                {'symbol': self.symbol_id})
-            point_of_reference = response['result']
+            method_name = 'private_get_v2_private_position_list'
         elif self.symbol_id.endswith("USDC"):
             raise NotImplementedError()
         else:
             raise NotImplementedError()
+
+        if along_with_balance == True:
+            response = self.parent._get_balance_along_with(
+                method_name, {'symbol': self.symbol_id})
+        else:
+            response = self.parent._invoke_exchange(
+                method_name, {'symbol': self.symbol_id})
+        point_of_reference = response['result']
         return point_of_reference
 
+    def _get_ws_position_list(self):
+        '''
+        Return the raw positions kept up to date by the websocket position stream if they are newer than the last fill
+        of the symbol, else None so that the caller falls back to HTTP.
+        '''
+        ws_positions = self.parent.get_fresh_ws_positions(self.symbol_id)
+        if ws_positions is None or len(ws_positions) == 0:
+            return None
+        return [ws_position['info'] for ws_position in ws_positions]
+
     def sync_symbol_positions(self) -> None:
         legality_check_not_none_obj(self.parent, "self.parent")
         if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
@@ -566,8 +550,10 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
                 # position.
                 pass
             elif self.parent.market_type == CCXT__MARKET_TYPE__FUTURE:
-                balance = self.parent._get_balance()
-                point_of_reference = balance['info']['positions']
+                point_of_reference = self._get_ws_position_list()
+                if point_of_reference is None:
+                    balance = self.parent._get_balance()
+                    point_of_reference = balance['info']['positions']
 
                 for position in point_of_reference:
                     if position['symbol'].upper() == self.symbol_id.upper():
@@ -591,11 +577,12 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
                 # position.
                 pass
             elif self.parent.market_type == CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP:
-                # Get account balance is required here so that the cash and value are updated in the account as well
-                # despite no use in this function
-                _ = self.parent._get_balance()
-
-                point_of_reference = self._get_bybit_position_list()
+                point_of_reference = self._get_ws_position_list()
+                if point_of_reference is None:
+                    # Get account balance is required here so that the cash and value are updated in the account as
+                    # well despite no use in this function. Websocket wallet stream takes care of it otherwise.
+                    point_of_reference = self._get_bybit_position_list(
+                        along_with_balance=not self.parent.is_ws_available)
 
                 updated_position_mode = False
                 for position in point_of_reference:
@@ -659,9 +646,22 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
         '''
         We could only populate symbol static info AFTER parent has been set
         '''
+        get_metadata_cache_key__dict = dict(
+            metadata_cache_key=SYMBOL_STATIONARY_KEY,
+            symbol_id=self.symbol_id,
+        )
+        symbol_stationary__dict = self.parent.metadata_cache.get_or_fetch(
+            get_metadata_cache_key(params=get_metadata_cache_key__dict), self._fetch_symbol_static_info)
+
+        # Populate symbol static info over according to symbol_stationary__dict_template
+        for key, attribute_value in symbol_stationary__dict.items():
+            setattr(self, key, attribute_value)
+
+    def _fetch_symbol_static_info(self) -> dict:
         http_parser__dict = dict(
             symbol_id=self.symbol_id,
             market_type=self.parent.market_type,
+            timeout_in_seconds=self.parent.http_timeout_in_seconds,
         )
         if self.exchange_dropdown_value == BINANCE_EXCHANGE_ID:
             http_parser = Binance_Symbol_Info__HTTP_Parser(
@@ -672,17 +672,25 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
         else:
             raise NotImplementedError(
                 "{} exchange is yet to be supported!!!".format(self.exchange_dropdown_value))
-        http_parser.run()
+        self.parent.call_rate_limited(http_parser.run)
 
-        # Populate symbol static info over according to symbol_stationary__dict_template
+        symbol_stationary__dict = {}
         for key in symbol_stationary__dict_template.keys():
             if hasattr(http_parser, key):
                 attribute_value = getattr(http_parser, key)
                 if attribute_value is not None:
-                    setattr(self, key, attribute_value)
-        pass
+                    symbol_stationary__dict[key] = attribute_value
+        return symbol_stationary__dict
+
+    def get_orderbook_snapshot(self) -> Order_Book_Snapshot:
+        legality_check_not_none_obj(self.parent, "self.parent")
+        orderbook = self.parent.get_orderbook(symbol_id=self.symbol_id)
+        return Order_Book_Snapshot(orderbook)
 
     def get_orderbook_prices(self) -> tuple:
+        '''
+        :return: (asks, bids) as lists of prices. Use get_orderbook_snapshot for the float64 arrays instead.
+        '''
         legality_check_not_none_obj(self.parent, "self.parent")
         orderbook = self.parent.get_orderbook(symbol_id=self.symbol_id)
         asks = []
@@ -696,19 +704,16 @@ class BT_CCXT_Instrument(backtrader.with_metaclass(Meta_Instrument, object)):
 
     def get_orderbook_price_by_offset(self, offset) -> tuple:
         legality_check_not_none_obj(self.parent, "self.parent")
-        orderbook = self.parent.get_orderbook(symbol_id=self.symbol_id)
-
-        # Legality Check
-        assert offset < len(orderbook['asks']), \
-            "Expected: {} vs Actual: {}".format(
-                len(orderbook['asks']) - 1, offset)
-        assert offset >= -len(orderbook['asks']), \
-            "Expected: {} vs Actual: {}".format(
-                len(orderbook['asks']) - 1, offset)
+        if offset == 0:
+            # Top of the book is available from the websocket quote, no need to fetch the order book if it is fresh
+            quote = self.parent.get_quote(symbol_id=self.symbol_id)
+            if quote is not None:
+                return quote.ask1_price, quote.bid1_price
 
-        ask = orderbook['asks'][offset][0]
-        bid = orderbook['bids'][offset][0]
+        orderbook_snapshot = self.get_orderbook_snapshot()
+        return orderbook_snapshot.get_price_by_offset(offset)
 
-        assert isinstance(ask, float)
-        assert isinstance(bid, float)
-        return ask, bid
+    def get_orderbook_spread_in_ticks(self) -> int:
+        legality_check_not_none_obj(self.tick_size, "self.tick_size")
+        orderbook_snapshot = self.get_orderbook_snapshot()
+        return orderbook_snapshot.get_spread_in_ticks(self.tick_size)
@@ -0,0 +1,238 @@
+import inspect
+import itertools
+import threading
+import time
+import traceback
+
+from multiprocessing.managers import BaseManager
+
+from ccxtbt.market_data_hub.market_data_hub__specifications import DEFAULT__MARKET_DATA_HUB__OWNER_TIMEOUT_IN_SECONDS, \
+    MARKET_DATA_TOPICS
+
+
+class Market_Data_Hub(object):
+    '''
+    Single source of public market data of one exchange, market type and network.
+
+    Only the owner, i.e. the first account to acquire ownership, holds the websocket subscription of each topic and
+    publishes what it receives. Any number of subscribers get every message pushed to them, while others read the latest
+    message per topic and symbol in O(1) whenever they need it.
+
+    Every account and subscriber requests the (topic, symbol) pairs it needs. The owner streams the union of them and
+    resubscribes whenever the union grows, as told by the version returned along with it.
+
+    Like Quote_Store, publishing is a single dict assignment and readers never take any lock. Subscribers are kept copy
+    on write so that the publishing websocket thread walks them without locking either.
+
+    :param owner_timeout_in_seconds: Owner that has not published within this time may be taken over, None to never
+    '''
+
+    def __init__(self, name, owner_timeout_in_seconds=DEFAULT__MARKET_DATA_HUB__OWNER_TIMEOUT_IN_SECONDS):
+        self.name = name
+        self.owner_timeout_in_seconds = owner_timeout_in_seconds
+
+        self.lock = threading.Lock()
+        self.owner = None
+        self.owner__monotonic = None
+
+        # (topic, symbol_id) -> (message, time.monotonic() when published)
+        self.latest = {}
+
+        # (topic, symbol_id) -> {subscription_id: callback}
+        self.subscribers = {}
+        self.subscription_id__counter = itertools.count(1)
+        self.subscription_keys = {}
+
+        # (topic, symbol_id) -> set of requesters
+        self.requests = {}
+        # Bumped whenever a pair is requested for the first time
+        self.requests__version = 0
+
+        self.published__counts = [0] * len(MARKET_DATA_TOPICS)
+        self.callback_error__count = 0
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: owner: {}, len(latest): {}".format(type(self).__name__, self.name, self.owner, len(self.latest))
+
+    def _legality_check_topic(self, topic):
+        if topic not in range(len(MARKET_DATA_TOPICS)):
+            raise ValueError("{}: {} topic must be one of {}!!!".format(
+                inspect.currentframe(),
+                topic, range(len(MARKET_DATA_TOPICS))))
+
+    def acquire_ownership(self, owner) -> bool:
+        '''
+        :return: True if the caller is now the owner and should therefore subscribe to the public streams
+        '''
+        with self.lock:
+            if self.owner is not None and self.owner != owner:
+                if self.owner_timeout_in_seconds is None or \
+                        time.monotonic() - self.owner__monotonic <= self.owner_timeout_in_seconds:
+                    return False
+
+            self.owner = owner
+            self.owner__monotonic = time.monotonic()
+            return True
+
+    def release_ownership(self, owner) -> bool:
+        '''
+        Let another account take over. What the owner published is dropped as nobody keeps it up to date anymore.
+        '''
+        with self.lock:
+            if self.owner != owner:
+                return False
+
+            self.owner = None
+            self.owner__monotonic = None
+        self.invalidate()
+        return True
+
+    def get_owner(self):
+        return self.owner
+
+    def publish(self, topic, symbol_id, message) -> None:
+        self._legality_check_topic(topic)
+
+        now = time.monotonic()
+        key = (topic, symbol_id)
+        self.latest[key] = (message, now)
+        self.owner__monotonic = now
+        self.published__counts[topic] += 1
+
+        for callback in self.subscribers.get(key, {}).values():
+            try:
+                callback(message)
+            except Exception:
+                # A faulty subscriber must not starve the others nor break the websocket thread
+                self.callback_error__count += 1
+                traceback.print_exc()
+
+    def get_latest(self, topic, symbol_id, max_age_in_seconds=None, default=None):
+        '''
+        :return: The latest message of the topic for the symbol, default if there is none or it is older than
+            max_age_in_seconds
+        '''
+        self._legality_check_topic(topic)
+
+        latest = self.latest.get((topic, symbol_id), None)
+        if latest is None:
+            return default
+
+        (message, published__monotonic, ) = latest
+        if max_age_in_seconds is not None and time.monotonic() - published__monotonic > max_age_in_seconds:
+            return default
+        return message
+
+    def invalidate(self, topic=None) -> None:
+        '''
+        Drop the latest messages of the topic, or of all topics if None, e.g. once the owner is disconnected
+        '''
+        if topic is None:
+            self.latest = {}
+        else:
+            self._legality_check_topic(topic)
+            self.latest = {key: value for key,
+                           value in self.latest.items() if key[0] != topic}
+
+    def _add_request(self, requester, key) -> None:
+        # Caller must hold self.lock
+        requesters = self.requests.setdefault(key, set())
+        if len(requesters) == 0:
+            self.requests__version += 1
+        requesters.add(requester)
+
+    def _remove_request(self, requester, key) -> None:
+        # Caller must hold self.lock. Shrinking the union is left to the next resubscription
+        requesters = self.requests.get(key, None)
+        if requesters is not None:
+            requesters.discard(requester)
+            if len(requesters) == 0:
+                del self.requests[key]
+
+    def request(self, requester, topic, symbols_id) -> None:
+        '''
+        Ask the owner to stream the topic for the symbols on behalf of requester, e.g. an account reading get_latest
+        '''
+        self._legality_check_topic(topic)
+
+        with self.lock:
+            for symbol_id in symbols_id:
+                self._add_request(requester, (topic, symbol_id))
+
+    def cancel_requests(self, requester) -> None:
+        with self.lock:
+            for key in list(self.requests.keys()):
+                self._remove_request(requester, key)
+
+    def get_requests(self) -> tuple:
+        '''
+        :return: (version, symbols_id per topic) where symbols_id is the sorted union of what has been requested for
+            the topic. The owner should resubscribe once version differs from the one it has subscribed with.
+        '''
+        with self.lock:
+            symbols_id__per_topic = [[] for _ in MARKET_DATA_TOPICS]
+            for (topic, symbol_id) in self.requests.keys():
+                symbols_id__per_topic[topic].append(symbol_id)
+            ret_value = (self.requests__version, [sorted(
+                symbols_id) for symbols_id in symbols_id__per_topic], )
+        return ret_value
+
+    def subscribe(self, topic, symbol_id, callback) -> int:
+        '''
+        Push every message of the topic for the symbol to callback, called from the publishing thread. The pair is
+        requested until unsubscribed.
+
+        :return: Subscription id to unsubscribe with
+        '''
+        self._legality_check_topic(topic)
+
+        key = (topic, symbol_id)
+        with self.lock:
+            subscription_id = next(self.subscription_id__counter)
+            callbacks = dict(self.subscribers.get(key, {}))
+            callbacks[subscription_id] = callback
+            self.subscribers[key] = callbacks
+            self.subscription_keys[subscription_id] = key
+            self._add_request(subscription_id, key)
+        return subscription_id
+
+    def unsubscribe(self, subscription_id) -> bool:
+        with self.lock:
+            key = self.subscription_keys.pop(subscription_id, None)
+            if key is None:
+                return False
+
+            callbacks = dict(self.subscribers[key])
+            del callbacks[subscription_id]
+            if len(callbacks) > 0:
+                self.subscribers[key] = callbacks
+            else:
+                del self.subscribers[key]
+            self._remove_request(subscription_id, key)
+        return True
+
+    def get_metrics(self) -> dict:
+        subscriber__counts = [0] * len(MARKET_DATA_TOPICS)
+        for (topic, _), callbacks in self.subscribers.items():
+            subscriber__counts[topic] += len(callbacks)
+
+        metrics = dict(
+            name=self.name,
+            owner=self.owner,
+            symbols=len(self.latest),
+            published=dict(zip(MARKET_DATA_TOPICS, self.published__counts)),
+            subscribers=dict(zip(MARKET_DATA_TOPICS, subscriber__counts)),
+            requested=len(self.requests),
+            callback_errors=self.callback_error__count,
+        )
+        return metrics
+
+
+class Market_Data_Hub_Manager(BaseManager):
+    '''
+    Share a Market_Data_Hub with other processes over a socket, see serve_market_data_hub and connect_market_data_hub
+    '''
+    pass
@@ -0,0 +1,95 @@
+import inspect
+import threading
+
+from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES
+from ccxtbt.market_data_hub.market_data_hub__classes import Market_Data_Hub, Market_Data_Hub_Manager
+from ccxtbt.market_data_hub.market_data_hub__specifications import MARKET_DATA_HUB__EXPOSED_METHODS
+from ccxtbt.utils import legality_check_not_none_obj
+
+# Process-wide registry of market data hubs keyed by (exchange, market type). Public market data is always streamed
+#       from MAINNET, whichever network the accounts trade on
+shared_market_data_hubs = {}
+shared_market_data_hubs__lock = threading.Lock()
+
+
+def get_shared_market_data_hub(params) -> Market_Data_Hub:
+    # Un-serialize Params
+    exchange_dropdown_value = params['exchange_dropdown_value']
+    market_type = params['market_type']
+
+    # Optional Params
+    owner_timeout_in_seconds = params.get('owner_timeout_in_seconds', None)
+
+    # Legality Check
+    legality_check_not_none_obj(
+        exchange_dropdown_value, "exchange_dropdown_value")
+    if market_type not in range(len(CCXT__MARKET_TYPES)):
+        raise ValueError("{}: {} market_type must be one of {}!!!".format(
+            inspect.currentframe(),
+            market_type, range(len(CCXT__MARKET_TYPES))))
+
+    key = (exchange_dropdown_value, market_type, )
+    with shared_market_data_hubs__lock:
+        if key not in shared_market_data_hubs.keys():
+            name = "{}: {}: MAINNET".format(
+                exchange_dropdown_value, CCXT__MARKET_TYPES[market_type])
+            market_data_hub__dict = dict(
+                name=name,
+            )
+            if owner_timeout_in_seconds is not None:
+                market_data_hub__dict['owner_timeout_in_seconds'] = owner_timeout_in_seconds
+            shared_market_data_hubs[key] = Market_Data_Hub(
+                **market_data_hub__dict)
+        market_data_hub = shared_market_data_hubs[key]
+    return market_data_hub
+
+
+def _get_served_market_data_hub(exchange_dropdown_value, market_type):
+    # Runs in the serving process on behalf of the remote caller
+    get_shared_market_data_hub__dict = dict(
+        exchange_dropdown_value=exchange_dropdown_value,
+        market_type=market_type,
+    )
+    return get_shared_market_data_hub(params=get_shared_market_data_hub__dict)
+
+
+Market_Data_Hub_Manager.register('get_market_data_hub', callable=_get_served_market_data_hub,
+                                 exposed=MARKET_DATA_HUB__EXPOSED_METHODS)
+
+
+def serve_market_data_hub(params) -> tuple:
+    '''
+    Serve the shared market data hubs of this process to other processes from a daemon thread.
+
+    :return: (server, address) where address is the one actually bound, e.g. if port 0 was requested
+    '''
+    # Un-serialize Params
+    address = params['address']
+    authkey = params['authkey']
+
+    market_data_hub_manager = Market_Data_Hub_Manager(
+        address=address, authkey=authkey)
+    server = market_data_hub_manager.get_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    ret_value = (server, server.address, )
+    return ret_value
+
+
+def connect_market_data_hub(params):
+    '''
+    :return: Proxy of the market data hub served by another process, which could be passed to the account as
+        config['market_data_hub']. Only MARKET_DATA_HUB__EXPOSED_METHODS are available on it.
+    '''
+    # Un-serialize Params
+    address = params['address']
+    authkey = params['authkey']
+    exchange_dropdown_value = params['exchange_dropdown_value']
+    market_type = params['market_type']
+
+    market_data_hub_manager = Market_Data_Hub_Manager(
+        address=address, authkey=authkey)
+    market_data_hub_manager.connect()
+    market_data_hub = market_data_hub_manager.get_market_data_hub(
+        exchange_dropdown_value, market_type)
+    return market_data_hub
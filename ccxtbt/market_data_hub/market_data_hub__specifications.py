@@ -0,0 +1,13 @@
+# Public topics streamed once per exchange and market type, always from MAINNET, then fanned out to every account
+#       interested
+MARKET_DATA_TOPICS = ('kline', 'instrument_info', )
+KLINE_TOPIC, INSTRUMENT_INFO_TOPIC, = range(len(MARKET_DATA_TOPICS))
+
+# Owner that has not published anything within this time is presumed gone, e.g. its process was killed, and another
+#       account may take over the public streams
+DEFAULT__MARKET_DATA_HUB__OWNER_TIMEOUT_IN_SECONDS = 60.0
+
+# Methods of Market_Data_Hub reachable from other processes. Subscription is not among them as callbacks cannot cross
+#       the process boundary, remote readers poll the latest message instead
+MARKET_DATA_HUB__EXPOSED_METHODS = ('acquire_ownership', 'release_ownership', 'get_owner', 'publish', 'get_latest',
+                                    'invalidate', 'request', 'cancel_requests', 'get_requests', 'get_metrics', )
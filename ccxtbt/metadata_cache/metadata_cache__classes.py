@@ -0,0 +1,157 @@
+import json
+import os
+import threading
+import time
+import traceback
+
+from pathlib import Path
+
+from ccxtbt.metadata_cache.metadata_cache__specifications import DEFAULT__METADATA_CACHE__ENABLED, \
+    DEFAULT__METADATA_CACHE__TTL_IN_SECONDS, METADATA_CACHE_FILE_EXTENSION, METADATA_CACHE__VERSION
+
+
+class Metadata_Cache(object):
+    '''
+    Versioned on-disk cache of slow changing exchange metadata (markets, symbol filters, risk limits and commission
+    rates) for one exchange, market type and network. Each entry lives in its own file. An entry older than the TTL is
+    still served while it is refreshed in a background thread, so a warm restart never waits for the exchange.
+
+    Cached values are shared, hence callers must copy them before modification.
+    '''
+
+    def __init__(self, dir_path, ttl_in_seconds=None, enabled=None):
+        if ttl_in_seconds is None:
+            ttl_in_seconds = DEFAULT__METADATA_CACHE__TTL_IN_SECONDS
+        if enabled is None:
+            enabled = DEFAULT__METADATA_CACHE__ENABLED
+        self.dir_path = dir_path
+        self.ttl_in_seconds = ttl_in_seconds
+        self.enabled = enabled
+
+        self.lock = threading.Lock()
+        self.entries = {}
+        # Callbacks of every caller which got the stale value of a key being refreshed
+        self.on_refresh_fns = {}
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: len(entries): {}".format(type(self).__name__, self.dir_path, len(self.entries))
+
+    def _get_file_path(self, key):
+        return os.path.join(self.dir_path, "{}.{}".format(key, METADATA_CACHE_FILE_EXTENSION))
+
+    def _read_entry(self, key):
+        file_path = self._get_file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            # Corrupted entry will be overwritten by the next fetch
+            return None
+
+        if not isinstance(entry, dict) or entry.get('version', None) != METADATA_CACHE__VERSION:
+            return None
+        return entry
+
+    def _write_entry(self, key, entry):
+        file_path = self._get_file_path(key)
+        Path(self.dir_path).mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so that a concurrent reader never observes a partially written entry
+        temp_file_path = "{}.{}.{}.tmp".format(
+            file_path, os.getpid(), threading.get_ident())
+        try:
+            with open(temp_file_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(temp_file_path, file_path)
+        except (OSError, TypeError, ValueError):
+            traceback.print_exc()
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+
+    def _is_fresh(self, entry):
+        return time.time() - entry['timestamp'] < self.ttl_in_seconds
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key, None)
+            if entry is None and self.enabled:
+                entry = self._read_entry(key)
+                if entry is not None:
+                    self.entries[key] = entry
+        if entry is None:
+            return None
+        return entry['value']
+
+    def set(self, key, value):
+        entry = dict(
+            version=METADATA_CACHE__VERSION,
+            timestamp=time.time(),
+            value=value,
+        )
+        with self.lock:
+            self.entries[key] = entry
+        if self.enabled:
+            self._write_entry(key, entry)
+
+    def invalidate(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+        file_path = self._get_file_path(key)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def _refresh(self, key, fetch_fn):
+        value = None
+        try:
+            value = fetch_fn()
+            self.set(key, value)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            with self.lock:
+                on_refresh_fns = self.on_refresh_fns.pop(key, [])
+
+        if value is not None:
+            for on_refresh_fn in on_refresh_fns:
+                try:
+                    on_refresh_fn(value)
+                except Exception:
+                    traceback.print_exc()
+
+    def _refresh_in_background(self, key, fetch_fn, on_refresh_fn):
+        with self.lock:
+            is_refreshing = key in self.on_refresh_fns.keys()
+            on_refresh_fns = self.on_refresh_fns.setdefault(key, [])
+            if on_refresh_fn is not None:
+                on_refresh_fns.append(on_refresh_fn)
+            if is_refreshing == True:
+                return
+        thread = threading.Thread(target=self._refresh, args=(key, fetch_fn, ),
+                                  name="{}: {}".format(type(self).__name__, key), daemon=True)
+        thread.start()
+
+    def get_or_fetch(self, key, fetch_fn, on_refresh_fn=None):
+        '''
+        Return the cached value of the key. Fetch it synchronously if it is not cached yet, or schedule a background
+        refresh if it is older than the TTL. The refreshed value is handed to on_refresh_fn (if any) so that the
+        caller could apply it to whatever already consumed the stale value.
+        '''
+        if self.enabled == False:
+            return fetch_fn()
+
+        value = self.get(key)
+        if value is None:
+            value = fetch_fn()
+            self.set(key, value)
+            return value
+
+        with self.lock:
+            entry = self.entries[key]
+        if not self._is_fresh(entry):
+            self._refresh_in_background(key, fetch_fn, on_refresh_fn)
+        return value
@@ -0,0 +1,105 @@
+import backtrader
+import hashlib
+import inspect
+import os
+import sys
+import threading
+
+from pathlib import Path
+
+from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES
+from ccxtbt.metadata_cache.metadata_cache__classes import Metadata_Cache
+from ccxtbt.metadata_cache.metadata_cache__specifications import METADATA_CACHE_KEYS, METADATA_CACHE__DIR_NAME
+from ccxtbt.utils import legality_check_not_none_obj
+
+# Process-wide registry of metadata caches keyed by (exchange, market type, network)
+shared_metadata_caches = {}
+shared_metadata_caches__lock = threading.Lock()
+
+
+def get_user_cache_dir_path() -> str:
+    '''
+    Per-user cache directory of the platform, i.e. %LOCALAPPDATA% on Windows, ~/Library/Caches on macOS and
+    $XDG_CACHE_HOME (default to ~/.cache) elsewhere
+    '''
+    if sys.platform.startswith("win"):
+        user_cache_dir_path = os.environ.get(
+            'LOCALAPPDATA', None) or os.path.join(Path.home(), "AppData", "Local")
+    elif sys.platform == "darwin":
+        user_cache_dir_path = os.path.join(Path.home(), "Library", "Caches")
+    else:
+        user_cache_dir_path = os.environ.get(
+            'XDG_CACHE_HOME', None) or os.path.join(Path.home(), ".cache")
+    return os.path.join(user_cache_dir_path, METADATA_CACHE__DIR_NAME)
+
+
+def get_metadata_cache_dir_path(params) -> str:
+    # Un-serialize Params
+    exchange_dropdown_value = params['exchange_dropdown_value']
+    market_type = params['market_type']
+    main_net_toggle_switch_value = params['main_net_toggle_switch_value']
+
+    # Optional Params
+    root_dir_path = params.get('root_dir_path', None)
+
+    # Legality Check
+    legality_check_not_none_obj(
+        exchange_dropdown_value, "exchange_dropdown_value")
+    if market_type not in range(len(CCXT__MARKET_TYPES)):
+        raise ValueError("{}: {} market_type must be one of {}!!!".format(
+            inspect.currentframe(),
+            market_type, range(len(CCXT__MARKET_TYPES))))
+    assert isinstance(main_net_toggle_switch_value, bool)
+
+    if main_net_toggle_switch_value == True:
+        exchange_net_type = backtrader.Broker_or_Exchange_Base.Exchange_Net_Types[
+            backtrader.Broker_or_Exchange_Base.MAINNET]
+    else:
+        exchange_net_type = backtrader.Broker_or_Exchange_Base.Exchange_Net_Types[
+            backtrader.Broker_or_Exchange_Base.TESTNET]
+
+    if root_dir_path is None:
+        root_dir_path = get_user_cache_dir_path()
+
+    metadata_cache_dir_path = \
+        os.path.join(root_dir_path, exchange_dropdown_value,
+                     CCXT__MARKET_TYPES[market_type], exchange_net_type)
+    return metadata_cache_dir_path
+
+
+def get_shared_metadata_cache(params) -> Metadata_Cache:
+    # Optional Params
+    ttl_in_seconds = params.get('ttl_in_seconds', None)
+    enabled = params.get('enabled', None)
+
+    metadata_cache_dir_path = get_metadata_cache_dir_path(params)
+
+    with shared_metadata_caches__lock:
+        if metadata_cache_dir_path not in shared_metadata_caches.keys():
+            shared_metadata_caches[metadata_cache_dir_path] = Metadata_Cache(
+                dir_path=metadata_cache_dir_path, ttl_in_seconds=ttl_in_seconds, enabled=enabled)
+        metadata_cache = shared_metadata_caches[metadata_cache_dir_path]
+    return metadata_cache
+
+
+def get_metadata_cache_key(params) -> str:
+    # Un-serialize Params
+    metadata_cache_key = params['metadata_cache_key']
+
+    # Optional Params
+    symbol_id = params.get('symbol_id', None)
+    api_key = params.get('api_key', None)
+
+    if metadata_cache_key not in range(len(METADATA_CACHE_KEYS)):
+        raise ValueError("{}: {} metadata_cache_key must be one of {}!!!".format(
+            inspect.currentframe(),
+            metadata_cache_key, range(len(METADATA_CACHE_KEYS))))
+
+    key = METADATA_CACHE_KEYS[metadata_cache_key]
+    if symbol_id is not None:
+        key = "{}_{}".format(key, symbol_id)
+    if api_key is not None:
+        # Account specific entry (e.g. fee tier). Never write the API key itself onto the disk
+        key = "{}_{}".format(key, hashlib.sha256(
+            api_key.encode()).hexdigest()[:16])
+    return key
@@ -0,0 +1,17 @@
+# Bump whenever the layout of any cached entry changes so that stale files written by older code get ignored
+METADATA_CACHE__VERSION = 1
+
+METADATA_CACHE_FILE_EXTENSION = "json"
+
+# Static exchange metadata barely changes. Older entries are still served while being refreshed in the background
+DEFAULT__METADATA_CACHE__TTL_IN_SECONDS = 24 * 60 * 60
+
+DEFAULT__METADATA_CACHE__ENABLED = True
+
+# Sub-directory created under the per-user cache directory of the platform, as the installed package may be read-only
+METADATA_CACHE__DIR_NAME = "bt_ccxt_store"
+
+METADATA_CACHE_KEYS = ('markets', 'symbol_stationary',
+                       'risk_limit', 'commission_rate', )
+MARKETS_KEY, SYMBOL_STATIONARY_KEY, RISK_LIMIT_KEY, COMMISSION_RATE_KEY, = range(
+    len(METADATA_CACHE_KEYS))
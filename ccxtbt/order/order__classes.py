@@ -21,12 +21,25 @@
 from __future__ import division, absolute_import, print_function, unicode_literals
 
 import backtrader
+import ccxt
+import collections
 import copy
 import datetime
 import inspect
 import json
-
-from ccxtbt.order.order__specifications import CCXT_SIDE_KEY, DERIVED__CCXT_ORDER__KEYS, EXECUTION_TYPE, STATUS
+import threading
+
+from time import monotonic
+
+from ccxtbt.exchange_or_broker.exchange__helper import get_symbol_id
+from ccxtbt.exchange_or_broker.exchange__specifications import CCXT_TERMINAL_MAPPING_VALUES
+from ccxtbt.order.order__specifications import CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT, CCXT_ORDER_KEYS__MUST_EXIST, \
+    CCXT_ORDER_TYPES, CCXT_SIDE_KEY, CCXT_SYMBOL_KEY, CCXT_TYPE_KEY, DEFAULT__ORDER_STATE_WAITER__MAX_SIZE, \
+    DEFAULT__WEBSOCKET_ORDER_CACHE__MAX_TERMINAL_ORDERS_PER_SYMBOL, \
+    DEFAULT__WEBSOCKET_ORDER_CACHE__TERMINAL_ORDER_TTL_IN_SECONDS, DERIVED__CCXT_ORDER__KEYS, EXECUTION_TYPE, \
+    LIST_OF_CCXT_KEY_TO_BE_RENAMED, ORDERING_TYPE, ORDER_INTENT, POSITION_TYPE, SIDE, STATUS, CANCELED_ORDER, \
+    CLOSED_ORDER, EXPIRED_ORDER, OPENED_ORDER, PARTIALLY_FILLED_ORDER, REJECTED_ORDER
+from ccxtbt.utils import capitalize_sentence, legality_check_not_none_obj
 from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID
 from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
 
@@ -303,3 +316,340 @@ class BT_CCXT_Order(backtrader.OrderBase):
         self.executed.mark_pending()
         obj = copy.copy(self)
         return obj
+
+
+class Order_State_Waiter(object):
+    '''
+    Remember the latest ccxt order pushed by the exchange per order id and wake up any thread waiting for that order
+    to reach one of the expected statuses. This allows the caller to react as soon as the exchange confirms instead of
+    sleeping for a fixed period.
+    '''
+
+    def __init__(self, max_size=None):
+        if max_size is None:
+            max_size = DEFAULT__ORDER_STATE_WAITER__MAX_SIZE
+        self.max_size = max_size
+        self.condition = threading.Condition()
+        self.latest_ccxt_orders = collections.OrderedDict()
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: len(latest_ccxt_orders): {}/{}".format(
+            type(self).__name__, len(self.latest_ccxt_orders), self.max_size)
+
+    def update(self, order_id, ccxt_order):
+        with self.condition:
+            self.latest_ccxt_orders[order_id] = ccxt_order
+            self.latest_ccxt_orders.move_to_end(order_id)
+
+            # Forget the oldest order should the waiter grow beyond its limit
+            while len(self.latest_ccxt_orders) > self.max_size:
+                self.latest_ccxt_orders.popitem(last=False)
+            self.condition.notify_all()
+
+    def discard(self, order_id):
+        with self.condition:
+            self.latest_ccxt_orders.pop(order_id, None)
+
+    def get(self, order_id):
+        with self.condition:
+            return self.latest_ccxt_orders.get(order_id, None)
+
+    def wait_for_order_state(self, order_id, states=None, timeout=None):
+        '''
+        Block until the order is seen in one of the states (any state if None) or until the timeout lapses. Return the
+        latest ccxt order if the condition is met, otherwise None.
+        '''
+        def is_order_in_expected_state():
+            ccxt_order = self.latest_ccxt_orders.get(order_id, None)
+            if ccxt_order is None:
+                return False
+            return states is None or ccxt_order['status'] in states
+
+        with self.condition:
+            if self.condition.wait_for(is_order_in_expected_state, timeout=timeout):
+                return self.latest_ccxt_orders[order_id]
+        return None
+
+
+class Websocket_Order_Cache(object):
+    '''
+    Per-symbol index of the ccxt orders pushed by the websocket, keyed by order id. Opened orders are kept for as long
+    as they are opened while terminal orders are evicted once they are older than the TTL or once there are more than
+    the allowed number of them, so that memory and lookup cost stay flat regardless of the uptime.
+    '''
+
+    def __init__(self, terminal_order_ttl_in_seconds=None, max_terminal_orders_per_symbol=None):
+        if terminal_order_ttl_in_seconds is None:
+            terminal_order_ttl_in_seconds = DEFAULT__WEBSOCKET_ORDER_CACHE__TERMINAL_ORDER_TTL_IN_SECONDS
+        if max_terminal_orders_per_symbol is None:
+            max_terminal_orders_per_symbol = DEFAULT__WEBSOCKET_ORDER_CACHE__MAX_TERMINAL_ORDERS_PER_SYMBOL
+        self.terminal_order_ttl_in_seconds = terminal_order_ttl_in_seconds
+        self.max_terminal_orders_per_symbol = max_terminal_orders_per_symbol
+
+        self.lock = threading.Lock()
+        self.ccxt_orders = collections.defaultdict(collections.OrderedDict)
+
+        # Track since when an order turned terminal, oldest first
+        self.terminal_since = collections.defaultdict(collections.OrderedDict)
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}".format(
+            type(self).__name__,
+            ", ".join(["{}: {}".format(symbol_id, len(ccxt_orders))
+                       for symbol_id, ccxt_orders in self.ccxt_orders.items()]),
+        )
+
+    def __len__(self):
+        with self.lock:
+            return sum([len(ccxt_orders) for ccxt_orders in self.ccxt_orders.values()])
+
+    def _evict(self, symbol_id, now):
+        ccxt_orders = self.ccxt_orders[symbol_id]
+        terminal_since = self.terminal_since[symbol_id]
+        while len(terminal_since) > 0:
+            order_id, since = next(iter(terminal_since.items()))
+            if now - since < self.terminal_order_ttl_in_seconds and \
+                    len(terminal_since) <= self.max_terminal_orders_per_symbol:
+                break
+            del terminal_since[order_id]
+            ccxt_orders.pop(order_id, None)
+
+    def upsert(self, symbol_id, ccxt_order):
+        order_id = ccxt_order['id']
+        now = monotonic()
+        with self.lock:
+            self.ccxt_orders[symbol_id][order_id] = ccxt_order
+
+            if ccxt_order['status'] in CCXT_TERMINAL_MAPPING_VALUES:
+                if order_id not in self.terminal_since[symbol_id].keys():
+                    self.terminal_since[symbol_id][order_id] = now
+            else:
+                self.terminal_since[symbol_id].pop(order_id, None)
+
+            self._evict(symbol_id, now)
+
+    def get(self, symbol_id, order_id):
+        with self.lock:
+            if symbol_id not in self.ccxt_orders.keys():
+                return None
+            return self.ccxt_orders[symbol_id].get(order_id, None)
+
+    def get_orders(self, symbol_id):
+        with self.lock:
+            if symbol_id not in self.ccxt_orders.keys():
+                return []
+            return list(self.ccxt_orders[symbol_id].values())
+
+    def get_orders_id(self, symbol_id):
+        with self.lock:
+            if symbol_id not in self.ccxt_orders.keys():
+                return []
+            return list(self.ccxt_orders[symbol_id].keys())
+
+
+class CCXT_Order_Normalizer(object):
+    '''
+    Turn ccxt orders into the structure expected by BT_CCXT_Order, i.e. renamed keys, float fields and the derived
+    ordering type, execution type, order intent, position type and status. The key remaps and the reverse lookup
+    tables are built once per exchange so that normalizing a batch of ccxt orders only costs a handful of dict lookups
+    per order.
+    '''
+
+    def __init__(self, params):
+        # Un-serialize Params
+        exchange_dropdown_value = params['exchange_dropdown_value']
+        order_types = params['order_types']
+        mappings = params['mappings']
+
+        # Legality Check
+        assert isinstance(exchange_dropdown_value, str)
+        assert isinstance(order_types, dict)
+        assert isinstance(mappings, dict)
+
+        if exchange_dropdown_value == BINANCE_EXCHANGE_ID:
+            # Rename 'reduceOnly' key into 'reduce_only' key while maintaining its ordering
+            self.reduce_only_key = 'reduceOnly'
+        elif exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+            # Read from the raw exchange order
+            self.reduce_only_key = None
+        else:
+            raise NotImplementedError(
+                "{} exchange is yet to be supported!!!".format(exchange_dropdown_value))
+
+        self.exchange_dropdown_value = exchange_dropdown_value
+        self.renamed_keys = dict(LIST_OF_CCXT_KEY_TO_BE_RENAMED)
+        if self.reduce_only_key is not None:
+            self.renamed_keys[self.reduce_only_key] = 'reduce_only'
+
+        # First matching order type wins, same as a linear search
+        self.execution_types = {}
+        for execution_type, order_type in order_types.items():
+            self.execution_types.setdefault(order_type, execution_type)
+
+        bt_statuses = {
+            OPENED_ORDER: backtrader.Order.Accepted,
+            PARTIALLY_FILLED_ORDER: backtrader.Order.Partial,
+            CLOSED_ORDER: backtrader.Order.Completed,
+            CANCELED_ORDER: backtrader.Order.Canceled,
+            REJECTED_ORDER: backtrader.Order.Rejected,
+            EXPIRED_ORDER: backtrader.Order.Expired,
+        }
+
+        # Mappings are evaluated in CCXT_ORDER_TYPES order and may use different keys, hence keep them as a list
+        self.status_mappings = []
+        for ccxt_order_type in range(len(CCXT_ORDER_TYPES)):
+            mapping = mappings[CCXT_ORDER_TYPES[ccxt_order_type]]
+            self.status_mappings.append(
+                (mapping['key'], mapping['value'], bt_statuses[ccxt_order_type]))
+
+        # Entry order has matching side while exit order has the opposite side
+        self.position_types = {
+            (backtrader.Order.Entry_Order, backtrader.Order.Buy): backtrader.Position.LONG_POSITION,
+            (backtrader.Order.Entry_Order, backtrader.Order.Sell): backtrader.Position.SHORT_POSITION,
+            (backtrader.Order.Exit_Order, backtrader.Order.Buy): backtrader.Position.SHORT_POSITION,
+            (backtrader.Order.Exit_Order, backtrader.Order.Sell): backtrader.Position.LONG_POSITION,
+        }
+
+        # Memoized per distinct value seen
+        self.symbol_ids = {}
+        self.sides = {}
+
+        # Alias
+        self.ordering_type_key = DERIVED__CCXT_ORDER__KEYS[ORDERING_TYPE]
+        self.execution_type_key = DERIVED__CCXT_ORDER__KEYS[EXECUTION_TYPE]
+        self.order_intent_key = DERIVED__CCXT_ORDER__KEYS[ORDER_INTENT]
+        self.position_type_key = DERIVED__CCXT_ORDER__KEYS[POSITION_TYPE]
+        self.status_key = DERIVED__CCXT_ORDER__KEYS[STATUS]
+        self.side_key = DERIVED__CCXT_ORDER__KEYS[SIDE]
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}".format(type(self).__name__, self.exchange_dropdown_value)
+
+    def _get_symbol_id(self, symbol_name):
+        symbol_id = self.symbol_ids.get(symbol_name, None)
+        if symbol_id is None:
+            get_symbol_id__dict = dict(
+                exchange_dropdown_value=self.exchange_dropdown_value,
+                symbol_name=symbol_name,
+            )
+            symbol_id = get_symbol_id(params=get_symbol_id__dict)
+            self.symbol_ids[symbol_name] = symbol_id
+        return symbol_id
+
+    def _get_side(self, side_name):
+        side = self.sides.get(side_name, None)
+        if side is None:
+            capitalized_side_name = capitalize_sentence(side_name)
+            side = (capitalized_side_name,
+                    backtrader.Order.Order_Types.index(capitalized_side_name))
+            self.sides[side_name] = side
+        return side
+
+    def normalize(self, ccxt_order):
+        assert isinstance(ccxt_order, dict)
+
+        # Rename dict while maintaining its ordering
+        renamed_keys = self.renamed_keys
+        normalized_ccxt_order = {renamed_keys.get(
+            k, k): v for k, v in ccxt_order.items()}
+
+        if CCXT_SYMBOL_KEY in normalized_ccxt_order:
+            normalized_ccxt_order['symbol_id'] = self._get_symbol_id(
+                normalized_ccxt_order[CCXT_SYMBOL_KEY])
+
+        if CCXT_SIDE_KEY in normalized_ccxt_order:
+            normalized_ccxt_order[CCXT_SIDE_KEY], normalized_ccxt_order[self.side_key] = \
+                self._get_side(normalized_ccxt_order[CCXT_SIDE_KEY])
+
+        for key in CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT:
+            if key in normalized_ccxt_order:
+                value = normalized_ccxt_order[key]
+                if value is None:
+                    # Convert None to 0.0 for consistency
+                    normalized_ccxt_order[key] = 0.0
+                elif not isinstance(value, float):
+                    # Same as exchange.safe_float, i.e. non-numeric value turns into None instead of raising
+                    normalized_ccxt_order[key] = ccxt.Exchange.safe_float(
+                        normalized_ccxt_order, key)
+
+        if self.reduce_only_key is None:
+            normalized_ccxt_order['reduce_only'] = bool(
+                normalized_ccxt_order['info']['reduce_only'])
+        else:
+            normalized_ccxt_order['reduce_only'] = bool(
+                normalized_ccxt_order['reduce_only'])
+
+        for key in CCXT_ORDER_KEYS__MUST_EXIST:
+            assert key in normalized_ccxt_order, "{} key must exist in ccxt_order.keys()!!!".format(key)
+
+        # Identify 'ordering_type'
+        if normalized_ccxt_order['stopPrice'] == 0.0:
+            ordering_type = backtrader.Order.ACTIVE_ORDERING_TYPE
+        else:
+            ordering_type = backtrader.Order.CONDITIONAL_ORDERING_TYPE
+        normalized_ccxt_order[self.ordering_type_key] = ordering_type
+        normalized_ccxt_order['{}_name'.format(self.ordering_type_key)] = \
+            backtrader.Order.Ordering_Types[ordering_type]
+
+        # Identify 'execution_type'
+        execution_type = self.execution_types.get(
+            normalized_ccxt_order[CCXT_TYPE_KEY], None)
+        legality_check_not_none_obj(execution_type, "execution_type")
+        normalized_ccxt_order[self.execution_type_key] = execution_type
+        normalized_ccxt_order['{}_name'.format(self.execution_type_key)] = \
+            backtrader.Order.Execution_Types[execution_type]
+
+        # Identify 'order_intent'
+        if normalized_ccxt_order['reduce_only'] == True:
+            order_intent = backtrader.Order.Exit_Order
+        else:
+            order_intent = backtrader.Order.Entry_Order
+        normalized_ccxt_order[self.order_intent_key] = order_intent
+        normalized_ccxt_order['{}_name'.format(self.order_intent_key)] = \
+            backtrader.Order.Order_Intents[order_intent]
+
+        # Identify 'position_type'
+        position_type = self.position_types[(
+            order_intent, normalized_ccxt_order[self.side_key])]
+        normalized_ccxt_order[self.position_type_key] = position_type
+        normalized_ccxt_order['{}_name'.format(self.position_type_key)] = \
+            backtrader.Position.Position_Types[position_type]
+
+        # Identify CCXT order's 'ccxt_status' -> backtrader's 'status'
+        status = None
+        for key, value, bt_status in self.status_mappings:
+            if normalized_ccxt_order[key] == value:
+                status = bt_status
+                break
+
+        if status is None:
+            frameinfo = inspect.getframeinfo(inspect.currentframe())
+            msg = "{} Line: {}: ERROR: Tried combinations:".format(
+                frameinfo.function, frameinfo.lineno,
+            )
+            for key, value, _ in self.status_mappings:
+                sub_msg = "ccxt_order[\'{}\']: {} vs value: {}".format(
+                    key,
+                    normalized_ccxt_order[key],
+                    value,
+                )
+                print(msg + sub_msg)
+            raise KeyError(self.status_key)
+
+        normalized_ccxt_order[self.status_key] = status
+        normalized_ccxt_order['{}_name'.format(
+            self.status_key)] = backtrader.Order.Status[status]
+        return normalized_ccxt_order
+
+    def normalize_all(self, ccxt_orders):
+        normalize = self.normalize
+        return [normalize(ccxt_order) for ccxt_order in ccxt_orders]
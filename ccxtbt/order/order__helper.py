@@ -4,173 +4,10 @@ import inspect
 from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID
 from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
 from ccxtbt.order.order__classes import BT_CCXT_Order
-from ccxtbt.order.order__specifications import CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT, CCXT_ORDER_KEYS__MUST_EXIST, \
-    CCXT_ORDER_TYPES, CCXT_TYPE_KEY, DERIVED__CCXT_ORDER__KEYS, PLURAL__CCXT_ORDER__KEYS, STATUSES, CANCELED_ORDER, \
-    CLOSED_ORDER, EXECUTION_TYPE, EXECUTION_TYPES, EXPIRED_ORDER, OPENED_ORDER, ORDERING_TYPE, ORDERING_TYPES, \
-    ORDER_INTENT, ORDER_INTENTS, PARTIALLY_FILLED_ORDER, POSITION_TYPE, POSITION_TYPES, REJECTED_ORDER, \
-    SIDE, SIDES, STATUS
-from ccxtbt.utils import capitalize_sentence, legality_check_not_none_obj
-
-
-def converge_ccxt_reduce_only_value(params):
-    exchange_dropdown_value = params['exchange_dropdown_value']
-    ccxt_order = params['ccxt_order']
-
-    assert isinstance(exchange_dropdown_value, str)
-    assert isinstance(ccxt_order, dict)
-
-    if exchange_dropdown_value == BINANCE_EXCHANGE_ID:
-        assert 'reduceOnly' in ccxt_order.keys()
-        ccxt_order['reduce_only'] = bool(ccxt_order['reduceOnly'])
-        # Rename dict from 'reduceOnly' key with 'reduce_only' key while maintaining its ordering
-        ccxt_order = {'reduce_only' if k ==
-                      'reduceOnly' else k: v for k, v in ccxt_order.items()}
-    elif exchange_dropdown_value == BYBIT_EXCHANGE_ID:
-        assert 'info' in ccxt_order.keys()
-        assert 'reduce_only' in ccxt_order['info'].keys()
-        ccxt_order['reduce_only'] = bool(ccxt_order['info']['reduce_only'])
-    else:
-        raise NotImplementedError(
-            "{} exchange is yet to be supported!!!".format(exchange_dropdown_value))
-    return ccxt_order
-
-
-def reverse_engineer__ccxt_order(params):
-    '''
-    The following codes made assumption where def post_process__ccxt_orders has been called prior to this
-    '''
-    # Un-serialize Params
-    bt_ccxt_exchange = params['bt_ccxt_exchange']
-    bt_ccxt_account_or_store = params['bt_ccxt_account_or_store']
-    ccxt_order = params['ccxt_order']
-
-    # Legality Check
-    legality_check_not_none_obj(bt_ccxt_exchange, "bt_ccxt_exchange")
-    legality_check_not_none_obj(
-        bt_ccxt_account_or_store, "bt_ccxt_account_or_store")
-
-    for key in CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT:
-        assert isinstance(ccxt_order[key], float), "ccxt_order[{}]: {} must be in float!!!".format(
-            key, ccxt_order[key])
-
-    for key in CCXT_ORDER_KEYS__MUST_EXIST:
-        assert key in ccxt_order.keys(), "{} key must exist in ccxt_order.keys()!!!".format(key)
-    assert isinstance(ccxt_order['reduce_only'], bool)
-
-    assert hasattr(bt_ccxt_exchange, 'order_types')
-    assert isinstance(bt_ccxt_exchange.order_types, dict)
-    assert ccxt_order[CCXT_TYPE_KEY] in bt_ccxt_exchange.order_types.values()
-
-    # Identify 'ordering_type'
-    if ccxt_order['stopPrice'] == 0.0:
-        ccxt_order[DERIVED__CCXT_ORDER__KEYS[ORDERING_TYPE]
-                   ] = backtrader.Order.ACTIVE_ORDERING_TYPE
-    else:
-        ccxt_order[DERIVED__CCXT_ORDER__KEYS[ORDERING_TYPE]
-                   ] = backtrader.Order.CONDITIONAL_ORDERING_TYPE
-    ccxt_order['{}_name'.format(DERIVED__CCXT_ORDER__KEYS[ORDERING_TYPE])] = \
-        backtrader.Order.Ordering_Types[ccxt_order[DERIVED__CCXT_ORDER__KEYS[ORDERING_TYPE]]]
-
-    # Identify 'execution_type'
-    execution_type = None
-    for key, value in bt_ccxt_exchange.order_types.items():
-        if ccxt_order[CCXT_TYPE_KEY] == value:
-            execution_type = key
-            break
-    legality_check_not_none_obj(execution_type, "execution_type")
-
-    ccxt_order[DERIVED__CCXT_ORDER__KEYS[EXECUTION_TYPE]] = execution_type
-    ccxt_order['{}_name'.format(DERIVED__CCXT_ORDER__KEYS[EXECUTION_TYPE])] = \
-        backtrader.Order.Execution_Types[ccxt_order['execution_type']]
-
-    # Identify 'order_intent'
-    ccxt_order[DERIVED__CCXT_ORDER__KEYS[ORDER_INTENT]] = \
-        backtrader.Order.Exit_Order if ccxt_order['reduce_only'] == True else backtrader.Order.Entry_Order
-    ccxt_order['{}_name'.format(DERIVED__CCXT_ORDER__KEYS[ORDER_INTENT])] = \
-        backtrader.Order.Order_Intents[ccxt_order[DERIVED__CCXT_ORDER__KEYS[ORDER_INTENT]]]
-
-    # Identify 'position_type'
-    side = backtrader.Order.Order_Types.index(
-        capitalize_sentence(ccxt_order['side_name']))
-    if ccxt_order[DERIVED__CCXT_ORDER__KEYS[ORDER_INTENT]] == backtrader.Order.Entry_Order:
-        # Entry order, the side is matching
-        if side == backtrader.Order.Buy:
-            ccxt_order[DERIVED__CCXT_ORDER__KEYS[POSITION_TYPE]
-                       ] = backtrader.Position.LONG_POSITION
-        else:
-            assert side == backtrader.Order.Sell
-
-            ccxt_order[DERIVED__CCXT_ORDER__KEYS[POSITION_TYPE]
-                       ] = backtrader.Position.SHORT_POSITION
-    else:
-        assert ccxt_order[DERIVED__CCXT_ORDER__KEYS[ORDER_INTENT]
-                          ] == backtrader.Order.Exit_Order
-
-        # Exit order, the side is opposite
-        if side == backtrader.Order.Buy:
-            ccxt_order[DERIVED__CCXT_ORDER__KEYS[POSITION_TYPE]
-                       ] = backtrader.Position.SHORT_POSITION
-        else:
-            assert side == backtrader.Order.Sell
-
-            ccxt_order[DERIVED__CCXT_ORDER__KEYS[POSITION_TYPE]
-                       ] = backtrader.Position.LONG_POSITION
-    ccxt_order['{}_name'.format(DERIVED__CCXT_ORDER__KEYS[POSITION_TYPE])] = \
-        backtrader.Position.Position_Types[ccxt_order[DERIVED__CCXT_ORDER__KEYS[POSITION_TYPE]]]
-
-    # Identify CCXT order's 'ccxt_status' -> backtrader's 'status'
-    for ccxt_order_type in range(len(CCXT_ORDER_TYPES)):
-        key = bt_ccxt_exchange.mappings[CCXT_ORDER_TYPES[ccxt_order_type]]['key']
-        value = bt_ccxt_exchange.mappings[CCXT_ORDER_TYPES[ccxt_order_type]]['value']
-
-        if ccxt_order[key] == value:
-            if ccxt_order_type == OPENED_ORDER:
-                ccxt_order[DERIVED__CCXT_ORDER__KEYS[STATUS]
-                           ] = backtrader.Order.Accepted
-                break
-            elif ccxt_order_type == PARTIALLY_FILLED_ORDER:
-                ccxt_order[DERIVED__CCXT_ORDER__KEYS[STATUS]
-                           ] = backtrader.Order.Partial
-                break
-            elif ccxt_order_type == CLOSED_ORDER:
-                ccxt_order[DERIVED__CCXT_ORDER__KEYS[STATUS]
-                           ] = backtrader.Order.Completed
-                break
-            elif ccxt_order_type == CANCELED_ORDER:
-                ccxt_order[DERIVED__CCXT_ORDER__KEYS[STATUS]
-                           ] = backtrader.Order.Canceled
-                break
-            elif ccxt_order_type == REJECTED_ORDER:
-                ccxt_order[DERIVED__CCXT_ORDER__KEYS[STATUS]
-                           ] = backtrader.Order.Rejected
-                break
-            elif ccxt_order_type == EXPIRED_ORDER:
-                ccxt_order[DERIVED__CCXT_ORDER__KEYS[STATUS]
-                           ] = backtrader.Order.Expired
-                break
-            else:
-                raise NotImplementedError()
-
-    if DERIVED__CCXT_ORDER__KEYS[STATUS] not in ccxt_order.keys():
-        frameinfo = inspect.getframeinfo(inspect.currentframe())
-        msg = "{} Line: {}: ERROR: Tried combinations:".format(
-            frameinfo.function, frameinfo.lineno,
-        )
-
-        for ccxt_order_type in range(len(CCXT_ORDER_TYPES)):
-            key = bt_ccxt_exchange.mappings[CCXT_ORDER_TYPES[ccxt_order_type]]['key']
-            value = bt_ccxt_exchange.mappings[CCXT_ORDER_TYPES[ccxt_order_type]]['value']
-
-            sub_msg = "ccxt_order[\'{}\']: {} vs value: {}".format(
-                key,
-                ccxt_order[key],
-                value,
-            )
-            print(msg + sub_msg)
-
-    ccxt_order['{}_name'.format(DERIVED__CCXT_ORDER__KEYS[STATUS])] = \
-        backtrader.Order.Status[ccxt_order[DERIVED__CCXT_ORDER__KEYS[STATUS]]]
-    return ccxt_order
+from ccxtbt.order.order__specifications import CCXT_ORDER_TYPES, DERIVED__CCXT_ORDER__KEYS, PLURAL__CCXT_ORDER__KEYS, \
+    STATUSES, EXECUTION_TYPE, EXECUTION_TYPES, ORDERING_TYPE, ORDERING_TYPES, ORDER_INTENT, ORDER_INTENTS, \
+    POSITION_TYPE, POSITION_TYPES, SIDE, SIDES, STATUS
+from ccxtbt.utils import legality_check_not_none_obj
 
 
 def get_ccxt_order_id(exchange_dropdown_value, order):
@@ -46,3 +46,12 @@ filter_order__dict_template = {
     PLURAL__CCXT_ORDER__KEYS[SIDES]: None,
 }
 # ----------------------------------------------------------------------------------------------------------------------
+
+# Maximum number of order ids whose latest state is remembered by Order_State_Waiter
+DEFAULT__ORDER_STATE_WAITER__MAX_SIZE = 1000
+
+# Terminal (closed, canceled, expired or rejected) orders are evicted from Websocket_Order_Cache after this period
+DEFAULT__WEBSOCKET_ORDER_CACHE__TERMINAL_ORDER_TTL_IN_SECONDS = 3600
+
+# Maximum number of terminal orders retained per symbol by Websocket_Order_Cache, oldest first to be evicted
+DEFAULT__WEBSOCKET_ORDER_CACHE__MAX_TERMINAL_ORDERS_PER_SYMBOL = 200
@@ -0,0 +1,227 @@
+import threading
+
+from time import monotonic
+
+from ccxtbt.order_book.order_book__specifications import ASKS_SIDE, BIDS_SIDE, ORDER_BOOK_SIDES
+
+
+class Local_Order_Book(object):
+    '''
+    L2 order book of one symbol maintained from the depth stream of the exchange.
+
+    Every snapshot replaces the whole book. A crossed snapshot, or an invalidation, e.g. upon websocket reconnection,
+    marks the book out of sync until the next snapshot, so that readers fall back to REST meanwhile.
+
+    Price levels are kept sorted, hence reading the top of the book costs no more than slicing a list.
+
+    :param max_depth: Levels per side of the depth stream. A deeper snapshot is trimmed to it
+    '''
+
+    def __init__(self, symbol_id, max_depth=None):
+        self.symbol_id = symbol_id
+        self.max_depth = max_depth
+
+        self.lock = threading.Lock()
+        self.bids = {}
+        self.asks = {}
+        # Both kept in ascending order. The best bid is the last bid price, the best ask is the first ask price
+        self.bid_prices = []
+        self.ask_prices = []
+
+        self.synced = False
+        self.sequence = None
+        self.timestamp = None
+        self.updated__timestamp = None
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: synced: {}, sequence: {}, len(bids): {}, len(asks): {}".format(
+            type(self).__name__, self.symbol_id, self.synced, self.sequence, len(self.bids), len(self.asks))
+
+    def _is_crossed(self):
+        return len(self.bid_prices) > 0 and len(self.ask_prices) > 0 and self.bid_prices[-1] >= self.ask_prices[0]
+
+    def apply_snapshot(self, bids, asks, sequence=None, timestamp=None) -> None:
+        '''
+        :param bids: List of [price, size]
+        :param asks: List of [price, size]
+        '''
+        with self.lock:
+            self.bids = {float(price): float(size)
+                         for price, size in bids if float(size) > 0.0}
+            self.asks = {float(price): float(size)
+                         for price, size in asks if float(size) > 0.0}
+            self.bid_prices = sorted(self.bids.keys())
+            self.ask_prices = sorted(self.asks.keys())
+            if self.max_depth is not None:
+                for price in self.bid_prices[:-self.max_depth]:
+                    del self.bids[price]
+                for price in self.ask_prices[self.max_depth:]:
+                    del self.asks[price]
+                self.bid_prices = self.bid_prices[-self.max_depth:]
+                self.ask_prices = self.ask_prices[:self.max_depth]
+
+            self.synced = not self._is_crossed()
+            self.sequence = sequence
+            self.timestamp = timestamp
+            self.updated__timestamp = monotonic()
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.synced = False
+
+    def is_synced(self, max_age_in_seconds=None) -> bool:
+        with self.lock:
+            if self.synced == False:
+                return False
+            if max_age_in_seconds is not None and monotonic() - self.updated__timestamp > max_age_in_seconds:
+                return False
+            return True
+
+    def get_snapshot(self, depth=None) -> dict:
+        '''
+        :return: The book in the shape of ccxt fetch_order_book, best price first
+        '''
+        with self.lock:
+            bid_prices = self.bid_prices[::-
+                                         1] if depth is None else self.bid_prices[:-depth - 1:-1]
+            ask_prices = self.ask_prices if depth is None else self.ask_prices[:depth]
+            snapshot = dict(
+                symbol=self.symbol_id,
+                bids=[[price, self.bids[price]] for price in bid_prices],
+                asks=[[price, self.asks[price]] for price in ask_prices],
+                nonce=self.sequence,
+                timestamp=self.timestamp,
+            )
+        return snapshot
+
+
+class Order_Book_Snapshot(object):
+    '''
+    Immutable view of an order book where each side is held as contiguous float64 arrays of price and size, best price
+    first. Depth queries are vectorized over the arrays instead of walking the ccxt lists level by level.
+    '''
+
+    def __init__(self, orderbook):
+        '''
+        :param orderbook: The book in the shape of ccxt fetch_order_book
+        '''
+        # Defer import of numpy as it is costly to import
+        import numpy as np
+
+        self.symbol_id = orderbook.get('symbol', None)
+        self.nonce = orderbook.get('nonce', None)
+        self.timestamp = orderbook.get('timestamp', None)
+
+        self.prices = []
+        self.sizes = []
+        for side in ORDER_BOOK_SIDES:
+            levels = np.asarray(
+                orderbook[side], dtype=np.float64).reshape(-1, 2)
+            self.prices.append(np.ascontiguousarray(levels[:, 0]))
+            self.sizes.append(np.ascontiguousarray(levels[:, 1]))
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: nonce: {}, len(bids): {}, len(asks): {}".format(
+            type(self).__name__, self.symbol_id, self.nonce, len(
+                self.prices[BIDS_SIDE]),
+            len(self.prices[ASKS_SIDE]))
+
+    @property
+    def bid_prices(self):
+        return self.prices[BIDS_SIDE]
+
+    @property
+    def bid_sizes(self):
+        return self.sizes[BIDS_SIDE]
+
+    @property
+    def ask_prices(self):
+        return self.prices[ASKS_SIDE]
+
+    @property
+    def ask_sizes(self):
+        return self.sizes[ASKS_SIDE]
+
+    def get_depth(self) -> int:
+        '''
+        :return: Number of levels available on both sides
+        '''
+        return min(len(self.prices[BIDS_SIDE]), len(self.prices[ASKS_SIDE]))
+
+    def get_price_by_offset(self, offset) -> tuple:
+        '''
+        :return: (ask, bid) at the given level, where offset 0 is the top of the book
+        '''
+        depth = self.get_depth()
+
+        # Legality Check
+        assert offset < depth, \
+            "Expected: {} vs Actual: {}".format(depth - 1, offset)
+        assert offset >= -depth, \
+            "Expected: {} vs Actual: {}".format(depth - 1, offset)
+
+        ask = float(self.prices[ASKS_SIDE][:depth][offset])
+        bid = float(self.prices[BIDS_SIDE][:depth][offset])
+        return ask, bid
+
+    def get_spread_in_ticks(self, tick_size) -> int:
+        ask, bid = self.get_price_by_offset(0)
+        return int(round((ask - bid) / tick_size))
+
+    def get_cumulative_depth(self, side, notional) -> tuple:
+        '''
+        :param side: Either BIDS_SIDE or ASKS_SIDE
+        :param notional: Notional value to be filled, in quote currency
+        :return: (size, price) where size is the cumulative size required to fill the notional and price is the worst
+            level reached. Size is capped at the depth available should the book be too thin.
+        '''
+        # Defer import of numpy as it is costly to import
+        import numpy as np
+
+        prices = self.prices[side]
+        sizes = self.sizes[side]
+        if len(prices) == 0:
+            return 0.0, None
+
+        cumulative_notional = np.cumsum(prices * sizes)
+        level = int(np.searchsorted(
+            cumulative_notional, notional, side='left'))
+        if level >= len(prices):
+            return float(sizes.sum()), float(prices[-1])
+
+        previous_notional = cumulative_notional[level -
+                                                1] if level > 0 else 0.0
+        previous_size = sizes[:level].sum()
+        size = previous_size + (notional - previous_notional) / prices[level]
+        return float(size), float(prices[level])
+
+    def get_vwap(self, side, size):
+        '''
+        :param side: Either BIDS_SIDE or ASKS_SIDE
+        :return: Volume weighted average price to fill the size against the side, None if the book is too thin
+        '''
+        # Defer import of numpy as it is costly to import
+        import numpy as np
+
+        # Legality Check
+        assert size > 0.0, "Expected: > 0.0 vs Actual: {}".format(size)
+
+        prices = self.prices[side]
+        sizes = self.sizes[side]
+        cumulative_sizes = np.cumsum(sizes)
+        if len(prices) == 0 or cumulative_sizes[-1] < size:
+            return None
+
+        # Take whole levels before the one that completes the size, then the remainder off that level
+        level = int(np.searchsorted(cumulative_sizes, size, side='left'))
+        filled_sizes = sizes[:level + 1].copy()
+        filled_sizes[level] = size - \
+            (cumulative_sizes[level - 1] if level > 0 else 0.0)
+        vwap = float(np.dot(prices[:level + 1], filled_sizes) / size)
+        return vwap
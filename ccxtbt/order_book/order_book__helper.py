@@ -0,0 +1,64 @@
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
+from ccxtbt.order_book.order_book__specifications import ORDER_BOOK_MESSAGE_TYPES, SNAPSHOT_MESSAGE_TYPE
+
+
+def _get_bybit_order_book_levels(entries) -> tuple:
+    bids = []
+    asks = []
+    for entry in entries:
+        # Deleted level comes without size
+        level = [float(entry['price']), float(entry.get('size', 0.0))]
+        if entry['side'] == "Buy":
+            bids.append(level)
+        else:
+            # Validate assumption made
+            assert entry['side'] == "Sell"
+
+            asks.append(level)
+    ret_value = (bids, asks, )
+    return ret_value
+
+
+def parse_bybit_order_book_message(params) -> dict:
+    '''
+    Reference: https://bybit-exchange.github.io/docs/futuresV2/linear/#t-websocketorderbook25
+
+    pybit applies every delta to the book it maintains itself and hands that whole book over as a snapshot instead
+    '''
+    # Un-serialize Params
+    message = params['message']
+
+    # Validate assumption made
+    assert message['type'] == ORDER_BOOK_MESSAGE_TYPES[SNAPSHOT_MESSAGE_TYPE]
+
+    data = message['data']
+    # Raw snapshot of Bybit nests the levels under order_book
+    entries = data['order_book'] if isinstance(data, dict) else data
+    (bids, asks, ) = _get_bybit_order_book_levels(entries)
+    symbol_id = entries[0]['symbol'] if len(
+        entries) > 0 else message['topic'].split(".")[-1]
+
+    sequence = message.get('cross_seq', None)
+    timestamp = message.get('timestamp_e6', None)
+    order_book_message = dict(
+        symbol_id=symbol_id,
+        type=message['type'],
+        bids=bids,
+        asks=asks,
+        sequence=int(sequence) if sequence is not None else None,
+        # Microseconds to milliseconds as per ccxt
+        timestamp=int(timestamp) // 1000 if timestamp is not None else None,
+    )
+    return order_book_message
+
+
+def parse_order_book_message(params) -> dict:
+    # Un-serialize Params
+    exchange_dropdown_value = params['exchange_dropdown_value']
+
+    if exchange_dropdown_value == BYBIT_EXCHANGE_ID:
+        order_book_message = parse_bybit_order_book_message(params)
+    else:
+        raise NotImplementedError(
+            "{} exchange is yet to be supported!!!".format(exchange_dropdown_value))
+    return order_book_message
@@ -0,0 +1,10 @@
+# Local order book is served only if it has been updated within this time, otherwise get_orderbook falls back to REST
+DEFAULT__ORDER_BOOK__MAX_AGE_IN_SECONDS = 30.0
+
+ORDER_BOOK_MESSAGE_TYPES = ["snapshot", "delta"]
+SNAPSHOT_MESSAGE_TYPE, DELTA_MESSAGE_TYPE = range(
+    len(ORDER_BOOK_MESSAGE_TYPES))
+
+# Sides of the book, named after the keys of ccxt fetch_order_book
+ORDER_BOOK_SIDES = ["bids", "asks"]
+BIDS_SIDE, ASKS_SIDE = range(len(ORDER_BOOK_SIDES))
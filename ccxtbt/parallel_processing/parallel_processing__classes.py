@@ -1,7 +1,10 @@
+import functools
 import threading
 
 from abc import abstractmethod
+from time import time as timer
 
+from ccxtbt.parallel_processing.parallel_processing__helper import run_in_thread_pool
 from ccxtbt.utils import legality_check_not_none_obj
 
 
@@ -26,3 +29,141 @@ class Thread_Skeleton(threading.Thread):
     @abstractmethod
     def limited_thread_run(self):
         print("ERROR: This abstract method is not implemented!!!")
+
+
+class In_Flight_Call(object):
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class Single_Flight(object):
+    '''
+    Coalesce concurrent calls sharing the same key into one. The first caller (leader) performs the call while the
+    others wait for and receive the very same result, or exception. The result object is shared and must be treated as
+    read-only by the callers.
+    '''
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight_calls = {}
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: len(in_flight_calls): {}".format(type(self).__name__, len(self.in_flight_calls))
+
+    def do(self, key, fn, *args, **kwargs):
+        with self.lock:
+            in_flight_call = self.in_flight_calls.get(key, None)
+            is_leader = in_flight_call is None
+            if is_leader:
+                in_flight_call = In_Flight_Call()
+                self.in_flight_calls[key] = in_flight_call
+
+        if not is_leader:
+            in_flight_call.event.wait()
+            if in_flight_call.exception is not None:
+                raise in_flight_call.exception
+            return in_flight_call.result
+
+        try:
+            in_flight_call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            in_flight_call.exception = e
+            raise
+        finally:
+            # Subsequent call must go to the network again as the result could have gone stale
+            with self.lock:
+                del self.in_flight_calls[key]
+            in_flight_call.event.set()
+        return in_flight_call.result
+
+
+class Crash_Recovery_Coordinator(object):
+    '''
+    Reconcile the persisted orders of every pending instrument of every account_or_store concurrently.
+
+    The exchange lookups of each instrument run on a thread pool. Every request still goes through the rate limiter
+    shared by the accounts hitting the same host, hence the pool only fills the budget instead of exceeding it. The
+    results are then applied one instrument at a time in the order the accounts and instruments were added, so that
+    the notifications come out in the very same order on every restart.
+
+    An instrument whose recovery plan could not be fetched is handed back to its account_or_store, so that a subsequent
+    recover retries it, while the plans of every other instrument are still applied.
+    '''
+
+    def __init__(self, accounts_or_stores, max_workers=None):
+        assert isinstance(accounts_or_stores, list)
+        self.accounts_or_stores = accounts_or_stores
+        self.max_workers = max_workers
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: len(accounts_or_stores): {}".format(type(self).__name__, len(self.accounts_or_stores))
+
+    def recover(self) -> dict:
+        '''
+        :return: Time taken in seconds to fetch the recovery plan of each symbol, keyed by (account alias, symbol_id)
+        '''
+        tasks = []
+        for account_or_store in self.accounts_or_stores:
+            for instrument in account_or_store.pop_pending_recovery__instruments():
+                tasks.append((account_or_store, instrument, ))
+
+        fetch_timings = {}
+        if len(tasks) == 0:
+            return fetch_timings
+
+        def fetch_recovery_plan(account_or_store, instrument):
+            start = timer()
+            recovery_plan = account_or_store.fetch_recovery_plan(instrument)
+            return recovery_plan, timer() - start
+
+        run_in_thread_pool__dict = dict(
+            tasks=[functools.partial(fetch_recovery_plan, account_or_store, instrument)
+                   for account_or_store, instrument in tasks],
+            rate_limiters=[getattr(account_or_store, 'rate_limiter', None)
+                           for account_or_store in self.accounts_or_stores],
+            max_workers=self.max_workers,
+            return_exceptions=True,
+        )
+        results = run_in_thread_pool(params=run_in_thread_pool__dict)
+
+        # Merge in deterministic order and only then let each account_or_store process its reinstated orders
+        reinstated_accounts_or_stores = []
+        failed_tasks = []
+        first_exception = None
+        for (account_or_store, instrument, ), result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                failed_tasks.append((account_or_store, instrument, ))
+                if first_exception is None:
+                    first_exception = result
+                continue
+
+            (recovery_plan, seconds, ) = result
+            fetch_timings[(account_or_store.account_alias,
+                           instrument.symbol_id, )] = seconds
+
+            reinstated_order = account_or_store.apply_recovery_plan(
+                recovery_plan, call_next=False)
+            if reinstated_order == True and account_or_store not in reinstated_accounts_or_stores:
+                reinstated_accounts_or_stores.append(account_or_store)
+
+        # Stage 3 of STAGES_OF_RESEND_NOTIFICATION
+        for account_or_store in reinstated_accounts_or_stores:
+            account_or_store.next(ut_provided__new_ccxt_order=True)
+
+        if first_exception is not None:
+            for account_or_store in self.accounts_or_stores:
+                instruments = [instrument for (failed__account_or_store, instrument, ) in failed_tasks
+                               if failed__account_or_store is account_or_store]
+                if len(instruments) > 0:
+                    account_or_store.push_back_pending_recovery__instruments(
+                        instruments)
+            raise first_exception
+        return fetch_timings
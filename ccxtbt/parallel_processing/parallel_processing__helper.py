@@ -1,3 +1,4 @@
+import concurrent.futures
 import inspect
 import multiprocessing
 import threading
@@ -49,3 +50,46 @@ def run_threads(threads, timeout, disable_verbose=None, print_checkpoint=False):
         print("{} Line: {}: Took {}m:{:.2f}s".format(
             frameinfo.function, frameinfo.lineno, minutes, seconds)
         )
+
+
+def run_in_thread_pool(params) -> list:
+    '''
+    Run every task, i.e. a callable taking no argument, on a thread pool. Return the results in the order of the tasks.
+    The first exception, if any, is raised only after every task is done. With return_exceptions, the exception of a
+    failed task is returned in place of its result instead.
+    '''
+    # Un-serialize Params
+    tasks = params['tasks']
+
+    # Optional Params
+    rate_limiters = params.get('rate_limiters', [])
+    max_workers = params.get('max_workers', None)
+    return_exceptions = params.get('return_exceptions', False)
+
+    # Legality Check
+    assert isinstance(tasks, list)
+    assert isinstance(rate_limiters, list)
+
+    if len(tasks) == 0:
+        return []
+
+    if max_workers is None:
+        # Any more workers would only queue up on the rate limiters. Rate limiter shared by several callers counts once.
+        distinct__rate_limiters = []
+        for rate_limiter in rate_limiters:
+            if rate_limiter is not None and \
+                    all(rate_limiter is not other for other in distinct__rate_limiters):
+                distinct__rate_limiters.append(rate_limiter)
+
+        capacities = [int(rate_limiter.capacity)
+                      for rate_limiter in distinct__rate_limiters]
+        max_workers = sum(capacities) if len(capacities) > 0 else 1
+    max_workers = max(1, min(max_workers, len(tasks)))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        concurrent.futures.wait(futures)
+
+    if return_exceptions == True:
+        return [future.result() if future.exception() is None else future.exception() for future in futures]
+    return [future.result() for future in futures]
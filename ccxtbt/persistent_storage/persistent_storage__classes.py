@@ -0,0 +1,151 @@
+import contextlib
+import os
+import sqlite3
+import threading
+
+from pathlib import Path
+
+from ccxtbt.persistent_storage.persistent_storage__specifications import \
+    DEFAULT__PERSISTENT_STORAGE__BUSY_TIMEOUT_IN_SECONDS, PERSISTENT_STORAGE_DB_KEYS, PS_DB_ORDERING_TYPE
+
+
+class Order_Id_Store(object):
+    '''
+    Embedded store of opened order ids backed by SQLite in WAL mode.
+
+    Rows are indexed by the (exchange, market type, network, symbol, ordering type, order id) primary key, hence
+    insert and delete are O(log n) regardless of how many orders are persisted. Every write is a transaction, so a
+    crash leaves either the old or the new content behind but never a half written file. Use transaction() to batch
+    several writes into one commit.
+    '''
+
+    def __init__(self, db_file_path, busy_timeout_in_seconds=None):
+        if busy_timeout_in_seconds is None:
+            busy_timeout_in_seconds = DEFAULT__PERSISTENT_STORAGE__BUSY_TIMEOUT_IN_SECONDS
+        self.db_file_path = db_file_path
+
+        db_dir_path = os.path.dirname(os.path.abspath(db_file_path))
+        if not os.path.exists(db_dir_path):
+            Path(db_dir_path).mkdir(parents=True, exist_ok=True)
+
+        # Connection is shared by every thread of the process and serialized by the lock below. Transactions are
+        #       managed explicitly, hence autocommit mode
+        self.connection = sqlite3.connect(
+            db_file_path, timeout=busy_timeout_in_seconds, isolation_level=None, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.transaction_depth = 0
+
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            # WAL is durable against application crash with NORMAL, only a power loss may roll back the last commits
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS ccxt_orders_id ("
+                "exchange TEXT NOT NULL, "
+                "market_type TEXT NOT NULL, "
+                "exchange_net_type TEXT NOT NULL, "
+                "symbol_id TEXT NOT NULL, "
+                "ordering_type INTEGER NOT NULL, "
+                "ccxt_order_id TEXT NOT NULL, "
+                "PRIMARY KEY ({}))".format(", ".join(PERSISTENT_STORAGE_DB_KEYS)))
+
+            # Timestamp in ms up to which the orders of the symbol have been reconciled with the exchange
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS reconciliation_watermarks ("
+                "exchange TEXT NOT NULL, "
+                "market_type TEXT NOT NULL, "
+                "exchange_net_type TEXT NOT NULL, "
+                "symbol_id TEXT NOT NULL, "
+                "timestamp INTEGER NOT NULL, "
+                "PRIMARY KEY ({}))".format(", ".join(PERSISTENT_STORAGE_DB_KEYS[:PS_DB_ORDERING_TYPE])))
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}".format(type(self).__name__, self.db_file_path)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        '''
+        Group every write issued within the block into a single commit. Nested blocks join the outermost one.
+        '''
+        with self.lock:
+            if self.transaction_depth == 0:
+                self.connection.execute("BEGIN IMMEDIATE")
+            self.transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self.transaction_depth -= 1
+                if self.transaction_depth == 0:
+                    self.connection.execute("ROLLBACK")
+                raise
+            else:
+                self.transaction_depth -= 1
+                if self.transaction_depth == 0:
+                    self.connection.execute("COMMIT")
+
+    def insert(self, symbol_key, rows) -> int:
+        '''
+        Persist (ordering_type, ccxt_order_id) rows for the symbol. Rows already persisted are ignored.
+
+        :return: Number of rows inserted
+        '''
+        with self.transaction():
+            cursor = self.connection.executemany(
+                "INSERT OR IGNORE INTO ccxt_orders_id VALUES (?, ?, ?, ?, ?, ?)",
+                [tuple(symbol_key) + (int(ordering_type), str(ccxt_order_id), )
+                 for ordering_type, ccxt_order_id in rows])
+            return cursor.rowcount
+
+    def delete(self, symbol_key, ordering_type, ccxt_order_id) -> bool:
+        '''
+        :return: True if the row was persisted
+        '''
+        with self.transaction():
+            cursor = self.connection.execute(
+                "DELETE FROM ccxt_orders_id WHERE exchange = ? AND market_type = ? AND exchange_net_type = ? AND "
+                "symbol_id = ? AND ordering_type = ? AND ccxt_order_id = ?",
+                tuple(symbol_key) + (int(ordering_type), str(ccxt_order_id), ))
+            return cursor.rowcount > 0
+
+    def replace(self, symbol_key, rows) -> None:
+        '''
+        Atomically replace every row persisted for the symbol
+        '''
+        with self.transaction():
+            self.connection.execute(
+                "DELETE FROM ccxt_orders_id WHERE exchange = ? AND market_type = ? AND exchange_net_type = ? AND "
+                "symbol_id = ?", tuple(symbol_key))
+            self.insert(symbol_key, rows)
+
+    def select(self, symbol_key) -> list:
+        '''
+        :return: (ordering_type, ccxt_order_id) rows of the symbol in the order they were persisted
+        '''
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT ordering_type, ccxt_order_id FROM ccxt_orders_id WHERE exchange = ? AND market_type = ? AND "
+                "exchange_net_type = ? AND symbol_id = ? ORDER BY rowid", tuple(symbol_key))
+            return cursor.fetchall()
+
+    def get_watermark(self, symbol_key):
+        '''
+        :return: Timestamp in ms of the last reconciliation of the symbol or None if it has never been reconciled
+        '''
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT timestamp FROM reconciliation_watermarks WHERE exchange = ? AND market_type = ? AND "
+                "exchange_net_type = ? AND symbol_id = ?", tuple(symbol_key)).fetchone()
+            return None if row is None else row[0]
+
+    def set_watermark(self, symbol_key, timestamp) -> None:
+        with self.transaction():
+            self.connection.execute(
+                "INSERT OR REPLACE INTO reconciliation_watermarks VALUES (?, ?, ?, ?, ?)",
+                tuple(symbol_key) + (int(timestamp), ))
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
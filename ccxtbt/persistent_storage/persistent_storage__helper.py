@@ -2,20 +2,46 @@ import backtrader
 import csv
 import inspect
 import os
+import threading
 
-import pandas as pd
-
-from pandas.core.frame import DataFrame
-from pandas.io.parsers import TextFileReader
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES
+from ccxtbt.persistent_storage.persistent_storage__classes import Order_Id_Store
 from ccxtbt.persistent_storage.persistent_storage__specifications import PERSISTENT_STORAGE_CSV_HEADERS, \
-    PERSISTENT_STORAGE_ORDER_FILE_NAME, PS_CCXT_ORDER_ID, PS_ORDERING_TYPE
+    PERSISTENT_STORAGE_DB_FILE_NAME, PERSISTENT_STORAGE_MIGRATED_FILE_EXTENSION, PERSISTENT_STORAGE_ORDER_FILE_NAME, \
+    PS_CCXT_ORDER_ID, PS_ORDERING_TYPE
 from ccxtbt.utils import legality_check_not_none_obj
 
+if TYPE_CHECKING:
+    from pandas.core.frame import DataFrame
+
+# Process-wide registry of order id stores keyed by database file path
+shared_order_id_stores = {}
+shared_order_id_stores__lock = threading.Lock()
+
+# Symbols whose legacy CSV file has been imported into the store during this process
+migrated_symbol_keys = set()
+migrated_symbol_keys__lock = threading.Lock()
+
+
+def get_exchange_net_type(main_net_toggle_switch_value) -> str:
+    assert isinstance(main_net_toggle_switch_value, bool)
+
+    if main_net_toggle_switch_value == True:
+        exchange_net_type = backtrader.Broker_or_Exchange_Base.Exchange_Net_Types[
+            backtrader.Broker_or_Exchange_Base.MAINNET]
+    else:
+        exchange_net_type = backtrader.Broker_or_Exchange_Base.Exchange_Net_Types[
+            backtrader.Broker_or_Exchange_Base.TESTNET]
+    return exchange_net_type
+
 
 def get_persistent_storage_file_path(params) -> str:
+    '''
+    Path of the legacy CSV file of the symbol. Only used to import it into the order id store.
+    '''
     # Un-serialize Params
     exchange_dropdown_value = params['exchange_dropdown_value']
     market_type = params['market_type']
@@ -32,12 +58,7 @@ def get_persistent_storage_file_path(params) -> str:
     assert isinstance(main_net_toggle_switch_value, bool)
     assert isinstance(symbol_id, str)
 
-    if main_net_toggle_switch_value == True:
-        exchange_net_type = backtrader.Broker_or_Exchange_Base.Exchange_Net_Types[
-            backtrader.Broker_or_Exchange_Base.MAINNET]
-    else:
-        exchange_net_type = backtrader.Broker_or_Exchange_Base.Exchange_Net_Types[
-            backtrader.Broker_or_Exchange_Base.TESTNET]
+    exchange_net_type = get_exchange_net_type(main_net_toggle_switch_value)
 
     persistent_storage_dir_path = \
         os.path.join(Path(os.path.dirname(os.path.realpath(__file__))), exchange_dropdown_value,
@@ -50,6 +71,78 @@ def get_persistent_storage_file_path(params) -> str:
     return persistent_storage_file_path
 
 
+def get_persistent_storage_db_file_path(params) -> str:
+    # Optional Params
+    root_dir_path = params.get('root_dir_path', None)
+
+    if root_dir_path is None:
+        root_dir_path = Path(os.path.dirname(os.path.realpath(__file__)))
+    persistent_storage_db_file_path = os.path.join(
+        root_dir_path, PERSISTENT_STORAGE_DB_FILE_NAME)
+    return persistent_storage_db_file_path
+
+
+def get_shared_order_id_store(params) -> Order_Id_Store:
+    db_file_path = get_persistent_storage_db_file_path(params)
+
+    with shared_order_id_stores__lock:
+        if db_file_path not in shared_order_id_stores.keys():
+            shared_order_id_stores[db_file_path] = Order_Id_Store(
+                db_file_path=db_file_path)
+        order_id_store = shared_order_id_stores[db_file_path]
+    return order_id_store
+
+
+def get_persistent_storage_symbol_key(params) -> tuple:
+    # Un-serialize Params
+    exchange_dropdown_value = params['exchange_dropdown_value']
+    market_type = params['market_type']
+    main_net_toggle_switch_value = params['main_net_toggle_switch_value']
+    symbol_id = params['symbol_id']
+
+    # Legality Check
+    legality_check_not_none_obj(
+        exchange_dropdown_value, "exchange_dropdown_value")
+    if market_type not in range(len(CCXT__MARKET_TYPES)):
+        raise ValueError("{}: {} market_type must be one of {}!!!".format(
+            inspect.currentframe(),
+            market_type, range(len(CCXT__MARKET_TYPES))))
+    assert isinstance(symbol_id, str)
+
+    symbol_key = (exchange_dropdown_value, CCXT__MARKET_TYPES[market_type],
+                  get_exchange_net_type(main_net_toggle_switch_value), symbol_id, )
+    return symbol_key
+
+
+def get_symbol_order_id_store(params) -> tuple:
+    '''
+    Return the order id store together with the key of the symbol, importing the legacy CSV file of the symbol on
+    first use.
+    '''
+    order_id_store = get_shared_order_id_store(params)
+    symbol_key = get_persistent_storage_symbol_key(params)
+
+    migration_key = (order_id_store.db_file_path, ) + symbol_key
+    with migrated_symbol_keys__lock:
+        if migration_key not in migrated_symbol_keys:
+            legacy_file_path = get_persistent_storage_file_path(params)
+            if os.path.exists(legacy_file_path):
+                with open(legacy_file_path, "r", newline='') as file:
+                    reader = csv.DictReader(file)
+                    rows = [(int(csv_dict[PERSISTENT_STORAGE_CSV_HEADERS[PS_ORDERING_TYPE]]),
+                             str(csv_dict[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]]), )
+                            for csv_dict in reader]
+                order_id_store.insert(symbol_key, rows)
+
+                # Keep the legacy file around for reference but never import it twice
+                os.replace(legacy_file_path, "{}.{}".format(
+                    legacy_file_path, PERSISTENT_STORAGE_MIGRATED_FILE_EXTENSION))
+            migrated_symbol_keys.add(migration_key)
+
+    ret_value = (order_id_store, symbol_key, )
+    return ret_value
+
+
 def save_to_persistent_storage(params) -> bool:
     # Un-serialize Params
     csv_headers = params['csv_headers']
@@ -58,59 +151,39 @@ def save_to_persistent_storage(params) -> bool:
     # Optional Params
     mode = params.get('mode', None)
 
-    # Reference: https://www.scaler.com/topics/how-to-create-a-csv-file-in-python/
     assert isinstance(csv_headers, list)
     assert isinstance(csv_dicts, list)
 
-    success = False
-    save_to_file_path = get_persistent_storage_file_path(params)
-    save_to_dir_path = os.path.dirname(os.path.abspath(save_to_file_path))
-
-    # Make the directory
-    if not os.path.exists(save_to_dir_path):
-        Path(save_to_dir_path).mkdir(parents=True, exist_ok=True)
-
     if len(csv_dicts) > 0:
         mode = "a" if mode is None else mode
     else:
         mode = "w" if mode is None else mode
 
-    if not os.path.exists(save_to_file_path):
-        mode += "+"
+    (order_id_store, symbol_key, ) = get_symbol_order_id_store(params)
 
-    with open(save_to_file_path, mode, newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=csv_headers)
+    rows = [(csv_dict[PERSISTENT_STORAGE_CSV_HEADERS[PS_ORDERING_TYPE]],
+             csv_dict[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]], ) for csv_dict in csv_dicts]
+    if "a" in mode:
+        order_id_store.insert(symbol_key, rows)
+    else:
+        order_id_store.replace(symbol_key, rows)
+    success = True
+    return success
 
-        # Write header only if we are NOT in append mode
-        if "a" not in mode:
-            writer.writeheader()
 
-        writer.writerows(csv_dicts)
-        success = True
-        pass
-    return success
+def read_from_persistent_storage(params) -> 'DataFrame':
+    # Only readers pay for pandas, the order submission path does not need it
+    import pandas as pd
+
+    (order_id_store, symbol_key, ) = get_symbol_order_id_store(params)
 
+    dataframe = pd.DataFrame(order_id_store.select(
+        symbol_key), columns=PERSISTENT_STORAGE_CSV_HEADERS)
 
-def read_from_persistent_storage(params) -> None | DataFrame | TextFileReader:
-    read_from_file_path = get_persistent_storage_file_path(params)
-    read_from_dir_path = os.path.dirname(os.path.abspath(read_from_file_path))
-
-    # Reference: https://www.scaler.com/topics/how-to-create-a-csv-file-in-python/
-    dataframe = None
-    # Confirm if the directory must exist
-    if os.path.exists(read_from_dir_path):
-        # Confirm if the file must exist
-        if os.path.exists(read_from_file_path):
-            try:
-                dataframe = pd.read_csv(read_from_file_path)
-
-                # Reference: https://pbpython.com/pandas_dtypes.html
-                dataframe[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]] = \
-                    dataframe[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]].astype(
-                        str)
-                pass
-            except pd.errors.EmptyDataError:
-                pass
+    # Reference: https://pbpython.com/pandas_dtypes.html
+    dataframe[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]] = \
+        dataframe[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]].astype(
+            str)
     return dataframe
 
 
@@ -119,30 +192,10 @@ def delete_from_persistent_storage(params) -> bool:
     ordering_type = params['ordering_type']
     ccxt_order_id = params['ccxt_order_id']
 
-    success = False
-    dataframe = read_from_persistent_storage(params)
-
-    ordering_type_list = []
-    ccxt_orders_id = []
-    if dataframe is not None:
-        ordering_type_list = dataframe[PERSISTENT_STORAGE_CSV_HEADERS[PS_ORDERING_TYPE]].tolist(
-        )
-        ccxt_orders_id = dataframe[PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]].tolist(
-        )
-
-    csv_dicts = []
-
-    found_match = False
-    for file_ordering_type, file_ccxt_order_id in zip(ordering_type_list, ccxt_orders_id):
-        if ordering_type != file_ordering_type or ccxt_order_id != file_ccxt_order_id:
-            csv_dict = {
-                PERSISTENT_STORAGE_CSV_HEADERS[PS_ORDERING_TYPE]: file_ordering_type,
-                PERSISTENT_STORAGE_CSV_HEADERS[PS_CCXT_ORDER_ID]: file_ccxt_order_id,
-            }
-            csv_dicts.append(csv_dict)
-        else:
-            found_match = True
+    (order_id_store, symbol_key, ) = get_symbol_order_id_store(params)
 
+    found_match = order_id_store.delete(
+        symbol_key, ordering_type, ccxt_order_id)
     if found_match == False:
         frameinfo = inspect.getframeinfo(inspect.currentframe())
         msg = "{} Line: {}: WARNING: ".format(
@@ -151,18 +204,28 @@ def delete_from_persistent_storage(params) -> bool:
         sub_msg = "\'{}\' ccxt_order_id of {} ordering type not found in {}".format(
             ccxt_order_id,
             backtrader.Order.Ordering_Types[ordering_type],
-            ccxt_orders_id,
+            [row[PS_CCXT_ORDER_ID]
+                for row in order_id_store.select(symbol_key)],
         )
         print(msg + sub_msg)
+    success = True
+    return success
+
+
+def read_reconciliation_watermark(params) -> int | None:
+    (order_id_store, symbol_key, ) = get_symbol_order_id_store(params)
+    timestamp = order_id_store.get_watermark(symbol_key)
+    return timestamp
 
-    save_to_persistent_storage__dict = dict(
-        csv_headers=PERSISTENT_STORAGE_CSV_HEADERS,
-        csv_dicts=csv_dicts,
 
-        # Optional Params
-        mode="w",
-    )
-    save_to_persistent_storage__dict.update(params)
-    success = save_to_persistent_storage(
-        params=save_to_persistent_storage__dict)
+def save_reconciliation_watermark(params) -> bool:
+    # Un-serialize Params
+    timestamp = params['timestamp']
+
+    # Legality Check
+    assert isinstance(timestamp, int)
+
+    (order_id_store, symbol_key, ) = get_symbol_order_id_store(params)
+    order_id_store.set_watermark(symbol_key, timestamp)
+    success = True
     return success
@@ -2,3 +2,16 @@ PERSISTENT_STORAGE_ORDER_FILE_NAME = "ccxt_orders_id.csv"
 
 PERSISTENT_STORAGE_CSV_HEADERS = ["Ordering Type", "CCXT Order ID"]
 PS_ORDERING_TYPE, PS_CCXT_ORDER_ID = range(len(PERSISTENT_STORAGE_CSV_HEADERS))
+
+PERSISTENT_STORAGE_DB_FILE_NAME = "ccxt_orders_id.sqlite3"
+PERSISTENT_STORAGE_MIGRATED_FILE_EXTENSION = "migrated"
+
+# SQLite waits up to this long for another writer before raising "database is locked"
+DEFAULT__PERSISTENT_STORAGE__BUSY_TIMEOUT_IN_SECONDS = 10.0
+
+# The primary key of a persisted order. Every column but the last two identifies one symbol of one account
+PERSISTENT_STORAGE_DB_KEYS = \
+    ["exchange", "market_type", "exchange_net_type",
+        "symbol_id", "ordering_type", "ccxt_order_id"]
+PS_DB_EXCHANGE, PS_DB_MARKET_TYPE, PS_DB_EXCHANGE_NET_TYPE, PS_DB_SYMBOL_ID, PS_DB_ORDERING_TYPE, \
+    PS_DB_CCXT_ORDER_ID = range(len(PERSISTENT_STORAGE_DB_KEYS))
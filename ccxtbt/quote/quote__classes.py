@@ -0,0 +1,85 @@
+import collections
+import itertools
+import time
+
+
+Quote = collections.namedtuple('Quote', [
+    'symbol_id',
+    'mark_price',
+    'ask1_price',
+    'bid1_price',
+    # Monotonic across all symbols of the store, tells which of any two quotes was published later
+    'sequence',
+    # Number of quotes published for the symbol so far
+    'version',
+    # Milliseconds since epoch as stamped by the exchange, None if not provided
+    'exchange_timestamp',
+    # Milliseconds since epoch as received locally
+    'receive_timestamp',
+    # time.monotonic() when received, used to compute the age
+    'receive__monotonic',
+])
+
+
+class Quote_Store(object):
+    '''
+    Latest quote per symbol as published by the websocket thread.
+
+    Each quote is an immutable named tuple and publishing one is a single dict assignment, which is atomic in CPython.
+    Readers therefore get a consistent snapshot without taking any lock, and the websocket thread is never blocked by
+    them. There must be at most one publisher per symbol, which holds as each symbol is streamed by one connection.
+    '''
+
+    def __init__(self):
+        self.quotes = {}
+        self.versions = {}
+        self.sequence__counter = itertools.count(1)
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: len(quotes): {}".format(type(self).__name__, len(self.quotes))
+
+    def publish(self, symbol_id, mark_price, ask1_price, bid1_price, exchange_timestamp=None) -> Quote:
+        version = self.versions.get(symbol_id, 0) + 1
+        self.versions[symbol_id] = version
+        quote = Quote(
+            symbol_id=symbol_id,
+            mark_price=mark_price,
+            ask1_price=ask1_price,
+            bid1_price=bid1_price,
+            sequence=next(self.sequence__counter),
+            version=version,
+            exchange_timestamp=exchange_timestamp,
+            receive_timestamp=int(time.time() * 1000),
+            receive__monotonic=time.monotonic(),
+        )
+        self.quotes[symbol_id] = quote
+        return quote
+
+    def get(self, symbol_id, max_age_in_seconds=None):
+        '''
+        :return: The latest quote of the symbol, None if there is none or it is older than max_age_in_seconds
+        '''
+        quote = self.quotes.get(symbol_id, None)
+        if quote is not None and max_age_in_seconds is not None:
+            if time.monotonic() - quote.receive__monotonic > max_age_in_seconds:
+                quote = None
+        return quote
+
+    def get_age_in_seconds(self, symbol_id):
+        quote = self.quotes.get(symbol_id, None)
+        if quote is None:
+            return None
+        return time.monotonic() - quote.receive__monotonic
+
+    def invalidate(self, symbol_id=None) -> None:
+        '''
+        Drop the quote of the symbol, or of all symbols if None, e.g. once the websocket is disconnected. Versions carry
+        on from where they were on the next quote.
+        '''
+        if symbol_id is None:
+            self.quotes = {}
+        else:
+            self.quotes.pop(symbol_id, None)
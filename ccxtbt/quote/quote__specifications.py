@@ -0,0 +1,2 @@
+# Websocket quote is trusted for pricing only if it has been received within this time, otherwise REST is used
+DEFAULT__QUOTE__MAX_AGE_IN_SECONDS = 5.0
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from ccxtbt.utils import legality_check_not_none_obj
+
+
+class Token_Bucket_Rate_Limiter(object):
+    '''
+    Thread-safe token bucket shared by every account_or_store that hits the same exchange host and IP.
+
+    Tokens are refilled continuously at refill_rate per second up to capacity. A request that finds the bucket empty
+    reserves its token in advance and only sleeps for the deficit, so concurrent callers are served in arrival order
+    and nobody sleeps while the budget is still available.
+    '''
+
+    def __init__(self, refill_rate, capacity):
+        legality_check_not_none_obj(refill_rate, "refill_rate")
+        legality_check_not_none_obj(capacity, "capacity")
+        assert refill_rate > 0.0, "refill_rate: {} must be positive!!!".format(
+            refill_rate)
+        assert capacity >= 1, "capacity: {} must be at least 1!!!".format(
+            capacity)
+
+        self.refill_rate = float(refill_rate)
+        self.capacity = float(capacity)
+
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}(refill_rate={:.2f}/s, capacity={}, tokens={:.2f})".format(
+            type(self).__name__, self.refill_rate, self.capacity, self.get_available_tokens())
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        if elapsed > 0.0:
+            self._tokens = min(self.capacity, self._tokens +
+                               elapsed * self.refill_rate)
+            self._last_refill = now
+
+    def get_available_tokens(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def try_acquire(self, cost=1.0) -> bool:
+        '''
+        Take the tokens only if they are immediately available
+        '''
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= cost:
+                self._tokens -= cost
+                return True
+        return False
+
+    def acquire(self, cost=1.0) -> float:
+        '''
+        Take the tokens, sleeping only when the budget is exhausted.
+
+        :return: Time slept in seconds
+        '''
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= cost
+            deficit = -self._tokens
+
+        time_to_sleep = 0.0
+        if deficit > 0.0:
+            time_to_sleep = deficit / self.refill_rate
+            time.sleep(time_to_sleep)
+        return time_to_sleep
@@ -0,0 +1,67 @@
+import threading
+
+from urllib.parse import urlparse
+
+from ccxtbt.rate_limiter.rate_limiter__classes import Token_Bucket_Rate_Limiter
+from ccxtbt.rate_limiter.rate_limiter__specifications import CCXT__API_URL_SECTIONS__PER_MARKET_TYPE, \
+    DEFAULT__RATE_LIMITER__CAPACITY, DEFAULT__RATE_LIMITER__RATE_LIMIT_IN_MS, DEFAULT__RATE_LIMITER__SOURCE_IP
+from ccxtbt.utils import legality_check_not_none_obj
+
+# Process-wide registry of rate limiters keyed by (exchange host, source IP)
+shared_rate_limiters = {}
+shared_rate_limiters__lock = threading.Lock()
+
+
+def get_exchange_host(exchange, market_type=None) -> str:
+    '''
+    Extract the REST host from ccxt exchange urls. Exchanges such as Binance serve each market type from a different
+    host (e.g. fapi.binance.com for USDT-M futures and api.binance.com for spot), so the api url section used by the
+    market type is looked up first. The first url is taken only when none of those sections is advertised.
+    '''
+    api_urls = exchange.urls.get('api', None)
+    legality_check_not_none_obj(api_urls, "api_urls")
+
+    if isinstance(api_urls, dict) and market_type is not None:
+        for api_url_section in CCXT__API_URL_SECTIONS__PER_MARKET_TYPE.get(market_type, ()):
+            if api_url_section in api_urls.keys():
+                api_urls = api_urls[api_url_section]
+                break
+
+    while isinstance(api_urls, dict):
+        api_urls = next(iter(api_urls.values()))
+    assert isinstance(api_urls, str), "Unsupported api url type: {}".format(
+        type(api_urls))
+
+    # Some exchanges (e.g. Bybit) template their urls with a configurable hostname
+    if hasattr(exchange, 'implode_hostname'):
+        api_urls = exchange.implode_hostname(api_urls)
+
+    host = urlparse(api_urls).hostname
+    legality_check_not_none_obj(host, "host")
+    return host
+
+
+def get_shared_rate_limiter(params) -> Token_Bucket_Rate_Limiter:
+    # Un-serialize Params
+    exchange = params['exchange']
+
+    # Optional Params
+    capacity = params.get('capacity', None)
+    market_type = params.get('market_type', None)
+    source_ip = params.get('source_ip', None)
+
+    legality_check_not_none_obj(exchange, "exchange")
+    if capacity is None:
+        capacity = DEFAULT__RATE_LIMITER__CAPACITY
+    if source_ip is None:
+        source_ip = DEFAULT__RATE_LIMITER__SOURCE_IP
+
+    rate_limit_in_ms = exchange.rateLimit or DEFAULT__RATE_LIMITER__RATE_LIMIT_IN_MS
+    key = (get_exchange_host(exchange, market_type), source_ip, )
+
+    with shared_rate_limiters__lock:
+        if key not in shared_rate_limiters.keys():
+            shared_rate_limiters[key] = Token_Bucket_Rate_Limiter(
+                refill_rate=1000.0 / rate_limit_in_ms, capacity=capacity)
+        rate_limiter = shared_rate_limiters[key]
+    return rate_limiter
@@ -0,0 +1,22 @@
+from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPE__FUTURE, CCXT__MARKET_TYPE__INVERSE, \
+    CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP, CCXT__MARKET_TYPE__MARGIN, CCXT__MARKET_TYPE__OPTION, CCXT__MARKET_TYPE__SPOT
+
+# Number of requests that could be fired back-to-back before the token bucket starts to throttle
+DEFAULT__RATE_LIMITER__CAPACITY = 10
+
+# Fallback when the exchange does not advertise its rateLimit (in milliseconds per request)
+DEFAULT__RATE_LIMITER__RATE_LIMIT_IN_MS = 1000
+
+# Placeholder source IP for requests going out through the default network interface
+DEFAULT__RATE_LIMITER__SOURCE_IP = "default"
+
+# ccxt api url section actually hit per market type, in order of preference. Exchanges serving every market type from
+# a single host (e.g. Bybit) have none of these sections and fall back to their first api url.
+CCXT__API_URL_SECTIONS__PER_MARKET_TYPE = {
+    CCXT__MARKET_TYPE__SPOT: ('private', 'public', ),
+    CCXT__MARKET_TYPE__MARGIN: ('sapi', 'private', ),
+    CCXT__MARKET_TYPE__INVERSE: ('dapiPrivate', 'dapiPublic', ),
+    CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP: ('fapiPrivate', 'fapiPublic', ),
+    CCXT__MARKET_TYPE__FUTURE: ('fapiPrivate', 'fapiPublic', ),
+    CCXT__MARKET_TYPE__OPTION: ('eapiPrivate', 'eapiPublic', ),
+}
@@ -1,12 +1,8 @@
-import backtrader
 import decimal
 import inspect
 import datetime
 import math
 
-import numpy as np
-import pandas as pd
-
 from pprint import pprint
 from time import time as timer
 
@@ -147,10 +143,15 @@ def round_to_nearest_decimal_points(x, prec, base):
 
     assert isinstance(prec, int)
 
-    if type(x) == float or type(x) == int or type(x) == np.float64:
+    # numpy.float64 is a subclass of float, hence no need to import numpy just to recognize it
+    if type(x) == int or isinstance(x, float):
         ret_number = round(base * round(float(x)/base), prec)
         return ret_number
-    elif type(x) == pd.Series:
+
+    # Utilities are imported by nearly every module, hence only pay for pandas when a series is really given
+    import pandas as pd
+
+    if type(x) == pd.Series:
         numbers = x.tolist()
         new_numbers = []
         for number in numbers:
@@ -257,6 +258,8 @@ def capitalize_sentence(sentences):
 
 
 def get_order_exit_price_and_queue(position_type, ask, bid):
+    import backtrader
+
     if position_type not in range(len(backtrader.Position.Position_Types)):
         raise ValueError("{}: {} position_type must be one of {}!!!".format(
             inspect.currentframe(), position_type, range(len(backtrader.Position.Position_Types))))
@@ -280,6 +283,8 @@ def get_order_entry_price_without_queue(position_type, ask, bid, disable_message
              be used for production. Use at your own risk!
              The impact is that this will bring the [Entry] Price nearer to TP price.
     '''
+    import backtrader
+
     # Swapped the ask and bid to accelerate the queue time
     entry_price = get_order_exit_price_and_queue(position_type, ask, bid)
 
@@ -300,6 +305,8 @@ def get_order_entry_price_and_queue(position_type, ask, bid):
     '''
     WARNING: This API will bring the [Entry] Price nearer to SL price.
     '''
+    import backtrader
+
     if position_type not in range(len(backtrader.Position.Position_Types)):
         raise ValueError("{}: {} position_type must be one of {}!!!".format(
             inspect.currentframe(), position_type, range(len(backtrader.Position.Position_Types))))
@@ -323,6 +330,8 @@ def get_order_exit_price_without_queue(position_type, ask, bid, disable_message=
              address positions closure issue when we are in hedged positions, one position got closed whereas another
              position remains opened.
     '''
+    import backtrader
+
     # Swapped the ask and bid to accelerate the queue time
     exit_price = get_order_entry_price_and_queue(position_type, ask, bid)
 
@@ -343,6 +352,8 @@ def get_order_exit_price_without_queue(position_type, ask, bid, disable_message=
 
 
 def screen_dataframe_for_duplicated_index(params):
+    import numpy as np
+
     df = params['df']
 
     if len(df.index) >= 2:
@@ -369,6 +380,8 @@ def screen_dataframe_for_duplicated_index(params):
 
 
 def get_opposite__position_type(position_type):
+    import backtrader
+
     if position_type not in range(len(backtrader.Position.Position_Types)):
         raise RuntimeError("{}: {} position type must be one of {}!!!".format(
             inspect.currentframe(), position_type, range(len(backtrader.Position.Position_Types))))
@@ -377,3 +390,20 @@ def get_opposite__position_type(position_type):
         backtrader.Position.SHORT_POSITION if position_type == backtrader.Position.LONG_POSITION else \
         backtrader.Position.LONG_POSITION
     return opposite__position_type
+
+
+def get_max_leverage_from_risk_limit(risk_limit, notional_value):
+    '''
+    Pick the max leverage of the first risk limit tier able to accommodate the notional value. risk_limit is a list of
+    risk_limit__dict_template sorted by ascending max_position_value.
+    '''
+    assert isinstance(risk_limit, list)
+    assert notional_value >= 0.0
+
+    max_leverage = None
+    for risk_limit_dict in risk_limit:
+        if risk_limit_dict['max_position_value'] >= notional_value:
+            max_leverage = risk_limit_dict['max_leverage']
+            break
+    legality_check_not_none_obj(max_leverage, "max_leverage")
+    return max_leverage
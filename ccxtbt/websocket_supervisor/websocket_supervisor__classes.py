@@ -0,0 +1,259 @@
+import threading
+import traceback
+
+from time import monotonic
+
+from ccxtbt.circuit_breaker.circuit_breaker__helper import get_backoff_delay_in_seconds
+from ccxtbt.websocket_supervisor.websocket_supervisor__specifications import CONNECTED_STATE, \
+    DEFAULT__WEBSOCKET_SUPERVISOR__BACKOFF__BASE_IN_SECONDS, DEFAULT__WEBSOCKET_SUPERVISOR__BACKOFF__CAP_IN_SECONDS, \
+    DEFAULT__WEBSOCKET_SUPERVISOR__CHECK_INTERVAL_IN_SECONDS, \
+    DEFAULT__WEBSOCKET_SUPERVISOR__HEARTBEAT_TIMEOUT_IN_SECONDS, RECONNECTING_STATE, WEBSOCKET_CONNECTION_STATES
+
+
+class Supervised_Websocket_Connection(object):
+    '''
+    Book keeping of one websocket connection owned by Websocket_Supervisor.
+
+    :param connect: Make a single attempt to connect and subscribe all topics, returns True once connected
+    :param is_connected: Returns True if the connection is still up
+    :param close: Tear down whatever is left of the connection before reconnecting
+    :param on_reconnected: Resync over REST whatever might have been missed while the connection was down
+    :param is_established: False to leave the first connection to the supervisor as well
+    '''
+
+    def __init__(self, name, connect, is_connected, close, on_reconnected=None, is_established=True):
+        self.name = name
+        self.connect = connect
+        self.is_connected = is_connected
+        self.close = close
+        self.on_reconnected = on_reconnected
+
+        self.state = CONNECTED_STATE
+        self.last_message__monotonic = monotonic()
+        self.down__monotonic = None
+        self.attempt = 0
+        self.next_attempt__monotonic = None
+        if is_established == False:
+            self.state = RECONNECTING_STATE
+            self.down__monotonic = self.last_message__monotonic
+            self.next_attempt__monotonic = self.last_message__monotonic
+
+        # Metrics
+        self.reconnect_count = 0
+        self.last_reconnect_time_in_seconds = None
+        self.max_reconnect_time_in_seconds = None
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: state: {}, reconnect_count: {}".format(
+            type(self).__name__, self.name, WEBSOCKET_CONNECTION_STATES[self.state], self.reconnect_count)
+
+
+class Websocket_Supervisor(object):
+    '''
+    Dedicated thread owning the websocket connections of an account. A connection is considered dropped when it reports
+    itself disconnected or when no message has been received within the heartbeat timeout. Dropped connections are
+    reconnected with exponential backoff and resubscribed, then resynced over REST through their on_reconnected
+    callback.
+
+    Nothing here ever runs on the caller's thread, hence a strategy asking for a pulse check is never blocked.
+    '''
+
+    def __init__(self, name, check_interval_in_seconds=None, heartbeat_timeout_in_seconds=None,
+                 backoff_base_in_seconds=None, backoff_cap_in_seconds=None):
+        if check_interval_in_seconds is None:
+            check_interval_in_seconds = DEFAULT__WEBSOCKET_SUPERVISOR__CHECK_INTERVAL_IN_SECONDS
+        if heartbeat_timeout_in_seconds is None:
+            heartbeat_timeout_in_seconds = DEFAULT__WEBSOCKET_SUPERVISOR__HEARTBEAT_TIMEOUT_IN_SECONDS
+        if backoff_base_in_seconds is None:
+            backoff_base_in_seconds = DEFAULT__WEBSOCKET_SUPERVISOR__BACKOFF__BASE_IN_SECONDS
+        if backoff_cap_in_seconds is None:
+            backoff_cap_in_seconds = DEFAULT__WEBSOCKET_SUPERVISOR__BACKOFF__CAP_IN_SECONDS
+
+        # Legality Check
+        assert check_interval_in_seconds > 0, \
+            "check_interval_in_seconds: {} must be positive!!!".format(
+                check_interval_in_seconds)
+
+        self.name = name
+        self.check_interval_in_seconds = check_interval_in_seconds
+        self.heartbeat_timeout_in_seconds = heartbeat_timeout_in_seconds
+        self.backoff_base_in_seconds = backoff_base_in_seconds
+        self.backoff_cap_in_seconds = backoff_cap_in_seconds
+
+        self.lock = threading.Lock()
+        self.connections = {}
+        self.tasks = {}
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return "{}: {}: connections: {}".format(type(self).__name__, self.name, list(self.connections.values()))
+
+    def add_connection(self, name, connect, is_connected, close, on_reconnected=None, is_established=True) -> None:
+        '''
+        The connection is expected to have been established already by the caller, unless is_established is False.
+        '''
+        with self.lock:
+            self.connections[name] = Supervised_Websocket_Connection(
+                name, connect, is_connected, close, on_reconnected=on_reconnected, is_established=is_established)
+
+    def remove_connection(self, name) -> bool:
+        '''
+        Stop supervising the connection. Closing it is up to the caller.
+        '''
+        with self.lock:
+            return self.connections.pop(name, None) is not None
+
+    def add_task(self, name, task) -> None:
+        '''
+        Run task after every check of the connections, for housekeeping that must not block the caller's thread either.
+        '''
+        with self.lock:
+            self.tasks[name] = task
+
+    def touch(self, name) -> None:
+        '''
+        Heartbeat, to be called by the message handlers of the connection.
+        '''
+        connection = self.connections.get(name, None)
+        if connection is not None:
+            connection.last_message__monotonic = monotonic()
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, name="{}: {}".format(type(self).__name__, self.name),
+                                           daemon=True)
+            self.thread.start()
+
+    def stop(self, timeout=None) -> None:
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+        if thread is not None:
+            self.stop_event.set()
+            self.wake_event.set()
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+    def wake(self) -> None:
+        '''
+        Ask for a check without waiting for the next interval. Never blocks.
+        '''
+        self.wake_event.set()
+
+    def is_connected(self, name) -> bool:
+        connection = self.connections.get(name, None)
+        return connection is not None and connection.state == CONNECTED_STATE
+
+    def get_metrics(self) -> dict:
+        with self.lock:
+            connections = list(self.connections.values())
+        now = monotonic()
+        metrics = {}
+        for connection in connections:
+            down_time_in_seconds = None
+            if connection.down__monotonic is not None:
+                down_time_in_seconds = now - connection.down__monotonic
+            metrics[connection.name] = dict(
+                state=WEBSOCKET_CONNECTION_STATES[connection.state],
+                reconnect_count=connection.reconnect_count,
+                last_reconnect_time_in_seconds=connection.last_reconnect_time_in_seconds,
+                max_reconnect_time_in_seconds=connection.max_reconnect_time_in_seconds,
+                down_time_in_seconds=down_time_in_seconds,
+            )
+        return metrics
+
+    def run(self) -> None:
+        while self.stop_event.is_set() == False:
+            self.check()
+            self.wake_event.wait(self.check_interval_in_seconds)
+            self.wake_event.clear()
+
+    def check(self) -> None:
+        with self.lock:
+            connections = list(self.connections.values())
+            tasks = list(self.tasks.values())
+        for connection in connections:
+            if self.stop_event.is_set() == True:
+                break
+            try:
+                self._check_connection(connection)
+            except Exception:
+                traceback.print_exc()
+
+        for task in tasks:
+            if self.stop_event.is_set() == True:
+                break
+            try:
+                task()
+            except Exception:
+                traceback.print_exc()
+
+    def _is_alive(self, connection) -> bool:
+        if connection.is_connected() == False:
+            return False
+        if self.heartbeat_timeout_in_seconds is not None and \
+                monotonic() - connection.last_message__monotonic > self.heartbeat_timeout_in_seconds:
+            return False
+        return True
+
+    def _check_connection(self, connection) -> None:
+        now = monotonic()
+        if connection.state == CONNECTED_STATE:
+            if self._is_alive(connection) == True:
+                return
+            connection.state = RECONNECTING_STATE
+            connection.down__monotonic = now
+            connection.attempt = 0
+            connection.next_attempt__monotonic = now
+
+        # Validate assumption made
+        assert connection.state == RECONNECTING_STATE
+
+        if now < connection.next_attempt__monotonic:
+            return
+
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+        connected = False
+        try:
+            connected = connection.connect()
+        except Exception:
+            traceback.print_exc()
+
+        if connected == True:
+            reconnect_time_in_seconds = monotonic() - connection.down__monotonic
+            connection.state = CONNECTED_STATE
+            connection.last_message__monotonic = monotonic()
+            connection.down__monotonic = None
+            connection.next_attempt__monotonic = None
+            connection.reconnect_count += 1
+            connection.last_reconnect_time_in_seconds = reconnect_time_in_seconds
+            if connection.max_reconnect_time_in_seconds is None or \
+                    reconnect_time_in_seconds > connection.max_reconnect_time_in_seconds:
+                connection.max_reconnect_time_in_seconds = reconnect_time_in_seconds
+
+            if connection.on_reconnected is not None:
+                connection.on_reconnected()
+        else:
+            get_backoff_delay_in_seconds__dict = dict(
+                attempt=connection.attempt,
+                base_in_seconds=self.backoff_base_in_seconds,
+                cap_in_seconds=self.backoff_cap_in_seconds,
+            )
+            connection.next_attempt__monotonic = \
+                monotonic() + get_backoff_delay_in_seconds(params=get_backoff_delay_in_seconds__dict)
+            connection.attempt += 1
@@ -0,0 +1,13 @@
+# How often the supervisor checks the connections
+DEFAULT__WEBSOCKET_SUPERVISOR__CHECK_INTERVAL_IN_SECONDS = 1.0
+
+# A connection that has not delivered any message within this time is considered dropped, even if it still claims to be
+#       connected. None to rely on the connection state only.
+DEFAULT__WEBSOCKET_SUPERVISOR__HEARTBEAT_TIMEOUT_IN_SECONDS = 60.0
+
+# Exponential backoff with full jitter between reconnection attempts
+DEFAULT__WEBSOCKET_SUPERVISOR__BACKOFF__BASE_IN_SECONDS = 0.5
+DEFAULT__WEBSOCKET_SUPERVISOR__BACKOFF__CAP_IN_SECONDS = 30.0
+
+WEBSOCKET_CONNECTION_STATES = ('connected', 'reconnecting', )
+CONNECTED_STATE, RECONNECTING_STATE, = range(len(WEBSOCKET_CONNECTION_STATES))
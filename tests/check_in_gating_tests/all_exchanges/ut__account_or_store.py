@@ -0,0 +1,944 @@
+import asyncio
+import backtrader
+import ccxt
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from ccxt.base.errors import ExchangeError, NetworkError
+from unittest.mock import MagicMock, patch
+
+from ccxtbt.account_or_store.account_or_store__specifications import BYBIT_WEBSOCKET_CONNECTIONS, \
+    DEFAULT__BALANCE_CACHE__TTL_IN_SECONDS, DEFAULT__BALANCE_CACHE__WEBSOCKET_TTL_IN_SECONDS, \
+    MAINNET_USDT_PERPETUAL_CONNECTION, MARKET_DATA_HUB_OWNERSHIP_TASK
+from ccxtbt.async_exchange.async_exchange__classes import Async_Exchange_Bridge
+from ccxtbt.bt_ccxt__specifications import MIN_LEVERAGE
+from ccxtbt.circuit_breaker.circuit_breaker__classes import Circuit_Breaker_Open_Error
+from ccxtbt.circuit_breaker.circuit_breaker__helper import get_shared_circuit_breaker
+from ccxtbt.circuit_breaker.circuit_breaker__specifications import DEFAULT__CIRCUIT_BREAKER__FAILURE_THRESHOLD
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID, \
+    BYBIT__ORDER_BOOK_STREAM__DEPTH
+from ccxtbt.expansion.bt_ccxt_expansion__helper import construct_standalone_exchange
+from ccxtbt.market_data_hub.market_data_hub__classes import Market_Data_Hub
+from ccxtbt.market_data_hub.market_data_hub__specifications import INSTRUMENT_INFO_TOPIC, KLINE_TOPIC
+from ccxtbt.metadata_cache.metadata_cache__classes import Metadata_Cache
+from ccxtbt.order.order__specifications import CCXT_ORDER_TYPES, CLOSED_ORDER
+from ccxtbt.order_book.order_book__classes import Local_Order_Book
+from ccxtbt.utils import convert_slider_from_percent
+from ccxtbt.websocket_supervisor.websocket_supervisor__classes import Websocket_Supervisor
+from tests.common.test__helper import ut_get_offline_bt_ccxt_account_or_store
+
+
+class FAKE_CCXT_EXCHANGE(object):
+    safe_float = staticmethod(ccxt.Exchange.safe_float)
+    safe_string = staticmethod(ccxt.Exchange.safe_string)
+    safe_value = staticmethod(ccxt.Exchange.safe_value)
+
+    def __init__(self):
+        self.calls = []
+
+        # Keyed by (symbol, stop, )
+        self.open_orders = {}
+
+    def __str__(self):
+        return "Bybit"
+
+    def fetch_order_book(self, symbol, limit=None, params={}):
+        self.calls.append(('fetch_order_book', limit, ))
+
+        # Deeper than asked for by default, like the REST end point
+        depth = 50 if limit is None else limit
+        return dict(
+            symbol=symbol,
+            bids=[[1000.0 - i * 0.5, 1.0] for i in range(depth)],
+            asks=[[1000.5 + i * 0.5, 1.0] for i in range(depth)],
+            nonce=100,
+            timestamp=1672502400000,
+        )
+
+    def fetch_order(self, id, symbol=None, params={}):
+        self.calls.append(('fetch_order', id, ))
+        return dict(id=id, symbol=symbol, status="open")
+
+    def fetch_open_orders(self, symbol=None, since=None, limit=None, params={}):
+        stop = params.get('stop', False)
+        self.calls.append(('fetch_open_orders', symbol, stop, ))
+        return self.open_orders.get((symbol, stop, ), [])
+
+    def fetch_balance(self, params={}):
+        self.calls.append(('fetch_balance', ))
+        return dict(
+            USDT=dict(free=1000.0, used=0.0, total=1000.0),
+            free=dict(USDT=1000.0),
+            used=dict(USDT=0.0),
+            total=dict(USDT=1000.0),
+        )
+
+
+class FAKE_ASYNC_CCXT_EXCHANGE(object):
+    def __init__(self, config):
+        self.failed_ids = config.get('failed_ids', ())
+        self.calls = []
+
+    async def fetch_order(self, id, symbol=None, params={}):
+        await asyncio.sleep(0)
+        self.calls.append(('fetch_order', id, ))
+        if id in self.failed_ids:
+            raise NetworkError("{} timed out".format(id))
+        return dict(id=id, symbol=symbol, status="open")
+
+    async def close(self):
+        pass
+
+
+class Account_or_Store__Async_Mode__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.async_exchange_bridge = Async_Exchange_Bridge(
+            exchange_constructor=FAKE_ASYNC_CCXT_EXCHANGE, config=dict(failed_ids=("2", )))
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            async_exchange_bridge=self.async_exchange_bridge,
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+
+        # Breakers are shared process-wide, hence a host of its own per test
+        self.bt_ccxt_account_or_store.exchange_host = self.id()
+
+    def tearDown(self):
+        self.bt_ccxt_account_or_store.close_async_exchange()
+
+    def test_01__Single_Call_Goes_Through_Async_Exchange(self):
+        ccxt_order = self.bt_ccxt_account_or_store._call_exchange(
+            'fetch_order', "1", "ETH/USDT:USDT")
+
+        # Test Assertion
+        self.assertEqual(ccxt_order['id'], "1")
+        self.assertEqual(self.async_exchange_bridge.exchange.calls, [
+                         ('fetch_order', "1", ), ])
+        self.assertEqual(self.bt_ccxt_account_or_store.exchange.calls, [])
+
+    def test_02__Failed_Call_Recovered_And_Recorded_By_Circuit_Breaker(self):
+        calls = [('fetch_order', (ccxt_id, "ETH/USDT:USDT", ), dict(), )
+                 for ccxt_id in ("1", "2", )]
+
+        results = self.bt_ccxt_account_or_store.gather_exchange_calls(
+            calls, recover_failed_calls=False)
+
+        # Test Assertion
+        self.assertEqual(results[0]['id'], "1")
+        self.assertIsInstance(results[1], NetworkError)
+
+        # The async exchange keeps failing "2", hence the retry of the blocking path fails as well
+        with self.assertRaises(NetworkError):
+            self.bt_ccxt_account_or_store.gather_exchange_calls(calls)
+
+        get_shared_circuit_breaker__dict = dict(
+            host=self.bt_ccxt_account_or_store.exchange_host,
+            endpoint='fetch_order',
+        )
+        circuit_breaker = get_shared_circuit_breaker(
+            params=get_shared_circuit_breaker__dict)
+
+        # Test Assertion: "1" reset the breaker before "2" failed again
+        self.assertEqual(circuit_breaker.consecutive_failures, 1)
+
+    def test_03__Open_Circuit_Breaker_Fails_Fast(self):
+        get_shared_circuit_breaker__dict = dict(
+            host=self.bt_ccxt_account_or_store.exchange_host,
+            endpoint='fetch_order',
+        )
+        circuit_breaker = get_shared_circuit_breaker(
+            params=get_shared_circuit_breaker__dict)
+        for _ in range(DEFAULT__CIRCUIT_BREAKER__FAILURE_THRESHOLD):
+            circuit_breaker.record_failure()
+
+        # Test Assertion
+        with self.assertRaises(Circuit_Breaker_Open_Error):
+            self.bt_ccxt_account_or_store.gather_exchange_calls(
+                [('fetch_order', ("1", ), dict(), ), ])
+        self.assertEqual(self.async_exchange_bridge.exchange.calls, [])
+
+    def test_04__Stop_Closes_Async_Exchange(self):
+        self.bt_ccxt_account_or_store.stop()
+
+        # Test Assertion
+        self.assertIsNone(self.bt_ccxt_account_or_store.async_exchange_bridge)
+        self.assertTrue(self.async_exchange_bridge.loop.is_closed())
+
+        # Back to the blocking exchange
+        self.bt_ccxt_account_or_store._call_exchange('fetch_order', "3")
+
+        # Test Assertion
+        self.assertEqual(self.bt_ccxt_account_or_store.exchange.calls, [
+                         ('fetch_order', "3", ), ])
+
+
+class Account_or_Store__Retry__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.bt_ccxt_account_or_store.exchange_host = self.id()
+
+        get_shared_circuit_breaker__dict = dict(
+            host=self.bt_ccxt_account_or_store.exchange_host,
+            endpoint='_call_exchange',
+        )
+        self.circuit_breaker = get_shared_circuit_breaker(
+            params=get_shared_circuit_breaker__dict)
+
+    def _call_exchange(self, exchange_error):
+        with patch.object(self.bt_ccxt_account_or_store.exchange, 'fetch_order', side_effect=exchange_error):
+            with self.assertRaises(type(exchange_error)):
+                self.bt_ccxt_account_or_store._call_exchange(
+                    'fetch_order', "1", "ETH/USDT:USDT")
+
+    def test_01__Only_Coded_Exchange_Error_Counts_As_Healthy(self):
+        self._call_exchange(NetworkError("bybit timed out"))
+
+        # Test Assertion
+        self.assertEqual(self.circuit_breaker.consecutive_failures, 1)
+
+        self._call_exchange(ExchangeError(
+            'bybit GET https://api-testnet.bybit.com 502 Bad Gateway'))
+
+        # Test Assertion: no exchange code, hence the gateway rather than the end point replied
+        self.assertEqual(self.circuit_breaker.consecutive_failures, 2)
+
+        self._call_exchange(ExchangeError(
+            'bybit {"retCode":20001,"retMsg":"order not exists"}'))
+
+        # Test Assertion
+        self.assertEqual(self.circuit_breaker.consecutive_failures, 0)
+
+
+class FAKE_BT_CCXT_ORDER(object):
+    def __init__(self, ccxt_id, symbol_id="ETHUSDT", ordering_type=backtrader.Order.ACTIVE_ORDERING_TYPE):
+        self.ccxt_id = ccxt_id
+        self.symbol_id = symbol_id
+        self.ordering_type = ordering_type
+
+
+class Account_or_Store__Push_Mode__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            is_ws_available=True,
+            push_order_notification=True,
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.bt_ccxt_account_or_store.parent = object()
+        self.orders = [FAKE_BT_CCXT_ORDER("1"), FAKE_BT_CCXT_ORDER("2"), ]
+        self.bt_ccxt_account_or_store.open_orders.extend(self.orders)
+
+        # Orders missing from the websocket cache
+        self.evicted_ccxt_orders_id = set()
+
+        # Record which order got applied with which update on which thread
+        self.applied = []
+
+    def tearDown(self):
+        self.bt_ccxt_account_or_store.stop_order_notification_worker()
+
+    def _get_ws_ccxt_order(self, order):
+        if order.ccxt_id in self.evicted_ccxt_orders_id:
+            return None
+        return dict(id=order.ccxt_id, source="ws")
+
+    def _apply_ccxt_order_update(self, order, new_ccxt_order):
+        self.applied.append(
+            (order.ccxt_id, new_ccxt_order['source'], threading.current_thread(), ))
+
+    def _push_from_websocket_thread(self, *ccxt_orders):
+        for ccxt_order in ccxt_orders:
+            thread = threading.Thread(
+                target=self.bt_ccxt_account_or_store._push_ws_ccxt_order, args=(ccxt_order, ))
+            thread.start()
+            thread.join()
+
+    def _apply_by_worker(self, *ccxt_orders):
+        '''
+        Push from the websocket thread, then stop the worker once it has applied every pushed update
+        '''
+        del self.applied[:]
+        with patch.object(self.bt_ccxt_account_or_store, '_get_ws_ccxt_order', side_effect=self._get_ws_ccxt_order), \
+                patch.object(self.bt_ccxt_account_or_store, 'fetch_ccxt_order',
+                             side_effect=lambda symbol_id, order_id=None, stop_order_id=None: dict(
+                                 id=order_id, source="rest")), \
+                patch.object(self.bt_ccxt_account_or_store, '_apply_ccxt_order_update',
+                             side_effect=self._apply_ccxt_order_update):
+            self.bt_ccxt_account_or_store.start_order_notification_worker()
+            order_notification_worker = self.bt_ccxt_account_or_store.order_notification_worker
+            self._push_from_websocket_thread(*ccxt_orders)
+            self.bt_ccxt_account_or_store.stop_order_notification_worker()
+        return order_notification_worker
+
+    def test_01__Websocket_Thread_Only_Enqueues(self):
+        with patch.object(self.bt_ccxt_account_or_store, '_apply_ccxt_order_update',
+                          side_effect=self._apply_ccxt_order_update):
+            self._push_from_websocket_thread(dict(id="1"))
+
+        # Test Assertion
+        self.assertEqual(self.applied, [])
+        self.assertEqual(
+            self.bt_ccxt_account_or_store.pushed_ccxt_orders_id.qsize(), 1)
+
+    def test_02__Worker_Applies_Pushed_Updates(self):
+        order_notification_worker = self._apply_by_worker(
+            dict(id="2"), dict(id="3"))
+
+        # Test Assertion: untracked orders are ignored
+        self.assertEqual(self.applied, [
+                         ("2", "ws", order_notification_worker, ), ])
+        self.assertIsNone(
+            self.bt_ccxt_account_or_store.order_notification_worker)
+
+        with patch.object(self.bt_ccxt_account_or_store, '_apply_ccxt_order_update',
+                          side_effect=self._apply_ccxt_order_update):
+            self.bt_ccxt_account_or_store.next()
+
+        # Test Assertion: nothing left for next() to poll
+        self.assertEqual(
+            self.applied, [("2", "ws", order_notification_worker, ), ])
+        self.assertEqual(self.bt_ccxt_account_or_store.exchange.calls, [])
+
+    def test_03__Newly_Tracked_Order_Is_Looked_At(self):
+        # Reported by websocket before it was tracked
+        with self.bt_ccxt_account_or_store.open_orders__lock:
+            self.bt_ccxt_account_or_store._add_open_order(
+                FAKE_BT_CCXT_ORDER("3"))
+        self._apply_by_worker()
+
+        # Test Assertion
+        self.assertEqual([(ccxt_id, source, ) for (ccxt_id, source, _) in self.applied], [
+                         ("3", "ws", ), ])
+
+    def test_04__Missing_From_Websocket_Cache_Falls_Back_To_Rest(self):
+        self.evicted_ccxt_orders_id.add("1")
+        self._apply_by_worker(dict(id="1"))
+
+        # Test Assertion
+        self.assertEqual([(ccxt_id, source, ) for (ccxt_id, source, _) in self.applied], [
+                         ("1", "rest", ), ])
+
+
+class Account_or_Store__Market_Data_Hub__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.market_data_hub = Market_Data_Hub(
+            "Bybit: linear_perpetual_swap: MAINNET")
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            is_ws_available=True,
+            is_ohlcv_provider=True,
+            market_data_hub=self.market_data_hub,
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.bt_ccxt_account_or_store.main_net_toggle_switch_value = True
+        self.websocket_supervisor = Websocket_Supervisor(
+            name="ut", heartbeat_timeout_in_seconds=None)
+        self.bt_ccxt_account_or_store.websocket_supervisor = self.websocket_supervisor
+
+        # As registered by supervise_bybit_websocket, checked synchronously instead of by the supervisor thread
+        self.websocket_supervisor.add_task(MARKET_DATA_HUB_OWNERSHIP_TASK,
+                                           self.bt_ccxt_account_or_store._check_market_data_hub_ownership)
+        self.connection_name = BYBIT_WEBSOCKET_CONNECTIONS[MAINNET_USDT_PERPETUAL_CONNECTION]
+
+        # Stand in for the public websocket
+        self.connected = False
+
+    def _connect(self):
+        self.connected = True
+        return True
+
+    def _check(self):
+        with patch.object(self.bt_ccxt_account_or_store, '_connect_bybit_mainnet_usdt_perpetual_websocket',
+                          side_effect=self._connect), \
+                patch.object(self.bt_ccxt_account_or_store, '_is_bybit_mainnet_usdt_perpetual_websocket_connected',
+                             side_effect=lambda: self.connected):
+            self.websocket_supervisor.check()
+
+    def test_01__Take_Over_Released_Public_Streams(self):
+        # The ohlcv provider owns the public streams from init onwards, hand them to another account first
+        self.bt_ccxt_account_or_store.release_market_data_hub()
+        self.assertTrue(self.market_data_hub.acquire_ownership("Main"))
+        self._check()
+
+        # Test Assertion
+        self.assertFalse(self.bt_ccxt_account_or_store.is_market_data_owner)
+        self.assertFalse(self.connected)
+
+        self.market_data_hub.release_ownership("Main")
+
+        # Ownership is taken on this check, the connection is made on the next one
+        self._check()
+        self._check()
+
+        # Test Assertion
+        self.assertTrue(self.bt_ccxt_account_or_store.is_market_data_owner)
+        self.assertEqual(self.market_data_hub.get_owner(),
+                         self.bt_ccxt_account_or_store.market_data_hub__owner)
+        self.assertTrue(self.connected)
+        self.assertTrue(
+            self.websocket_supervisor.is_connected(self.connection_name))
+
+    def test_02__Step_Down_Once_Taken_Over(self):
+        self._check()
+        self._check()
+
+        # Test Assertion
+        self.assertTrue(self.bt_ccxt_account_or_store.is_market_data_owner)
+
+        # Silent for longer than the owner timeout
+        self.market_data_hub.owner_timeout_in_seconds = -1.0
+        self.assertTrue(self.market_data_hub.acquire_ownership("Sub"))
+        self.market_data_hub.publish(INSTRUMENT_INFO_TOPIC, "ETHUSDT", "quote")
+        self._check()
+
+        # Test Assertion
+        self.assertFalse(self.bt_ccxt_account_or_store.is_market_data_owner)
+        self.assertNotIn(self.connection_name,
+                         self.websocket_supervisor.get_metrics().keys())
+
+        # What the new owner published is left alone
+        self.assertEqual(self.market_data_hub.get_latest(
+            INSTRUMENT_INFO_TOPIC, "ETHUSDT"), "quote")
+
+    def test_03__Resubscribe_Once_Requests_Grow(self):
+        # Taken over, hence the public connection is supervised
+        self.bt_ccxt_account_or_store.release_market_data_hub()
+        self._check()
+        self._check()
+        (requests__version, symbols_id__per_topic,
+         ) = self.market_data_hub.get_requests()
+        self.bt_ccxt_account_or_store.market_data__requests__version = requests__version
+
+        # Test Assertion: the owner streams what it has requested itself
+        self.assertEqual(symbols_id__per_topic, [
+                         ["ETHUSDT", ], ["ETHUSDT", ], ])
+
+        self.market_data_hub.request(
+            "Sub", INSTRUMENT_INFO_TOPIC, ["ETHUSDT", ])
+        with patch.object(self.bt_ccxt_account_or_store, 'close_bybit_mainnet_usdt_perpetual_websocket') as close:
+            self._check()
+
+        # Test Assertion: nothing new requested
+        close.assert_not_called()
+
+        self.market_data_hub.request("Sub", KLINE_TOPIC, ["BTCUSDT", ])
+
+        def close_bybit_mainnet_usdt_perpetual_websocket(force=False):
+            self.connected = False
+
+        with patch.object(self.bt_ccxt_account_or_store, 'close_bybit_mainnet_usdt_perpetual_websocket',
+                          side_effect=close_bybit_mainnet_usdt_perpetual_websocket) as close:
+            self._check()
+
+        # Test Assertion: closed on this check, reconnected with the union on the next one
+        close.assert_called_once_with(force=True)
+        self.assertFalse(self.connected)
+        self.assertIsNone(
+            self.bt_ccxt_account_or_store.market_data__requests__version)
+
+        self._check()
+
+        # Test Assertion
+        self.assertTrue(self.connected)
+
+    def test_04__Owner_Reads_Its_Own_Quotes(self):
+        self._check()
+        quote = self.bt_ccxt_account_or_store.quote_store.publish(
+            "ETHUSDT", 1000.2, 1000.5, 1000.0)
+
+        # Test Assertion
+        self.assertIs(
+            self.bt_ccxt_account_or_store.get_quote("ETHUSDT"), quote)
+
+        self.bt_ccxt_account_or_store.is_market_data_owner = False
+        self.market_data_hub.publish(INSTRUMENT_INFO_TOPIC, "ETHUSDT", "quote")
+
+        # Test Assertion
+        self.assertEqual(
+            self.bt_ccxt_account_or_store.get_quote("ETHUSDT"), "quote")
+
+
+class Account_or_Store__Local_Order_Book__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            is_ws_available=True,
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.bt_ccxt_account_or_store.exchange_host = self.id()
+        self.local_order_book = Local_Order_Book(
+            "ETHUSDT", max_depth=BYBIT__ORDER_BOOK_STREAM__DEPTH)
+        self.bt_ccxt_account_or_store.local_order_books = dict(
+            ETHUSDT=self.local_order_book)
+        self.bt_ccxt_account_or_store.websocket_supervisor = Websocket_Supervisor(
+            name="ut", heartbeat_timeout_in_seconds=None)
+
+    def test_01__Served_From_Websocket_Snapshot_After_Reconnection(self):
+        self.bt_ccxt_account_or_store._resync_after_bybit_usdt_perpetual_websocket_reconnected()
+        self.bt_ccxt_account_or_store.get_orderbook("ETHUSDT")
+
+        # Test Assertion: REST meanwhile, without any deeper book leaking into the local one
+        self.assertEqual(self.bt_ccxt_account_or_store.exchange.calls, [
+                         ('fetch_order_book', None, ), ])
+        self.assertFalse(self.local_order_book.is_synced())
+
+        # The resubscribed stream starts over with the whole book
+        message = {
+            'topic': "orderBookL2_25.ETHUSDT",
+            'type': "snapshot",
+            'data': [dict(price=str(1000.0 - i * 0.5), symbol="ETHUSDT", side="Buy", size=1.0)
+                     for i in range(BYBIT__ORDER_BOOK_STREAM__DEPTH)] +
+                    [dict(price=str(1000.5 + i * 0.5), symbol="ETHUSDT", side="Sell", size=1.0)
+                     for i in range(BYBIT__ORDER_BOOK_STREAM__DEPTH)],
+            'cross_seq': "101",
+            'timestamp_e6': "1672502400123456",
+        }
+        self.bt_ccxt_account_or_store.handle_orderbook_stream(message)
+        snapshot = self.bt_ccxt_account_or_store.get_orderbook("ETHUSDT")
+
+        # Test Assertion
+        self.assertEqual(len(self.bt_ccxt_account_or_store.exchange.calls), 1)
+        self.assertEqual(len(snapshot['bids']),
+                         BYBIT__ORDER_BOOK_STREAM__DEPTH)
+        self.assertEqual(len(snapshot['asks']),
+                         BYBIT__ORDER_BOOK_STREAM__DEPTH)
+        self.assertEqual(snapshot['nonce'], 101)
+
+
+class Account_or_Store__Leverage_Cache__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            symbols_id=["ETHUSDT", "BTCUSDT", ],
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.max_leverage = 100.0
+        self.exchange_leverage = 10
+        self.failed_symbols_id = set()
+        self.get_leverage__symbols_id = []
+        self.set_leverage__calls = []
+        self.lock = threading.Lock()
+
+    def get_bybit_leverage(self, params):
+        with self.lock:
+            self.get_leverage__symbols_id.append(params['symbol_id'])
+        return self.exchange_leverage
+
+    def set_bybit_leverage(self, params):
+        with self.lock:
+            self.set_leverage__calls.append(
+                (params['symbol_id'], params['from_leverage'], params['to_leverage'], ))
+        if params['symbol_id'] in self.failed_symbols_id:
+            raise NetworkError("{} timed out".format(params['symbol_id']))
+
+    def set_leverage_in_percent(self, leverage_in_percent):
+        module_name = 'ccxtbt.account_or_store.account_or_store__classes'
+        with patch.object(self.bt_ccxt_account_or_store, '_get_risk_limit', return_value=[]), \
+                patch('{}.get_bybit_max_leverage'.format(module_name), return_value=self.max_leverage), \
+                patch('{}.get_bybit_leverage'.format(module_name), self.get_bybit_leverage), \
+                patch('{}.set_bybit_leverage'.format(module_name), self.set_bybit_leverage):
+            return self.bt_ccxt_account_or_store.set_leverage_in_percent(leverage_in_percent)
+
+    def test_01__Unchanged_Leverage_Skips_Set(self):
+        to_leverage = int(convert_slider_from_percent(
+            50.0, MIN_LEVERAGE, self.max_leverage))
+
+        # Test Assertion
+        self.assertTrue(self.set_leverage_in_percent(50.0))
+        self.assertEqual(sorted(self.get_leverage__symbols_id),
+                         ["BTCUSDT", "ETHUSDT", ])
+        self.assertEqual(sorted(self.set_leverage__calls), [
+            ("BTCUSDT", self.exchange_leverage, to_leverage, ),
+            ("ETHUSDT", self.exchange_leverage, to_leverage, ),
+        ])
+        self.assertEqual(self.bt_ccxt_account_or_store.leverages, dict(
+            ETHUSDT=to_leverage, BTCUSDT=to_leverage))
+
+        self.get_leverage__symbols_id.clear()
+        self.set_leverage__calls.clear()
+
+        # Test Assertion
+        self.assertFalse(self.set_leverage_in_percent(50.0))
+        self.assertEqual(self.get_leverage__symbols_id, [])
+        self.assertEqual(self.set_leverage__calls, [])
+
+    def test_02__Failed_Set_Drops_Cached_Leverage(self):
+        to_leverage = int(convert_slider_from_percent(
+            50.0, MIN_LEVERAGE, self.max_leverage))
+        self.failed_symbols_id.add("BTCUSDT")
+
+        # Test Assertion
+        with self.assertRaises(NetworkError):
+            self.set_leverage_in_percent(50.0)
+        self.assertEqual(self.bt_ccxt_account_or_store.leverages,
+                         dict(ETHUSDT=to_leverage))
+
+        self.failed_symbols_id.clear()
+        self.get_leverage__symbols_id.clear()
+        self.set_leverage__calls.clear()
+
+        # Test Assertion: ETHUSDT is left unchanged, hence not every symbol is set
+        self.assertFalse(self.set_leverage_in_percent(50.0))
+        self.assertEqual(self.get_leverage__symbols_id, ["BTCUSDT", ])
+        self.assertEqual(self.set_leverage__calls, [
+            ("BTCUSDT", self.exchange_leverage, to_leverage, ), ])
+        self.assertEqual(self.bt_ccxt_account_or_store.leverages, dict(
+            ETHUSDT=to_leverage, BTCUSDT=to_leverage))
+
+
+class Account_or_Store__Balance_Cache__TestCases(unittest.TestCase):
+    def _get_bt_ccxt_account_or_store(self, is_ws_available):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            is_ws_available=is_ws_available,
+        )
+        bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+
+        # Breakers are shared process-wide, hence a host of its own per test
+        bt_ccxt_account_or_store.exchange_host = self.id()
+        return bt_ccxt_account_or_store
+
+    def _age_cached_balance(self, bt_ccxt_account_or_store, seconds):
+        with bt_ccxt_account_or_store.balance__lock:
+            bt_ccxt_account_or_store.cached_balance__timestamp -= seconds
+
+    def _get_fetch_balance__count(self, bt_ccxt_account_or_store):
+        return bt_ccxt_account_or_store.exchange.calls.count(('fetch_balance', ))
+
+    def test_01__Cached_Within_TTL(self):
+        for is_ws_available, ttl_in_seconds in ((False, DEFAULT__BALANCE_CACHE__TTL_IN_SECONDS, ),
+                                                (True, DEFAULT__BALANCE_CACHE__WEBSOCKET_TTL_IN_SECONDS, ), ):
+            with self.subTest(is_ws_available=is_ws_available):
+                bt_ccxt_account_or_store = self._get_bt_ccxt_account_or_store(
+                    is_ws_available)
+
+                # Test Assertion
+                self.assertEqual(
+                    bt_ccxt_account_or_store.get_balance(), (1000.0, 1000.0, ))
+                self.assertEqual(
+                    bt_ccxt_account_or_store.get_balance(), (1000.0, 1000.0, ))
+                self.assertEqual(self._get_fetch_balance__count(
+                    bt_ccxt_account_or_store), 1)
+
+                self._age_cached_balance(
+                    bt_ccxt_account_or_store, ttl_in_seconds - 1.0)
+                bt_ccxt_account_or_store.get_cash(force=True)
+
+                # Test Assertion
+                self.assertEqual(self._get_fetch_balance__count(
+                    bt_ccxt_account_or_store), 1)
+
+                self._age_cached_balance(bt_ccxt_account_or_store, 1.0)
+                bt_ccxt_account_or_store.get_cash(force=True)
+
+                # Test Assertion
+                self.assertEqual(self._get_fetch_balance__count(
+                    bt_ccxt_account_or_store), 2)
+
+    def test_02__Invalidated_On_Fill_Without_Websocket(self):
+        for is_ws_available, fetch_balance__count in ((False, 2, ), (True, 1, ), ):
+            with self.subTest(is_ws_available=is_ws_available):
+                bt_ccxt_account_or_store = self._get_bt_ccxt_account_or_store(
+                    is_ws_available)
+                construct_standalone_exchange__dict = dict(
+                    exchange_dropdown_value=BYBIT_EXCHANGE_ID,
+                    ut_disable_singleton=True,
+                )
+                bt_ccxt_account_or_store.parent = construct_standalone_exchange(
+                    params=construct_standalone_exchange__dict)
+                bt_ccxt_account_or_store.get_balance()
+
+                order = MagicMock()
+                order.executed.remaining_size = 0.0
+                closed__ccxt_order = dict(
+                    trades=None,
+                    ccxt_status=bt_ccxt_account_or_store.parent.mappings[
+                        CCXT_ORDER_TYPES[CLOSED_ORDER]]['value'],
+                )
+                with patch.object(bt_ccxt_account_or_store, 'notify'), \
+                        patch.object(bt_ccxt_account_or_store, 'execute'), \
+                        patch.object(bt_ccxt_account_or_store, 'get__child'), \
+                        patch.object(bt_ccxt_account_or_store, 'remove_open_order') as remove_open_order:
+                    bt_ccxt_account_or_store._apply_ccxt_order_update(
+                        order, closed__ccxt_order)
+                bt_ccxt_account_or_store.get_balance()
+
+                # Test Assertion: Websocket wallet stream keeps the balance up to date instead
+                remove_open_order.assert_called_once_with(order)
+                self.assertEqual(self._get_fetch_balance__count(
+                    bt_ccxt_account_or_store), fetch_balance__count)
+
+    def test_03__Websocket_Wallet_Update(self):
+        bt_ccxt_account_or_store = self._get_bt_ccxt_account_or_store(True)
+        bt_ccxt_account_or_store.websocket_supervisor = Websocket_Supervisor(
+            name="ut", heartbeat_timeout_in_seconds=None)
+        message = dict(
+            topic="wallet",
+            data=[dict(coin="USDT", available_balance="900.5",
+                       wallet_balance="1100.25")],
+        )
+
+        # Test Assertion: the first HTTP fetch seeds the cache
+        bt_ccxt_account_or_store.handle_wallet(message)
+        self.assertIsNone(bt_ccxt_account_or_store.cached_balance)
+
+        bt_ccxt_account_or_store.get_balance()
+        self._age_cached_balance(bt_ccxt_account_or_store,
+                                 DEFAULT__BALANCE_CACHE__WEBSOCKET_TTL_IN_SECONDS)
+        bt_ccxt_account_or_store.handle_wallet(message)
+
+        # Test Assertion: served from the pushed wallet rather than HTTP
+        self.assertEqual(
+            bt_ccxt_account_or_store.get_balance(), (900.5, 1100.25, ))
+        self.assertEqual(self._get_fetch_balance__count(
+            bt_ccxt_account_or_store), 1)
+        self.assertEqual(bt_ccxt_account_or_store.cached_balance['USDT'], dict(
+            free=900.5, used=0.0, total=1100.25))
+
+        # Test Assertion: the pushed wallet is a copy, leaving the fetched balance intact
+        self.assertEqual(bt_ccxt_account_or_store.exchange.fetch_balance()[
+                         'free'], dict(USDT=1000.0))
+
+
+class Account_or_Store__Batched_Polling__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            symbols_id=["ETHUSDT", "BTCUSDT", ],
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.bt_ccxt_account_or_store.exchange_host = self.id()
+        self.bt_ccxt_account_or_store.parent = object()
+
+        self.bt_ccxt_account_or_store.open_orders.extend([
+            FAKE_BT_CCXT_ORDER("1", symbol_id="ETHUSDT"),
+            FAKE_BT_CCXT_ORDER(
+                "2", symbol_id="ETHUSDT", ordering_type=backtrader.Order.CONDITIONAL_ORDERING_TYPE),
+            FAKE_BT_CCXT_ORDER("3", symbol_id="BTCUSDT"),
+            # No longer open on the exchange
+            FAKE_BT_CCXT_ORDER("4", symbol_id="BTCUSDT"),
+        ])
+
+        # "5" is placed by another client
+        exchange = self.bt_ccxt_account_or_store.exchange
+        exchange.open_orders[("ETHUSDT", False, )] = [
+            dict(id="1", status="open"), dict(id="5", status="open"), ]
+        exchange.open_orders[("ETHUSDT", True, )] = [
+            dict(id="2", status="open"), ]
+        exchange.open_orders[("BTCUSDT", False, )] = [
+            dict(id="3", status="open"), ]
+
+        self.applied = []
+
+    def _apply_ccxt_order_update(self, order, new_ccxt_order):
+        self.applied.append((order.ccxt_id, new_ccxt_order['id'], ))
+
+    def _fetch_ccxt_order(self, symbol_id, order_id=None, stop_order_id=None):
+        return dict(id=order_id if order_id is not None else stop_order_id, status="closed")
+
+    def test_01__One_Request_Per_Symbol(self):
+        with patch.object(self.bt_ccxt_account_or_store, 'post_process__ccxt_orders',
+                          side_effect=lambda params: params['ccxt_orders']):
+            batched__ccxt_orders = self.bt_ccxt_account_or_store._fetch_ccxt_orders_in_batch()
+
+        # Test Assertion: conditional orders of Bybit are served from a separate end point
+        self.assertEqual(self.bt_ccxt_account_or_store.exchange.calls, [
+            ('fetch_open_orders', "ETHUSDT", False, ),
+            ('fetch_open_orders', "ETHUSDT", True, ),
+            ('fetch_open_orders', "BTCUSDT", False, ),
+        ])
+        self.assertEqual(sorted(batched__ccxt_orders.keys()),
+                         ["1", "2", "3", ])
+
+    def test_02__Next_Fetches_Orders_Left_Open_Set_Individually(self):
+        for batched_order_polling, fetched__orders_id in ((True, ["4", ], ), (False, ["1", "2", "3", "4", ], ), ):
+            with self.subTest(batched_order_polling=batched_order_polling):
+                self.bt_ccxt_account_or_store.batched_order_polling = batched_order_polling
+                del self.applied[:]
+                with patch.object(self.bt_ccxt_account_or_store, 'post_process__ccxt_orders',
+                                  side_effect=lambda params: params['ccxt_orders']), \
+                        patch.object(self.bt_ccxt_account_or_store, 'fetch_ccxt_order',
+                                     side_effect=self._fetch_ccxt_order) as fetch_ccxt_order, \
+                        patch.object(self.bt_ccxt_account_or_store, '_apply_ccxt_order_update',
+                                     side_effect=self._apply_ccxt_order_update):
+                    self.bt_ccxt_account_or_store.next()
+
+                # Test Assertion
+                self.assertEqual(self.applied, [
+                    ("1", "1", ), ("2", "2", ), ("3", "3", ), ("4", "4", ), ])
+                self.assertEqual([(kwargs.get('order_id', None) or kwargs.get('stop_order_id', None))
+                                  for (_, kwargs) in fetch_ccxt_order.call_args_list], fetched__orders_id)
+
+
+class Account_or_Store__Fresh_Websocket_Positions__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            is_ws_available=True,
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+
+        # Stand in for the private websocket
+        self.bt_ccxt_account_or_store.ws_usdt_perpetual = object()
+        self.symbol_id = "ETHUSDT"
+        self.ws_position = dict(symbol=self.symbol_id,
+                                side="buy", info=dict(size=0.01))
+
+    def _update_ws_positions(self, ws_position):
+        # As done by the websocket position handlers
+        with self.bt_ccxt_account_or_store.ws_positions__condition:
+            self.bt_ccxt_account_or_store.ws_positions[self.symbol_id] = [
+                ws_position]
+            self.bt_ccxt_account_or_store.ws_positions__timestamp[self.symbol_id] = time.monotonic(
+            )
+            self.bt_ccxt_account_or_store.ws_positions__condition.notify_all()
+
+    def test_01__None_Without_Websocket_Position(self):
+        # Test Assertion
+        self.assertIsNone(self.bt_ccxt_account_or_store.get_fresh_ws_positions(
+            self.symbol_id, timeout=0.1))
+
+        self.bt_ccxt_account_or_store.ws_usdt_perpetual = None
+        self._update_ws_positions(self.ws_position)
+
+        # Test Assertion: the caller falls back to HTTP
+        self.assertIsNone(self.bt_ccxt_account_or_store.get_fresh_ws_positions(
+            self.symbol_id, timeout=0.1))
+
+    def test_02__Fresh_Position_Returned_As_Copy(self):
+        self._update_ws_positions(self.ws_position)
+
+        ws_positions = self.bt_ccxt_account_or_store.get_fresh_ws_positions(
+            self.symbol_id, timeout=0.0)
+
+        # Test Assertion
+        self.assertEqual(ws_positions, [self.ws_position])
+        self.assertIsNot(
+            ws_positions, self.bt_ccxt_account_or_store.ws_positions[self.symbol_id])
+
+    def test_03__Wait_For_Position_Newer_Than_Fill(self):
+        self._update_ws_positions(self.ws_position)
+        self.bt_ccxt_account_or_store._record_ws_fill(
+            self.symbol_id, dict(filled=0.01))
+
+        # Test Assertion: stale until the position update following the fill arrives
+        self.assertIsNone(self.bt_ccxt_account_or_store.get_fresh_ws_positions(
+            self.symbol_id, timeout=0.1))
+
+        filled__ws_position = dict(
+            symbol=self.symbol_id, side="buy", info=dict(size=0.02))
+        timer = threading.Timer(
+            0.1, self._update_ws_positions, args=(filled__ws_position, ))
+        timer.start()
+        start = time.monotonic()
+        ws_positions = self.bt_ccxt_account_or_store.get_fresh_ws_positions(
+            self.symbol_id, timeout=5.0)
+        timer.join()
+
+        # Test Assertion: woken up by the update instead of waiting for the timeout
+        self.assertEqual(ws_positions, [filled__ws_position])
+        self.assertLess(time.monotonic() - start, 5.0)
+
+        # Test Assertion: an update without any fill does not make the position stale
+        self.bt_ccxt_account_or_store._record_ws_fill(
+            self.symbol_id, dict(filled=0.0))
+        self.assertEqual(self.bt_ccxt_account_or_store.get_fresh_ws_positions(
+            self.symbol_id, timeout=0.0), [filled__ws_position])
+
+
+class Counting_Rate_Limiter(object):
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+
+class Account_or_Store__Rate_Limited_Metadata__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.dir_path = tempfile.mkdtemp()
+        self.bt_ccxt_account_or_store.metadata_cache = Metadata_Cache(
+            dir_path=self.dir_path, ttl_in_seconds=60)
+        self.bt_ccxt_account_or_store.rate_limiter = Counting_Rate_Limiter()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def test_01__Token_Taken_Only_When_Fetched_From_Exchange(self):
+        with patch('ccxtbt.account_or_store.account_or_store__classes.get_bybit_risk_limit',
+                   return_value=[dict(id=1, limit=1000000)]):
+            for _ in range(3):
+                risk_limit = self.bt_ccxt_account_or_store._get_risk_limit(
+                    "ETHUSDT")
+
+        # Test Assertion
+        self.assertEqual(risk_limit, [dict(id=1, limit=1000000)])
+        self.assertEqual(
+            self.bt_ccxt_account_or_store.rate_limiter.acquired, 1)
+
+
+class FAKE_INSTRUMENT(object):
+    def __init__(self, symbol_id):
+        self.symbol_id = symbol_id
+
+
+class Account_or_Store__Deferred_Recovery__TestCases(unittest.TestCase):
+    def setUp(self):
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.bt_ccxt_account_or_store.deferred_recovery = True
+        self.recovered__symbols_id = []
+
+    def fetch_recovery_plan(self, instrument):
+        return dict(symbol_id=instrument.symbol_id)
+
+    def apply_recovery_plan(self, recovery_plan, call_next=True):
+        self.recovered__symbols_id.append(recovery_plan['symbol_id'])
+        return False
+
+    def test_01__Instrument_Added_After_Coordinator_Recovered_Right_Away(self):
+        bt_ccxt_account_or_store = self.bt_ccxt_account_or_store
+        with patch.object(bt_ccxt_account_or_store, 'fetch_recovery_plan', self.fetch_recovery_plan), \
+                patch.object(bt_ccxt_account_or_store, 'apply_recovery_plan', self.apply_recovery_plan):
+            bt_ccxt_account_or_store._post_process__after_child_is_added(
+                FAKE_INSTRUMENT("ETHUSDT"))
+
+            # Test Assertion: left to Crash_Recovery_Coordinator
+            self.assertEqual(self.recovered__symbols_id, [])
+            self.assertEqual([instrument.symbol_id for instrument in
+                              bt_ccxt_account_or_store.pop_pending_recovery__instruments()], ["ETHUSDT"])
+
+            bt_ccxt_account_or_store._post_process__after_child_is_added(
+                FAKE_INSTRUMENT("BTCUSDT"))
+
+        # Test Assertion: Crash_Recovery_Coordinator has run, hence nothing else would recover it
+        self.assertEqual(self.recovered__symbols_id, ["BTCUSDT"])
+        self.assertEqual(
+            bt_ccxt_account_or_store.pop_pending_recovery__instruments(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+
+from ccxt.base.errors import RequestTimeout
+from time import sleep
+from time import time as timer
+
+from ccxtbt.async_exchange.async_exchange__classes import Async_Exchange_Bridge
+
+
+class FAKE_ASYNC_CCXT_EXCHANGE(object):
+    def __init__(self, config):
+        self.config = config
+        self.latency_in_seconds = config['latency_in_seconds']
+        self.is_closed = False
+        self.is_cancelled = False
+
+    async def fetch_open_orders(self, symbol, params={}):
+        await asyncio.sleep(self.latency_in_seconds)
+        if symbol is None:
+            raise ValueError("symbol is required")
+        return [dict(id="{}-1".format(symbol), symbol=symbol, params=params)]
+
+    async def fetch_order(self, id, symbol=None, params={}):
+        try:
+            await asyncio.sleep(self.latency_in_seconds)
+        except asyncio.CancelledError:
+            self.is_cancelled = True
+            raise
+        return dict(id=id, symbol=symbol)
+
+    async def close(self):
+        self.is_closed = True
+
+
+class Async_Exchange_Bridge__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.latency_in_seconds = 0.2
+        self.async_exchange_bridge = Async_Exchange_Bridge(
+            exchange_constructor=FAKE_ASYNC_CCXT_EXCHANGE, config=dict(latency_in_seconds=self.latency_in_seconds))
+
+    def tearDown(self):
+        self.async_exchange_bridge.close()
+
+    def test_01__Independent_Calls_Are_Concurrent(self):
+        symbols_id = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", ]
+        calls = [('fetch_open_orders', (symbol_id, ), dict(
+            params=dict(type="swap")), ) for symbol_id in symbols_id]
+
+        start = timer()
+        results = self.async_exchange_bridge.gather(calls)
+        time_taken = timer() - start
+
+        # Test Assertion
+        self.assertLess(time_taken, self.latency_in_seconds *
+                        len(symbols_id) / 2)
+        self.assertEqual([result[0]['symbol']
+                         for result in results], symbols_id)
+
+    def test_02__Failed_Call_Is_Returned_In_Place(self):
+        calls = [
+            ('fetch_open_orders', ("BTCUSDT", ), dict(), ),
+            ('fetch_open_orders', (None, ), dict(), ),
+        ]
+
+        results = self.async_exchange_bridge.gather(calls)
+
+        # Test Assertion
+        self.assertEqual(results[0][0]['id'], "BTCUSDT-1")
+        self.assertIsInstance(results[1], ValueError)
+
+    def test_03__Synchronous_Call_And_Close(self):
+        result = self.async_exchange_bridge.call(
+            'fetch_open_orders', "ETHUSDT")
+        exchange = self.async_exchange_bridge.exchange
+        self.async_exchange_bridge.close()
+
+        # Test Assertion
+        self.assertEqual(result[0]['id'], "ETHUSDT-1")
+        self.assertTrue(exchange.is_closed)
+        self.assertTrue(self.async_exchange_bridge.loop.is_closed())
+
+    def test_04__Exchange_Id_Resolved_From_Async_Support(self):
+        async_exchange_bridge = Async_Exchange_Bridge(
+            exchange_constructor="bybit", config=dict(enableRateLimit=True))
+        exchange = async_exchange_bridge.exchange
+        async_exchange_bridge.close()
+
+        # Test Assertion
+        self.assertEqual(type(exchange).__module__, "ccxt.async_support.bybit")
+        self.assertTrue(async_exchange_bridge.loop.is_closed())
+
+    def test_05__Timeout_Raised_As_Ccxt_Error_And_Cancelled(self):
+        async_exchange_bridge = Async_Exchange_Bridge(
+            exchange_constructor=FAKE_ASYNC_CCXT_EXCHANGE, config=dict(
+                latency_in_seconds=5.0),
+            timeout_in_seconds=0.1)
+
+        # Test Assertion
+        with self.assertRaises(RequestTimeout):
+            async_exchange_bridge.call('fetch_order', "1", "ETHUSDT")
+
+        # Cancellation is delivered on the loop thread
+        for _ in range(50):
+            if async_exchange_bridge.exchange.is_cancelled:
+                break
+            sleep(0.01)
+
+        # Test Assertion
+        self.assertTrue(async_exchange_bridge.exchange.is_cancelled)
+
+        async_exchange_bridge.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import json
+import threading
+import unittest
+
+from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPE__FUTURE, CCXT__MARKET_TYPE__SPOT
+from ccxtbt.exchange_or_broker.binance.binance__exchange__classes import Binance_Listen_Key_Keeper, Binance_Websocket
+from ccxtbt.exchange_or_broker.binance.binance__exchange__helper import get_binance_market_websocket_url, \
+    get_binance_user_data_websocket_url, is_binance_conditional_order, parse_binance_ws_kline, parse_binance_ws_order, \
+    parse_binance_ws_positions
+
+
+class Fake_Websocket_App(object):
+    '''
+    Stand-in of websocket.WebSocketApp delivering the queued messages once opened
+    '''
+    messages = []
+
+    def __init__(self, url, on_open, on_message, on_error, on_close, on_ping, on_pong):
+        self.url = url
+        self.on_open = on_open
+        self.on_message = on_message
+        self.on_close = on_close
+        self.on_pong = on_pong
+        self.closed_event = threading.Event()
+
+    def run_forever(self, ping_interval=None):
+        self.on_open(self)
+        for message in self.messages:
+            self.on_message(self, json.dumps(message))
+        self.on_pong(self, b"")
+        self.closed_event.wait()
+        self.on_close(self, None, None)
+
+    def close(self):
+        self.closed_event.set()
+
+
+class Binance_Websocket__TestCases(unittest.TestCase):
+    def test_01__Connect_Deliver_And_Close(self):
+        kline_event = {'e': "kline",
+                       'E': 1672502400123, 's': "ETHUSDT", 'k': {}}
+        Fake_Websocket_App.messages = [
+            {'stream': "ethusdt@kline_1m", 'data': kline_event},
+            {'e': "listenKeyExpired", 'E': 1672502400456},
+        ]
+        events = []
+        heartbeats = []
+        delivered_event = threading.Event()
+
+        def on_message(event):
+            events.append(event)
+            if len(events) == len(Fake_Websocket_App.messages):
+                delivered_event.set()
+
+        binance_websocket = Binance_Websocket("wss://localhost/ws", on_message=on_message,
+                                              on_heartbeat=lambda: heartbeats.append(
+                                                  None),
+                                              websocket_app_factory=Fake_Websocket_App)
+        connected = binance_websocket.connect(timeout=1.0)
+        delivered_event.wait(1.0)
+
+        # Test Assertion
+        self.assertTrue(connected)
+        self.assertTrue(binance_websocket.is_connected())
+        self.assertEqual(events[0], kline_event)
+        self.assertEqual(events[1]['e'], "listenKeyExpired")
+        self.assertGreaterEqual(len(heartbeats), 3)
+
+        binance_websocket.close()
+        binance_websocket.thread.join(1.0)
+
+        # Test Assertion
+        self.assertFalse(binance_websocket.is_connected())
+        self.assertFalse(binance_websocket.thread.is_alive())
+
+    def test_02__Listen_Key_Kept_Alive_Until_Stopped(self):
+        keep_alive_event = threading.Event()
+        binance_listen_key_keeper = Binance_Listen_Key_Keeper(
+            keep_alive_event.set, interval_in_seconds=0.01)
+        binance_listen_key_keeper.start()
+
+        # Test Assertion
+        self.assertTrue(keep_alive_event.wait(1.0))
+
+        binance_listen_key_keeper.stop()
+        binance_listen_key_keeper.thread.join(1.0)
+
+        # Test Assertion
+        self.assertFalse(binance_listen_key_keeper.thread.is_alive())
+
+
+class Binance_Websocket_Helper__TestCases(unittest.TestCase):
+    def test_01__Websocket_Urls(self):
+        get_binance_user_data_websocket_url__dict = dict(
+            market_type=CCXT__MARKET_TYPE__FUTURE,
+            main_net_toggle_switch_value=False,
+            listen_key="abc",
+        )
+        get_binance_market_websocket_url__dict = dict(
+            market_type=CCXT__MARKET_TYPE__SPOT,
+            symbols_id=["ETHUSDT", "BTCUSDT", ],
+        )
+
+        # Test Assertion
+        self.assertEqual(get_binance_user_data_websocket_url(params=get_binance_user_data_websocket_url__dict),
+                         "wss://stream.binancefuture.com/ws/abc")
+        self.assertEqual(get_binance_market_websocket_url(params=get_binance_market_websocket_url__dict),
+                         "wss://stream.binance.com:9443/stream?streams=ethusdt@kline_1m/btcusdt@kline_1m")
+
+    def test_02__Parse_Futures_Order(self):
+        event = {
+            'e': "ORDER_TRADE_UPDATE", 'E': 1672502400123, 'T': 1672502400120,
+            'o': {
+                's': "ETHUSDT", 'c': "client_id", 'S': "BUY", 'o': "STOP_MARKET", 'f': "GTC", 'q': "0.010",
+                'p': "0", 'ap': "1200.5", 'sp': "1200", 'x': "TRADE", 'X': "FILLED", 'i': 8886774, 'z': "0.010",
+                'T': 1672502400120, 'R': False, 'wt': "CONTRACT_PRICE", 'ot': "STOP_MARKET", 'ps': "LONG",
+                'cp': False,
+            },
+        }
+        parse_binance_ws_order__dict = dict(
+            market_type=CCXT__MARKET_TYPE__FUTURE,
+            event=event,
+        )
+        raw_order = parse_binance_ws_order(params=parse_binance_ws_order__dict)
+
+        # Test Assertion
+        self.assertEqual(raw_order['orderId'], "8886774")
+        self.assertEqual(raw_order['status'], "FILLED")
+        self.assertEqual(raw_order['executedQty'], "0.010")
+        self.assertAlmostEqual(float(raw_order['cumQuote']), 12.005)
+        self.assertEqual(raw_order['positionSide'], "LONG")
+        self.assertTrue(is_binance_conditional_order(raw_order))
+
+    def test_03__Parse_Spot_Order(self):
+        event = {
+            'e': "executionReport", 'E': 1672502400123, 's': "ETHUSDT", 'c': "cancel_id", 'S': "SELL",
+            'o': "LIMIT", 'f': "GTC", 'q': "0.5", 'p': "1300.0", 'P': "0.0", 'x': "CANCELED", 'X': "CANCELED",
+            'i': 4293153, 'z': "0.0", 'Z': "0.0", 'T': 1672502400120, 'O': 1672502300000, 'w': False,
+            'C': "client_id",
+        }
+        parse_binance_ws_order__dict = dict(
+            market_type=CCXT__MARKET_TYPE__SPOT,
+            event=event,
+        )
+        raw_order = parse_binance_ws_order(params=parse_binance_ws_order__dict)
+
+        # Test Assertion
+        self.assertEqual(raw_order['orderId'], "4293153")
+        self.assertEqual(raw_order['clientOrderId'], "client_id")
+        self.assertEqual(raw_order['status'], "CANCELED")
+        self.assertFalse(is_binance_conditional_order(raw_order))
+
+    def test_04__Parse_Positions_And_Kline(self):
+        account_update_event = {
+            'e': "ACCOUNT_UPDATE", 'E': 1672502400123, 'T': 1672502400120,
+            'a': {
+                'm': "ORDER", 'B': [],
+                'P': [{'s': "ETHUSDT", 'pa': "0.010", 'ep': "1200.5", 'cr': "0", 'up': "0.1", 'mt': "cross",
+                       'iw': "0", 'ps': "LONG"}],
+            },
+        }
+        positions = parse_binance_ws_positions(account_update_event)
+
+        # Test Assertion
+        self.assertEqual(positions, [dict(symbol="ETHUSDT", positionSide="LONG", positionAmt="0.010",
+                                          entryPrice="1200.5", unrealizedProfit="0.1")])
+
+        kline_event = {
+            'e': "kline", 'E': 1672502400123, 's': "ETHUSDT",
+            'k': {'o': "1200.0", 'h': "1201.0", 'l': "1199.0", 'c': "1200.5", 'v': "10.0"},
+        }
+        (symbol_id, tstamp, ohlcv, ) = parse_binance_ws_kline(kline_event)
+
+        # Test Assertion
+        self.assertEqual(symbol_id, "ETHUSDT")
+        self.assertAlmostEqual(tstamp, 1672502400.123)
+        self.assertEqual(ohlcv, (1200.0, 1201.0, 1199.0, 1200.5, 10.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,345 @@
+import backtrader
+import ccxt
+import copy
+import unittest
+
+from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID, \
+    BINANCE__PARTIALLY_FILLED__ORDER_STATUS__VALUE
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID, \
+    BYBIT__PARTIALLY_FILLED__ORDER_STATUS__VALUE
+from ccxtbt.expansion.bt_ccxt_expansion__helper import construct_standalone_exchange
+from ccxtbt.order.order__classes import CCXT_Order_Normalizer
+from ccxtbt.order.order__specifications import CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT
+from tests.common.test__helper import ut_get_offline_bt_ccxt_account_or_store
+
+
+# Recorded from ccxt, with None and string typed float fields as seen in the unified order structure
+BINANCE__CCXT_ORDERS = [
+    {
+        'info': {'orderId': "8389765590452813491", 'symbol': "ETHUSDT", 'status': "NEW", 'price': "1200.00",
+                 'origQty': "0.010", 'executedQty': "0", 'type': "LIMIT", 'reduceOnly': False, 'side': "BUY",
+                 'stopPrice': "0"},
+        'id': "8389765590452813491", 'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e4e", 'timestamp': 1672502400000,
+        'datetime': "2023-01-01T00:00:00.000Z", 'lastTradeTimestamp': None, 'symbol': "ETH/USDT",
+        'type': "limit", 'timeInForce': "GTC", 'postOnly': False, 'reduceOnly': False, 'side': "buy",
+        'price': 1200.0, 'stopPrice': None, 'triggerPrice': None, 'amount': 0.01, 'cost': 0.0, 'average': None,
+        'filled': 0.0, 'remaining': 0.01, 'status': "open", 'fee': None, 'trades': [], 'fees': [],
+    },
+    {
+        'info': {'orderId': "8389765590452813492", 'symbol': "ETHUSDT", 'status': "FILLED", 'price': "0",
+                 'origQty': "0.010", 'executedQty': "0.010", 'type': "MARKET", 'reduceOnly': True, 'side': "SELL",
+                 'stopPrice': "0"},
+        'id': "8389765590452813492", 'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e4f", 'timestamp': 1672502460000,
+        'datetime': "2023-01-01T00:01:00.000Z", 'lastTradeTimestamp': 1672502460000, 'symbol': "ETH/USDT",
+        'type': "market", 'timeInForce': "GTC", 'postOnly': False, 'reduceOnly': True, 'side': "sell",
+        'price': "1201.50", 'stopPrice': "0", 'triggerPrice': None, 'amount': "0.010", 'cost': 12.015,
+        'average': "1201.50", 'filled': "0.010", 'remaining': "0", 'status': "closed", 'fee': None, 'trades': [],
+        'fees': [],
+    },
+    {
+        'info': {'orderId': "8389765590452813493", 'symbol': "ETHUSDT", 'status': "NEW", 'price': "0",
+                 'origQty': "0.010", 'executedQty': "0", 'type': "STOP_MARKET", 'reduceOnly': True, 'side': "BUY",
+                 'stopPrice': "1300.00"},
+        'id': "8389765590452813493", 'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e50", 'timestamp': 1672502520000,
+        'datetime': "2023-01-01T00:02:00.000Z", 'lastTradeTimestamp': None, 'symbol': "ETH/USDT",
+        'type': "stop_market", 'timeInForce': "GTC", 'postOnly': False, 'reduceOnly': True, 'side': "buy",
+        'price': None, 'stopPrice': 1300.0, 'triggerPrice': 1300.0, 'amount': 0.01, 'cost': 0.0, 'average': None,
+        'filled': 0.0, 'remaining': 0.01, 'status': "canceled", 'fee': None, 'trades': [], 'fees': [],
+    },
+    {
+        'info': {'orderId': "8389765590452813494", 'symbol': "ETHUSDT", 'status': "PARTIALLY_FILLED",
+                 'price': "1195.00", 'origQty': "0.020", 'executedQty': "0.005", 'type': "STOP",
+                 'reduceOnly': False, 'side': "SELL", 'stopPrice': "1196.00"},
+        'id': "8389765590452813494", 'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e51", 'timestamp': 1672502580000,
+        'datetime': "2023-01-01T00:03:00.000Z", 'lastTradeTimestamp': 1672502590000, 'symbol': "ETH/USDT",
+        'type': "stop", 'timeInForce': "GTC", 'postOnly': False, 'reduceOnly': False, 'side': "sell",
+        'price': 1195.0, 'stopPrice': "1196.00", 'triggerPrice': "1196.00", 'amount': 0.02, 'cost': 5.975,
+        'average': 1195.0, 'filled': 0.005, 'remaining': 0.015,
+        'status': BINANCE__PARTIALLY_FILLED__ORDER_STATUS__VALUE, 'fee': None, 'trades': [], 'fees': [],
+    },
+]
+
+BYBIT__CCXT_ORDERS = [
+    {
+        'info': {'order_id': "b3b4bcd9-0c7e-4f6c-9d4e-6a5e0f1a2b3c", 'symbol': "ETHUSDT", 'side': "Buy",
+                 'order_type': "Limit", 'price': "1200", 'qty': "0.01", 'order_status': "New",
+                 'reduce_only': False, 'close_on_trigger': False},
+        'id': "b3b4bcd9-0c7e-4f6c-9d4e-6a5e0f1a2b3c", 'clientOrderId': None, 'timestamp': 1672502400000,
+        'datetime': "2023-01-01T00:00:00.000Z", 'lastTradeTimestamp': None, 'symbol': "ETH/USDT:USDT",
+        'type': "limit", 'timeInForce': "GTC", 'postOnly': False, 'side': "buy", 'price': 1200.0,
+        'stopPrice': None, 'triggerPrice': None, 'amount': 0.01, 'cost': 0.0, 'average': None, 'filled': 0.0,
+        'remaining': 0.01, 'status': "open", 'fee': None, 'trades': [], 'fees': [],
+    },
+    {
+        'info': {'order_id': "c4c5cde0-1d8f-4a7d-8e5f-7b6f1a2b3c4d", 'symbol': "ETHUSDT", 'side': "Sell",
+                 'order_type': "Market", 'price': "1140.5", 'qty': "0.01", 'order_status': "Filled",
+                 'reduce_only': True, 'close_on_trigger': True},
+        'id': "c4c5cde0-1d8f-4a7d-8e5f-7b6f1a2b3c4d", 'clientOrderId': None, 'timestamp': 1672502460000,
+        'datetime': "2023-01-01T00:01:00.000Z", 'lastTradeTimestamp': 1672502460000, 'symbol': "ETH/USDT:USDT",
+        'type': "market", 'timeInForce': "IOC", 'postOnly': False, 'side': "sell", 'price': "1140.5",
+        'stopPrice': "0", 'triggerPrice': None, 'amount': "0.01", 'cost': "11.99", 'average': "1199.0",
+        'filled': "0.01", 'remaining': "0", 'status': "closed", 'fee': None, 'trades': [], 'fees': [],
+    },
+    {
+        'info': {'stop_order_id': "d5d6def1-2e9a-4b8e-9f6a-8c7a2b3c4d5e", 'symbol': "ETHUSDT", 'side': "Buy",
+                 'order_type': "Market", 'price': "0", 'qty': "0.01", 'order_status': "Untriggered",
+                 'reduce_only': True, 'close_on_trigger': True, 'trigger_price': "1300"},
+        'id': "d5d6def1-2e9a-4b8e-9f6a-8c7a2b3c4d5e", 'clientOrderId': None, 'timestamp': 1672502520000,
+        'datetime': "2023-01-01T00:02:00.000Z", 'lastTradeTimestamp': None, 'symbol': "ETH/USDT:USDT",
+        'type': "market", 'timeInForce': "IOC", 'postOnly': False, 'side': "buy", 'price': None,
+        'stopPrice': "1300", 'triggerPrice': "1300", 'amount': 0.01, 'cost': None, 'average': None,
+        'filled': None, 'remaining': None, 'status': "open", 'fee': None, 'trades': [], 'fees': [],
+    },
+    {
+        'info': {'order_id': "e6e7ef02-3fab-4c9f-8a7b-9d8b3c4d5e6f", 'symbol': "ETHUSDT", 'side': "Sell",
+                 'order_type': "Limit", 'price': "1250", 'qty': "0.02", 'order_status': "PartiallyFilled",
+                 'reduce_only': False, 'close_on_trigger': False},
+        'id': "e6e7ef02-3fab-4c9f-8a7b-9d8b3c4d5e6f", 'clientOrderId': None, 'timestamp': 1672502580000,
+        'datetime': "2023-01-01T00:03:00.000Z", 'lastTradeTimestamp': 1672502590000, 'symbol': "ETH/USDT:USDT",
+        'type': "limit", 'timeInForce': "GTC", 'postOnly': False, 'side': "sell", 'price': 1250.0,
+        'stopPrice': 0.0, 'triggerPrice': None, 'amount': 0.02, 'cost': 6.25, 'average': 1250.0, 'filled': 0.005,
+        'remaining': 0.015, 'status': BYBIT__PARTIALLY_FILLED__ORDER_STATUS__VALUE, 'fee': None, 'trades': [],
+        'fees': [],
+    },
+    {
+        'info': {'order_id': "f7f8f013-4abc-4dab-9b8c-ae9c4d5e6f70", 'symbol': "ETHUSDT", 'side': "Buy",
+                 'order_type': "Limit", 'price': "1100", 'qty': "0.01", 'order_status': "Rejected",
+                 'reduce_only': False, 'close_on_trigger': False},
+        'id': "f7f8f013-4abc-4dab-9b8c-ae9c4d5e6f70", 'clientOrderId': None, 'timestamp': 1672502640000,
+        'datetime': "2023-01-01T00:04:00.000Z", 'lastTradeTimestamp': None, 'symbol': "ETH/USDT:USDT",
+        'type': "limit", 'timeInForce': "GTC", 'postOnly': False, 'side': "buy", 'price': "1100",
+        'stopPrice': None, 'triggerPrice': None, 'amount': "0.01", 'cost': None, 'average': None, 'filled': None,
+        'remaining': None, 'status': "rejected", 'fee': None, 'trades': [], 'fees': [],
+    },
+]
+
+
+# Recorded from post_process__ccxt_orders of the release prior to CCXT_Order_Normalizer
+EXPECTED__BINANCE__CCXT_ORDERS = [
+    {
+        'info': BINANCE__CCXT_ORDERS[0]['info'], 'id': "8389765590452813491",
+        'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e4e", 'timestamp': 1672502400000,
+        'datetime': "2023-01-01T00:00:00.000Z", 'lastTradeTimestamp': None, 'symbol_name': "ETH/USDT",
+        'type_name': "limit", 'timeInForce': "GTC", 'postOnly': False, 'reduce_only': False, 'side_name': "Buy",
+        'price': 1200.0, 'stopPrice': 0.0, 'triggerPrice': None, 'amount': 0.01, 'cost': 0.0, 'average': 0.0,
+        'filled': 0.0, 'remaining': 0.01, 'ccxt_status': "open", 'fee': None, 'trades': [], 'fees': [],
+        'symbol_id': "ETHUSDT", 'side': backtrader.Order.Buy,
+        'ordering_type': backtrader.Order.ACTIVE_ORDERING_TYPE, 'ordering_type_name': "Active",
+        'execution_type': backtrader.Order.Limit, 'execution_type_name': "Limit",
+        'order_intent': backtrader.Order.Entry_Order, 'order_intent_name': "Entry",
+        'position_type': backtrader.Position.LONG_POSITION, 'position_type_name': "Long",
+        'status': backtrader.Order.Accepted, 'status_name': "Accepted",
+    },
+    {
+        'info': BINANCE__CCXT_ORDERS[1]['info'], 'id': "8389765590452813492",
+        'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e4f", 'timestamp': 1672502460000,
+        'datetime': "2023-01-01T00:01:00.000Z", 'lastTradeTimestamp': 1672502460000, 'symbol_name': "ETH/USDT",
+        'type_name': "market", 'timeInForce': "GTC", 'postOnly': False, 'reduce_only': True, 'side_name': "Sell",
+        'price': 1201.5, 'stopPrice': 0.0, 'triggerPrice': None, 'amount': 0.01, 'cost': 12.015, 'average': 1201.5,
+        'filled': 0.01, 'remaining': 0.0, 'ccxt_status': "closed", 'fee': None, 'trades': [], 'fees': [],
+        'symbol_id': "ETHUSDT", 'side': backtrader.Order.Sell,
+        'ordering_type': backtrader.Order.ACTIVE_ORDERING_TYPE, 'ordering_type_name': "Active",
+        'execution_type': backtrader.Order.Market, 'execution_type_name': "Market",
+        'order_intent': backtrader.Order.Exit_Order, 'order_intent_name': "Exit",
+        'position_type': backtrader.Position.LONG_POSITION, 'position_type_name': "Long",
+        'status': backtrader.Order.Completed, 'status_name': "Completed",
+    },
+    {
+        'info': BINANCE__CCXT_ORDERS[2]['info'], 'id': "8389765590452813493",
+        'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e50", 'timestamp': 1672502520000,
+        'datetime': "2023-01-01T00:02:00.000Z", 'lastTradeTimestamp': None, 'symbol_name': "ETH/USDT",
+        'type_name': "stop_market", 'timeInForce': "GTC", 'postOnly': False, 'reduce_only': True,
+        'side_name': "Buy", 'price': 0.0, 'stopPrice': 1300.0, 'triggerPrice': 1300.0, 'amount': 0.01, 'cost': 0.0,
+        'average': 0.0, 'filled': 0.0, 'remaining': 0.01, 'ccxt_status': "canceled", 'fee': None, 'trades': [],
+        'fees': [], 'symbol_id': "ETHUSDT", 'side': backtrader.Order.Buy,
+        'ordering_type': backtrader.Order.CONDITIONAL_ORDERING_TYPE, 'ordering_type_name': "Conditional",
+        'execution_type': backtrader.Order.StopMarket, 'execution_type_name': "StopMarket",
+        'order_intent': backtrader.Order.Exit_Order, 'order_intent_name': "Exit",
+        'position_type': backtrader.Position.SHORT_POSITION, 'position_type_name': "Short",
+        'status': backtrader.Order.Canceled, 'status_name': "Canceled",
+    },
+    {
+        'info': BINANCE__CCXT_ORDERS[3]['info'], 'id': "8389765590452813494",
+        'clientOrderId': "x-xcKtGhcu1b0f8c6e6c4e4e51", 'timestamp': 1672502580000,
+        'datetime': "2023-01-01T00:03:00.000Z", 'lastTradeTimestamp': 1672502590000, 'symbol_name': "ETH/USDT",
+        'type_name': "stop", 'timeInForce': "GTC", 'postOnly': False, 'reduce_only': False, 'side_name': "Sell",
+        'price': 1195.0, 'stopPrice': 1196.0, 'triggerPrice': "1196.00", 'amount': 0.02, 'cost': 5.975,
+        'average': 1195.0, 'filled': 0.005, 'remaining': 0.015,
+        'ccxt_status': BINANCE__PARTIALLY_FILLED__ORDER_STATUS__VALUE, 'fee': None, 'trades': [], 'fees': [],
+        'symbol_id': "ETHUSDT", 'side': backtrader.Order.Sell,
+        'ordering_type': backtrader.Order.CONDITIONAL_ORDERING_TYPE, 'ordering_type_name': "Conditional",
+        'execution_type': backtrader.Order.StopLimit, 'execution_type_name': "StopLimit",
+        'order_intent': backtrader.Order.Entry_Order, 'order_intent_name': "Entry",
+        'position_type': backtrader.Position.SHORT_POSITION, 'position_type_name': "Short",
+        'status': backtrader.Order.Partial, 'status_name': "Partial",
+    },
+]
+
+EXPECTED__BYBIT__CCXT_ORDERS = [
+    {
+        'info': BYBIT__CCXT_ORDERS[0]['info'], 'id': "b3b4bcd9-0c7e-4f6c-9d4e-6a5e0f1a2b3c", 'clientOrderId': None,
+        'timestamp': 1672502400000, 'datetime': "2023-01-01T00:00:00.000Z", 'lastTradeTimestamp': None,
+        'symbol_name': "ETH/USDT:USDT", 'type_name': "limit", 'timeInForce': "GTC", 'postOnly': False,
+        'side_name': "Buy", 'price': 1200.0, 'stopPrice': 0.0, 'triggerPrice': None, 'amount': 0.01, 'cost': 0.0,
+        'average': 0.0, 'filled': 0.0, 'remaining': 0.01, 'ccxt_status': "open", 'fee': None, 'trades': [],
+        'fees': [], 'symbol_id': "ETHUSDT", 'side': backtrader.Order.Buy, 'reduce_only': False,
+        'ordering_type': backtrader.Order.ACTIVE_ORDERING_TYPE, 'ordering_type_name': "Active",
+        'execution_type': backtrader.Order.Limit, 'execution_type_name': "Limit",
+        'order_intent': backtrader.Order.Entry_Order, 'order_intent_name': "Entry",
+        'position_type': backtrader.Position.LONG_POSITION, 'position_type_name': "Long",
+        'status': backtrader.Order.Accepted, 'status_name': "Accepted",
+    },
+    {
+        'info': BYBIT__CCXT_ORDERS[1]['info'], 'id': "c4c5cde0-1d8f-4a7d-8e5f-7b6f1a2b3c4d", 'clientOrderId': None,
+        'timestamp': 1672502460000, 'datetime': "2023-01-01T00:01:00.000Z", 'lastTradeTimestamp': 1672502460000,
+        'symbol_name': "ETH/USDT:USDT", 'type_name': "market", 'timeInForce': "IOC", 'postOnly': False,
+        'side_name': "Sell", 'price': 1140.5, 'stopPrice': 0.0, 'triggerPrice': None, 'amount': 0.01,
+        'cost': "11.99", 'average': 1199.0, 'filled': 0.01, 'remaining': 0.0, 'ccxt_status': "closed", 'fee': None,
+        'trades': [], 'fees': [], 'symbol_id': "ETHUSDT", 'side': backtrader.Order.Sell, 'reduce_only': True,
+        'ordering_type': backtrader.Order.ACTIVE_ORDERING_TYPE, 'ordering_type_name': "Active",
+        'execution_type': backtrader.Order.Market, 'execution_type_name': "Market",
+        'order_intent': backtrader.Order.Exit_Order, 'order_intent_name': "Exit",
+        'position_type': backtrader.Position.LONG_POSITION, 'position_type_name': "Long",
+        'status': backtrader.Order.Completed, 'status_name': "Completed",
+    },
+    {
+        'info': BYBIT__CCXT_ORDERS[2]['info'], 'id': "d5d6def1-2e9a-4b8e-9f6a-8c7a2b3c4d5e", 'clientOrderId': None,
+        'timestamp': 1672502520000, 'datetime': "2023-01-01T00:02:00.000Z", 'lastTradeTimestamp': None,
+        'symbol_name': "ETH/USDT:USDT", 'type_name': "market", 'timeInForce': "IOC", 'postOnly': False,
+        'side_name': "Buy", 'price': 0.0, 'stopPrice': 1300.0, 'triggerPrice': "1300", 'amount': 0.01, 'cost': None,
+        'average': 0.0, 'filled': 0.0, 'remaining': 0.0, 'ccxt_status': "open", 'fee': None, 'trades': [],
+        'fees': [], 'symbol_id': "ETHUSDT", 'side': backtrader.Order.Buy, 'reduce_only': True,
+        'ordering_type': backtrader.Order.CONDITIONAL_ORDERING_TYPE, 'ordering_type_name': "Conditional",
+        'execution_type': backtrader.Order.Market, 'execution_type_name': "Market",
+        'order_intent': backtrader.Order.Exit_Order, 'order_intent_name': "Exit",
+        'position_type': backtrader.Position.SHORT_POSITION, 'position_type_name': "Short",
+        'status': backtrader.Order.Accepted, 'status_name': "Accepted",
+    },
+    {
+        'info': BYBIT__CCXT_ORDERS[3]['info'], 'id': "e6e7ef02-3fab-4c9f-8a7b-9d8b3c4d5e6f", 'clientOrderId': None,
+        'timestamp': 1672502580000, 'datetime': "2023-01-01T00:03:00.000Z", 'lastTradeTimestamp': 1672502590000,
+        'symbol_name': "ETH/USDT:USDT", 'type_name': "limit", 'timeInForce': "GTC", 'postOnly': False,
+        'side_name': "Sell", 'price': 1250.0, 'stopPrice': 0.0, 'triggerPrice': None, 'amount': 0.02, 'cost': 6.25,
+        'average': 1250.0, 'filled': 0.005, 'remaining': 0.015,
+        'ccxt_status': BYBIT__PARTIALLY_FILLED__ORDER_STATUS__VALUE, 'fee': None, 'trades': [], 'fees': [],
+        'symbol_id': "ETHUSDT", 'side': backtrader.Order.Sell, 'reduce_only': False,
+        'ordering_type': backtrader.Order.ACTIVE_ORDERING_TYPE, 'ordering_type_name': "Active",
+        'execution_type': backtrader.Order.Limit, 'execution_type_name': "Limit",
+        'order_intent': backtrader.Order.Entry_Order, 'order_intent_name': "Entry",
+        'position_type': backtrader.Position.SHORT_POSITION, 'position_type_name': "Short",
+        'status': backtrader.Order.Partial, 'status_name': "Partial",
+    },
+    {
+        'info': BYBIT__CCXT_ORDERS[4]['info'], 'id': "f7f8f013-4abc-4dab-9b8c-ae9c4d5e6f70", 'clientOrderId': None,
+        'timestamp': 1672502640000, 'datetime': "2023-01-01T00:04:00.000Z", 'lastTradeTimestamp': None,
+        'symbol_name': "ETH/USDT:USDT", 'type_name': "limit", 'timeInForce': "GTC", 'postOnly': False,
+        'side_name': "Buy", 'price': 1100.0, 'stopPrice': 0.0, 'triggerPrice': None, 'amount': 0.01, 'cost': None,
+        'average': 0.0, 'filled': 0.0, 'remaining': 0.0, 'ccxt_status': "rejected", 'fee': None, 'trades': [],
+        'fees': [], 'symbol_id': "ETHUSDT", 'side': backtrader.Order.Buy, 'reduce_only': False,
+        'ordering_type': backtrader.Order.ACTIVE_ORDERING_TYPE, 'ordering_type_name': "Active",
+        'execution_type': backtrader.Order.Limit, 'execution_type_name': "Limit",
+        'order_intent': backtrader.Order.Entry_Order, 'order_intent_name': "Entry",
+        'position_type': backtrader.Position.LONG_POSITION, 'position_type_name': "Long",
+        'status': backtrader.Order.Rejected, 'status_name': "Rejected",
+    },
+]
+
+
+class CCXT_Order_Normalizer__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.recorded__ccxt_orders = {
+            BINANCE_EXCHANGE_ID: (ccxt.binanceusdm, BINANCE__CCXT_ORDERS, EXPECTED__BINANCE__CCXT_ORDERS, ),
+            BYBIT_EXCHANGE_ID: (ccxt.bybit, BYBIT__CCXT_ORDERS, EXPECTED__BYBIT__CCXT_ORDERS, ),
+        }
+
+    def test_01__Same_Output_As_Recorded(self):
+        for exchange_dropdown_value, (exchange_constructor, ccxt_orders, expected__ccxt_orders, ) in \
+                self.recorded__ccxt_orders.items():
+            with self.subTest(exchange_dropdown_value=exchange_dropdown_value):
+                construct_standalone_exchange__dict = dict(
+                    exchange_dropdown_value=exchange_dropdown_value,
+                    ut_disable_singleton=True,
+                )
+                bt_ccxt_exchange = construct_standalone_exchange(
+                    params=construct_standalone_exchange__dict)
+
+                ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+                    exchange=exchange_constructor(dict()),
+                    exchange_dropdown_value=exchange_dropdown_value,
+                )
+                bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+                    params=ut_get_offline_bt_ccxt_account_or_store__dict)
+                bt_ccxt_account_or_store.parent = bt_ccxt_exchange
+
+                post_process__ccxt_orders__dict = dict(
+                    bt_ccxt_exchange=bt_ccxt_exchange,
+                    bt_ccxt_account_or_store=bt_ccxt_account_or_store,
+                    ccxt_orders=copy.deepcopy(ccxt_orders),
+                )
+                observed__ccxt_orders = bt_ccxt_account_or_store.post_process__ccxt_orders(
+                    params=post_process__ccxt_orders__dict)
+
+                # Test Assertion
+                self.assertIsInstance(
+                    bt_ccxt_account_or_store.ccxt_order_normalizer, CCXT_Order_Normalizer)
+                self.assertEqual(len(observed__ccxt_orders),
+                                 len(expected__ccxt_orders))
+                for observed__ccxt_order, expected__ccxt_order in zip(observed__ccxt_orders, expected__ccxt_orders):
+                    # Key order matters as well since the orders are persisted and printed as is
+                    self.assertEqual(list(observed__ccxt_order.items()), list(
+                        expected__ccxt_order.items()))
+                    for key in CCXT_ORDER_KEYS__MUST_BE_IN_FLOAT:
+                        self.assertIsInstance(observed__ccxt_order[key], float)
+
+    def test_02__Input_Orders_Left_Untouched(self):
+        construct_standalone_exchange__dict = dict(
+            exchange_dropdown_value=BINANCE_EXCHANGE_ID,
+            ut_disable_singleton=True,
+        )
+        bt_ccxt_exchange = construct_standalone_exchange(
+            params=construct_standalone_exchange__dict)
+
+        ccxt_order_normalizer__dict = dict(
+            exchange_dropdown_value=BINANCE_EXCHANGE_ID,
+            order_types=bt_ccxt_exchange.order_types,
+            mappings=bt_ccxt_exchange.mappings,
+        )
+        ccxt_order_normalizer = CCXT_Order_Normalizer(
+            params=ccxt_order_normalizer__dict)
+        ccxt_orders = copy.deepcopy(BINANCE__CCXT_ORDERS)
+        ccxt_order_normalizer.normalize_all(ccxt_orders)
+
+        # Test Assertion
+        self.assertEqual(ccxt_orders, BINANCE__CCXT_ORDERS)
+
+    def test_03__Non_Numeric_Or_Missing_Float_Fields(self):
+        construct_standalone_exchange__dict = dict(
+            exchange_dropdown_value=BYBIT_EXCHANGE_ID,
+            ut_disable_singleton=True,
+        )
+        bt_ccxt_exchange = construct_standalone_exchange(
+            params=construct_standalone_exchange__dict)
+
+        ccxt_order_normalizer__dict = dict(
+            exchange_dropdown_value=BYBIT_EXCHANGE_ID,
+            order_types=bt_ccxt_exchange.order_types,
+            mappings=bt_ccxt_exchange.mappings,
+        )
+        ccxt_order_normalizer = CCXT_Order_Normalizer(
+            params=ccxt_order_normalizer__dict)
+        ccxt_order = copy.deepcopy(BYBIT__CCXT_ORDERS[0])
+        ccxt_order['average'] = ""
+        ccxt_order['filled'] = "n/a"
+        del ccxt_order['remaining']
+
+        normalized_ccxt_order = ccxt_order_normalizer.normalize(ccxt_order)
+
+        # Test Assertion: same as exchange.safe_float instead of raising ValueError
+        self.assertIsNone(normalized_ccxt_order['average'])
+        self.assertIsNone(normalized_ccxt_order['filled'])
+        self.assertNotIn('remaining', normalized_ccxt_order.keys())
+        self.assertEqual(normalized_ccxt_order['price'], 1200.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
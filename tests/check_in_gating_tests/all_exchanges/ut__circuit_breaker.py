@@ -0,0 +1,104 @@
+import unittest
+
+from time import sleep
+
+from ccxtbt.circuit_breaker.circuit_breaker__classes import Circuit_Breaker, Circuit_Breaker_Open_Error
+from ccxtbt.circuit_breaker.circuit_breaker__helper import get_backoff_delay_in_seconds
+from ccxtbt.circuit_breaker.circuit_breaker__specifications import CLOSED_STATE, HALF_OPEN_STATE, OPEN_STATE
+from ccxtbt.exchange_or_broker.binance.binance__exchange__specifications import BINANCE_EXCHANGE_ID
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
+from ccxtbt.exchange_or_broker.exchange__helper import classify_exchange_error
+from ccxtbt.exchange_or_broker.exchange__specifications import BREAK_ACTION, RAISE_ACTION, \
+    RETRY_WITH_BACKOFF_ACTION
+
+
+class Circuit_Breaker__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.failure_threshold = 3
+        self.reset_timeout_in_seconds = 0.2
+        self.circuit_breaker = Circuit_Breaker(name="api-testnet.bybit.com/_fetch_order_from_exchange",
+                                               failure_threshold=self.failure_threshold,
+                                               reset_timeout_in_seconds=self.reset_timeout_in_seconds)
+
+    def test_01__Opens_After_Consecutive_Failures(self):
+        for _ in range(self.failure_threshold - 1):
+            self.circuit_breaker.record_failure()
+
+        # Test Assertion
+        self.assertEqual(self.circuit_breaker.get_state(), CLOSED_STATE)
+
+        self.circuit_breaker.record_failure()
+
+        # Test Assertion
+        self.assertEqual(self.circuit_breaker.get_state(), OPEN_STATE)
+        self.assertRaises(Circuit_Breaker_Open_Error,
+                          self.circuit_breaker.raise_if_open)
+
+    def test_02__Single_Probe_After_Reset_Timeout(self):
+        for _ in range(self.failure_threshold):
+            self.circuit_breaker.record_failure()
+        sleep(self.reset_timeout_in_seconds)
+
+        # Test Assertion
+        self.assertTrue(self.circuit_breaker.allow_request())
+        self.assertEqual(self.circuit_breaker.get_state(), HALF_OPEN_STATE)
+        self.assertFalse(self.circuit_breaker.allow_request())
+
+        # Failed probe re-opens the breaker
+        self.circuit_breaker.record_failure()
+
+        # Test Assertion
+        self.assertEqual(self.circuit_breaker.get_state(), OPEN_STATE)
+
+        sleep(self.reset_timeout_in_seconds)
+        self.assertTrue(self.circuit_breaker.allow_request())
+
+        # Successful probe closes the breaker
+        self.circuit_breaker.record_success()
+
+        # Test Assertion
+        self.assertEqual(self.circuit_breaker.get_state(), CLOSED_STATE)
+        self.assertTrue(self.circuit_breaker.allow_request())
+
+    def test_03__Backoff_With_Jitter_Is_Capped(self):
+        cap_in_seconds = 1.0
+        for attempt in range(20):
+            get_backoff_delay_in_seconds__dict = dict(
+                attempt=attempt,
+                base_in_seconds=0.1,
+                cap_in_seconds=cap_in_seconds,
+            )
+            backoff_delay_in_seconds = get_backoff_delay_in_seconds(
+                params=get_backoff_delay_in_seconds__dict)
+
+            # Test Assertion
+            self.assertGreaterEqual(backoff_delay_in_seconds, 0.0)
+            self.assertLessEqual(backoff_delay_in_seconds, min(
+                cap_in_seconds, 0.1 * (2 ** attempt)))
+
+    def test_04__Classify_Exchange_Error(self):
+        exchange_errors = [
+            (BYBIT_EXCHANGE_ID,
+             'bybit {"ret_code":130074,"ret_msg":"expect Rising"}', RAISE_ACTION, 130074, ),
+            (BYBIT_EXCHANGE_ID,
+             'bybit {"retCode":20001,"retMsg":"order not exists"}', BREAK_ACTION, 20001, ),
+            (BINANCE_EXCHANGE_ID,
+             'binance {"code":-2011,"msg":"Unknown order sent."}', BREAK_ACTION, -2011, ),
+            (BYBIT_EXCHANGE_ID, 'bybit GET https://api-testnet.bybit.com 502 Bad Gateway', RETRY_WITH_BACKOFF_ACTION,
+             None, ),
+        ]
+        for (exchange_dropdown_value, error_string, expected_action, expected_error_code, ) in exchange_errors:
+            classify_exchange_error__dict = dict(
+                exchange_dropdown_value=exchange_dropdown_value,
+                exchange_error=Exception(error_string),
+            )
+            (action, error_code, _, ) = classify_exchange_error(
+                params=classify_exchange_error__dict)
+
+            # Test Assertion
+            self.assertEqual(action, expected_action)
+            self.assertEqual(error_code, expected_error_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import random
+import threading
+import unittest
+
+from time import sleep
+from time import time as timer
+
+from ccxtbt.parallel_processing.parallel_processing__classes import Crash_Recovery_Coordinator
+
+
+class Fake_Instrument(object):
+    def __init__(self, symbol_id):
+        self.symbol_id = symbol_id
+
+
+class Fake_Rate_Limiter(object):
+    capacity = 4
+
+
+class Fake_Account_or_Store(object):
+    '''
+    Mimic the recovery API of BT_CCXT_Account_or_Store with a random network latency per symbol
+    '''
+
+    def __init__(self, account_alias, symbols_id, applied_plans, latency_in_seconds=0.2, failed_symbols_id=()):
+        self.account_alias = account_alias
+        self.failed_symbols_id = failed_symbols_id
+        self.rate_limiter = Fake_Rate_Limiter()
+        self.pending_recovery__instruments = [
+            Fake_Instrument(symbol_id) for symbol_id in symbols_id]
+        self.applied_plans = applied_plans
+        self.latency_in_seconds = latency_in_seconds
+        self.next_calls = 0
+        self.apply_threads = set()
+
+    def pop_pending_recovery__instruments(self):
+        instruments = self.pending_recovery__instruments
+        self.pending_recovery__instruments = []
+        return instruments
+
+    def push_back_pending_recovery__instruments(self, instruments):
+        self.pending_recovery__instruments = instruments + \
+            self.pending_recovery__instruments
+
+    def fetch_recovery_plan(self, instrument):
+        sleep(random.uniform(0.5, 1.0) * self.latency_in_seconds)
+        if instrument.symbol_id in self.failed_symbols_id:
+            raise ConnectionError(instrument.symbol_id)
+        return dict(symbol_id=instrument.symbol_id)
+
+    def apply_recovery_plan(self, recovery_plan, call_next=True):
+        self.apply_threads.add(threading.get_ident())
+        self.applied_plans.append(
+            (self.account_alias, recovery_plan['symbol_id'], ))
+        return True
+
+    def next(self, ut_provided__new_ccxt_order=None):
+        self.next_calls += 1
+
+
+class Crash_Recovery_Coordinator__TestCases(unittest.TestCase):
+    def test_01__Recover_Concurrently_And_Apply_In_Deterministic_Order(self):
+        applied_plans = []
+        accounts_or_stores = [
+            Fake_Account_or_Store(
+                "Main", ["ETHUSDT", "BTCUSDT", "XRPUSDT", "SOLUSDT"], applied_plans),
+            Fake_Account_or_Store(
+                "Sub", ["ETHUSDT", "BTCUSDT", "XRPUSDT", "SOLUSDT"], applied_plans),
+        ]
+
+        start = timer()
+        fetch_timings = Crash_Recovery_Coordinator(
+            accounts_or_stores).recover()
+        elapsed = timer() - start
+
+        # Test Assertion
+        self.assertEqual(len(fetch_timings), 8)
+        self.assertLess(elapsed, 8 * 0.2 / 2)
+        self.assertEqual(applied_plans, [
+            ("Main", "ETHUSDT"), ("Main", "BTCUSDT"), ("Main",
+                                                       "XRPUSDT"), ("Main", "SOLUSDT"),
+            ("Sub", "ETHUSDT"), ("Sub", "BTCUSDT"), ("Sub",
+                                                     "XRPUSDT"), ("Sub", "SOLUSDT"),
+        ])
+        for account_or_store in accounts_or_stores:
+            self.assertEqual(account_or_store.next_calls, 1)
+            self.assertEqual(account_or_store.apply_threads,
+                             {threading.get_ident()})
+
+    def test_02__Nothing_To_Recover(self):
+        account_or_store = Fake_Account_or_Store("Main", [], [])
+
+        # Test Assertion
+        self.assertEqual(Crash_Recovery_Coordinator(
+            [account_or_store]).recover(), {})
+        self.assertEqual(account_or_store.next_calls, 0)
+
+    def test_03__Pending_Instruments_Are_Recovered_Once(self):
+        applied_plans = []
+        account_or_store = Fake_Account_or_Store(
+            "Main", ["ETHUSDT"], applied_plans, latency_in_seconds=0.0)
+        crash_recovery_coordinator = Crash_Recovery_Coordinator(
+            [account_or_store])
+        crash_recovery_coordinator.recover()
+        crash_recovery_coordinator.recover()
+
+        # Test Assertion
+        self.assertEqual(applied_plans, [("Main", "ETHUSDT")])
+
+    def test_04__Failed_Instruments_Pushed_Back_While_Others_Applied(self):
+        applied_plans = []
+        account_or_store = Fake_Account_or_Store(
+            "Main", ["ETHUSDT", "BTCUSDT", "XRPUSDT"], applied_plans, latency_in_seconds=0.0,
+            failed_symbols_id=("BTCUSDT", ))
+        crash_recovery_coordinator = Crash_Recovery_Coordinator(
+            [account_or_store])
+
+        # Test Assertion
+        with self.assertRaises(ConnectionError):
+            crash_recovery_coordinator.recover()
+        self.assertEqual(applied_plans, [
+                         ("Main", "ETHUSDT"), ("Main", "XRPUSDT")])
+        self.assertEqual(account_or_store.next_calls, 1)
+        self.assertEqual([instrument.symbol_id for instrument in account_or_store.pending_recovery__instruments],
+                         ["BTCUSDT"])
+
+        # The exchange is reachable again
+        account_or_store.failed_symbols_id = ()
+        fetch_timings = crash_recovery_coordinator.recover()
+
+        # Test Assertion
+        self.assertEqual(list(fetch_timings.keys()), [("Main", "BTCUSDT")])
+        self.assertEqual(applied_plans, [
+                         ("Main", "ETHUSDT"), ("Main", "XRPUSDT"), ("Main", "BTCUSDT")])
+
+
+if __name__ == '__main__':
+    unittest.main()
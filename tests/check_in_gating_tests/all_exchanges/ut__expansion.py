@@ -0,0 +1,122 @@
+import collections
+import threading
+import unittest
+
+from time import sleep
+from time import time as timer
+from unittest.mock import patch
+
+from ccxtbt.expansion.bt_ccxt_expansion__helper import construct_standalone_instruments
+from ccxtbt.expansion.bt_ccxt_expansion__specifications import COMMISSION_RATE_STAGE, INSTRUMENT_BOOTSTRAP_STAGES, \
+    PERSISTED_ORDERS_STAGE, RISK_LIMIT_STAGE, SYMBOL_STATIC_INFO_AND_POSITIONS_STAGE
+from ccxtbt.instrument.instrument__classes import BT_CCXT_Instrument
+from tests.common.test__helper import ut_get_offline_bt_ccxt_account_or_store
+
+
+class FAKE_CCXT_EXCHANGE(object):
+    apiKey = "ut"
+
+
+class Stage_Recorder(object):
+    '''
+    Record the start and end time of every stage per symbol with a fixed network latency per stage
+    '''
+
+    def __init__(self, latency_in_seconds=0.2):
+        self.latency_in_seconds = latency_in_seconds
+        self.lock = threading.Lock()
+        self.stages = collections.defaultdict(list)
+
+    def record(self, symbol_id, stage, latency_in_seconds=None):
+        if latency_in_seconds is None:
+            latency_in_seconds = self.latency_in_seconds
+
+        start = timer()
+        sleep(latency_in_seconds)
+        with self.lock:
+            self.stages[symbol_id].append((stage, start, timer(), ))
+
+
+class Expansion__Construct_Standalone_Instruments__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.symbols_id = ["ETHUSDT", "BTCUSDT", "SOLUSDT", "XRPUSDT", ]
+        ut_get_offline_bt_ccxt_account_or_store__dict = dict(
+            exchange=FAKE_CCXT_EXCHANGE(),
+            symbols_id=self.symbols_id,
+        )
+        self.bt_ccxt_account_or_store = ut_get_offline_bt_ccxt_account_or_store(
+            params=ut_get_offline_bt_ccxt_account_or_store__dict)
+        self.stage_recorder = Stage_Recorder()
+
+    def test_01__Stages_In_Order_Per_Symbol_And_Overlap_Across_Symbols(self):
+        stage_recorder = self.stage_recorder
+
+        def set__parent(instrument, owner):
+            instrument.parent = owner
+            stage_recorder.record(
+                instrument.symbol_id, SYMBOL_STATIC_INFO_AND_POSITIONS_STAGE)
+
+        def get_standalone_commission_rate(params):
+            stage_recorder.record(params['symbol_id'], COMMISSION_RATE_STAGE)
+            return 0.0006
+
+        def add_commission_info(instrument, commission_info):
+            stage_recorder.record(instrument.symbol_id, RISK_LIMIT_STAGE)
+
+        def add__instrument(instrument):
+            stage_recorder.record(
+                instrument.symbol_id, PERSISTED_ORDERS_STAGE, latency_in_seconds=0.0)
+
+        construct_standalone_instruments__dict = dict(
+            bt_ccxt_account_or_store=self.bt_ccxt_account_or_store,
+            market_type=self.bt_ccxt_account_or_store.market_type,
+            symbols_id=self.symbols_id,
+        )
+        with patch.object(BT_CCXT_Instrument, 'set__parent', set__parent), \
+                patch.object(BT_CCXT_Instrument, 'add_commission_info', add_commission_info), \
+                patch('ccxtbt.expansion.bt_ccxt_expansion__helper.get_standalone_commission_rate',
+                      get_standalone_commission_rate), \
+                patch('ccxtbt.expansion.bt_ccxt_expansion__helper.FAKE_COMMISSION_INFO'), \
+                patch.object(self.bt_ccxt_account_or_store, 'add__instrument', add__instrument):
+            start = timer()
+            (instruments, stage_timings__dict, ) = construct_standalone_instruments(
+                params=construct_standalone_instruments__dict)
+            total_time_spent_in_seconds = timer() - start
+
+        # Test Assertion
+        self.assertEqual(
+            [instrument.symbol_id for instrument in instruments], self.symbols_id)
+        self.assertEqual(list(stage_timings__dict.keys()), self.symbols_id)
+        for symbol_id in self.symbols_id:
+            self.assertEqual(
+                list(stage_timings__dict[symbol_id].keys()), list(INSTRUMENT_BOOTSTRAP_STAGES))
+
+            # Every stage of a symbol starts only after its previous stage is done
+            stages = stage_recorder.stages[symbol_id]
+            self.assertEqual([stage for (stage, _, _, ) in stages], [
+                SYMBOL_STATIC_INFO_AND_POSITIONS_STAGE, COMMISSION_RATE_STAGE, RISK_LIMIT_STAGE,
+                PERSISTED_ORDERS_STAGE, ])
+            for (_, _, previous_end, ), (_, start, _, ) in zip(stages, stages[1:]):
+                self.assertGreaterEqual(start, previous_end)
+
+        # The first stage of every symbol is in flight at the same time
+        first_stages = [stage_recorder.stages[symbol_id][0]
+                        for symbol_id in self.symbols_id]
+        self.assertLess(max([start for (_, start, _, ) in first_stages]), min(
+            [end for (_, _, end, ) in first_stages]))
+
+        # Persisted orders are replayed in the order given, after every network bound stage is done
+        persisted_orders_stages = [(symbol_id, stage_recorder.stages[symbol_id][-1], )
+                                   for symbol_id in self.symbols_id]
+        self.assertEqual(sorted(persisted_orders_stages,
+                         key=lambda item: item[1][1]), persisted_orders_stages)
+        self.assertGreaterEqual(min([start for (_, (_, start, _, ), ) in persisted_orders_stages]), max(
+            [stage_recorder.stages[symbol_id][2][2] for symbol_id in self.symbols_id]))
+
+        # Sequential bootstrap would have taken 3 stages * 4 symbols * 0.2s
+        self.assertLess(total_time_spent_in_seconds, 3 *
+                        len(self.symbols_id) * stage_recorder.latency_in_seconds)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import ccxt
+import gc
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ccxtbt.http_session.http_session__helper import attach_shared_http_session, get_shared_http_adapter, \
+    mount_shared_http_adapter
+from ccxtbt.rate_limiter.rate_limiter__helper import get_exchange_host
+
+
+class Keep_Alive_Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session={}".format(self.path[1:]))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Shared_HTTP_Session__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.http_server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), Keep_Alive_Handler)
+        self.thread = threading.Thread(
+            target=self.http_server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = "http://127.0.0.1:{}".format(
+            self.http_server.server_address[1])
+
+    def tearDown(self):
+        self.http_server.shutdown()
+        self.http_server.server_close()
+
+    def test_01__Mounted_On_Exchange_Host_Only(self):
+        exchanges = [ccxt.bybit(dict()), ccxt.bybit(dict())]
+        for exchange in exchanges:
+            attach_shared_http_session__dict = dict(
+                exchange=exchange,
+            )
+            attach_shared_http_session(
+                params=attach_shared_http_session__dict)
+
+        host = get_exchange_host(exchanges[0])
+        get_shared_http_adapter__dict = dict(
+            host=host,
+        )
+        http_adapter = get_shared_http_adapter(
+            params=get_shared_http_adapter__dict)
+
+        # Test Assertion
+        self.assertIsNot(exchanges[0].session, exchanges[1].session)
+        self.assertFalse(exchanges[1].session.trust_env)
+        for exchange in exchanges:
+            self.assertIs(exchange.session.get_adapter(
+                "https://{}/v5/market/time".format(host)), http_adapter)
+            self.assertIsNot(exchange.session.get_adapter(
+                "https://api.binance.com/api/v3/time"), http_adapter)
+            self.assertIsNot(exchange.session.get_adapter(
+                "https://{}.evil.com/".format(host)), http_adapter)
+        self.assertEqual(http_adapter._pool_connections, 1)
+
+    def test_02__Connection_Pool_Survives_Deleted_Exchange(self):
+        exchanges = [ccxt.bybit(dict()), ccxt.bybit(dict())]
+        host = "127.0.0.1:{}".format(self.http_server.server_address[1])
+        for exchange in exchanges:
+            mount_shared_http_adapter__dict = dict(
+                http_session=exchange.session,
+                host=host,
+                scheme="http",
+            )
+            mount_shared_http_adapter(params=mount_shared_http_adapter__dict)
+
+        get_shared_http_adapter__dict = dict(
+            host=host,
+        )
+        http_adapter = get_shared_http_adapter(
+            params=get_shared_http_adapter__dict)
+
+        # Test Assertion
+        self.assertIs(exchanges[0].session.get_adapter(
+            "{}/first".format(self.url)), http_adapter)
+        self.assertIs(exchanges[1].session.get_adapter(
+            "{}/first".format(self.url)), http_adapter)
+
+        exchanges[0].session.get("{}/first".format(self.url), timeout=5)
+        pool_manager = http_adapter.poolmanager
+        pools_count = len(pool_manager.pools)
+
+        # ccxt closes the session of an exchange once it is garbage collected
+        del exchanges[0]
+        gc.collect()
+
+        response = exchanges[0].session.get(
+            "{}/second".format(self.url), timeout=5)
+
+        # Test Assertion
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(http_adapter.poolmanager, pool_manager)
+        self.assertEqual(len(pool_manager.pools), pools_count)
+        self.assertEqual(
+            exchanges[0].session.cookies.get("session"), "second")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import subprocess
+import sys
+import unittest
+
+from tests.common.test__specifications import MAX__LIGHTWEIGHT_MODULES__IMPORT_TIME__IN_SECONDS
+
+HEAVY_MODULES = ["pandas", "numpy", "pybit", "websocket", "binance", "aiohttp"]
+
+LIGHTWEIGHT_MODULES = [
+    "ccxtbt.bt_ccxt__specifications",
+    "ccxtbt.utils",
+    "ccxtbt.order.order__specifications",
+    "ccxtbt.persistent_storage.persistent_storage__helper",
+    "ccxtbt.rate_limiter.rate_limiter__helper",
+    "ccxtbt.metadata_cache.metadata_cache__classes",
+]
+
+
+def import_in_fresh_interpreter(modules_name):
+    '''
+    Import the modules in a brand-new interpreter so that nothing is served from sys.modules of the test runner.
+    Return the import time in seconds of each top level module reported by -X importtime together with the heavy
+    modules that ended up being imported.
+    '''
+    code = "import sys, json\n" + \
+        "".join(["import {}\n".format(module_name) for module_name in modules_name]) + \
+        "print(json.dumps([m for m in {} if m in sys.modules]))".format(
+            json.dumps(HEAVY_MODULES))
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+    # Format: "import time: self [us] | cumulative | imported package"
+    import_times = {}
+    for line in completed_process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if name.strip() in modules_name:
+                import_times[name.strip()] = int(cumulative.strip()) / 1e6
+    heavy_modules = json.loads(
+        completed_process.stdout.strip().splitlines()[-1])
+    ret_value = (import_times, heavy_modules, )
+    return ret_value
+
+
+class Import_Time__TestCases(unittest.TestCase):
+    def test_01__Lightweight_Modules_Do_Not_Import_Heavy_Dependencies(self):
+        (import_times, heavy_modules, ) = import_in_fresh_interpreter(
+            LIGHTWEIGHT_MODULES)
+        msg = ", ".join(["{}: {:.3f}s".format(module_name, seconds) for module_name, seconds in
+                         sorted(import_times.items(), key=lambda item: item[1], reverse=True)])
+
+        # Test Assertion
+        self.assertEqual(heavy_modules, [])
+        self.assertLess(sum(import_times.values()),
+                        MAX__LIGHTWEIGHT_MODULES__IMPORT_TIME__IN_SECONDS, msg=msg)
+
+    def test_02__Account_or_Store_Does_Not_Import_Exchange_Specific_Websocket(self):
+        (_, heavy_modules, ) = import_in_fresh_interpreter(
+            ["ccxtbt.account_or_store.account_or_store__classes"])
+
+        # Test Assertion
+        self.assertNotIn("pybit", heavy_modules)
+        self.assertNotIn("websocket", heavy_modules)
+
+        # ccxt.async_support is imported only by accounts in async mode
+        self.assertNotIn("aiohttp", heavy_modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
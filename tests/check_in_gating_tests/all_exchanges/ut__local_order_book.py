@@ -0,0 +1,206 @@
+import unittest
+
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
+from ccxtbt.instrument.instrument__classes import BT_CCXT_Instrument
+from ccxtbt.order_book.order_book__classes import Local_Order_Book, Order_Book_Snapshot
+from ccxtbt.order_book.order_book__helper import parse_order_book_message
+from ccxtbt.order_book.order_book__specifications import ASKS_SIDE, BIDS_SIDE
+
+
+class Local_Order_Book__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.local_order_book = Local_Order_Book("ETHUSDT")
+        self.local_order_book.apply_snapshot(
+            bids=[[1000.0, 1.0], [999.5, 2.0], [999.0, 3.0]],
+            asks=[[1000.5, 1.5], [1001.0, 2.5], [1001.5, 3.5]],
+            sequence=100, timestamp=1672502400000)
+
+    def test_01__Snapshot_Best_Price_First(self):
+        snapshot = self.local_order_book.get_snapshot()
+
+        # Test Assertion
+        self.assertTrue(self.local_order_book.is_synced())
+        self.assertEqual(snapshot['bids'], [
+                         [1000.0, 1.0], [999.5, 2.0], [999.0, 3.0]])
+        self.assertEqual(snapshot['asks'], [
+                         [1000.5, 1.5], [1001.0, 2.5], [1001.5, 3.5]])
+        self.assertEqual(snapshot['nonce'], 100)
+
+        snapshot = self.local_order_book.get_snapshot(depth=2)
+
+        # Test Assertion
+        self.assertEqual(snapshot['bids'], [[1000.0, 1.0], [999.5, 2.0]])
+        self.assertEqual(snapshot['asks'], [[1000.5, 1.5], [1001.0, 2.5]])
+
+    def test_02__Crossed_Snapshot_Is_Not_Synced(self):
+        self.local_order_book.apply_snapshot(bids=[[1000.5, 1.0]], asks=[
+                                             [1000.5, 1.5]], sequence=101)
+
+        # Test Assertion
+        self.assertFalse(self.local_order_book.is_synced())
+
+        self.local_order_book.apply_snapshot(bids=[[1000.0, 1.0]], asks=[
+                                             [1000.5, 1.5]], sequence=102)
+
+        # Test Assertion
+        self.assertTrue(self.local_order_book.is_synced())
+
+    def test_03__Invalidated_Until_Next_Snapshot(self):
+        self.local_order_book.invalidate()
+
+        # Test Assertion
+        self.assertFalse(self.local_order_book.is_synced())
+
+        self.local_order_book.apply_snapshot(bids=[[1000.0, 1.0]], asks=[
+                                             [1000.5, 1.5]], sequence=200)
+
+        # Test Assertion
+        self.assertTrue(self.local_order_book.is_synced())
+        self.assertEqual(self.local_order_book.get_snapshot()['nonce'], 200)
+
+    def test_04__Stale_Book_Is_Not_Synced(self):
+        # Test Assertion
+        self.assertTrue(self.local_order_book.is_synced(
+            max_age_in_seconds=60.0))
+        self.assertFalse(self.local_order_book.is_synced(
+            max_age_in_seconds=-1.0))
+
+    def test_05__Parse_Book_Handed_Over_By_Pybit(self):
+        # pybit applies the delta to its own book and hands the whole book over as a snapshot
+        message = {
+            'topic': "orderBookL2_25.ETHUSDT",
+            'type': "snapshot",
+            'data': [
+                {'price': "999.75", 'symbol': "ETHUSDT", 'side': "Buy", 'size': 1.0},
+                {'price': "1000.50", 'symbol': "ETHUSDT",
+                    'side': "Sell", 'size': 2.0},
+            ],
+            'cross_seq': "101",
+            'timestamp_e6': "1672502400123456",
+        }
+        parse_order_book_message__dict = dict(
+            exchange_dropdown_value=BYBIT_EXCHANGE_ID,
+            message=message,
+        )
+        order_book_message = parse_order_book_message(
+            params=parse_order_book_message__dict)
+
+        # Test Assertion
+        self.assertEqual(order_book_message['symbol_id'], "ETHUSDT")
+        self.assertEqual(order_book_message['bids'], [[999.75, 1.0]])
+        self.assertEqual(order_book_message['asks'], [[1000.5, 2.0]])
+        self.assertEqual(order_book_message['sequence'], 101)
+        self.assertEqual(order_book_message['timestamp'], 1672502400123)
+
+    def test_06__Deeper_Snapshot_Trimmed_To_Stream_Depth(self):
+        local_order_book = Local_Order_Book("ETHUSDT", max_depth=2)
+        local_order_book.apply_snapshot(
+            bids=[[999.0, 3.0], [1000.0, 1.0], [999.5, 2.0]],
+            asks=[[1001.5, 3.5], [1000.5, 1.5], [1001.0, 2.5]],
+            sequence=100)
+
+        # Test Assertion
+        self.assertEqual(local_order_book.get_snapshot()[
+                         'bids'], [[1000.0, 1.0], [999.5, 2.0]])
+        self.assertEqual(local_order_book.get_snapshot()[
+                         'asks'], [[1000.5, 1.5], [1001.0, 2.5]])
+
+
+class Order_Book_Snapshot__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.orderbook_snapshot = Order_Book_Snapshot(dict(
+            symbol="ETHUSDT",
+            bids=[[1000.0, 1.0], [999.5, 2.0], [999.0, 3.0]],
+            asks=[[1000.5, 1.0], [1001.0, 2.0], [1001.5, 3.0], [1002.0, 4.0]],
+            nonce=100,
+        ))
+
+    def test_01__Contiguous_Arrays_Best_Price_First(self):
+        # Test Assertion
+        self.assertTrue(
+            self.orderbook_snapshot.ask_prices.flags['C_CONTIGUOUS'])
+        self.assertEqual(
+            self.orderbook_snapshot.ask_prices.dtype.name, "float64")
+        self.assertEqual(self.orderbook_snapshot.bid_prices.tolist(), [
+                         1000.0, 999.5, 999.0])
+        self.assertEqual(self.orderbook_snapshot.ask_sizes.tolist(), [
+                         1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(self.orderbook_snapshot.get_depth(), 3)
+
+    def test_02__Price_By_Offset_And_Spread_In_Ticks(self):
+        # Test Assertion
+        self.assertEqual(
+            self.orderbook_snapshot.get_price_by_offset(0), (1000.5, 1000.0))
+        self.assertEqual(
+            self.orderbook_snapshot.get_price_by_offset(-1), (1001.5, 999.0))
+        self.assertEqual(self.orderbook_snapshot.get_spread_in_ticks(0.05), 10)
+
+        with self.assertRaises(AssertionError):
+            self.orderbook_snapshot.get_price_by_offset(3)
+
+    def test_03__VWAP(self):
+        # Test Assertion
+        self.assertAlmostEqual(
+            self.orderbook_snapshot.get_vwap(ASKS_SIDE, 1.0), 1000.5)
+        self.assertAlmostEqual(self.orderbook_snapshot.get_vwap(
+            ASKS_SIDE, 2.0), (1000.5 + 1001.0) / 2)
+        self.assertAlmostEqual(self.orderbook_snapshot.get_vwap(
+            BIDS_SIDE, 4.0), (1000.0 + 999.5 * 2 + 999.0) / 4)
+        self.assertIsNone(self.orderbook_snapshot.get_vwap(BIDS_SIDE, 6.5))
+
+    def test_04__Cumulative_Depth_To_Notional(self):
+        size, price = self.orderbook_snapshot.get_cumulative_depth(
+            ASKS_SIDE, 1000.5 + 1001.0)
+
+        # Test Assertion
+        self.assertAlmostEqual(size, 2.0)
+        self.assertEqual(price, 1001.0)
+
+        # Book too thin, capped at the depth available
+        size, price = self.orderbook_snapshot.get_cumulative_depth(
+            BIDS_SIDE, 1.0e6)
+
+        # Test Assertion
+        self.assertAlmostEqual(size, 6.0)
+        self.assertEqual(price, 999.0)
+
+
+class FAKE_BT_CCXT_ACCOUNT_OR_STORE(object):
+    def __init__(self, orderbook):
+        self.orderbook = orderbook
+
+    def get_orderbook(self, symbol_id):
+        return self.orderbook
+
+
+class Instrument__Order_Book__TestCases(unittest.TestCase):
+    def setUp(self):
+        bt_ccxt_instrument__dict = dict(
+            symbol_id="ETHUSDT",
+        )
+        self.instrument = BT_CCXT_Instrument(**bt_ccxt_instrument__dict)
+        self.instrument.parent = FAKE_BT_CCXT_ACCOUNT_OR_STORE(dict(
+            asks=[[1000.5, 1.0], [1001.0, 2.0]],
+            bids=[[1000.0, 3.0], [999.5, 4.0]],
+        ))
+
+    def test_01__Prices_As_Lists(self):
+        (asks, bids, ) = self.instrument.get_orderbook_prices()
+
+        # Test Assertion
+        self.assertEqual((asks, bids, ), ([1000.5, 1001.0], [1000.0, 999.5], ))
+        self.assertIsInstance(asks, list)
+        self.assertIsInstance(bids, list)
+
+    def test_02__Snapshot_As_Arrays(self):
+        orderbook_snapshot = self.instrument.get_orderbook_snapshot()
+
+        # Test Assertion
+        self.assertEqual(
+            orderbook_snapshot.ask_prices.tolist(), [1000.5, 1001.0])
+        self.assertEqual(
+            orderbook_snapshot.get_price_by_offset(-1), (1001.0, 999.5, ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import unittest
+
+from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP, CCXT__MARKET_TYPE__SPOT
+from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBIT_EXCHANGE_ID
+from ccxtbt.market_data_hub.market_data_hub__classes import Market_Data_Hub
+from ccxtbt.market_data_hub.market_data_hub__helper import connect_market_data_hub, get_shared_market_data_hub, \
+    serve_market_data_hub
+from ccxtbt.market_data_hub.market_data_hub__specifications import INSTRUMENT_INFO_TOPIC, KLINE_TOPIC
+
+
+class Market_Data_Hub__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.market_data_hub = Market_Data_Hub(
+            "Bybit: linear_perpetual_swap: MAINNET")
+
+    def test_01__Single_Owner(self):
+        # Test Assertion
+        self.assertTrue(self.market_data_hub.acquire_ownership("Main"))
+        self.assertTrue(self.market_data_hub.acquire_ownership("Main"))
+        self.assertFalse(self.market_data_hub.acquire_ownership("Sub"))
+        self.assertFalse(self.market_data_hub.release_ownership("Sub"))
+
+        self.market_data_hub.publish(
+            KLINE_TOPIC, "ETHUSDT", (1672502400.0, (1.0, 2.0, 0.5, 1.5, 10.0)))
+
+        # Test Assertion
+        self.assertTrue(self.market_data_hub.release_ownership("Main"))
+        self.assertIsNone(
+            self.market_data_hub.get_latest(KLINE_TOPIC, "ETHUSDT"))
+        self.assertTrue(self.market_data_hub.acquire_ownership("Sub"))
+
+    def test_02__Silent_Owner_Taken_Over(self):
+        market_data_hub = Market_Data_Hub(
+            "Bybit: linear_perpetual_swap: MAINNET", owner_timeout_in_seconds=-1.0)
+
+        # Test Assertion
+        self.assertTrue(market_data_hub.acquire_ownership("Main"))
+        self.assertTrue(market_data_hub.acquire_ownership("Sub"))
+        self.assertEqual(market_data_hub.get_owner(), "Sub")
+
+    def test_03__Latest_Per_Topic_And_Symbol(self):
+        kline = (1672502400.0, (1.0, 2.0, 0.5, 1.5, 10.0))
+        self.market_data_hub.publish(KLINE_TOPIC, "ETHUSDT", kline)
+        self.market_data_hub.publish(INSTRUMENT_INFO_TOPIC, "ETHUSDT", "quote")
+
+        # Test Assertion
+        self.assertEqual(self.market_data_hub.get_latest(
+            KLINE_TOPIC, "ETHUSDT"), kline)
+        self.assertEqual(self.market_data_hub.get_latest(
+            KLINE_TOPIC, "BTCUSDT", default=()), ())
+        self.assertEqual(self.market_data_hub.get_latest(INSTRUMENT_INFO_TOPIC, "ETHUSDT", max_age_in_seconds=60.0),
+                         "quote")
+        self.assertIsNone(self.market_data_hub.get_latest(
+            INSTRUMENT_INFO_TOPIC, "ETHUSDT", max_age_in_seconds=-1.0))
+
+        self.market_data_hub.invalidate(INSTRUMENT_INFO_TOPIC)
+
+        # Test Assertion
+        self.assertIsNone(self.market_data_hub.get_latest(
+            INSTRUMENT_INFO_TOPIC, "ETHUSDT"))
+        self.assertEqual(self.market_data_hub.get_latest(
+            KLINE_TOPIC, "ETHUSDT"), kline)
+
+        with self.assertRaises(ValueError):
+            self.market_data_hub.publish(
+                len(self.market_data_hub.published__counts), "ETHUSDT", kline)
+
+    def test_04__Fan_Out_To_Subscribers(self):
+        received = []
+
+        def faulty_callback(message):
+            raise RuntimeError(message)
+
+        first_subscription_id = self.market_data_hub.subscribe(
+            KLINE_TOPIC, "ETHUSDT", received.append)
+        self.market_data_hub.subscribe(KLINE_TOPIC, "ETHUSDT", faulty_callback)
+        self.market_data_hub.subscribe(KLINE_TOPIC, "ETHUSDT", received.append)
+        self.market_data_hub.subscribe(KLINE_TOPIC, "BTCUSDT", received.append)
+        self.market_data_hub.publish(KLINE_TOPIC, "ETHUSDT", 1)
+
+        # Test Assertion
+        self.assertEqual(received, [1, 1])
+        self.assertEqual(self.market_data_hub.get_metrics()
+                         ['callback_errors'], 1)
+        self.assertEqual(self.market_data_hub.get_metrics()
+                         ['subscribers']['kline'], 4)
+
+        self.assertTrue(self.market_data_hub.unsubscribe(
+            first_subscription_id))
+        self.assertFalse(
+            self.market_data_hub.unsubscribe(first_subscription_id))
+        self.market_data_hub.publish(KLINE_TOPIC, "ETHUSDT", 2)
+
+        # Test Assertion
+        self.assertEqual(received, [1, 1, 2])
+        self.assertEqual(self.market_data_hub.get_metrics()
+                         ['published']['kline'], 2)
+
+    def test_05__Union_Of_Requests(self):
+        (version, symbols_id__per_topic, ) = self.market_data_hub.get_requests()
+
+        # Test Assertion
+        self.assertEqual(symbols_id__per_topic, [[], []])
+
+        self.market_data_hub.request(
+            "Main", KLINE_TOPIC, ["ETHUSDT", "BTCUSDT", ])
+        self.market_data_hub.request(
+            "Main", INSTRUMENT_INFO_TOPIC, ["ETHUSDT", ])
+        (main__version, symbols_id__per_topic,
+         ) = self.market_data_hub.get_requests()
+
+        # Test Assertion
+        self.assertNotEqual(main__version, version)
+        self.assertEqual(symbols_id__per_topic, [
+                         ["BTCUSDT", "ETHUSDT", ], ["ETHUSDT", ], ])
+
+        # Nothing new to stream
+        self.market_data_hub.request("Sub", KLINE_TOPIC, ["ETHUSDT", ])
+
+        # Test Assertion
+        self.assertEqual(self.market_data_hub.get_requests()[0], main__version)
+
+        subscription_id = self.market_data_hub.subscribe(
+            INSTRUMENT_INFO_TOPIC, "SOLUSDT", print)
+        (subscribed__version, symbols_id__per_topic,
+         ) = self.market_data_hub.get_requests()
+
+        # Test Assertion
+        self.assertNotEqual(subscribed__version, main__version)
+        self.assertEqual(symbols_id__per_topic[INSTRUMENT_INFO_TOPIC], [
+                         "ETHUSDT", "SOLUSDT", ])
+
+        self.market_data_hub.unsubscribe(subscription_id)
+        self.market_data_hub.cancel_requests("Main")
+
+        # Test Assertion: shrinking never asks for a resubscription
+        self.assertEqual(self.market_data_hub.get_requests(),
+                         (subscribed__version, [["ETHUSDT", ], [], ], ))
+
+
+class Shared_Market_Data_Hub__TestCases(unittest.TestCase):
+    def test_01__One_Hub_Per_Exchange_And_Market_Type(self):
+        get_shared_market_data_hub__dict = dict(
+            exchange_dropdown_value=BYBIT_EXCHANGE_ID,
+            market_type=CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP,
+        )
+        market_data_hub = get_shared_market_data_hub(
+            params=get_shared_market_data_hub__dict)
+
+        # Test Assertion
+        self.assertIs(get_shared_market_data_hub(
+            params=get_shared_market_data_hub__dict), market_data_hub)
+        self.assertEqual(market_data_hub.name,
+                         "bybit: swap: MAINNET")
+
+        get_shared_market_data_hub__dict['market_type'] = CCXT__MARKET_TYPE__SPOT
+
+        # Test Assertion
+        self.assertIsNot(get_shared_market_data_hub(
+            params=get_shared_market_data_hub__dict), market_data_hub)
+
+    def test_02__Served_To_Another_Process(self):
+        authkey = b"ut__market_data_hub"
+        serve_market_data_hub__dict = dict(
+            address=("127.0.0.1", 0),
+            authkey=authkey,
+        )
+        (_, address, ) = serve_market_data_hub(
+            params=serve_market_data_hub__dict)
+
+        get_shared_market_data_hub__dict = dict(
+            exchange_dropdown_value=BYBIT_EXCHANGE_ID,
+            market_type=CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP,
+        )
+        market_data_hub = get_shared_market_data_hub(
+            params=get_shared_market_data_hub__dict)
+        connect_market_data_hub__dict = dict(
+            address=address,
+            authkey=authkey,
+        )
+        connect_market_data_hub__dict.update(get_shared_market_data_hub__dict)
+        remote__market_data_hub = connect_market_data_hub(
+            params=connect_market_data_hub__dict)
+
+        # Test Assertion
+        self.assertTrue(market_data_hub.acquire_ownership("Main"))
+        self.assertFalse(remote__market_data_hub.acquire_ownership("Sub"))
+
+        kline = (1672502400.0, (1.0, 2.0, 0.5, 1.5, 10.0))
+        market_data_hub.publish(KLINE_TOPIC, "ETHUSDT", kline)
+
+        # Test Assertion
+        self.assertEqual(remote__market_data_hub.get_latest(
+            KLINE_TOPIC, "ETHUSDT", max_age_in_seconds=60.0), kline)
+        self.assertEqual(remote__market_data_hub.get_latest(
+            KLINE_TOPIC, "BTCUSDT", default=()), ())
+
+        # Remote accounts request what they read as well
+        remote__market_data_hub.request("Sub", KLINE_TOPIC, ["BTCUSDT", ])
+
+        # Test Assertion
+        self.assertIn("BTCUSDT", market_data_hub.get_requests()
+                      [1][KLINE_TOPIC])
+
+        remote__market_data_hub.cancel_requests("Sub")
+        self.assertTrue(market_data_hub.release_ownership("Main"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from time import sleep
+
+from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP
+from ccxtbt.metadata_cache.metadata_cache__classes import Metadata_Cache
+from ccxtbt.metadata_cache.metadata_cache__helper import get_metadata_cache_dir_path
+
+
+class Metadata_Cache__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+        self.fetch_count = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def fetch(self):
+        self.fetch_count += 1
+        return dict(tick_size=0.01, qty_step=0.001, fetch_count=self.fetch_count)
+
+    def test_01__Warm_Restart_Served_From_Disk(self):
+        metadata_cache = Metadata_Cache(
+            dir_path=self.dir_path, ttl_in_seconds=60)
+        value = metadata_cache.get_or_fetch(
+            "symbol_stationary_ETHUSDT", self.fetch)
+
+        # Simulate a restart with a brand-new cache pointing to the same directory
+        restarted_metadata_cache = Metadata_Cache(
+            dir_path=self.dir_path, ttl_in_seconds=60)
+        restarted_value = restarted_metadata_cache.get_or_fetch(
+            "symbol_stationary_ETHUSDT", self.fetch)
+
+        # Test Assertion
+        self.assertEqual(self.fetch_count, 1)
+        self.assertEqual(value, restarted_value)
+
+    def test_02__Stale_Entry_Served_While_Refreshed_In_Background(self):
+        metadata_cache = Metadata_Cache(
+            dir_path=self.dir_path, ttl_in_seconds=0.1)
+        metadata_cache.get_or_fetch("risk_limit_ETHUSDT", self.fetch)
+        sleep(0.2)
+
+        value = metadata_cache.get_or_fetch("risk_limit_ETHUSDT", self.fetch)
+
+        # Test Assertion
+        self.assertEqual(value['fetch_count'], 1)
+
+        for _ in range(50):
+            if metadata_cache.get("risk_limit_ETHUSDT")['fetch_count'] == 2:
+                break
+            sleep(0.01)
+
+        # Test Assertion
+        self.assertEqual(self.fetch_count, 2)
+        self.assertEqual(metadata_cache.get(
+            "risk_limit_ETHUSDT")['fetch_count'], 2)
+
+    def test_03__Entry_Of_Other_Version_Ignored(self):
+        file_path = os.path.join(self.dir_path, "markets.json")
+        with open(file_path, "w") as f:
+            json.dump(dict(version=-1, timestamp=0,
+                      value=dict(fetch_count=0)), f)
+
+        metadata_cache = Metadata_Cache(
+            dir_path=self.dir_path, ttl_in_seconds=60)
+        value = metadata_cache.get_or_fetch("markets", self.fetch)
+
+        # Test Assertion
+        self.assertEqual(value['fetch_count'], 1)
+
+    def test_04__Disabled_Cache_Always_Fetches(self):
+        metadata_cache = Metadata_Cache(
+            dir_path=self.dir_path, ttl_in_seconds=60, enabled=False)
+        metadata_cache.get_or_fetch("markets", self.fetch)
+        metadata_cache.get_or_fetch("markets", self.fetch)
+
+        # Test Assertion
+        self.assertEqual(self.fetch_count, 2)
+        self.assertEqual(os.listdir(self.dir_path), [])
+
+    def test_05__Refreshed_Value_Handed_To_Every_Stale_Caller(self):
+        metadata_cache = Metadata_Cache(
+            dir_path=self.dir_path, ttl_in_seconds=0.1)
+        metadata_cache.get_or_fetch("markets", self.fetch)
+        sleep(0.2)
+
+        def slow_fetch():
+            sleep(0.1)
+            return self.fetch()
+
+        refreshed_values = []
+        metadata_cache.get_or_fetch(
+            "markets", slow_fetch, refreshed_values.append)
+        metadata_cache.get_or_fetch(
+            "markets", slow_fetch, refreshed_values.append)
+
+        for _ in range(50):
+            if len(refreshed_values) == 2:
+                break
+            sleep(0.01)
+
+        # Test Assertion: a single refresh is issued and applied by both callers
+        self.assertEqual(self.fetch_count, 2)
+        self.assertEqual([value['fetch_count']
+                         for value in refreshed_values], [2, 2])
+
+    def test_06__Default_To_User_Cache_Dir(self):
+        get_metadata_cache_dir_path__dict = dict(
+            exchange_dropdown_value="bybit",
+            market_type=CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP,
+            main_net_toggle_switch_value=False,
+        )
+        with patch('sys.platform', "linux"), patch.dict(os.environ, dict(XDG_CACHE_HOME=self.dir_path)):
+            metadata_cache_dir_path = get_metadata_cache_dir_path(
+                params=get_metadata_cache_dir_path__dict)
+
+        # Test Assertion
+        self.assertTrue(metadata_cache_dir_path.startswith(
+            os.path.join(self.dir_path, "bt_ccxt_store")))
+
+
+if __name__ == '__main__':
+    unittest.main()
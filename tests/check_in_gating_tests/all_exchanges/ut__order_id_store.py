@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from ccxtbt.persistent_storage.persistent_storage__classes import Order_Id_Store
+
+
+class Order_Id_Store__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+        self.db_file_path = os.path.join(
+            self.dir_path, "ccxt_orders_id.sqlite3")
+        self.symbol_key = ("bybit", "linear", "Testnet", "ETHUSDT", )
+        self.order_id_store = Order_Id_Store(db_file_path=self.db_file_path)
+
+    def tearDown(self):
+        self.order_id_store.close()
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def test_01__Insert_Select_And_Delete(self):
+        self.order_id_store.insert(
+            self.symbol_key, [(0, "1001"), (1, "1002"), (0, "1003")])
+
+        # Duplicated row is ignored
+        inserted_count = self.order_id_store.insert(
+            self.symbol_key, [(0, "1001")])
+
+        # Test Assertion
+        self.assertEqual(inserted_count, 0)
+        self.assertEqual(self.order_id_store.select(self.symbol_key), [
+                         (0, "1001"), (1, "1002"), (0, "1003")])
+
+        # Test Assertion
+        self.assertTrue(self.order_id_store.delete(self.symbol_key, 1, "1002"))
+        self.assertFalse(self.order_id_store.delete(
+            self.symbol_key, 1, "1002"))
+        self.assertEqual(self.order_id_store.select(
+            self.symbol_key), [(0, "1001"), (0, "1003")])
+
+    def test_02__Replace_Only_Affects_Its_Own_Symbol(self):
+        other_symbol_key = ("bybit", "linear", "Testnet", "BTCUSDT", )
+        self.order_id_store.insert(self.symbol_key, [(0, "1001")])
+        self.order_id_store.insert(other_symbol_key, [(0, "2001")])
+
+        self.order_id_store.replace(self.symbol_key, [])
+
+        # Test Assertion
+        self.assertEqual(self.order_id_store.select(self.symbol_key), [])
+        self.assertEqual(self.order_id_store.select(
+            other_symbol_key), [(0, "2001")])
+
+    def test_03__Failed_Transaction_Is_Rolled_Back(self):
+        self.order_id_store.insert(self.symbol_key, [(0, "1001")])
+        try:
+            with self.order_id_store.transaction():
+                self.order_id_store.delete(self.symbol_key, 0, "1001")
+                self.order_id_store.insert(self.symbol_key, [(0, "1002")])
+                raise RuntimeError("Simulated crash")
+        except RuntimeError:
+            pass
+
+        # Test Assertion
+        self.assertEqual(self.order_id_store.select(
+            self.symbol_key), [(0, "1001")])
+
+    def test_04__Persisted_Across_Restart_And_Threads(self):
+        def insert(thread_index):
+            with self.order_id_store.transaction():
+                self.order_id_store.insert(
+                    self.symbol_key, [(0, "{}_{}".format(thread_index, i)) for i in range(50)])
+
+        threads = [threading.Thread(target=insert, args=(i, ))
+                   for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.order_id_store.close()
+
+        # Simulate a restart with a brand-new store pointing to the same file
+        self.order_id_store = Order_Id_Store(db_file_path=self.db_file_path)
+
+        # Test Assertion
+        self.assertEqual(len(self.order_id_store.select(self.symbol_key)), 200)
+
+    def test_05__Reconciliation_Watermark(self):
+        other_symbol_key = ("bybit", "linear", "Testnet", "BTCUSDT", )
+
+        # Test Assertion
+        self.assertIsNone(self.order_id_store.get_watermark(self.symbol_key))
+
+        self.order_id_store.set_watermark(self.symbol_key, 1700000000000)
+        self.order_id_store.set_watermark(self.symbol_key, 1700000060000)
+
+        # Test Assertion
+        self.assertEqual(self.order_id_store.get_watermark(
+            self.symbol_key), 1700000060000)
+        self.assertIsNone(self.order_id_store.get_watermark(other_symbol_key))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+from time import time as timer
+
+from ccxtbt.order.order__classes import Order_State_Waiter
+
+
+class Order_State_Waiter__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.order_state_waiter = Order_State_Waiter()
+
+    def test_01__Already_In_Expected_State(self):
+        self.order_state_waiter.update("1", dict(id="1", status='open'))
+
+        # Test Assertion
+        self.assertEqual(self.order_state_waiter.wait_for_order_state(
+            "1", timeout=0.0), dict(id="1", status='open'))
+        self.assertEqual(self.order_state_waiter.wait_for_order_state(
+            "1", states=('open', ), timeout=0.0), dict(id="1", status='open'))
+        self.assertIsNone(self.order_state_waiter.wait_for_order_state(
+            "1", states=('closed', ), timeout=0.0))
+        self.assertIsNone(
+            self.order_state_waiter.wait_for_order_state("2", timeout=0.0))
+
+    def test_02__Woken_Up_By_Update(self):
+        self.order_state_waiter.update("1", dict(id="1", status='open'))
+        timer_thread = threading.Timer(0.1, self.order_state_waiter.update, args=(
+            "1", dict(id="1", status='closed'), ))
+        timer_thread.start()
+
+        start = timer()
+        ccxt_order = self.order_state_waiter.wait_for_order_state(
+            "1", states=('closed', 'canceled', ), timeout=5.0)
+        timer_thread.join()
+
+        # Test Assertion: returns as soon as the exchange confirms instead of waiting for the timeout
+        self.assertEqual(ccxt_order, dict(id="1", status='closed'))
+        self.assertLess(timer() - start, 5.0)
+
+    def test_03__None_On_Timeout(self):
+        timeout = 0.2
+        start = timer()
+
+        # Test Assertion
+        self.assertIsNone(self.order_state_waiter.wait_for_order_state(
+            "1", states=('closed', ), timeout=timeout))
+        self.assertGreaterEqual(timer() - start, timeout)
+
+    def test_04__Oldest_Order_Forgotten(self):
+        max_size = 10
+        order_state_waiter = Order_State_Waiter(max_size=max_size)
+        for i in range(100):
+            order_state_waiter.update(str(i), dict(id=str(i), status='open'))
+
+        # Updating an order makes it the most recent one
+        order_state_waiter.update("90", dict(id="90", status='closed'))
+        order_state_waiter.update("100", dict(id="100", status='open'))
+
+        # Test Assertion
+        self.assertEqual(len(order_state_waiter.latest_ccxt_orders), max_size)
+        self.assertIsNone(order_state_waiter.get("0"))
+        self.assertIsNone(order_state_waiter.get("91"))
+        self.assertEqual(order_state_waiter.get("90"),
+                         dict(id="90", status='closed'))
+        self.assertEqual(order_state_waiter.get("100"),
+                         dict(id="100", status='open'))
+
+        order_state_waiter.discard("90")
+        order_state_waiter.discard("90")
+
+        # Test Assertion
+        self.assertIsNone(order_state_waiter.get("90"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+from ccxtbt.quote.quote__classes import Quote_Store
+
+
+class Quote_Store__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.quote_store = Quote_Store()
+
+    def test_01__Sequence_And_Version(self):
+        first_quote = self.quote_store.publish(
+            "ETHUSDT", 1000.2, 1000.5, 1000.0, exchange_timestamp=1672502400123)
+        other_quote = self.quote_store.publish(
+            "BTCUSDT", 16500.2, 16500.5, 16500.0)
+        second_quote = self.quote_store.publish(
+            "ETHUSDT", 1000.7, 1001.0, 1000.5)
+
+        # Test Assertion
+        self.assertEqual(
+            (first_quote.version, second_quote.version, other_quote.version), (1, 2, 1))
+        self.assertLess(first_quote.sequence, other_quote.sequence)
+        self.assertLess(other_quote.sequence, second_quote.sequence)
+        self.assertEqual(first_quote.exchange_timestamp, 1672502400123)
+        self.assertIsNone(second_quote.exchange_timestamp)
+        self.assertIs(self.quote_store.get("ETHUSDT"), second_quote)
+
+    def test_02__Max_Age(self):
+        quote = self.quote_store.publish("ETHUSDT", 1000.2, 1000.5, 1000.0)
+
+        # Test Assertion
+        self.assertIs(self.quote_store.get(
+            "ETHUSDT", max_age_in_seconds=60.0), quote)
+        self.assertIsNone(self.quote_store.get(
+            "ETHUSDT", max_age_in_seconds=-1.0))
+        self.assertIsNone(self.quote_store.get(
+            "BTCUSDT", max_age_in_seconds=60.0))
+        self.assertGreaterEqual(
+            self.quote_store.get_age_in_seconds("ETHUSDT"), 0.0)
+
+    def test_03__Invalidate_Keeps_Version_Going(self):
+        self.quote_store.publish("ETHUSDT", 1000.2, 1000.5, 1000.0)
+        self.quote_store.invalidate()
+
+        # Test Assertion
+        self.assertIsNone(self.quote_store.get("ETHUSDT"))
+        self.assertIsNone(self.quote_store.get_age_in_seconds("ETHUSDT"))
+        self.assertEqual(self.quote_store.publish(
+            "ETHUSDT", 1000.2, 1000.5, 1000.0).version, 2)
+
+    def test_04__Readers_Never_See_Torn_Quote(self):
+        stop_event = threading.Event()
+        torn_quotes = []
+
+        def read():
+            while stop_event.is_set() == False:
+                quote = self.quote_store.get("ETHUSDT")
+                if quote is not None and not (quote.ask1_price == quote.bid1_price + 1.0 == quote.version + 1.0):
+                    torn_quotes.append(quote)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(1, 20001):
+            self.quote_store.publish(
+                "ETHUSDT", float(i), float(i + 1), float(i))
+        stop_event.set()
+        for reader in readers:
+            reader.join()
+
+        # Test Assertion
+        self.assertEqual(torn_quotes, [])
+        self.assertEqual(self.quote_store.get("ETHUSDT").version, 20000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import ccxt
+import threading
+import unittest
+
+from time import time as timer
+
+from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP, CCXT__MARKET_TYPE__SPOT
+from ccxtbt.rate_limiter.rate_limiter__classes import Token_Bucket_Rate_Limiter
+from ccxtbt.rate_limiter.rate_limiter__helper import get_exchange_host, get_shared_rate_limiter
+
+
+class FAKE_CCXT_EXCHANGE(object):
+    def __init__(self, rate_limit, api_url):
+        self.rateLimit = rate_limit
+        self.urls = dict(api=dict(public=api_url, private=api_url))
+
+
+class Token_Bucket_Rate_Limiter__TestCases(unittest.TestCase):
+    def test_01__Burst_Within_Capacity_Does_Not_Sleep(self):
+        rate_limiter = Token_Bucket_Rate_Limiter(refill_rate=10.0, capacity=5)
+
+        start = timer()
+        time_slept = sum(rate_limiter.acquire() for _ in range(5))
+
+        # Test Assertion
+        self.assertEqual(time_slept, 0.0)
+        self.assertLess(timer() - start, 0.05)
+
+    def test_02__Exhausted_Budget_Sleeps_For_Deficit_Only(self):
+        refill_rate = 50.0
+        rate_limiter = Token_Bucket_Rate_Limiter(
+            refill_rate=refill_rate, capacity=1)
+
+        rate_limiter.acquire()
+        time_slept = rate_limiter.acquire()
+
+        # Test Assertion
+        self.assertGreater(time_slept, 0.0)
+        self.assertLessEqual(time_slept, 1.0 / refill_rate)
+        self.assertFalse(rate_limiter.try_acquire())
+
+    def test_03__Concurrent_Callers_Respect_Refill_Rate(self):
+        refill_rate = 100.0
+        rate_limiter = Token_Bucket_Rate_Limiter(
+            refill_rate=refill_rate, capacity=1)
+        number_of_threads = 10
+
+        start = timer()
+        threads = [threading.Thread(target=rate_limiter.acquire)
+                   for _ in range(number_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Test Assertion
+        self.assertGreaterEqual(
+            timer() - start, (number_of_threads - 1) / refill_rate * 0.9)
+
+    def test_04__Shared_By_Exchange_Host_And_Source_IP(self):
+        bybit = FAKE_CCXT_EXCHANGE(20, "https://api-testnet.bybit.com")
+        another_bybit = FAKE_CCXT_EXCHANGE(
+            20, "https://api-testnet.bybit.com/v5")
+        binance = FAKE_CCXT_EXCHANGE(50, "https://testnet.binance.vision/api")
+
+        # Test Assertion
+        self.assertEqual(get_exchange_host(bybit), "api-testnet.bybit.com")
+        self.assertIs(get_shared_rate_limiter(params=dict(exchange=bybit)),
+                      get_shared_rate_limiter(params=dict(exchange=another_bybit)))
+        self.assertIsNot(get_shared_rate_limiter(params=dict(exchange=bybit)),
+                         get_shared_rate_limiter(params=dict(exchange=binance)))
+        self.assertIsNot(get_shared_rate_limiter(params=dict(exchange=bybit)),
+                         get_shared_rate_limiter(params=dict(exchange=bybit, source_ip="10.0.0.2")))
+
+    def test_05__Host_Of_Market_Type(self):
+        binance = ccxt.binance()
+        bybit = ccxt.bybit()
+
+        # Test Assertion: Binance serves USDT-M futures and spot from different hosts with separate request budgets
+        self.assertEqual(get_exchange_host(
+            binance, CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP), "fapi.binance.com")
+        self.assertEqual(get_exchange_host(
+            binance, CCXT__MARKET_TYPE__SPOT), "api.binance.com")
+        self.assertIsNot(get_shared_rate_limiter(params=dict(exchange=binance, market_type=CCXT__MARKET_TYPE__SPOT)),
+                         get_shared_rate_limiter(params=dict(exchange=binance,
+                                                             market_type=CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP)))
+
+        # Test Assertion: Bybit serves every market type from the same host
+        self.assertEqual(get_exchange_host(bybit, CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP),
+                         get_exchange_host(bybit, CCXT__MARKET_TYPE__SPOT))
+
+
+if __name__ == '__main__':
+    unittest.main()
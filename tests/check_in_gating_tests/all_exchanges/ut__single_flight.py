@@ -0,0 +1,72 @@
+import threading
+import unittest
+
+from time import sleep
+
+from ccxtbt.parallel_processing.parallel_processing__classes import Single_Flight
+
+
+class Single_Flight__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.single_flight = Single_Flight()
+        self.number_of_calls = 0
+        self.number_of_calls__lock = threading.Lock()
+
+    def fetch_order_book(self, symbol, latency_in_seconds=0.2):
+        with self.number_of_calls__lock:
+            self.number_of_calls += 1
+        sleep(latency_in_seconds)
+        if symbol is None:
+            raise ValueError("symbol is required")
+        return dict(symbol=symbol, bids=[[1.0, 1.0]], asks=[[1.1, 1.0]])
+
+    def run_concurrently(self, key, symbol, number_of_threads):
+        results = [None] * number_of_threads
+
+        def run(i):
+            try:
+                results[i] = self.single_flight.do(
+                    key, self.fetch_order_book, symbol)
+            except ValueError as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=run, args=(i, ))
+                   for i in range(number_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_01__Concurrent_Identical_Calls_Are_Coalesced(self):
+        number_of_threads = 10
+        results = self.run_concurrently(
+            ('fetch_order_book', "ETHUSDT", ), "ETHUSDT", number_of_threads)
+
+        # Test Assertion
+        self.assertEqual(self.number_of_calls, 1)
+        self.assertTrue(all([result is results[0] for result in results]))
+        self.assertEqual(len(self.single_flight.in_flight_calls), 0)
+
+    def test_02__Sequential_Calls_Are_Not_Cached(self):
+        self.single_flight.do(('fetch_order_book', "ETHUSDT", ),
+                              self.fetch_order_book, "ETHUSDT", 0.0)
+        self.single_flight.do(('fetch_order_book', "ETHUSDT", ),
+                              self.fetch_order_book, "ETHUSDT", 0.0)
+
+        # Test Assertion
+        self.assertEqual(self.number_of_calls, 2)
+
+    def test_03__Exception_Is_Shared(self):
+        number_of_threads = 5
+        results = self.run_concurrently(
+            ('fetch_order_book', None, ), None, number_of_threads)
+
+        # Test Assertion
+        self.assertEqual(self.number_of_calls, 1)
+        self.assertTrue(all([isinstance(result, ValueError)
+                        for result in results]))
+
+
+if __name__ == '__main__':
+    unittest.main()
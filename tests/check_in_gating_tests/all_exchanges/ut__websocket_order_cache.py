@@ -0,0 +1,59 @@
+import unittest
+
+from time import sleep
+
+from ccxtbt.order.order__classes import Websocket_Order_Cache
+
+
+class Websocket_Order_Cache__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.symbol_id = "ETHUSDT"
+
+    def test_01__Upsert_Replaces_Existing_Order(self):
+        ws_order_cache = Websocket_Order_Cache()
+
+        ws_order_cache.upsert(self.symbol_id, dict(
+            id="1", status='open', filled=0.0))
+        ws_order_cache.upsert(self.symbol_id, dict(
+            id="1", status='open', filled=0.5))
+
+        # Test Assertion
+        self.assertEqual(len(ws_order_cache), 1)
+        self.assertEqual(ws_order_cache.get(
+            self.symbol_id, "1")['filled'], 0.5)
+        self.assertIsNone(ws_order_cache.get(self.symbol_id, "2"))
+        self.assertIsNone(ws_order_cache.get("BTCUSDT", "1"))
+
+    def test_02__Terminal_Orders_Are_Evicted_By_Size(self):
+        max_terminal_orders_per_symbol = 10
+        ws_order_cache = Websocket_Order_Cache(
+            max_terminal_orders_per_symbol=max_terminal_orders_per_symbol)
+
+        ws_order_cache.upsert(self.symbol_id, dict(id="opened", status='open'))
+        for i in range(1000):
+            ws_order_cache.upsert(
+                self.symbol_id, dict(id=str(i), status='closed'))
+
+        # Test Assertion
+        self.assertEqual(len(ws_order_cache),
+                         max_terminal_orders_per_symbol + 1)
+        self.assertIsNotNone(ws_order_cache.get(self.symbol_id, "opened"))
+        self.assertIsNone(ws_order_cache.get(self.symbol_id, "0"))
+        self.assertIsNotNone(ws_order_cache.get(self.symbol_id, "999"))
+
+    def test_03__Terminal_Orders_Are_Evicted_By_TTL(self):
+        ws_order_cache = Websocket_Order_Cache(
+            terminal_order_ttl_in_seconds=0.1)
+
+        ws_order_cache.upsert(self.symbol_id, dict(id="1", status='open'))
+        ws_order_cache.upsert(self.symbol_id, dict(id="1", status='canceled'))
+        sleep(0.2)
+        ws_order_cache.upsert(self.symbol_id, dict(id="2", status='open'))
+
+        # Test Assertion
+        self.assertIsNone(ws_order_cache.get(self.symbol_id, "1"))
+        self.assertEqual(ws_order_cache.get_orders_id(self.symbol_id), ["2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
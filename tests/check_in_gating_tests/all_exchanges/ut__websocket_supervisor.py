@@ -0,0 +1,158 @@
+import threading
+import time
+import unittest
+
+from ccxtbt.websocket_supervisor.websocket_supervisor__classes import Websocket_Supervisor
+
+
+class Fake_Websocket(object):
+    def __init__(self, failed_attempts=0):
+        self.connected = True
+        self.failed_attempts = failed_attempts
+        self.connect_count = 0
+        self.close_count = 0
+        self.resync_count = 0
+        self.resynced_event = threading.Event()
+
+    def connect(self):
+        self.connect_count += 1
+        if self.failed_attempts > 0:
+            self.failed_attempts -= 1
+            return False
+        self.connected = True
+        return True
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.close_count += 1
+        self.connected = False
+
+    def on_reconnected(self):
+        self.resync_count += 1
+        self.resynced_event.set()
+
+
+class Websocket_Supervisor__TestCases(unittest.TestCase):
+    def setUp(self):
+        self.websocket_supervisor = Websocket_Supervisor(
+            name="Main", check_interval_in_seconds=0.01, heartbeat_timeout_in_seconds=None,
+            backoff_base_in_seconds=0.01, backoff_cap_in_seconds=0.02)
+
+    def tearDown(self):
+        self.websocket_supervisor.stop()
+
+    def _add_connection(self, fake_websocket, name="usdt_perpetual"):
+        self.websocket_supervisor.add_connection(
+            name, connect=fake_websocket.connect, is_connected=fake_websocket.is_connected, close=fake_websocket.close,
+            on_reconnected=fake_websocket.on_reconnected)
+
+    def test_01__Healthy_Connection_Is_Left_Alone(self):
+        fake_websocket = Fake_Websocket()
+        self._add_connection(fake_websocket)
+        self.websocket_supervisor.check()
+
+        # Test Assertion
+        self.assertEqual((fake_websocket.connect_count,
+                         fake_websocket.close_count), (0, 0))
+        self.assertTrue(
+            self.websocket_supervisor.is_connected("usdt_perpetual"))
+
+    def test_02__Reconnect_With_Backoff_Then_Resync(self):
+        fake_websocket = Fake_Websocket(failed_attempts=2)
+        self._add_connection(fake_websocket)
+        self.websocket_supervisor.start()
+
+        fake_websocket.connected = False
+        self.websocket_supervisor.wake()
+
+        # Test Assertion
+        self.assertTrue(fake_websocket.resynced_event.wait(5.0))
+        self.assertEqual(fake_websocket.connect_count, 3)
+        self.assertEqual(fake_websocket.resync_count, 1)
+
+        metrics = self.websocket_supervisor.get_metrics()['usdt_perpetual']
+
+        # Test Assertion
+        self.assertEqual(metrics['state'], "connected")
+        self.assertEqual(metrics['reconnect_count'], 1)
+        self.assertGreater(metrics['last_reconnect_time_in_seconds'], 0.0)
+        self.assertEqual(metrics['max_reconnect_time_in_seconds'],
+                         metrics['last_reconnect_time_in_seconds'])
+        self.assertIsNone(metrics['down_time_in_seconds'])
+
+    def test_03__Silent_Connection_Is_Reconnected(self):
+        self.websocket_supervisor.heartbeat_timeout_in_seconds = 0.05
+        fake_websocket = Fake_Websocket()
+        self._add_connection(fake_websocket)
+
+        self.websocket_supervisor.touch("usdt_perpetual")
+        self.websocket_supervisor.check()
+
+        # Test Assertion
+        self.assertEqual(fake_websocket.connect_count, 0)
+
+        time.sleep(0.1)
+        self.websocket_supervisor.check()
+
+        # Test Assertion
+        self.assertEqual((fake_websocket.close_count,
+                         fake_websocket.connect_count), (1, 1))
+        self.assertEqual(fake_websocket.resync_count, 1)
+
+    def test_04__Wake_Does_Not_Block_On_Slow_Connect(self):
+        release_event = threading.Event()
+        fake_websocket = Fake_Websocket()
+
+        def slow_connect():
+            release_event.wait(5.0)
+            return True
+
+        self.websocket_supervisor.add_connection(
+            "usdt_perpetual", connect=slow_connect, is_connected=fake_websocket.is_connected,
+            close=fake_websocket.close)
+        self.websocket_supervisor.start()
+        fake_websocket.connected = False
+
+        start = time.monotonic()
+        for _ in range(10):
+            self.websocket_supervisor.wake()
+            time.sleep(0.01)
+
+        # Test Assertion
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertFalse(
+            self.websocket_supervisor.is_connected("usdt_perpetual"))
+        self.assertEqual(self.websocket_supervisor.get_metrics()[
+                         'usdt_perpetual']['state'], "reconnecting")
+
+        release_event.set()
+
+    def test_05__First_Connection_Left_To_Supervisor_And_Tasks(self):
+        fake_websocket = Fake_Websocket()
+        fake_websocket.connected = False
+        self.websocket_supervisor.add_connection(
+            "mainnet_usdt_perpetual", connect=fake_websocket.connect, is_connected=fake_websocket.is_connected,
+            close=fake_websocket.close, is_established=False)
+        task_calls = []
+        self.websocket_supervisor.add_task(
+            "ownership", lambda: task_calls.append(len(task_calls)))
+        self.websocket_supervisor.check()
+
+        # Test Assertion
+        self.assertEqual(fake_websocket.connect_count, 1)
+        self.assertTrue(self.websocket_supervisor.is_connected(
+            "mainnet_usdt_perpetual"))
+        self.assertEqual(task_calls, [0])
+
+        # Test Assertion
+        self.assertTrue(self.websocket_supervisor.remove_connection(
+            "mainnet_usdt_perpetual"))
+        self.assertFalse(self.websocket_supervisor.remove_connection(
+            "mainnet_usdt_perpetual"))
+        self.assertEqual(self.websocket_supervisor.get_metrics(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
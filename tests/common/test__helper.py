@@ -1,10 +1,13 @@
 import backtrader
+import collections
 import copy
 import inspect
+import threading
 
 from time import time as timer
 from unittest.mock import patch
 
+from ccxtbt.account_or_store.account_or_store__classes import BT_CCXT_Account_or_Store
 from ccxtbt.bt_ccxt__specifications import CCXT__MARKET_TYPES, CCXT__MARKET_TYPE__FUTURE, \
     CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP
 from ccxtbt.exchange_or_broker.exchange__specifications import CCXT_COMMON_MAPPING_VALUES, REJECTED_VALUE
@@ -15,8 +18,11 @@ from ccxtbt.exchange_or_broker.bybit.bybit__exchange__specifications import BYBI
 from ccxtbt.exchange_or_broker.exchange__helper import get_minimum_instrument_quantity
 from ccxtbt.expansion.bt_ccxt_expansion__helper import construct_dual_position_datafeeds, \
     construct_standalone_account_or_store, construct_standalone_exchange, construct_standalone_instrument
-from ccxtbt.order.order__classes import BT_CCXT_Order
+from ccxtbt.market_data_hub.market_data_hub__classes import Market_Data_Hub
+from ccxtbt.order.order__classes import BT_CCXT_Order, Websocket_Order_Cache
 from ccxtbt.order.order__specifications import DERIVED__CCXT_ORDER__KEYS, STATUS
+from ccxtbt.order_book.order_book__classes import Local_Order_Book
+from ccxtbt.rate_limiter.rate_limiter__classes import Token_Bucket_Rate_Limiter
 from ccxtbt.utils import get_order_entry_price_and_queue, get_time_diff, legality_check_not_none_obj
 
 
@@ -587,3 +593,94 @@ def ut_get_bt_ccxt_account_or_stores(params) -> list:
 
             bt_ccxt_account_or_stores.append(bt_ccxt_account_or_store)
     return bt_ccxt_account_or_stores
+
+
+def ut_get_offline_bt_ccxt_account_or_store(params) -> BT_CCXT_Account_or_Store:
+    '''
+    Account or store holding only its in-memory state, i.e. neither markets loaded nor websocket connected, so that
+    the logic on top of the exchange could be tested against a fake ccxt exchange. init2 is run as is except for its
+    exchange, websocket and leverage steps.
+    '''
+    # Un-serialize Params
+    exchange = params['exchange']
+
+    # Optional Params
+    exchange_dropdown_value = params.get(
+        'exchange_dropdown_value', BYBIT_EXCHANGE_ID)
+    market_type = params.get(
+        'market_type', CCXT__MARKET_TYPE__LINEAR_PERPETUAL_SWAP)
+    symbols_id = params.get('symbols_id', ["ETHUSDT", ])
+    wallet_currency = params.get('wallet_currency', "USDT")
+    is_ws_available = params.get('is_ws_available', False)
+    push_order_notification = params.get('push_order_notification', False)
+    batched_order_polling = params.get('batched_order_polling', True)
+    async_exchange_bridge = params.get('async_exchange_bridge', None)
+    retries = params.get('retries', 1)
+    is_ohlcv_provider = params.get('is_ohlcv_provider', False)
+    market_data_hub = params.get('market_data_hub', None)
+
+    # Legality Check
+    legality_check_not_none_obj(exchange, "exchange")
+    assert isinstance(symbols_id, list)
+
+    if market_data_hub is None:
+        market_data_hub = Market_Data_Hub("ut")
+
+    config = dict(
+        account_alias="ut",
+        account_type=None,
+        market_type=market_type,
+        type=CCXT__MARKET_TYPES[market_type],
+        push_order_notification=push_order_notification,
+        batched_order_polling=batched_order_polling,
+        market_data_hub=market_data_hub,
+    )
+
+    def init_exchange(bt_ccxt_account_or_store, exchange_dropdown_value, config):
+        bt_ccxt_account_or_store.exchange = exchange
+        bt_ccxt_account_or_store.exchange_dropdown_value = exchange_dropdown_value
+        bt_ccxt_account_or_store.exchange_host = "{}.ut".format(
+            exchange_dropdown_value)
+        bt_ccxt_account_or_store.rate_limiter = Token_Bucket_Rate_Limiter(
+            refill_rate=1e6, capacity=100)
+        bt_ccxt_account_or_store.async_exchange_bridge = async_exchange_bridge
+
+    def init_websocket_and_balance(bt_ccxt_account_or_store, config):
+        bt_ccxt_account_or_store.is_ws_available = is_ws_available
+        bt_ccxt_account_or_store.fetch_balance__dict = {}
+        bt_ccxt_account_or_store.local_order_books = {symbol_id: Local_Order_Book(
+            symbol_id) for symbol_id in symbols_id}
+        if is_ws_available == True:
+            bt_ccxt_account_or_store.ws_active_orders = Websocket_Order_Cache()
+            bt_ccxt_account_or_store.ws_conditional_orders = Websocket_Order_Cache()
+            bt_ccxt_account_or_store.ws_positions = collections.defaultdict(
+                list)
+        else:
+            bt_ccxt_account_or_store.ws_active_orders = None
+            bt_ccxt_account_or_store.ws_conditional_orders = None
+            bt_ccxt_account_or_store.ws_positions = None
+        bt_ccxt_account_or_store._cash = 0.0
+        bt_ccxt_account_or_store._value = 0.0
+
+    def set_leverage_in_percent(bt_ccxt_account_or_store, leverage_in_percent, position_value=0.0):
+        bt_ccxt_account_or_store.leverage_in_percent = leverage_in_percent
+        return True
+
+    # Bypass __init__ as backtrader metaclass would register the account_or_store
+    bt_ccxt_account_or_store = BT_CCXT_Account_or_Store.__new__(
+        BT_CCXT_Account_or_Store)
+    with patch.object(BT_CCXT_Account_or_Store, '_init_exchange', init_exchange), \
+            patch.object(BT_CCXT_Account_or_Store, '_init_websocket_and_balance', init_websocket_and_balance), \
+            patch.object(BT_CCXT_Account_or_Store, 'set_leverage_in_percent', set_leverage_in_percent):
+        bt_ccxt_account_or_store.init2(exchange_dropdown_value=exchange_dropdown_value,
+                                       wallet_currency=wallet_currency,
+                                       config=config,
+                                       retries=retries,
+                                       symbols_id=symbols_id,
+                                       main_net_toggle_switch_value=False,
+                                       initial__capital_reservation__value=0.0,
+                                       is_ohlcv_provider=is_ohlcv_provider,
+                                       account__thread__connectivity__lock=threading.Lock(),
+                                       isolated_toggle_switch_value=False,
+                                       leverage_in_percent=100.0)
+    return bt_ccxt_account_or_store
@@ -1 +1,4 @@
 MAX__HTTP__REAL_ORDER_WAITING_TIME__IN_SECONDS = 30
+
+# Generous budget to catch heavy imports creeping back into the lightweight modules rather than to measure them
+MAX__LIGHTWEIGHT_MODULES__IMPORT_TIME__IN_SECONDS = 1.0